@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+8085 cycle cost of finding every ROM dictionary word with SEARCH-WORDLIST (src/answords/search.asm).
+
+For each word on the FORTH word list this follows the code path a successful lookup of
+that word takes and adds up its T-states:
+  phash   _swlphash: _phash over the name, the PHASHTAB probe at H1 and the name compare;
+          an empty cell or a different word there means a second _phash and a probe at H2
+  list    the linked-list walk of a build without PHASH: a length check (and, for equal
+          lengths, a name compare up to the first difference) for every newer word
+Both include the entry and exit code of SEARCH-WORDLIST, not (FIND)'s search-order loop.
+Names are looked up as they are stored (upper case); RAM words are assumed absent.
+
+The PHASH tables are read from the ROM at the PHASHAUX1/PHASHAUX2/PHASHTAB symbols, or
+from candidate phash.asm files (--phash-asm, labels resolved through the .sym), so tables
+can be compared before building with them.  --freq weights the totals (wordfreq.py).
+"""
+from __future__ import annotations
+import argparse, json, pathlib, re, statistics, sys
+
+import mforth_dict
+import wordfreq
+from symindex import Symbols
+
+CLOCK_HZ = 2457600  # Model 100 CPU clock
+
+# 8085 T-states.  Conditional jumps are "Jcc+" when taken and "Jcc-" when not.
+T = {
+    "MOV r,r": 4, "MOV r,M": 7, "MVI r": 7, "LXI": 10, "LDA": 13, "LHLD": 16, "SHLD": 16,
+    "LDAX": 7, "XCHG": 4, "XTHL": 16, "PCHL": 6, "ALU r": 4, "ALU M": 7, "ALU i": 7,
+    "INR r": 4, "DCR r": 4, "INX": 6, "DCX": 6, "DAD": 10, "PUSH": 12, "POP": 10,
+    "JMP": 10, "Jcc+": 10, "Jcc-": 7, "CALL": 18, "RET": 10, "DSUB": 10, "LHLX": 10,
+}
+
+def cost(*instrs: str) -> int:
+    return sum(T[i] for i in instrs)
+
+SAVE_DE = ("XCHG", "SHLD")
+SAVE_BC = ("MOV r,r", "MOV r,r", "SHLD")
+RESTORE_DE = ("LHLD", "XCHG")
+RESTORE_BC = ("LHLD", "MOV r,r", "MOV r,r")
+NEXT = ("LHLX", "INX", "INX", "PCHL")
+
+# searchwordlist .. _swllatest .. _swlagain, FORTH wid (JZ _swlforth taken).
+ENTRY = cost(*SAVE_DE, *SAVE_BC, "POP", "MOV r,r", "MOV r,r", "LXI", "DSUB", "Jcc+", "MVI r",
+             "LHLX", "XCHG", "MVI r", "POP", "SHLD", "POP", "SHLD")
+# _swlagain: still in ROM and FORTH, so fall through to _swlphash (PHASH builds only).
+ROM_CHECK = cost("MOV r,r", "ALU i", "ALU r", "Jcc-")
+
+# _phash: set-up and tear-down, and one character (JM taken below 'a'; a-z are upper-cased).
+PHASH_FIXED = cost("PUSH", "PUSH", "LXI", "PUSH", "ALU r", "Jcc-", "MOV r,r",
+                   "POP", "POP", "POP", "RET")
+PHASH_CHAR = cost("MOV r,M", "XTHL", "MOV r,r", "ALU r", "MOV r,r", "MVI r", "LDAX", "MOV r,r",
+                  "MOV r,r", "ALU r", "MOV r,r", "MVI r", "LDAX", "MOV r,r", "XTHL", "INX", "DCR r")
+PHASH_CHAR_LOW = cost("ALU i", "Jcc+")                                  # CPI 'a' / JM
+PHASH_CHAR_HIGH = cost("ALU i", "Jcc-", "ALU i", "Jcc+")                # above 'z'
+PHASH_CHAR_LOWER = cost("ALU i", "Jcc-", "ALU i", "Jcc-", "ALU i")      # a-z
+PHASH_LOOP, PHASH_LOOP_LAST = T["Jcc+"], T["Jcc-"]
+
+# _swlphash up to the CALL, the flag test and the H1/H2 selection, _swlphash1 to the cell test.
+PROBE_CALL = cost("PUSH", "LDA", "CALL")
+PROBE_H1 = cost("MOV r,r", "ALU r", "Jcc+", "MOV r,r")
+PROBE_H2 = cost("MOV r,r", "ALU r", "Jcc-", "Jcc+", "MOV r,r", "MOV r,r", "JMP")
+PROBE_CELL = cost("ALU i", "MOV r,r", "DAD", "MOV r,r", "ALU i", "MOV r,r", "MOV r,M", "INX", "MOV r,M",
+                  "POP", "INR r", "MOV r,r", "ALU r")
+CELL_EMPTY, CELL_USED = T["Jcc+"], T["Jcc-"]
+
+# _swlagain1: length compare, then the per-character loop of _swlnextchar/_swlmatchchar.
+LENGTH_CHECK = cost("LDAX", "ALU i", "LXI", "ALU M")
+LENGTH_DIFFERS, LENGTH_SAME = T["Jcc+"], T["Jcc-"] + cost("PUSH", "DCX", "LHLD")
+CHAR_SAME = cost("LDAX", "ALU i", "ALU M", "Jcc+")
+CHAR_CASE = cost("LDAX", "ALU i", "ALU M", "Jcc-", "ALU i", "ALU M", "Jcc-", "ALU i", "ALU i", "Jcc-",
+                 "ALU i", "Jcc-")
+CHAR_DIFFERS = cost("LDAX", "ALU i", "ALU M", "Jcc-", "ALU i", "ALU M", "Jcc+")
+CHAR_DIFFERS_CASE_LOW = cost("LDAX", "ALU i", "ALU M", "Jcc-", "ALU i", "ALU M", "Jcc-", "ALU i",
+                             "ALU i", "Jcc+")
+CHAR_DIFFERS_CASE_HIGH = CHAR_DIFFERS_CASE_LOW - T["Jcc+"] + cost("Jcc-", "ALU i", "Jcc+")
+MATCH_CHAR = cost("LDAX", "ALU i")
+MATCH_MORE, MATCH_LAST = cost("Jcc-", "DCX", "INX", "JMP"), T["Jcc+"]
+# _swlnextwordde and _swlnextword (.inxNfaToLfa, LFA fetch), then where each build goes next.
+NEXT_WORD_DE = T["POP"]
+NEXT_WORD = cost("INX", "LHLX", "XCHG", "LHLD")
+NEXT_WORD_PHASH = cost("MOV r,r", "ALU i", "ALU r", "Jcc-", "JMP")
+NEXT_WORD_LIST = cost("MOV r,r", "ALU r", "Jcc+")
+# _swlmatch (without .inxNfaToCfa), the flag push, and _swldone.
+MATCH = cost("POP", "LDAX", "ALU i", "PUSH")
+IMMEDIATE = cost("Jcc+", "LXI", "PUSH", "JMP")
+NOT_IMMEDIATE = cost("Jcc-", "LXI", "PUSH", "JMP")
+EXIT = cost(*RESTORE_DE, *RESTORE_BC, *NEXT)
+
+def phash_cost(name: bytes) -> int:
+    c = PHASH_FIXED + PHASH_LOOP * (len(name) - 1) + PHASH_LOOP_LAST
+    for ch in name:
+        c += PHASH_CHAR
+        if ch < 0x61:
+            c += PHASH_CHAR_LOW
+        elif ch > 0x7A:
+            c += PHASH_CHAR_HIGH
+        else:
+            c += PHASH_CHAR_LOWER
+    return c
+
+def phash_of(name: bytes, aux1: bytes, aux2: bytes) -> tuple[int, int]:
+    """(H1 byte pair as H:L, H2) exactly as _phash computes them."""
+    h = l = 0
+    for ch in name:
+        if 0x61 <= ch <= 0x7A:
+            ch &= 0xDF
+        h = aux1[h ^ ch]
+        l = aux2[l ^ ch]
+    return h, l
+
+def compare_cost(rom: bytes, nfa: int, name: bytes) -> tuple[int, bool]:
+    """Cost of _swlagain1 comparing name against the word at nfa, and whether it matched."""
+    c = LENGTH_CHECK
+    if rom[nfa] & 0x7F != len(name):
+        return c + LENGTH_DIFFERS, False
+    c += LENGTH_SAME
+    addr = nfa - 1
+    for ch in name:
+        d = rom[addr] & 0x7F
+        if d == ch:
+            c += CHAR_SAME
+        elif d ^ 0x20 == ch:
+            lowered = d | 0x20
+            if lowered < 0x61:
+                return c + CHAR_DIFFERS_CASE_LOW + NEXT_WORD_DE, False
+            if lowered > 0x7A:
+                return c + CHAR_DIFFERS_CASE_HIGH + NEXT_WORD_DE, False
+            c += CHAR_CASE
+        else:
+            return c + CHAR_DIFFERS + NEXT_WORD_DE, False
+        c += MATCH_CHAR
+        if rom[addr] & 0x80:
+            return c + MATCH_LAST, True
+        c += MATCH_MORE
+        addr -= 1
+    return c, False
+
+def found_cost(rom: bytes, nfa: int, nfatocfasz: int) -> int:
+    return MATCH + T["INX"] * nfatocfasz + (IMMEDIATE if rom[nfa] & 0x80 else NOT_IMMEDIATE) + EXIT
+
+class PhashTables:
+    def __init__(self, aux1: bytes, aux2: bytes, cells: list[int], source: str):
+        self.aux1, self.aux2, self.cells, self.source = aux1, aux2, cells, source
+        self.mask = len(cells) - 1
+
+    @classmethod
+    def from_rom(cls, rom: bytes, aux1: int, aux2: int, tab: int) -> PhashTables:
+        size = (mforth_dict.ROM_SIZE - tab) // 2
+        cells = [mforth_dict.get_u16(rom, tab + 2 * i) for i in range(size)]
+        return cls(rom[aux1:aux1 + 256], rom[aux2:aux2 + 256], cells, "ROM")
+
+    @classmethod
+    def from_asm(cls, path: pathlib.Path, symbols: Symbols, nfatocfasz: int) -> PhashTables:
+        data: dict[str, list[int]] = {"PHASHAUX1": [], "PHASHAUX2": [], "PHASHTAB": []}
+        current = None
+        for line in path.read_text().splitlines():
+            line = line.split(";", 1)[0].strip()
+            if line.rstrip(":").upper() in data:
+                current = data[line.rstrip(":").upper()]
+                continue
+            m = re.match(r"\.(BYTE|WORD)\s+(.*)", line, re.I)
+            if m is None or current is None:
+                continue
+            for item in m.group(2).split(","):
+                item = item.strip()
+                label = re.match(r"(\w+)\s*-\s*NFATOCFASZ$", item, re.I)
+                if label:
+                    addr = symbols.get(label.group(1))
+                    if addr is None:
+                        raise SystemExit(f"{path}: symbol '{label.group(1)}' is not in the .sym")
+                    current.append(addr - nfatocfasz)
+                else:
+                    current.append(int(item.rstrip("hH"), 16 if item[-1:] in "hH" else 10))
+        if len(data["PHASHAUX1"]) != 256 or len(data["PHASHAUX2"]) != 256:
+            raise SystemExit(f"{path}: expected two 256-byte aux tables")
+        return cls(bytes(data["PHASHAUX1"]), bytes(data["PHASHAUX2"]), data["PHASHTAB"], str(path))
+
+    def lookup_cost(self, rom: bytes, word: mforth_dict.Word, nfatocfasz: int) -> tuple[int, int]:
+        """(T-states, probes) of _swlphash finding word; probes is 0 if the tables do not hold it."""
+        name = word.name.encode("ascii")
+        hash_cost = PROBE_CALL + phash_cost(name)
+        h, l = phash_of(name, self.aux1, self.aux2)
+        c = ENTRY + ROM_CHECK
+        for probe, (sel, slot) in enumerate(((PROBE_H1, (h << 8 | l)), (PROBE_H2, (l << 8 | h))), 1):
+            c += hash_cost + sel + PROBE_CELL
+            cell = self.cells[slot & self.mask]
+            if cell == 0:
+                c += CELL_EMPTY
+                continue
+            c += CELL_USED
+            compared, matched = compare_cost(rom, cell, name)
+            c += compared
+            if matched and cell == word.nfa:
+                return c + found_cost(rom, cell, nfatocfasz), probe
+            c += NEXT_WORD + NEXT_WORD_PHASH
+        return c, 0
+
+def list_cost(rom: bytes, words: list[mforth_dict.Word], nfatocfasz: int) -> list[int]:
+    """T-states of finding each word (latest first) by walking the linked list from the latest word."""
+    names = [w.name.encode("ascii") for w in words]
+    costs = []
+    for i, (word, name) in enumerate(zip(words, names)):
+        c = ENTRY
+        for newer in words[:i]:
+            c += compare_cost(rom, newer.nfa, name)[0] + NEXT_WORD + NEXT_WORD_LIST
+        costs.append(c + compare_cost(rom, word.nfa, name)[0] + found_cost(rom, word.nfa, nfatocfasz))
+    return costs
+
+def summarize(costs: list[int], weights: list[int] | None) -> dict:
+    out = {
+        "words": len(costs),
+        "min": min(costs),
+        "median": statistics.median(costs),
+        "mean": round(statistics.fmean(costs), 1),
+        "max": max(costs),
+        "total": sum(costs),
+    }
+    if weights is not None:
+        lookups = sum(weights)
+        weighted = sum(c * w for c, w in zip(costs, weights))
+        out.update(lookups=lookups, weighted_total=weighted,
+                   weighted_mean=round(weighted / lookups, 1) if lookups else 0.0)
+    return out
+
+def histogram(costs: list[int], buckets: int = 10) -> list[tuple[int, int, int]]:
+    """(low, high, count) over equal-width cost buckets."""
+    lo, hi = min(costs), max(costs)
+    width = max(1, -(-(hi - lo + 1) // buckets))
+    counts = [0] * buckets
+    for c in costs:
+        counts[(c - lo) // width] += 1
+    return [(lo + k * width, lo + (k + 1) * width - 1, n) for k, n in enumerate(counts) if n]
+
+def print_report(title: str, words: list[mforth_dict.Word], costs: list[int], weights: list[int] | None,
+                 worst: int, extra: str = "") -> None:
+    s = summarize(costs, weights)
+    print(f"{title}{extra}")
+    print(f"  T-states per lookup: min {s['min']}  median {s['median']}  mean {s['mean']}  max {s['max']}"
+          f"  ({s['mean'] * 1e6 / CLOCK_HZ:.0f} us mean)")
+    if weights is not None:
+        print(f"  weighted: {s['lookups']} lookups, {s['weighted_total']} T-states, "
+              f"{s['weighted_mean']} per lookup ({s['weighted_total'] * 1e3 / CLOCK_HZ:.1f} ms)")
+    peak = max(n for _, _, n in histogram(costs))
+    for lo, hi, n in histogram(costs):
+        print(f"  {lo:6d}-{hi:<6d} {n:4d} {'#' * max(1, round(40 * n / peak))}")
+    ranked = sorted(range(len(costs)), key=lambda i: (-costs[i], words[i].name))[:worst]
+    if ranked:
+        print("  worst: " + ", ".join(f"{words[i].name} {costs[i]}" for i in ranked))
+
+def main():
+    ap=argparse.ArgumentParser(description="Model the 8085 cycle cost of SEARCH-WORDLIST for every ROM word.")
+    ap.add_argument("rom", help="ROM image (.BX)")
+    ap.add_argument("sym", nargs="?", help="Symbols for the ROM (.sym)")
+    ap.add_argument("--phash-asm", action="append", default=[], metavar="FILE",
+                    help="Evaluate the tables in a candidate phash.asm instead of the ROM's; may be repeated")
+    ap.add_argument("--freq", action="append", default=[], metavar="FILE",
+                    help="Weight lookups by word frequency (see wordfreq.py); may be repeated")
+    ap.add_argument("--head", help="NFA of the latest FORTH word (default: _latestforth, else 07FFEH)")
+    ap.add_argument("--worst", type=int, default=10, help="Show the N most expensive words, default 10")
+    ap.add_argument("--no-list", action="store_true", help="Skip the linked-list model")
+    ap.add_argument("--words", action="store_true", help="Print the cost of every word")
+    ap.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args=ap.parse_args()
+
+    try:
+        rom=mforth_dict.load_rom(args.rom)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    symbols=Symbols(pathlib.Path(args.sym) if args.sym else None)
+    nfatocfasz=symbols.get("nfatocfasz")
+    if args.head:
+        head=int(args.head.rstrip("hH"), 16)
+    elif symbols.get("_latestforth") is not None and nfatocfasz is not None:
+        head=symbols.get("_latestforth") - nfatocfasz
+    else:
+        head=mforth_dict.latest_word_addr(rom)
+    try:
+        words=mforth_dict.words(rom, head)
+        if nfatocfasz is None:
+            nfatocfasz=mforth_dict.Rom(rom, head).nfatocfasz
+    except ValueError as e:
+        raise SystemExit(f"cannot walk the dictionary from {head:04X}: {e}")
+
+    tables=[]
+    if args.phash_asm:
+        tables=[PhashTables.from_asm(pathlib.Path(p), symbols, nfatocfasz) for p in args.phash_asm]
+    else:
+        addrs=[symbols.get(n) for n in ("phashaux1", "phashaux2", "phashtab")]
+        if None not in addrs:
+            tables=[PhashTables.from_rom(rom, *addrs)]
+    weights=None
+    if args.freq:
+        weights=wordfreq.weights_for([w.name for w in words], wordfreq.load_any(args.freq))
+
+    results={}
+    for t in tables:
+        costs, probes = zip(*(t.lookup_cost(rom, w, nfatocfasz) for w in words))
+        missing=[w.name for w, p in zip(words, probes) if p == 0]
+        results[f"phash {t.source}"]=(list(costs), {
+            "h1": probes.count(1), "h2": probes.count(2), "missing": missing})
+    if not args.no_list:
+        results["list"]=(list_cost(rom, words, nfatocfasz), {})
+
+    if args.json:
+        out={}
+        for title, (costs, info) in results.items():
+            out[title]=dict(summarize(costs, weights), **info,
+                            histogram=histogram(costs),
+                            per_word={w.name: c for w, c in zip(words, costs)} if args.words else None)
+        print(json.dumps(out, indent=2))
+        return 0
+    if not tables:
+        print("no PHASH tables (no PHASHAUX1/PHASHAUX2/PHASHTAB symbols and no --phash-asm)")
+    for title, (costs, info) in results.items():
+        extra=""
+        if info:
+            extra=f": H1 {info['h1']}, H2 {info['h2']}"
+            if info["missing"]:
+                extra+=f", NOT FOUND {len(info['missing'])} ({' '.join(info['missing'][:8])})"
+        print_report(title, words, costs, weights, args.worst, extra)
+        if args.words:
+            for w, c in zip(words, costs):
+                print(f"    {c:6d} {w.name}")
+    return 0
+
+if __name__=="__main__":
+    sys.exit(main())
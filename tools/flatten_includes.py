@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Flatten an opForge source and its .include files into one preprocessed bundle.
+
+Every file is normalized with strip_preproc_hash.normalize_preproc and its
+.include directives are resolved in memory, so the assembler reads a single
+file and no stripped copy of the source tree has to be written.  Alongside
+the bundle a line map records where each bundle line came from, so
+assembler errors and listing lines can be traced back to file:line:
+
+    flatten_includes.py src/main.asm build/main.bundle.asm
+    flatten_includes.py --where 1234 build/main.bundle.asm.map
+
+The map is JSON: the list of source files (relative to the root file's
+directory) and runs of [bundle_line, file_index, source_line, count], all
+1-based.  An .include whose file does not exist (e.g. phash.asm before it
+has been generated) is left in place for the assembler, with its path
+rewritten relative to the bundle.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+from bisect import bisect_right
+from pathlib import Path
+
+from strip_preproc_hash import normalize_preproc
+
+INCLUDE_RE = re.compile(r'^(\s*)\.include\s+"([^"]+)"', re.IGNORECASE)
+
+
+class LineMap:
+    """Runs of consecutive bundle lines that come from consecutive source lines."""
+
+    def __init__(self, files: list[str] | None = None, ranges: list[list[int]] | None = None):
+        self.files = files or []
+        self.ranges = ranges or []  # [bundle_line, file_index, source_line, count]
+        self._file_index = {name: i for i, name in enumerate(self.files)}
+
+    def add(self, bundle_line: int, file: str, source_line: int) -> None:
+        index = self._file_index.get(file)
+        if index is None:
+            index = self._file_index[file] = len(self.files)
+            self.files.append(file)
+        if self.ranges:
+            last = self.ranges[-1]
+            if (
+                last[1] == index
+                and last[0] + last[3] == bundle_line
+                and last[2] + last[3] == source_line
+            ):
+                last[3] += 1
+                return
+        self.ranges.append([bundle_line, index, source_line, 1])
+
+    def lookup(self, bundle_line: int) -> tuple[str, int] | None:
+        i = bisect_right(self.ranges, [bundle_line, float("inf")]) - 1
+        if i < 0:
+            return None
+        start, index, source_line, count = self.ranges[i]
+        if bundle_line >= start + count:
+            return None
+        return self.files[index], source_line + bundle_line - start
+
+    def to_json(self) -> str:
+        return json.dumps({"files": self.files, "ranges": self.ranges}, separators=(",", ":")) + "\n"
+
+    @classmethod
+    def from_json(cls, text: str) -> LineMap:
+        data = json.loads(text)
+        return cls(data["files"], data["ranges"])
+
+
+def resolve_include(name: str, including: Path, root_dir: Path) -> Path | None:
+    for base in (including.parent, root_dir):
+        path = base / name
+        if path.is_file():
+            return path
+    return None
+
+
+def flatten(root: Path, bundle_dir: Path | None = None) -> tuple[list[str], LineMap]:
+    """Return the bundle lines for root and the line map back to the sources."""
+    root = root.resolve()
+    root_dir = root.parent
+    bundle_dir = (bundle_dir or root_dir).resolve()
+    out: list[str] = []
+    line_map = LineMap()
+
+    def emit(line: str, path: Path, lineno: int) -> None:
+        if not line.endswith("\n"):
+            line += "\n"
+        out.append(line)
+        line_map.add(len(out), path.relative_to(root_dir).as_posix(), lineno)
+
+    def visit(path: Path, stack: tuple[Path, ...]) -> None:
+        if path in stack:
+            chain = " -> ".join(p.name for p in stack + (path,))
+            raise SystemExit(f"error: recursive .include: {chain}")
+        text = normalize_preproc(path.read_text(errors="ignore"))
+        for lineno, line in enumerate(text.splitlines(keepends=True), 1):
+            m = INCLUDE_RE.match(line)
+            if not m:
+                emit(line, path, lineno)
+                continue
+            target = resolve_include(m.group(2), path, root_dir)
+            if target is None:
+                missing = Path(os.path.relpath(path.parent / m.group(2), bundle_dir)).as_posix()
+                emit(f'{line[:m.start(2)]}{missing}{line[m.end(2):]}', path, lineno)
+                continue
+            emit(f";{line}", path, lineno)
+            visit(target.resolve(), stack + (path,))
+
+    visit(root, ())
+    return out, line_map
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("src", type=Path, help="Root source file (e.g. src/main.asm), or a .map with --where")
+    parser.add_argument("dst", nargs="?", type=Path, help="Bundle to write (default: stdout)")
+    parser.add_argument("--map", type=Path, help="Line map path (default: <dst>.map)")
+    parser.add_argument("--where", type=int, metavar="LINE", help="Print file:line for a bundle line of the map in src")
+    args = parser.parse_args()
+
+    if args.where is not None:
+        hit = LineMap.from_json(args.src.read_text()).lookup(args.where)
+        if hit is None:
+            print(f"error: line {args.where} is not in the bundle", file=sys.stderr)
+            return 1
+        print(f"{hit[0]}:{hit[1]}")
+        return 0
+
+    bundle_dir = args.dst.parent if args.dst else Path.cwd()
+    lines, line_map = flatten(args.src, bundle_dir)
+    text = "".join(lines)
+    if args.dst is None:
+        sys.stdout.write(text)
+        if args.map:
+            args.map.write_text(line_map.to_json())
+        return 0
+
+    map_path = args.map or args.dst.with_name(args.dst.name + ".map")
+    args.dst.parent.mkdir(parents=True, exist_ok=True)
+    for path, content in ((args.dst, text), (map_path, line_map.to_json())):
+        try:
+            if path.read_text() == content:
+                continue
+        except OSError:
+            pass
+        path.write_text(content)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
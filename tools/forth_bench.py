@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Cycle-counted MFORTH benchmarks on the emulated Model 100 (m100emu.py).
+
+Every workload boots a fresh machine, types its setup (definitions, not
+measured) and then one measured line; the result is the exact number of 8085
+T-states from ENTER on that line until MFORTH waits for the keyboard again,
+so it includes reading and interpreting the line but nothing else.  The
+4 ms timer interrupt is off, so the counts depend only on the ROM.
+
+  next-loop     DO/LOOP with I and + : the NEXT dispatch and tiny primitives
+  enter-exit    nested colon definitions: ENTER/EXIT
+  find-compile  INCLUDED of a generated 150-definition source: FIND on every token
+  double        M+ D- DABS DNEGATE D2* D0< (double.asm)
+  pause         PAUSE round trips between three tasks (task.asm)
+  strings       FILL CMOVE CMOVE> MOVE /STRING COUNT over PAD
+
+The counts are compared with a stored baseline (test/bench_baseline.json by
+default); the run fails when a workload needs more than --threshold percent
+more T-states than the baseline, or when the baseline was recorded from a
+ROM of another name (Reference.bx counts say nothing about a new MFORTH.BX).
+--save writes the current counts as the new baseline.
+
+    forth_bench.py bin/MFORTH.BX [--baseline FILE] [--threshold PCT] [--save FILE]
+"""
+from __future__ import annotations
+import argparse, json, pathlib, sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import m100emu
+from jobs import job_count
+
+DEFAULT_BASELINE = pathlib.Path(__file__).resolve().parent.parent / "test" / "bench_baseline.json"
+
+class Workload(NamedTuple):
+    name: str
+    setup: str                  # lines typed first, not measured; each a complete definition
+    run: str                    # the measured line
+    files: dict[str, str] = {}
+
+# ROM words the find-compile source is built from: early and late in the word list.
+_FIND_WORDS = ("DUP DROP SWAP OVER ROT + - * AND OR XOR 0= = < > @ ! C@ C! 1+ 1- 2* 2/ NEGATE ABS MIN MAX "
+               "R@ >R R> TUCK NIP ?DUP INVERT LSHIFT RSHIFT CELLS CHARS HERE BASE DEPTH 2DUP 2DROP 2SWAP").split()
+
+def find_source(definitions: int = 150, per_definition: int = 12) -> str:
+    """A deterministic source of colon definitions mixing ROM words and earlier definitions."""
+    lines = []
+    for i in range(definitions):
+        words = []
+        for j in range(per_definition):
+            k = (i * 7 + j * 13) % (len(_FIND_WORDS) + 4)
+            if k < len(_FIND_WORDS) or i == 0:
+                words.append(_FIND_WORDS[k % len(_FIND_WORDS)])
+            else:
+                words.append(f"F{(i * 31 + j) % i}")
+        lines.append(f": F{i} " + " ".join(words) + " ;")
+    return "\n".join(lines) + "\n"
+
+WORKLOADS = (
+    Workload("next-loop", ": BN 0 10000 0 DO I + LOOP DROP ;", "BN"),
+    Workload("enter-exit", ": N1 ; : N2 N1 N1 ; : N3 N2 N2 ; : N4 N3 N3 ; : N5 N4 N4 ;\n"
+             ": BE 300 0 DO N5 LOOP ;", "BE"),
+    Workload("find-compile", "", 'S" FINDB" INCLUDED', {"FINDB": find_source()}),
+    Workload("double", ": BD 0 0 2000 0 DO I M+ 2DUP 7 0 D- DABS DNEGATE D2* D0< DROP LOOP 2DROP ;",
+             "BD"),
+    Workload("pause", "VARIABLE N : T1 BEGIN 1 N +! PAUSE AGAIN ;\n' T1 TASK ' T1 TASK\n"
+             ": BP 1000 0 DO PAUSE LOOP ;", "BP"),
+    Workload("strings", 'CREATE BUF 100 ALLOT\n: S1 PAD 100 BL FILL S" HELLO, WORLD" PAD SWAP CMOVE ;\n'
+             ": S2 PAD BUF 100 MOVE BUF PAD 1+ 99 CMOVE> ;\n: S3 PAD 100 7 /STRING 2DROP BUF COUNT 2DROP ;\n"
+             ": BS 100 0 DO S1 S2 S3 LOOP ;", "BS"),
+)
+
+class WorkloadError(Exception):
+    pass
+
+def measure(rom: bytes, workload: Workload, max_cycles: float = m100emu.MAX_CYCLES) -> int:
+    """T-states taken by the workload's measured line."""
+    return run_workload(rom, workload, max_cycles)[1]
+
+def run_workload(rom: bytes, workload: Workload, max_cycles: float = m100emu.MAX_CYCLES,
+                 cache: bool = True) -> tuple[m100emu.Model100, int]:
+    """The machine after the workload's measured line, and the T-states that line took."""
+    machine = m100emu.Model100(rom, workload.files, timer=False, cache=cache)
+    if machine.boot(max_cycles) != "input":
+        raise WorkloadError(f"{workload.name}: MFORTH did not reach the prompt ({machine.stopped})")
+    lines = [(line, False) for line in workload.setup.splitlines()] + [(workload.run, True)]
+    for line, measured in lines:
+        if len(line) >= m100emu.TIB_SIZE:
+            raise WorkloadError(f"{workload.name}: '{line[:40]}...' is longer than the TIB")
+        start = machine.cycles
+        out = machine.interpret(line, max_cycles)
+        if machine.stopped != "input" or not out.rstrip().endswith("ok"):
+            tail = out.strip().splitlines()[-1:] or [machine.stopped]
+            raise WorkloadError(f"{workload.name}: '{line[:40]}' failed: {tail[0]}")
+        if measured:
+            return machine, machine.cycles - start
+    raise AssertionError("unreachable")
+
+def _measure_worker(args: tuple[bytes, Workload]) -> tuple[str, int | str]:
+    rom, workload = args
+    try:
+        return workload.name, measure(rom, workload)
+    except WorkloadError as e:
+        return workload.name, str(e)
+
+def run_all(rom: bytes, workloads=WORKLOADS, jobs: int = 1) -> dict[str, int | str]:
+    """name -> T-states, or an error message for a workload that failed."""
+    tasks = [(rom, w) for w in workloads]
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            return dict(pool.map(_measure_worker, tasks))
+    return dict(map(_measure_worker, tasks))
+
+def load_baseline(path: pathlib.Path) -> tuple[str | None, dict[str, int]]:
+    """The name of the ROM the baseline was recorded from, and its counts; (None, {}) if there is none."""
+    if not path.exists():
+        return None, {}
+    data = json.loads(path.read_text())
+    return data.get("rom"), {name: int(t) for name, t in data["workloads"].items()}
+
+def save_baseline(path: pathlib.Path, rom_path: str, results: dict[str, int]) -> None:
+    data = {"rom": pathlib.Path(rom_path).name, "clock_hz": m100emu.CLOCK_HZ, "workloads": results}
+    path.write_text(json.dumps(data, indent=2) + "\n")
+
+def compare(results: dict[str, int | str], baseline: dict[str, int],
+            threshold: float) -> tuple[list[tuple[str, int | str, int | None, float | None]], list[str]]:
+    """Report rows (name, T-states or error, baseline, change %) and the names that failed."""
+    rows, failed = [], []
+    for name, t in results.items():
+        base = baseline.get(name)
+        if isinstance(t, str):
+            rows.append((name, t, base, None))
+            failed.append(name)
+            continue
+        change = None if not base else 100.0 * (t - base) / base
+        rows.append((name, t, base, change))
+        if change is not None and change > threshold:
+            failed.append(name)
+    return rows, failed
+
+def main():
+    ap=argparse.ArgumentParser(description="Run the cycle-counted MFORTH benchmarks.")
+    ap.add_argument("rom", help="MFORTH ROM image (bin/MFORTH.BX)")
+    ap.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline counts, default %(default)s")
+    ap.add_argument("--threshold", type=float, default=1.0,
+                    help="Fail when a workload takes more than this many percent longer, default %(default)s")
+    ap.add_argument("--save", metavar="FILE", help="Write the counts as a baseline to FILE (nothing is compared)")
+    ap.add_argument("--only", action="append", default=[], metavar="NAME", help="Run only these workloads")
+    ap.add_argument("-j", "--jobs", type=job_count, default=0, help="Worker processes (0 = one per CPU)")
+    ap.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args=ap.parse_args()
+
+    rom=pathlib.Path(args.rom).read_bytes()
+    workloads=[w for w in WORKLOADS if not args.only or w.name in args.only]
+    unknown=set(args.only) - {w.name for w in WORKLOADS}
+    if unknown:
+        raise SystemExit(f"unknown workload(s): {', '.join(sorted(unknown))}")
+    if not args.save:
+        baseline_rom, baseline=load_baseline(pathlib.Path(args.baseline))
+        rom_name=pathlib.Path(args.rom).name
+        if baseline_rom is None:
+            print(f"no baseline in {args.baseline}; nothing compared (--save records one)", file=sys.stderr)
+        elif baseline_rom != rom_name:
+            raise SystemExit(f"{args.baseline} was recorded from {baseline_rom}, not {rom_name}; "
+                             f"record a baseline from this ROM with --save, or pass one with --baseline")
+    results=run_all(rom, workloads, args.jobs)
+
+    if args.save:
+        errors={n: t for n, t in results.items() if isinstance(t, str)}
+        if errors:
+            raise SystemExit("\n".join(errors.values()))
+        save_baseline(pathlib.Path(args.save), args.rom, results)
+        print(f"Saved {len(results)} workload(s) to {args.save}")
+        return 0
+
+    rows, failed=compare(results, baseline, args.threshold)
+    if args.json:
+        print(json.dumps({"threshold": args.threshold, "failed": failed,
+                          "workloads": [{"name": n, "tstates": t, "baseline": b, "change": c}
+                                        for n, t, b, c in rows]}, indent=2))
+    else:
+        print(f"{'workload':<14}{'T-states':>12}{'ms':>9}{'baseline':>12}{'change':>9}")
+        for name, t, base, change in rows:
+            if isinstance(t, str):
+                print(f"{name:<14}  ERROR {t}")
+                continue
+            ms=1000.0 * t / m100emu.CLOCK_HZ
+            base_text="-" if base is None else str(base)
+            change_text="-" if change is None else f"{change:+.2f}%"
+            mark="  REGRESSED" if name in failed else ""
+            print(f"{name:<14}{t:>12}{ms:>9.1f}{base_text:>12}{change_text:>9}{mark}")
+    if failed:
+        print(f"{len(failed)} workload(s) failed or regressed by more than {args.threshold}%: {', '.join(failed)}",
+              file=sys.stderr)
+        return 1
+    return 0
+
+if __name__=="__main__":
+    sys.exit(main())
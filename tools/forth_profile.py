@@ -0,0 +1,642 @@
+#!/usr/bin/env python3
+"""
+PC-sampling profiler for an unmodified MFORTH ROM on the emulated Model 100 (m100emu.py).
+
+While profiling, every instruction adds its T-states to a histogram indexed by
+PC, and every NEXT (the PCHL that dispatches to a code field) counts a call of
+the word it enters.  Every NEXT also records the Forth call stack, weighted
+by the T-states since the previous NEXT: the return stack (xx7FH down to BC
+in the task page, see src/main.asm) gives the callers, IP (DE) the colon
+definition being run and the PC of the PCHL the primitive that just
+finished.  A return stack cell is a frame only if the thread cell before it
+is a colon or DOES> word (or EXECUTE); DO..LOOP parameters and >R data are
+skipped.
+
+Addresses are attributed after the run, from the dictionary then in memory
+(FORTH and ASSEMBLER word lists, so RAM definitions are included): a word owns
+the bytes from its code field to the next header.  With --sym (the .sym or
+.symidx of the build) code outside any word is named by its label, and the
+src/*.asm lines are found by walking the sources from every known label (and
+every .linkTo code field) and checking each instruction against the image.
+
+Reports:
+  flat        T-states, NEXT calls and share per word (the default)
+  --lines     T-states per src/*.asm line
+  --callgraph inclusive/self time per word with its callers and callees
+  --folded    "outer;inner;word T-states" lines for flamegraph.pl
+
+Without --sym, the labels the source walk places name the code outside words.
+
+    forth_profile.py bin/MFORTH.BX test/tester.fs test/core.fs -i core --sym build/MFORTH.sym --lines
+    forth_profile.py bin/MFORTH.BX --workload find-compile --folded build/find.folded
+"""
+from __future__ import annotations
+import argparse, bisect, collections, pathlib, re, sys, time
+
+import forth_bench
+import i8085
+import m100emu
+import mforth_dict
+import phashgen
+from flatten_includes import flatten
+from symindex import load_entries
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+MAIN_BANK = 0x10000             # histogram offset of PCs run while the Main ROM is selected
+PCHL, OUT, JMP, CALL = 0xE9, 0xD3, 0xC3, 0xCD
+
+# MFORTH globals (altbgn + n in src/main.asm).
+DP, FORTHWL, ASSEMBLERWL = 0xFCD8, 0xFCFA, 0xFCFC
+RS_TOP = 0x7F                   # the return stack grows down from xx7FH in the task page
+
+def u16(mem, addr: int) -> int:
+    return mem[addr] | mem[(addr + 1) & 0xFFFF] << 8
+
+class ProfiledModel100(m100emu.Model100):
+    """A Model100 that records a PC histogram and the Forth call stack at every NEXT while profiling is set."""
+
+    def __init__(self, rom: bytes, files=None, **kwargs):
+        super().__init__(rom, files, **kwargs)
+        self.profiling = False
+        self.clear_profile()
+
+    def clear_profile(self) -> None:
+        self.hist = [0] * (2 * MAIN_BANK)
+        self.calls = [0] * (2 * MAIN_BANK)
+        self.stacks: collections.Counter = collections.Counter()
+        self.last_next = self.cycles
+
+    def start_profile(self) -> None:
+        self.clear_profile()
+        self.profiling = True
+
+    def execute(self, t: int) -> int:
+        if not self.profiling:
+            return super().execute(t)
+        ops, mem, hist, calls = self.ops, self.mem, self.hist, self.calls
+        bank = 0 if self.option_selected else MAIN_BANK
+        while t < self.limit:
+            pc = self.pc
+            op = mem[pc]
+            n = ops[op](self)
+            hist[pc | bank] += n
+            t += n
+            if op == PCHL:
+                calls[self.pc | bank] += 1
+                self._sample(pc, t)
+            elif op == OUT:
+                bank = 0 if self.option_selected else MAIN_BANK
+        return t
+
+    def _sample(self, pc: int, t: int) -> None:
+        page = self.b << 8
+        rs = bytes(self.mem[page + self.c + 1:page + RS_TOP + 1]) if self.c < RS_TOP else b""
+        self.stacks[rs, self.d << 8 | self.e, pc] += t - self.last_next
+        self.last_next = t
+
+    def pc_times(self) -> list[int]:
+        """T-states per PC, Main ROM bank at MAIN_BANK + PC (RAM is the same in both banks)."""
+        hist = list(self.hist)
+        for pc in range(m100emu.RAM_START, MAIN_BANK):
+            hist[pc] += hist[MAIN_BANK + pc]
+            hist[MAIN_BANK + pc] = 0
+        return hist
+
+class Dictionary:
+    """The words on the FORTH and ASSEMBLER word lists in memory, with the code range each owns."""
+
+    def __init__(self, mem, option_rom: bytes):
+        heads = [u16(mem, FORTHWL), u16(mem, ASSEMBLERWL)]
+        rom_head = next((nfa for nfa in self._nfas(mem, heads[0]) if nfa < m100emu.ROM_SIZE), 0)
+        size = mforth_dict.Rom(option_rom, rom_head).nfatocfasz
+        self.nfatocfasz = size
+        found: dict[int, tuple[str, int]] = {}
+        for head in heads:
+            for nfa in self._nfas(mem, head):
+                word = mforth_dict.read_word(mem, nfa)
+                found[nfa + size] = (word.name, word.header_start)
+        here = u16(mem, DP)
+        rom_end = phashgen.code_end(option_rom)         # the PHASH tables follow the code
+        starts = sorted(start for _, start in found.values())
+        names = collections.Counter(name for name, _ in found.values())
+        self.ranges: list[tuple[int, int, str]] = []
+        for cfa, (name, _) in sorted(found.items()):
+            limit = max(rom_end, cfa + 1) if cfa < m100emu.ROM_SIZE else max(here, cfa)
+            j = bisect.bisect_right(starts, cfa)
+            end = min(starts[j], limit) if j < len(starts) else limit
+            if names[name] > 1 and cfa >= m100emu.RAM_START:
+                name = f"{name}@{cfa:04X}"
+            self.ranges.append((cfa, end, name))
+        self.cfas = [cfa for cfa, _, _ in self.ranges]
+        self.by_cfa = {cfa: name for cfa, _, name in self.ranges}
+        self.by_name = {name.upper(): cfa for cfa, _, name in reversed(self.ranges) if cfa < m100emu.ROM_SIZE}
+        # ENTER is where most ROM code fields jump; DOES> compiles "CALL DODOES" from LIT 205 C, LIT DODOES ,
+        targets = collections.Counter(u16(mem, cfa + 1) for cfa in self.cfas
+                                      if cfa < m100emu.ROM_SIZE and mem[cfa] == JMP)
+        self.enter = targets.most_common(1)[0][0] if targets else None
+        self.dodoes = None
+        does = self.by_name.get("DOES>")
+        if does is not None:
+            thread = [u16(mem, does + 3 + 2 * k) for k in range(8)]
+            if 205 in thread[:-3]:
+                self.dodoes = thread[thread.index(205) + 3]
+
+    def is_colon(self, cfa: int, mem) -> bool:
+        """Does the word at cfa run a thread: a code field that JMPs/CALLs ENTER or DODOES (or DOES> code)?"""
+        if mem[cfa] not in (JMP, CALL):
+            return False
+        target = u16(mem, cfa + 1)
+        return target in (self.enter, self.dodoes) or \
+            (mem[target] == CALL and self.dodoes is not None and u16(mem, target + 1) == self.dodoes)
+
+    @staticmethod
+    def _nfas(mem, head: int):
+        seen = set()
+        while head and head not in seen:
+            seen.add(head)
+            try:
+                word = mforth_dict.read_word(mem, head)
+            except ValueError:
+                return
+            yield head
+            head = word.next_word_addr
+
+    def word_at(self, addr: int) -> tuple[int, int, str] | None:
+        i = bisect.bisect_right(self.cfas, addr) - 1
+        if i >= 0 and addr < self.ranges[i][1]:
+            return self.ranges[i]
+        return None
+
+def load_labels(path: str | pathlib.Path) -> dict[str, int]:
+    """Label -> address from a .sym or .symidx (the index when it is current)."""
+    return {name: addr for addr, name in load_entries(path)}
+
+# --- Source lines ------------------------------------------------------------
+
+MNEMONICS = {op.mnemonic.split()[0] for op in i8085.OPS}
+LABEL_RE = re.compile(r"^([A-Za-z_][\w.]*):?(?=\s|$)")
+NUMBER_RE = re.compile(r"^(?:([0-9][0-9A-Fa-f]*)[Hh]|\$([0-9A-Fa-f]+)|0[xX]([0-9A-Fa-f]+)|([0-9]+))$")
+
+def _scan(text: str):
+    """(index, char, quoted) for text, honouring backslash escapes inside quotes."""
+    quote, escaped = None, False
+    for i, ch in enumerate(text):
+        if quote:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == quote:
+                quote = None
+            yield i, ch, True
+        elif ch in "'\"":
+            quote = ch
+            yield i, ch, True
+        else:
+            yield i, ch, False
+
+def strip_comment(line: str) -> str:
+    for i, ch, quoted in _scan(line):
+        if ch == ";" and not quoted:
+            return line[:i].rstrip()
+    return line.rstrip()
+
+def split_args(text: str) -> list[str]:
+    """Comma-separated operands, leaving commas inside quotes alone."""
+    args, start = [], 0
+    for i, ch, quoted in _scan(text):
+        if ch == "," and not quoted:
+            args.append(text[start:i].strip())
+            start = i + 1
+    if text[start:].strip():
+        args.append(text[start:].strip())
+    return args
+
+def string_length(arg: str) -> int:
+    """Bytes in a quoted .byte operand."""
+    return len(re.sub(r"\\(.)", r"\1", arg[1:-1]))
+
+def parse_number(text: str) -> int | None:
+    m = NUMBER_RE.match(text.strip())
+    if not m:
+        return None
+    hexa = m.group(1) or m.group(2) or m.group(3)
+    return int(hexa, 16) if hexa else int(m.group(4))
+
+class SourceMap:
+    """Start address -> (file, line, text) of every src/*.asm line that assembles to bytes in the ROM.
+
+    The bundle from flatten_includes is walked like a one-pass assembler that only
+    counts bytes: macros are expanded, .ifdef takes the branch for the image's
+    build (PROFILER from the header layout; .if expressions are the source's
+    build-time assertions and count as false) and every instruction must decode
+    to the same mnemonic in the image.  Anything the walk cannot size loses the
+    address until the next known label (--sym) or .linkTo code field.
+    """
+
+    def __init__(self, src: pathlib.Path, rom: bytes, labels: dict[str, int], words: dict[str, int],
+                 defined: set[str]):
+        self.rom = rom
+        self.labels = {name.lower(): addr for name, addr in labels.items()}
+        self.words = words
+        self.defined = {name.lower() for name in defined}
+        lines, line_map = flatten(src / "main.asm")
+        self.lines = [strip_comment(line.rstrip("\n")) for line in lines]
+        self.where = [line_map.lookup(n) for n in range(1, len(lines) + 1)]
+        self.macros = self._macros()
+        self.starts: list[int] = []
+        self.rows: list[tuple[str, int, str]] = []
+        self.placed: dict[str, int] = {}     # every label the walk reached with a known address
+        self.lost = 0
+        self._walk()
+
+    def _active(self):
+        """(bundle index, code) of the lines in the branches this build assembles, outside macros."""
+        stack: list[tuple[bool, bool]] = []     # (active, a branch was taken)
+        active = True
+        for i, code in enumerate(self.lines):
+            word = code.split(None, 1)[0].lower() if code.strip() else ""
+            if word in (".ifdef", ".ifndef", ".if"):
+                name = code.split(None, 1)[1].strip().lower() if len(code.split()) > 1 else ""
+                cond = (name in self.defined) if word == ".ifdef" else \
+                       (name not in self.defined) if word == ".ifndef" else False
+                stack.append((active, active and cond))
+                active = active and cond
+            elif word in (".else", ".elseif") and stack:
+                parent, taken = stack[-1]
+                active = parent and not taken and word == ".else"
+                stack[-1] = (parent, taken or active)
+            elif word == ".endif" and stack:
+                active = stack.pop()[0]
+            elif active:
+                yield i, code
+
+    def _macros(self) -> dict[str, tuple[list[str], list[str]]]:
+        macros: dict[str, tuple[list[str], list[str]]] = {}
+        body: list[str] | None = None
+        for _, code in self._active():
+            parts = code.split(None, 2)
+            if body is not None:
+                if parts and parts[0].lower() == ".endmacro":
+                    body = None
+                else:
+                    body.append(code)
+            elif len(parts) >= 2 and parts[1].lower() == ".macro":
+                params = split_args(parts[2]) if len(parts) > 2 else []
+                body = []
+                macros[parts[0].lower()] = (params, body)
+        return macros
+
+    def _expand(self, op: str, operands: str, depth: int = 0) -> list[tuple[str, object]] | None:
+        """("op", mnemonic) and ("data", size) items a statement assembles to, or None if unknown."""
+        op = op.lower()
+        if op.upper() in MNEMONICS:
+            return [("op", op.upper())]
+        if op in (".byte", ".db"):
+            size = 0
+            for arg in split_args(operands):
+                size += string_length(arg) if arg[:1] == '"' and arg[-1:] == '"' else 1
+            return [("data", size)]
+        if op in (".word", ".dw"):
+            return [("data", 2 * len(split_args(operands)))]
+        if op.startswith(".") and op[1:] in self.macros and depth < 8:
+            params, body = self.macros[op[1:]]
+            args = split_args(operands)
+            items: list[tuple[str, object]] = []
+            for line in body:
+                for param, arg in sorted(zip(params, args), key=lambda p: -len(p[0])):
+                    line = line.replace("\\" + param, arg)
+                parts = line.split(None, 1)
+                if not parts:
+                    continue
+                sub = self._expand(parts[0], parts[1] if len(parts) > 1 else "", depth + 1)
+                if sub is None:
+                    return None
+                items += sub
+            return items
+        return None
+
+    def _walk(self) -> None:
+        addr: int | None = None
+        cfa_name: str | None = None
+        in_macro = False
+        for i, code in self._active():
+            if not code.strip():
+                continue
+            parts = code.split(None, 1)
+            if in_macro:
+                in_macro = parts[0].lower() != ".endmacro"
+                continue
+            m = LABEL_RE.match(code)
+            if m:
+                rest = code[m.end():].strip()
+                if rest[:1] == "=" or rest.lower().startswith((".macro", ".equ")):
+                    in_macro = rest.lower().startswith(".macro")
+                    continue
+                known = self.labels.get(m.group(1).lower())
+                if known is None and cfa_name is not None:
+                    known = self.words.get(cfa_name)
+                if known is not None:
+                    if addr is not None and addr != known:
+                        self.lost += 1
+                    addr = known
+                if addr is not None:
+                    self.placed[m.group(1)] = addr
+                cfa_name = None
+                parts = rest.split(None, 1)
+                if not parts:
+                    continue
+            op = parts[0].lower()
+            operands = parts[1] if len(parts) > 1 else ""
+            if op == ".org":
+                addr = parse_number(operands)
+                continue
+            if op == ".end":
+                break
+            if op in (".linkto", ".linkto0"):
+                args = split_args(operands)
+                if len(args) >= 4:
+                    rest = re.sub(r"\\(.)", r"\1", args[4][1:-1])[::-1] if len(args) > 4 else ""
+                    last = args[3][1:-1] if args[3][:1] == "'" else chr(parse_number(args[3]) or 0)
+                    cfa_name = (rest + last).upper()
+            items = self._expand(op, operands)
+            if items is None:
+                addr = None
+                continue
+            if addr is None:
+                continue
+            start = addr
+            for kind, value in items:
+                if kind == "data":
+                    addr += value
+                    continue
+                text, size = i8085.disassemble(self.rom, addr) if addr < len(self.rom) else ("", 0)
+                if text.split(None, 1)[:1] != [value]:
+                    addr = None
+                    self.lost += 1
+                    break
+                addr += size
+            if addr is not None and addr > start and start < len(self.rom):
+                file, line = self.where[i] or ("?", 0)
+                self.starts.append(start)
+                self.rows.append((file, line, code.strip()))
+        order = sorted(range(len(self.starts)), key=self.starts.__getitem__)
+        self.starts = [self.starts[k] for k in order]
+        self.rows = [self.rows[k] for k in order]
+
+    def line_at(self, addr: int) -> tuple[str, int, str] | None:
+        i = bisect.bisect_right(self.starts, addr) - 1
+        if i < 0 or addr >= m100emu.ROM_SIZE:
+            return None
+        return self.rows[i]
+
+# --- Attribution ---------------------------------------------------------------
+
+class Symbolizer:
+    """Names for addresses: the word that owns it, else the nearest label, else the region."""
+
+    def __init__(self, dictionary: Dictionary, labels: dict[str, int] | None = None):
+        self.dictionary = dictionary
+        by_addr = sorted((addr, name) for name, addr in (labels or {}).items() if addr < m100emu.ROM_SIZE)
+        self.label_addrs = [addr for addr, _ in by_addr]
+        self.label_names = [name for _, name in by_addr]
+        self._cache: dict[int, str] = {}
+        self.execute = dictionary.by_name.get("EXECUTE")
+
+    def label_at(self, addr: int) -> str | None:
+        i = bisect.bisect_right(self.label_addrs, addr) - 1
+        return self.label_names[i] if i >= 0 else None
+
+    def name(self, index: int) -> str:
+        """Name for a histogram index (MAIN_BANK + PC for the Main ROM)."""
+        if index >= MAIN_BANK:
+            return "[Main ROM]"
+        name = self._cache.get(index)
+        if name is None:
+            word = self.dictionary.word_at(index)
+            if word is not None:
+                name = word[2]
+            elif index < m100emu.ROM_SIZE:
+                name = self.label_at(index) or "[ROM]"
+            else:
+                name = "[RAM]"
+            self._cache[index] = name
+        return name
+
+    def is_return(self, ip: int, mem) -> bool:
+        """Is ip what ENTER (or DODOES) pushes: the cell after a colon/DOES> word (or EXECUTE) in a thread?"""
+        dictionary = self.dictionary
+        caller = dictionary.word_at((ip - 1) & 0xFFFF)
+        if caller is None or not dictionary.is_colon(caller[0], mem):
+            return False
+        callee = u16(mem, (ip - 2) & 0xFFFF)
+        return callee in dictionary.by_cfa and (dictionary.is_colon(callee, mem) or callee == self.execute)
+
+    def calls(self, ip: int, word: tuple[int, int, str] | None, mem) -> bool:
+        """Does the cell before return address ip call word (directly, as a DOES> word or via EXECUTE)?"""
+        callee = u16(mem, (ip - 2) & 0xFFFF)
+        if word is None or callee in (word[0], self.execute):
+            return True
+        return mem[callee] in (JMP, CALL) and self.dictionary.word_at(u16(mem, callee + 1)) == word
+
+    def stack(self, sample: tuple[bytes, int, int], mem) -> tuple[str, ...]:
+        """Outermost-first frames of one call stack sample.
+
+        The return stack is read from the innermost cell out; a cell is a frame
+        only if it is a return address that calls the word the frame inside it
+        runs, so loop parameters that happen to look like one are skipped.
+        """
+        rs, ip, pc = sample
+        frames = [self.name((ip - 1) & 0xFFFF)]
+        word = self.dictionary.word_at((ip - 1) & 0xFFFF)
+        for k in range(0, len(rs) - 1, 2):
+            cell = rs[k] | rs[k + 1] << 8
+            if self.is_return(cell, mem) and self.calls(cell, word, mem):
+                frames.append(self.name((cell - 1) & 0xFFFF))
+                word = self.dictionary.word_at((cell - 1) & 0xFFFF)
+        frames.reverse()
+        leaf = self.name(pc)
+        if leaf != frames[-1]:
+            frames.append(leaf)
+        return tuple(frames)
+
+class Profile:
+    """Reports from a profiled run."""
+
+    def __init__(self, machine: ProfiledModel100, labels: dict[str, int] | None = None,
+                 src: pathlib.Path | None = None):
+        mem = bytearray(machine.mem)
+        mem[:m100emu.ROM_SIZE] = machine.option_rom     # the Main ROM may be switched in
+        self.dictionary = Dictionary(mem, machine.option_rom)
+        self.sources = None
+        if src is not None:
+            defined = {"phash"} | ({"profiler"} if self.dictionary.nfatocfasz == mforth_dict.NFATOCFASZ_PROFILER
+                                   else set())
+            self.sources = SourceMap(src, machine.option_rom, labels or {}, self.dictionary.by_name, defined)
+            labels = {**self.sources.placed, **(labels or {})}
+        self.symbols = Symbolizer(self.dictionary, labels)
+        self.hist = machine.pc_times()
+        self.calls = machine.calls
+        self.total = sum(self.hist)
+        stacks: collections.Counter = collections.Counter()
+        for sample, t in machine.stacks.items():
+            stacks[self.symbols.stack(sample, mem)] += t
+        self.stacks = stacks
+
+    def words(self) -> list[tuple[str, int, int]]:
+        """(name, T-states, NEXT calls), most expensive first."""
+        times: collections.Counter = collections.Counter()
+        calls: collections.Counter = collections.Counter()
+        for index, t in enumerate(self.hist):
+            if t:
+                times[self.symbols.name(index)] += t
+        for index, n in enumerate(self.calls):
+            if n:
+                calls[self.symbols.name(index)] += n
+        return [(name, t, calls[name]) for name, t in times.most_common()]
+
+    def lines(self) -> list[tuple[str, int]]:
+        """("file:line  text" or "[no source] NAME", T-states), most expensive first."""
+        times: collections.Counter = collections.Counter()
+        for index, t in enumerate(self.hist):
+            if not t:
+                continue
+            row = self.sources.line_at(index) if self.sources and index < MAIN_BANK else None
+            if row is None:
+                key = f"[no source] {self.symbols.name(index)}"
+            else:
+                key = f"src/{row[0]}:{row[1]}  {row[2]}"
+            times[key] += t
+        return times.most_common()
+
+    def callgraph(self) -> list[tuple[str, int, int, list[tuple[str, int]], list[tuple[str, int]]]]:
+        """(word, inclusive, self, callers, callees) from the stack samples, by inclusive time."""
+        inclusive: collections.Counter = collections.Counter()
+        own: collections.Counter = collections.Counter()
+        edges: collections.Counter = collections.Counter()
+        for frames, t in self.stacks.items():
+            for name in set(frames):
+                inclusive[name] += t
+            own[frames[-1]] += t
+            for edge in set(zip(frames, frames[1:])):
+                edges[edge] += t
+        callers: dict[str, list] = collections.defaultdict(list)
+        callees: dict[str, list] = collections.defaultdict(list)
+        for (caller, callee), t in edges.most_common():
+            callers[callee].append((caller, t))
+            callees[caller].append((callee, t))
+        return [(name, t, own[name], callers[name], callees[name]) for name, t in inclusive.most_common()]
+
+    def folded(self) -> list[str]:
+        """flamegraph.pl input; ';' in a word name (e.g. the word ;) is written %3B."""
+        return [f"{';'.join(f.replace(';', '%3B') for f in frames)} {t}" for frames, t in sorted(self.stacks.items())]
+
+def percent(t: int, total: int) -> str:
+    return f"{100.0 * t / total:6.2f}%" if total else "     -"
+
+def print_flat(profile: Profile, top: int, out) -> None:
+    total = profile.total
+    print(f"{'T-states':>12} {'share':>7} {'cumul':>7} {'calls':>9}  word", file=out)
+    cumulative = 0
+    for name, t, calls in profile.words()[:top or None]:
+        cumulative += t
+        print(f"{t:>12} {percent(t, total)} {percent(cumulative, total)} {calls:>9}  {name}", file=out)
+
+def print_lines(profile: Profile, top: int, out) -> None:
+    print(f"{'T-states':>12} {'share':>7}  line", file=out)
+    for key, t in profile.lines()[:top or None]:
+        print(f"{t:>12} {percent(t, profile.total)}  {key}", file=out)
+
+def print_callgraph(profile: Profile, top: int, out) -> None:
+    total = sum(profile.stacks.values())
+    print(f"{'inclusive':>12} {'share':>7} {'self':>12}  word", file=out)
+    for name, t, own, callers, callees in profile.callgraph()[:top or None]:
+        print(f"{t:>12} {percent(t, total)} {own:>12}  {name}", file=out)
+        for caller, ct in callers[:5]:
+            print(f"{'':>34}<- {caller} {ct}", file=out)
+        for callee, ct in callees[:5]:
+            print(f"{'':>34}-> {callee} {ct}", file=out)
+
+def main():
+    ap=argparse.ArgumentParser(description="Profile MFORTH on the emulated Model 100.")
+    ap.add_argument("rom", help="MFORTH ROM image (bin/MFORTH.BX)")
+    ap.add_argument("files", nargs="*", help="Host files to put in RAM as NAME.DO (name from the file stem)")
+    ap.add_argument("-i", "--include", action="append", default=[], metavar="NAME",
+                    help='Type S" NAME" INCLUDED (profiled); may be repeated')
+    ap.add_argument("-e", "--eval", action="append", default=[], metavar="TEXT", help="Type a line of Forth (profiled)")
+    ap.add_argument("--setup", action="append", default=[], metavar="TEXT",
+                    help="Type a line of Forth before profiling starts")
+    ap.add_argument("--workload", choices=[w.name for w in forth_bench.WORKLOADS],
+                    help="Profile the measured line of a forth_bench.py workload (after its setup)")
+    ap.add_argument("--sym", help="The build's .sym or .symidx, to name code outside words and find source lines")
+    ap.add_argument("--src", default=str(ROOT / "src"), help="Source tree the ROM was built from, default %(default)s")
+    ap.add_argument("--no-source", action="store_true", help="Do not read the sources (no labels without --sym)")
+    ap.add_argument("--max-cycles", type=float, default=float("inf"), help="Stop after this many profiled T-states")
+    ap.add_argument("--no-timer", action="store_true", help="Do not raise the 4 ms RST 7.5 interrupt")
+    ap.add_argument("--top", type=int, default=40, help="Rows per report (0 = all), default %(default)s")
+    ap.add_argument("--lines", action="store_true", help="Also report T-states per source line")
+    ap.add_argument("--callgraph", action="store_true", help="Also report the call graph from the stack samples")
+    ap.add_argument("--folded", metavar="FILE", help="Write folded stacks for flamegraph.pl to FILE ('-' = stdout)")
+    args=ap.parse_args()
+
+    rom=pathlib.Path(args.rom).read_bytes()
+    files={p: pathlib.Path(p).read_bytes() for p in args.files}
+    setup=list(args.setup)
+    profiled=[f'S" {name.upper()}" INCLUDED' for name in args.include] + args.eval
+    if args.workload:
+        workload=next(w for w in forth_bench.WORKLOADS if w.name == args.workload)
+        files.update(workload.files)
+        setup+=workload.setup.splitlines()
+        profiled.append(workload.run)
+    if not profiled:
+        raise SystemExit("nothing to profile: give -i, -e or --workload")
+    try:
+        machine=ProfiledModel100(rom, files, timer=not args.no_timer)
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    reason=machine.boot()
+    for line in setup:
+        if reason != "input":
+            break
+        machine.interpret(line)
+        reason=machine.stopped
+    if reason != "input":
+        raise SystemExit(f"forth_profile: stopped before profiling: {reason} {machine.error or ''}".rstrip())
+    start=len(machine.lcd)
+    for line in profiled:
+        machine.type(line + "\n")
+    machine.start_profile()
+    begin=machine.cycles
+    started=time.perf_counter()
+    reason=machine.run(args.max_cycles)
+    elapsed=time.perf_counter() - started
+    machine.profiling=False
+    sys.stderr.write(machine.output(start))
+    print(f"{reason}: {machine.cycles - begin} T-states profiled in {elapsed:.2f} s", file=sys.stderr)
+
+    labels=load_labels(args.sym) if args.sym else None
+    src=None if args.no_source else pathlib.Path(args.src)
+    if src is not None and not (src / "main.asm").exists():
+        raise SystemExit(f"{src}/main.asm not found (--src)")
+    if args.lines and src is None:
+        raise SystemExit("--lines needs the sources")
+    profile=Profile(machine, labels, src)
+
+    print_flat(profile, args.top, sys.stdout)
+    if args.lines:
+        print(file=sys.stdout)
+        print_lines(profile, args.top, sys.stdout)
+    if args.callgraph:
+        print(file=sys.stdout)
+        print_callgraph(profile, args.top, sys.stdout)
+    if args.folded:
+        text="\n".join(profile.folded()) + "\n"
+        if args.folded == "-":
+            sys.stdout.write(text)
+        else:
+            pathlib.Path(args.folded).write_text(text)
+    return 1 if reason == "error" else 0
+
+if __name__=="__main__":
+    sys.exit(main())
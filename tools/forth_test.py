@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Run MFORTH's Forth tests (test/*.fs, written for tester.fs) in parallel on
+emulated Model 100s (m100emu.py) and report the results as text, JUnit XML
+and/or JSON.
+
+Every test file gets its own machine in a process pool, booted and with
+tester.fs included, and is run one of two ways:
+
+  --per group   (default) the file is typed line by line; each T{ ... }T group
+                is a test case with its own T-states and time.  The machine
+                is rolled back to before a line that hangs or stops the
+                emulator, so the rest of the file still runs; after an
+                abort it carries on as MFORTH left it, like a real session.
+  --per file    S" NAME" INCLUDED, as MFORTH reads files: the whole file is
+                one test case.
+
+A case fails when tester.fs's ERROR reports it (INCORRECT RESULT / WRONG
+NUMBER OF RESULTS, followed by the SOURCE line it failed on) and is an error
+when MFORTH aborts on it (e.g. "FOO ?"), it takes more than --max-cycles
+T-states or --timeout seconds, or the emulator stops.  A worker process that
+dies only costs the file it was running.  Typed lines must fit the
+80-character TIB and see SOURCE-ID 0; --per file has neither limit but needs
+the file to fit in RAM next to MFORTH.
+
+    forth_test.py bin/MFORTH.BX [TEST.fs ...] [--per group|file] [-j N] [--junit FILE] [--json FILE]
+"""
+from __future__ import annotations
+import argparse, json, pathlib, re, sys, time, traceback
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import NamedTuple
+
+import m100emu
+from jobs import job_count
+
+TEST_DIR = pathlib.Path(__file__).resolve().parent.parent / "test"
+TIMEOUT = 300.0
+SLICE_CYCLES = 10_000_000       # T-states run between wall-clock checks
+STATE = 0xFCDE                  # tickstate (altbgn + 30 in src/main.asm)
+
+ERROR_RE = re.compile(r"(INCORRECT RESULT|WRONG NUMBER OF RESULTS): ?(.*)")
+
+class Case(NamedTuple):
+    name: str
+    line: int                   # first line of the case in the test file, 0 for the whole file
+    status: str                 # "passed", "failed" or "error"
+    message: str = ""
+    tstates: int = 0
+    seconds: float = 0.0
+
+class FileResult(NamedTuple):
+    name: str
+    cases: list[Case]
+    tstates: int = 0
+    seconds: float = 0.0
+
+class Stopped(Exception):
+    """MFORTH did not come back to the keyboard: it hung, ran out of time or the emulator stopped."""
+
+def groups(lines: list[str]) -> dict[int, int]:
+    """First line index -> last line index of every T{ ... }T group (a group may span lines)."""
+    spans, first = {}, None
+    for i, line in enumerate(lines):
+        words = line.split()
+        if first is None and "T{" in words and words[0] != "\\":
+            first = i
+        if first is not None and "}T" in words:
+            spans[first] = i
+            first = None
+    if first is not None:
+        spans[first] = len(lines) - 1
+    return spans
+
+def tester_errors(out: str) -> list[str]:
+    """ "INCORRECT RESULT: <source line>" and the like, for every failure tester.fs's ERROR printed."""
+    return [f"{m[1]}: {m[2].strip()}" for m in ERROR_RE.finditer(out)]
+
+def last_line(out: str) -> str:
+    return (out.strip().splitlines() or [""])[-1]
+
+def run_line(machine: m100emu.Model100, text: str, max_cycles: float, timeout: float) -> str:
+    """Type text and run until MFORTH waits for the keyboard again; returns the output."""
+    start, cycles, started = len(machine.lcd), machine.cycles, time.perf_counter()
+    machine.type(text if text.endswith("\n") else text + "\n")
+    while True:
+        reason = machine.run(min(SLICE_CYCLES, max_cycles - (machine.cycles - cycles)))
+        if reason == "input":
+            return machine.output(start)
+        if reason == "error":
+            raise Stopped(f"{machine.error} (PC {machine.pc:04X})")
+        if reason != "cycles":
+            raise Stopped(f"MFORTH stopped ({reason}): {last_line(machine.output(start))}")
+        if machine.cycles - cycles >= max_cycles:
+            raise Stopped(f"no result after {max_cycles:.0f} T-states")
+        if time.perf_counter() - started >= timeout:
+            raise Stopped(f"no result after {timeout:g} s")
+
+def start_machine(rom: bytes, files: dict[str, str], max_cycles: float, timeout: float) -> m100emu.Model100:
+    """A Model 100 at the MFORTH prompt with tester.fs (files["TESTER"]) included."""
+    machine = m100emu.Model100(rom, files)
+    if machine.boot(max_cycles) != "input":
+        raise Stopped(f"MFORTH did not reach the prompt ({machine.stopped})")
+    out = run_line(machine, 'S" TESTER" INCLUDED', max_cycles, timeout)
+    if not out.rstrip().endswith("ok"):
+        raise Stopped(f"tester.fs did not load: {last_line(out)}")
+    return machine
+
+def run_groups(rom: bytes, tester: str, name: str, text: str, max_cycles: float,
+               timeout: float) -> tuple[list[Case], int]:
+    """The file typed line by line: one case per T{ ... }T group, plus any other line that went wrong."""
+    machine = start_machine(rom, {"TESTER": tester}, max_cycles, timeout)
+    lines = text.splitlines()
+    spans = groups(lines)
+    cases = []
+    i = 0
+    while i < len(lines):
+        last = spans.get(i, i)
+        state, cycles, started = machine.snapshot(), machine.cycles, time.perf_counter()
+        problems, status, stopped = [], "passed", False
+        try:
+            for j in range(i, last + 1):
+                words = lines[j].split()
+                if not words or words[0] == "\\":
+                    continue
+                if len(lines[j]) >= m100emu.TIB_SIZE:
+                    raise Stopped(f"line {j + 1} does not fit the {m100emu.TIB_SIZE}-character TIB; use --per file")
+                out = run_line(machine, lines[j], max_cycles, timeout)
+                errors = tester_errors(out)
+                if errors:
+                    problems += errors
+                    status = "failed"
+                elif not out.rstrip().endswith("ok") and not machine.mem[STATE] | machine.mem[STATE + 1]:
+                    problems.append(f"aborted: {last_line(out)}")    # not just a definition left open;
+                    status = "error"                                 # MFORTH has recovered like a real session
+                    break
+        except Stopped as e:
+            problems.append(str(e))
+            status, stopped = "error", True
+        tstates, seconds = machine.cycles - cycles, time.perf_counter() - started
+        if stopped:
+            machine.restore(state)
+        if i in spans or status != "passed":
+            label = lines[i].strip() if i in spans else f"line {i + 1}"
+            cases.append(Case(label, i + 1, status, "\n".join(problems), tstates, seconds))
+        i = last + 1
+    return cases, machine.cycles
+
+def run_file(rom: bytes, tester: str, name: str, text: str, max_cycles: float,
+             timeout: float) -> tuple[list[Case], int]:
+    """The file INCLUDED in one go: a single case."""
+    machine = start_machine(rom, {"TESTER": tester, "TEST": text}, max_cycles, timeout)
+    cycles, started = machine.cycles, time.perf_counter()
+    try:
+        out = run_line(machine, 'S" TEST" INCLUDED', max_cycles, timeout)
+    except Stopped as e:
+        return [Case(name, 0, "error", str(e), machine.cycles - cycles, time.perf_counter() - started)], machine.cycles
+    problems = tester_errors(out)
+    status = "failed" if problems else "passed"
+    if not out.rstrip().endswith("ok"):
+        problems.append(f"aborted: {last_line(out)}")
+        status = "error"
+    return [Case(name, 0, status, "\n".join(problems), machine.cycles - cycles,
+                 time.perf_counter() - started)], machine.cycles
+
+RUNNERS = {"group": run_groups, "file": run_file}
+
+def _run_worker(task: tuple) -> FileResult:
+    rom, tester, path, per, max_cycles, timeout = task
+    name = pathlib.Path(path).name
+    started = time.perf_counter()
+    try:
+        text = pathlib.Path(path).read_text(encoding="latin-1")
+        cases, tstates = RUNNERS[per](rom, tester, name, text, max_cycles, timeout)
+    except (Stopped, ValueError, OSError) as e:
+        cases, tstates = [Case(name, 0, "error", str(e))], 0
+    except Exception:
+        cases, tstates = [Case(name, 0, "error", traceback.format_exc())], 0
+    return FileResult(name, cases, tstates, time.perf_counter() - started)
+
+def _run_alone(task: tuple) -> FileResult:
+    """task in a process of its own, so that a crash is reported against this file only."""
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        try:
+            return pool.submit(_run_worker, task).result()
+        except BrokenProcessPool:
+            name = pathlib.Path(task[2]).name
+            return FileResult(name, [Case(name, 0, "error", "the worker process died")])
+
+def run_all(rom: bytes, tester: str, paths: list[str], per: str = "group", jobs: int = 1,
+            max_cycles: float = m100emu.MAX_CYCLES, timeout: float = TIMEOUT) -> list[FileResult]:
+    """One FileResult per test file, in the order of paths."""
+    tasks = [(rom, tester, path, per, max_cycles, timeout) for path in paths]
+    if jobs <= 1 or len(tasks) <= 1:
+        return list(map(_run_worker, tasks))
+    results: dict[str, FileResult] = {}
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        futures = [(task[2], pool.submit(_run_worker, task)) for task in tasks]
+        for path, future in futures:
+            try:
+                results[path] = future.result()
+            except BrokenProcessPool:
+                pass
+    # A process that dies breaks the whole pool: rerun what did not finish one file per process.
+    return [results.get(task[2]) or _run_alone(task) for task in tasks]
+
+def counts(cases: list[Case]) -> dict[str, int]:
+    return {status: sum(c.status == status for c in cases) for status in ("passed", "failed", "error")}
+
+def junit(results: list[FileResult]) -> ET.ElementTree:
+    every = [c for r in results for c in r.cases]
+    total = counts(every)
+    root = ET.Element("testsuites", name="MFORTH", tests=str(len(every)), failures=str(total["failed"]),
+                      errors=str(total["error"]), time=f"{sum(r.seconds for r in results):.3f}")
+    for result in results:
+        n = counts(result.cases)
+        suite = ET.SubElement(root, "testsuite", name=result.name, tests=str(len(result.cases)),
+                              failures=str(n["failed"]), errors=str(n["error"]), time=f"{result.seconds:.3f}")
+        for case in result.cases:
+            name = f"{case.line}: {case.name}" if case.line else case.name
+            element = ET.SubElement(suite, "testcase", classname=pathlib.PurePath(result.name).stem, name=name,
+                                    time=f"{case.seconds:.3f}")
+            if case.status != "passed":
+                tag = "failure" if case.status == "failed" else "error"
+                ET.SubElement(element, tag, message=case.message.splitlines()[0] if case.message else tag).text = \
+                    case.message
+    ET.indent(root)
+    return ET.ElementTree(root)
+
+def report(results: list[FileResult], per: str) -> dict:
+    every = [c for r in results for c in r.cases]
+    return {"per": per, "clock_hz": m100emu.CLOCK_HZ, "summary": {"tests": len(every), **counts(every)},
+            "files": [{"name": r.name, "tstates": r.tstates, "seconds": round(r.seconds, 3), **counts(r.cases),
+                       "cases": [{**c._asdict(), "seconds": round(c.seconds, 3)} for c in r.cases]}
+                      for r in results]}
+
+def default_tests() -> list[str]:
+    return [str(p) for p in sorted(TEST_DIR.glob("*.fs")) if p.name != "tester.fs"]
+
+def main():
+    ap=argparse.ArgumentParser(description="Run MFORTH's tester.fs tests in parallel on emulated Model 100s.")
+    ap.add_argument("rom", help="MFORTH ROM image (bin/MFORTH.BX)")
+    ap.add_argument("tests", nargs="*", help="Test files, default test/*.fs except tester.fs")
+    ap.add_argument("--tester", default=str(TEST_DIR / "tester.fs"), help="tester.fs to include first, default %(default)s")
+    ap.add_argument("--per", choices=sorted(RUNNERS), default="group",
+                    help="One test case per T{ ... }T group (typed) or per file (INCLUDED), default %(default)s")
+    ap.add_argument("-j", "--jobs", type=job_count, default=0, help="Worker processes (0 = one per CPU)")
+    ap.add_argument("--max-cycles", type=float, default=m100emu.MAX_CYCLES,
+                    help="T-states a typed line (--per group) or a file (--per file) may take, default %(default).0f")
+    ap.add_argument("--timeout", type=float, default=TIMEOUT,
+                    help="Seconds a typed line or a file may take, default %(default)g")
+    ap.add_argument("--junit", metavar="FILE", help="Write a JUnit XML report to FILE")
+    ap.add_argument("--json", metavar="FILE", help="Write a JSON report to FILE")
+    args=ap.parse_args()
+
+    rom=pathlib.Path(args.rom).read_bytes()
+    tester=pathlib.Path(args.tester).read_text(encoding="latin-1")
+    paths=args.tests or default_tests()
+    if not paths:
+        raise SystemExit("no test files")
+    started=time.perf_counter()
+    results=run_all(rom, tester, paths, args.per, args.jobs, args.max_cycles, args.timeout)
+    elapsed=time.perf_counter() - started
+
+    if args.junit:
+        junit(results).write(args.junit, encoding="utf-8", xml_declaration=True)
+    if args.json:
+        pathlib.Path(args.json).write_text(json.dumps(report(results, args.per), indent=2) + "\n")
+
+    print(f"{'file':<16}{'passed':>8}{'failed':>8}{'errors':>8}{'T-states':>14}{'s':>8}")
+    for result in results:
+        n=counts(result.cases)
+        print(f"{result.name:<16}{n['passed']:>8}{n['failed']:>8}{n['error']:>8}{result.tstates:>14}"
+              f"{result.seconds:>8.1f}")
+    for result in results:
+        for case in result.cases:
+            if case.status != "passed":
+                where=f"{result.name}:{case.line}" if case.line else result.name
+                for line in case.message.splitlines() or [case.status]:
+                    print(f"{where}: {case.status}: {line}")
+    total=counts([c for r in results for c in r.cases])
+    print(f"{total['passed']} passed, {total['failed']} failed, {total['error']} errors in {len(results)} file(s), "
+          f"{elapsed:.1f} s")
+    return 1 if total["failed"] or total["error"] else 0
+
+if __name__=="__main__":
+    sys.exit(main())
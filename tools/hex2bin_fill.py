@@ -2,53 +2,134 @@
 """
 Convert an Intel HEX file to a fixed-size binary image, filling gaps with a chosen value.
 MFORTH expects a 32 KiB ROM (0x8000 bytes). ToolLib.ROM reads exactly 32768 bytes. (repo source)
+
+The HEX file is parsed once (checksums verified, record types 00-05) and any number of
+images can be cut from it: the fixed-size ROM, raw address ranges and a Model 100 .CO
+load image (6-byte header: load address, length, exec address; little endian).
 """
 from __future__ import annotations
-import argparse, pathlib, sys, re
+import argparse, binascii, pathlib, sys
+
+class HexError(ValueError):
+    pass
+
+class HexImage:
+    """Data segments and start address decoded from one Intel HEX file."""
+    def __init__(self):
+        self.segments: list[tuple[int, bytes]] = []   # (absolute address, data) in file order
+        self.start: int | None = None                 # from a type 03/05 record
 
-def parse_hex_line(line: str):
+    def span(self) -> tuple[int, int]:
+        if not self.segments:
+            return 0, 0
+        return min(a for a, _ in self.segments), max(a+len(d) for a, d in self.segments)
+
+    def render(self, base: int, size: int, fill: int = 0, strict: bool = False) -> bytearray:
+        """Return size bytes starting at base; with strict, data outside the window is an error."""
+        mem=bytearray(bytes((fill & 0xFF,)))*size
+        view=memoryview(mem)
+        end=base+size
+        for a, data in self.segments:
+            lo=max(a, base); hi=min(a+len(data), end)
+            if strict and (lo!=a or hi!=a+len(data)):
+                raise HexError(f"HEX record writes beyond size: addr=0x{a:X} len={len(data)} size={size}")
+            if lo<hi:
+                view[lo-base:hi-base]=data[lo-a:hi-a]
+        return mem
+
+def parse_hex_line(line: str | bytes):
     line=line.strip()
-    if not line or not line.startswith(':'):
+    if not line or line[:1] not in (':', b':'):
         return None
-    b=bytes.fromhex(line[1:])
+    try:
+        b=binascii.a2b_hex(line[1:])
+    except (binascii.Error, ValueError) as e:
+        raise HexError(f"bad hex digits ({e})") from None
+    if len(b)<5 or len(b)!=b[0]+5:
+        raise HexError(f"record length {len(b)} does not match byte count {b[0] if b else 0}")
+    if sum(b) & 0xFF:
+        raise HexError(f"checksum mismatch (got 0x{b[-1]:02X}, expected 0x{(-sum(b[:-1])) & 0xFF:02X})")
     ln=b[0]
     addr=(b[1]<<8)|b[2]
     rectype=b[3]
     data=b[4:4+ln]
-    # checksum ignored (last byte)
     return ln, addr, rectype, data
 
+def parse_hex(text: bytes, name: str = "<hex>") -> HexImage:
+    img=HexImage()
+    upper=0
+    for lineno, line in enumerate(text.splitlines(), 1):
+        try:
+            rec=parse_hex_line(line)
+        except HexError as e:
+            raise HexError(f"{name}:{lineno}: {e}") from None
+        if not rec:
+            continue
+        ln, addr, rectype, data = rec
+        if rectype==0x00:   # data
+            img.segments.append((upper+addr, data))
+        elif rectype==0x01: # EOF
+            break
+        elif rectype in (0x02, 0x04) and ln==2: # extended segment / linear address
+            upper=((data[0]<<8)|data[1]) << (4 if rectype==0x02 else 16)
+        elif rectype==0x03 and ln==4: # start segment address (CS:IP)
+            img.start=(((data[0]<<8)|data[1])<<4)+((data[2]<<8)|data[3])
+        elif rectype==0x05 and ln==4: # start linear address
+            img.start=int.from_bytes(data, 'big')
+        else:
+            raise HexError(f"{name}:{lineno}: unsupported record type 0x{rectype:02X} (length {ln})")
+    return img
+
+def co_image(img: HexImage, lo: int, hi: int, exec_addr: int | None, fill: int) -> bytearray:
+    if not 0<=lo<hi<=0x10000:
+        raise HexError(f".CO range 0x{lo:X}-0x{hi:X} is outside the 64K address space")
+    if exec_addr is None:
+        exec_addr=img.start if img.start is not None else lo
+    out=bytearray(6)
+    out[0:2]=lo.to_bytes(2,'little'); out[2:4]=(hi-lo).to_bytes(2,'little'); out[4:6]=(exec_addr & 0xFFFF).to_bytes(2,'little')
+    return out+img.render(lo, hi-lo, fill)
+
+def parse_range(text: str) -> tuple[int, int]:
+    start, _, end = text.partition(':')
+    lo=int(start,0); hi=int(end,0)
+    if hi<=lo:
+        raise argparse.ArgumentTypeError(f"empty range {text} (use START:END, END exclusive)")
+    return lo, hi
+
 def main():
     ap=argparse.ArgumentParser()
     ap.add_argument("hex", help="Input .hex (Intel HEX)")
-    ap.add_argument("bin", help="Output .bin")
+    ap.add_argument("bin", nargs="?", help="Output .bin/.BX (fixed-size image from address 0)")
     ap.add_argument("--size", default="0x8000", help="Output size, default 0x8000")
     ap.add_argument("--fill", default="0x00", help="Fill byte for gaps, default 0x00")
+    ap.add_argument("--range", nargs=2, action="append", default=[], metavar=("START:END", "OUT"),
+                    help="Also write the raw bytes START..END-1 to OUT (repeatable)")
+    ap.add_argument("--co", metavar="OUT", help="Also write a Model 100 .CO load image")
+    ap.add_argument("--co-range", type=parse_range, metavar="START:END",
+                    help=".CO load range, default: the span of the HEX data")
+    ap.add_argument("--exec", dest="exec_addr", type=lambda s: int(s,0),
+                    help=".CO exec address, default: HEX start address or load address")
     args=ap.parse_args()
     size=int(args.size,0)
     fill=int(args.fill,0) & 0xFF
 
-    mem=bytearray([fill]*size)
-    upper=0
-    with open(args.hex,'r',encoding='utf-8',errors='ignore') as f:
-        for line in f:
-            rec=parse_hex_line(line)
-            if not rec: 
-                continue
-            ln, addr, rectype, data = rec
-            if rectype==0x00: # data
-                a=upper+addr
-                if a+ln>size:
-                    raise SystemExit(f"HEX record writes beyond size: addr=0x{a:X} len={ln} size={size}")
-                mem[a:a+ln]=data
-            elif rectype==0x01: # EOF
-                break
-            elif rectype==0x04: # extended linear address
-                upper=((data[0]<<8)|data[1])<<16
-            else:
-                # ignore other types
-                pass
-    pathlib.Path(args.bin).write_bytes(mem)
+    try:
+        img=parse_hex(pathlib.Path(args.hex).read_bytes(), args.hex)
+        outputs=[]
+        if args.bin:
+            outputs.append((args.bin, img.render(0, size, fill, strict=True)))
+        for spec, out in args.range:
+            lo, hi = parse_range(spec)
+            outputs.append((out, img.render(lo, hi-lo, fill)))
+        if args.co:
+            lo, hi = args.co_range or img.span()
+            outputs.append((args.co, co_image(img, lo, hi, args.exec_addr, fill)))
+    except (HexError, argparse.ArgumentTypeError) as e:
+        raise SystemExit(str(e))
+    if not outputs:
+        ap.error("nothing to write: give an output .bin, --range or --co")
+    for out, data in outputs:
+        pathlib.Path(out).write_bytes(data)
 
 if __name__=="__main__":
     main()
@@ -0,0 +1,607 @@
+#!/usr/bin/env python3
+"""
+Table-driven Intel 8085 core with exact T-state counts.
+
+OPS holds one Op per opcode: its mnemonic, size, base T-states and the Python
+statements that execute it.  The statements work on the registers A B C D E H L
+F SP PC as plain names, on M (the 64 KiB memory) and on the operands n/nn;
+a conditional instruction adds its extra T-states to T.  CPU compiles every
+entry into a handler once (per write-protect boundary) and runs them from a
+256-entry table, so adding or fixing an instruction is a one-line change here.
+
+With cache=True the CPU instead compiles the code it reaches into regions:
+the basic blocks reachable from an entry point through jumps and calls with
+constant targets, as one function with the operands folded in and the
+registers kept in locals.  Regions are cached by entry address: below
+rom_top per ROM image (select_rom), above it until a write lands on one of
+their bytes.  Cycle counts and interrupt timing are the same as instruction
+by instruction.
+
+The undocumented 8085 instructions MFORTH assembles as raw bytes are included
+(DSUB, ARHL, RDEL, LDHI "LDEH", LDSI "LDES", RSTV, SHLX, JNK, LHLX, JK).  F keeps
+the 8085 layout S Z K AC 0 P V CY: V is set by 8-bit add/subtract/compare and
+DSUB overflow, K by INX/DCX wrapping around (the JK/JNK condition).
+
+    cpu = CPU(rom_top=0x8000, cache=True)   # writes below 8000H are ignored (ROM)
+    cpu.mem[0:len(image)] = image
+    cpu.run(1000000)                        # T-states; returns why it stopped
+
+Subclasses supply the machine: port_in/port_out, on_halt (HLT executed) and
+on_event (called when cycles reaches next_event, e.g. a timer interrupt).
+Run as a script to disassemble: i8085.py IMAGE [START [COUNT]]
+"""
+from __future__ import annotations
+import argparse, functools, pathlib, re, sys
+from typing import NamedTuple
+
+S_FLAG, Z_FLAG, K_FLAG, AC_FLAG, P_FLAG, V_FLAG, CY_FLAG = 0x80, 0x40, 0x20, 0x10, 0x04, 0x02, 0x01
+
+# S, Z and P for every byte value.
+SZP = [(v & 0x80) | (0 if v else 0x40) | (0 if bin(v).count("1") & 1 else 0x04) for v in range(256)]
+
+REGS = ("B", "C", "D", "E", "H", "L", "M", "A")
+PAIRS = (("B", "C"), ("D", "E"), ("H", "L"))
+PAIR_NAMES = ("B", "D", "H", "SP")
+CONDITIONS = (("NZ", "not F & 64"), ("Z", "F & 64"), ("NC", "not F & 1"), ("C", "F & 1"),
+              ("PO", "not F & 4"), ("PE", "F & 4"), ("P", "not F & 128"), ("M", "F & 128"))
+REGISTER_NAMES = ("A", "B", "C", "D", "E", "H", "L", "F", "SP", "PC")
+
+class Op(NamedTuple):
+    mnemonic: str   # "MVI A,n" / "JMP nn": n and nn stand for the operand bytes
+    size: int
+    cycles: int     # T-states; conditional instructions add the rest to T when taken
+    code: str
+    flow: bool      # may change PC other than by falling through, or touches I/O/interrupts
+
+def write(addr: str, value: str) -> str:
+    """Statements storing value at addr; the write-protect test is filled in per CPU."""
+    return f"_w = {addr}\nif _w >= ROM_TOP: M[_w] = {value}"
+
+def push(hi: str, lo: str) -> str:
+    return "\n".join(("SP = (SP - 2) & 0xFFFF", write("(SP + 1) & 0xFFFF", hi), write("SP", lo)))
+
+POP_WORD = "_v = M[SP] | (M[(SP + 1) & 0xFFFF] << 8)\nSP = (SP + 2) & 0xFFFF"
+
+def _indent(code: str) -> str:
+    return "\n".join("    " + line for line in code.splitlines())
+
+def _when(cond: str, code: str, extra: int) -> str:
+    return f"if {cond}:\n{_indent(code)}\n    T += {extra}"
+
+def _get(r: int) -> str:
+    return "M[(H << 8) | L]" if r == 6 else REGS[r]
+
+def _set(r: int, value: str) -> str:
+    return write("(H << 8) | L", value) if r == 6 else f"{REGS[r]} = {value}"
+
+def _pair(p: int) -> str:
+    return "SP" if p == 3 else f"(({PAIRS[p][0]} << 8) | {PAIRS[p][1]})"
+
+def _set_pair(p: int, value: str) -> str:
+    if p == 3:
+        return f"SP = {value}"
+    hi, lo = PAIRS[p]
+    return f"_v = {value}\n{hi} = _v >> 8\n{lo} = _v & 255"
+
+def _alu(kind: int, v: str) -> str:
+    if kind in (0, 1):      # ADD, ADC
+        carry = " + (F & 1)" if kind else ""
+        return (f"_v = {v}\n_r = A + _v{carry}\n"
+                "F = SZP[_r & 255] | (_r >> 8) | ((A ^ _v ^ _r) & 16) | (((A ^ _r) & (_v ^ _r) & 128) >> 6)\n"
+                "A = _r & 255")
+    if kind in (2, 3, 7):   # SUB, SBB, CMP
+        borrow = " - (F & 1)" if kind == 3 else ""
+        code = (f"_v = {v}\n_r = A - _v{borrow}\n"
+                "F = SZP[_r & 255] | ((_r >> 8) & 1) | (~(A ^ _v ^ _r) & 16) | (((A ^ _v) & (A ^ _r) & 128) >> 6)")
+        return code if kind == 7 else code + "\nA = _r & 255"
+    op = {4: "&", 5: "^", 6: "|"}[kind]
+    return f"A {op}= {v}\nF = SZP[A]" + (" | 16" if kind == 4 else "")
+
+ALU_NAMES = ("ADD", "ADC", "SUB", "SBB", "ANA", "XRA", "ORA", "CMP")
+ALU_IMMEDIATE = ("ADI", "ACI", "SUI", "SBI", "ANI", "XRI", "ORI", "CPI")
+
+def _table() -> list[Op]:
+    ops: list[Op | None] = [None] * 256
+
+    def op(code_byte, mnemonic, size, cycles, code, flow=False):
+        assert ops[code_byte] is None, hex(code_byte)
+        ops[code_byte] = Op(mnemonic, size, cycles, code, flow)
+
+    for d in range(8):
+        for s in range(8):
+            if d == 6 and s == 6:
+                continue
+            op(0x40 | d << 3 | s, f"MOV {REGS[d]},{REGS[s]}", 1, 7 if 6 in (d, s) else 4, _set(d, _get(s)))
+        op(0x06 | d << 3, f"MVI {REGS[d]},n", 2, 10 if d == 6 else 7, _set(d, "n"))
+        if d == 6:
+            op(0x34, "INR M", 1, 10, "_a = (H << 8) | L\n_r = (M[_a] + 1) & 255\n"
+               "F = (F & 1) | SZP[_r] | (0 if _r & 15 else 16)\n" + write("_a", "_r"))
+            op(0x35, "DCR M", 1, 10, "_a = (H << 8) | L\n_r = (M[_a] - 1) & 255\n"
+               "F = (F & 1) | SZP[_r] | (0 if (_r & 15) == 15 else 16)\n" + write("_a", "_r"))
+        else:
+            r = REGS[d]
+            op(0x04 | d << 3, f"INR {r}", 1, 4, f"{r} = ({r} + 1) & 255\nF = (F & 1) | SZP[{r}] | (0 if {r} & 15 else 16)")
+            op(0x05 | d << 3, f"DCR {r}", 1, 4,
+               f"{r} = ({r} - 1) & 255\nF = (F & 1) | SZP[{r}] | (0 if ({r} & 15) == 15 else 16)")
+        for kind in range(8):
+            op(0x80 | kind << 3 | d, f"{ALU_NAMES[kind]} {REGS[d]}", 1, 7 if d == 6 else 4, _alu(kind, _get(d)))
+        op(0xC6 | d << 3, f"{ALU_IMMEDIATE[d]} n", 2, 7, _alu(d, "n"))
+
+    for p in range(4):
+        name = PAIR_NAMES[p]
+        op(0x01 | p << 4, f"LXI {name},nn", 3, 10, _set_pair(p, "nn"))
+        # _set_pair leaves the new value in _v (SP is its own value).
+        value = "SP" if p == 3 else "_v"
+        op(0x03 | p << 4, f"INX {name}", 1, 6,
+           _set_pair(p, f"({_pair(p)} + 1) & 0xFFFF") + f"\nF = (F & 223) | (0 if {value} else 32)")
+        op(0x0B | p << 4, f"DCX {name}", 1, 6,
+           _set_pair(p, f"({_pair(p)} - 1) & 0xFFFF") + f"\nF = (F & 223) | (32 if {value} == 0xFFFF else 0)")
+        op(0x09 | p << 4, f"DAD {name}", 1, 10,
+           f"_r = ((H << 8) | L) + {_pair(p)}\nF = (F & 254) | (_r >> 16)\nH = (_r >> 8) & 255\nL = _r & 255")
+        if p < 3:
+            hi, lo = PAIRS[p]
+            op(0xC5 | p << 4, f"PUSH {name}", 1, 12, push(hi, lo))
+            op(0xC1 | p << 4, f"POP {name}", 1, 10, f"{lo} = M[SP]\n{hi} = M[(SP + 1) & 0xFFFF]\nSP = (SP + 2) & 0xFFFF")
+    op(0xF5, "PUSH PSW", 1, 12, push("A", "F"))
+    op(0xF1, "POP PSW", 1, 10, "F = M[SP]\nA = M[(SP + 1) & 0xFFFF]\nSP = (SP + 2) & 0xFFFF")
+
+    op(0x02, "STAX B", 1, 7, write("(B << 8) | C", "A"))
+    op(0x12, "STAX D", 1, 7, write("(D << 8) | E", "A"))
+    op(0x0A, "LDAX B", 1, 7, "A = M[(B << 8) | C]")
+    op(0x1A, "LDAX D", 1, 7, "A = M[(D << 8) | E]")
+    op(0x22, "SHLD nn", 3, 16, write("nn", "L") + "\n" + write("(nn + 1) & 0xFFFF", "H"))
+    op(0x2A, "LHLD nn", 3, 16, "L = M[nn]\nH = M[(nn + 1) & 0xFFFF]")
+    op(0x32, "STA nn", 3, 13, write("nn", "A"))
+    op(0x3A, "LDA nn", 3, 13, "A = M[nn]")
+
+    op(0x00, "NOP", 1, 4, "")
+    op(0x07, "RLC", 1, 4, "F = (F & 254) | (A >> 7)\nA = ((A << 1) | (A >> 7)) & 255")
+    op(0x0F, "RRC", 1, 4, "F = (F & 254) | (A & 1)\nA = (A >> 1) | ((A & 1) << 7)")
+    op(0x17, "RAL", 1, 4, "_c = A >> 7\nA = ((A << 1) | (F & 1)) & 255\nF = (F & 254) | _c")
+    op(0x1F, "RAR", 1, 4, "_c = A & 1\nA = (A >> 1) | ((F & 1) << 7)\nF = (F & 254) | _c")
+    op(0x27, "DAA", 1, 4, "_c = F & 1\n_v = 6 if (A & 15) > 9 or F & 16 else 0\n"
+       "if A > 0x99 or _c:\n    _v |= 0x60\n    _c = 1\n"
+       "_r = A + _v\nF = SZP[_r & 255] | _c | ((A ^ _v ^ _r) & 16)\nA = _r & 255")
+    op(0x2F, "CMA", 1, 4, "A ^= 255")
+    op(0x37, "STC", 1, 4, "F |= 1")
+    op(0x3F, "CMC", 1, 4, "F ^= 1")
+    op(0x20, "RIM", 1, 4, "A = s.rim()")
+    op(0x30, "SIM", 1, 4, "s.sim(A)", flow=True)
+    op(0x76, "HLT", 1, 5, "s.halted = True\ns.limit = 0", flow=True)
+    op(0xF3, "DI", 1, 4, "s.ie = False", flow=True)
+    op(0xFB, "EI", 1, 4, "s.ie = True\ns.limit = 0", flow=True)
+    op(0xD3, "OUT n", 2, 10, "s.port_out(n, A)", flow=True)
+    op(0xDB, "IN n", 2, 10, "A = s.port_in(n)", flow=True)
+
+    op(0xC3, "JMP nn", 3, 10, "PC = nn", flow=True)
+    op(0xCD, "CALL nn", 3, 18, push("PC >> 8", "PC & 255") + "\nPC = nn", flow=True)
+    op(0xC9, "RET", 1, 10, POP_WORD + "\nPC = _v", flow=True)
+    for i, (name, cond) in enumerate(CONDITIONS):
+        op(0xC2 | i << 3, f"J{name} nn", 3, 7, _when(cond, "PC = nn", 3), flow=True)
+        op(0xC4 | i << 3, f"C{name} nn", 3, 9, _when(cond, push("PC >> 8", "PC & 255") + "\nPC = nn", 9), flow=True)
+        op(0xC0 | i << 3, f"R{name}", 1, 6, _when(cond, POP_WORD + "\nPC = _v", 6), flow=True)
+        op(0xC7 | i << 3, f"RST {i}", 1, 12, push("PC >> 8", "PC & 255") + f"\nPC = {i * 8}", flow=True)
+    op(0xE9, "PCHL", 1, 6, "PC = (H << 8) | L", flow=True)
+    op(0xF9, "SPHL", 1, 6, "SP = (H << 8) | L")
+    op(0xE3, "XTHL", 1, 16, "_l = M[SP]\n_h = M[(SP + 1) & 0xFFFF]\n" + write("SP", "L") + "\n"
+       + write("(SP + 1) & 0xFFFF", "H") + "\nL = _l\nH = _h")
+    op(0xEB, "XCHG", 1, 4, "_v = D\nD = H\nH = _v\n_v = E\nE = L\nL = _v")
+
+    # Undocumented 8085 instructions.
+    op(0x08, "DSUB", 1, 10, "_h = (H << 8) | L\n_v = (B << 8) | C\n_r = _h - _v\n"
+       "F = (SZP[_r & 255] & 4) | ((_r >> 8) & 128) | (0 if _r & 0xFFFF else 64) | ((_r >> 16) & 1)"
+       " | (((_h ^ _v) & (_h ^ _r) & 0x8000) >> 14)\n"
+       "H = (_r >> 8) & 255\nL = _r & 255")
+    op(0x10, "ARHL", 1, 7, "F = (F & 254) | (L & 1)\nL = (L >> 1) | ((H & 1) << 7)\nH = (H >> 1) | (H & 128)")
+    op(0x18, "RDEL", 1, 10, "_c = D >> 7\nD = ((D << 1) | (E >> 7)) & 255\nE = ((E << 1) | (F & 1)) & 255\n"
+       "F = (F & 254) | _c")
+    op(0x28, "LDHI n", 2, 10, "_v = (((H << 8) | L) + n) & 0xFFFF\nD = _v >> 8\nE = _v & 255")
+    op(0x38, "LDSI n", 2, 10, "_v = (SP + n) & 0xFFFF\nD = _v >> 8\nE = _v & 255")
+    op(0xCB, "RSTV", 1, 6, _when("F & 2", push("PC >> 8", "PC & 255") + "\nPC = 0x40", 6), flow=True)
+    op(0xD9, "SHLX", 1, 10, "_a = (D << 8) | E\n" + write("_a", "L") + "\n" + write("(_a + 1) & 0xFFFF", "H"))
+    op(0xDD, "JNK nn", 3, 7, _when("not F & 32", "PC = nn", 3), flow=True)
+    op(0xED, "LHLX", 1, 10, "_a = (D << 8) | E\nL = M[_a]\nH = M[(_a + 1) & 0xFFFF]")
+    op(0xFD, "JK nn", 3, 7, _when("F & 32", "PC = nn", 3), flow=True)
+
+    assert all(o is not None for o in ops)
+    return ops  # type: ignore[return-value]
+
+OPS: list[Op] = _table()
+
+_NAME_RE = {name: re.compile(rf"\b{name}\b") for name in REGISTER_NAMES}
+_ASSIGN_RE = {name: re.compile(rf"(?m)^\s*{name}\s*(=|[-+&|^]=)(?!=)") for name in REGISTER_NAMES}
+
+def registers_used(code: str) -> tuple[list[str], list[str]]:
+    """(registers read or written, registers assigned) by a statement block."""
+    used = [r for r in REGISTER_NAMES if _NAME_RE[r].search(code)]
+    return used, [r for r in used if _ASSIGN_RE[r].search(code)]
+
+def operand_loads(size: int, pc: str = "pc") -> list[str]:
+    if size == 2:
+        return [f"n = M[({pc} + 1) & 0xFFFF]"]
+    if size == 3:
+        return [f"nn = M[({pc} + 1) & 0xFFFF] | (M[({pc} + 2) & 0xFFFF] << 8)"]
+    return []
+
+WRITE_RE = re.compile(r"(?m)^(\s*)if _w >= ROM_TOP: M\[_w\] = (.*)$")
+EXTRA_RE = re.compile(r"T \+= (\d+)")
+
+CONSTANT_WRITE_RE = re.compile(r"(?m)^(\s*)_w = ([0-9 ()+&x]+|\(\d+ \+ 1\) & 0xFFFF)\n\1if _w >= ROM_TOP: M\[_w\] = (.*)$")
+
+def tracked(code: str) -> str:
+    """code with every RAM write also invalidating cached regions decoded from the byte."""
+    return WRITE_RE.sub(lambda m: f"{m[1]}if _w >= ROM_TOP:\n{m[1]}    M[_w] = {m[2]}\n"
+                                  f"{m[1]}    if CODE[_w]: s.invalidate(_w)", code)
+
+def with_operands(code: str, size: int, operand: int, rom_top: int) -> str:
+    """code for a fixed operand: the constant in place of n/nn and writes to a constant address resolved."""
+    if size == 2:
+        code = re.sub(r"\bn\b", str(operand), code)
+    elif size == 3:
+        code = re.sub(r"\bnn\b", str(operand), code)
+
+    def resolve(m: re.Match) -> str:
+        addr = eval(m[2], {})
+        if addr < rom_top:
+            return f"{m[1]}pass"
+        return f"{m[1]}M[{addr}] = {m[3]}\n{m[1]}if CODE[{addr}]: s.invalidate({addr})"
+    return CONSTANT_WRITE_RE.sub(resolve, code)
+
+def worst_cycles(op: Op) -> int:
+    """T-states of op when every condition is taken."""
+    return op.cycles + sum(int(extra) for extra in EXTRA_RE.findall(op.code))
+
+def _handler_source(opcode: int, op: Op, track: bool = False) -> str:
+    used, assigned = registers_used(op.code)
+    code = tracked(op.code) if track else op.code
+    lines = [f"def op_{opcode:02X}(s):", "    M = s.mem", "    pc = s.pc"]
+    if code != op.code:
+        lines.append("    CODE = s.code")
+    lines += ["    " + line for line in operand_loads(op.size)]
+    lines.append(f"    PC = (pc + {op.size}) & 0xFFFF")
+    lines += [f"    {r} = s.{r.lower()}" for r in used if r != "PC"]
+    lines.append(f"    T = {op.cycles}")
+    if code:
+        lines.append(_indent(code))
+    lines += [f"    s.{r.lower()} = {r}" for r in assigned if r != "PC"]
+    lines += ["    s.pc = PC", "    return T"]
+    return "\n".join(lines)
+
+_HANDLERS: dict[tuple[int, bool], list] = {}
+
+def handlers(rom_top: int = 0, track: bool = False) -> list:
+    """The 256 compiled handlers for a CPU whose writes below rom_top are ignored.
+
+    With track, writes at or above rom_top also call s.invalidate(addr) when
+    s.code marks the byte as part of a cached region.
+    """
+    table = _HANDLERS.get((rom_top, track))
+    if table is None:
+        env = {"SZP": SZP, "ROM_TOP": rom_top}
+        exec("\n\n".join(_handler_source(i, op, track) for i, op in enumerate(OPS)), env)
+        table = _HANDLERS[rom_top, track] = [env[f"op_{i:02X}"] for i in range(256)]
+    return table
+
+BLOCK_INSTRUCTIONS = 32         # longest straight-line block
+REGION_BLOCKS = 12              # most blocks compiled into one function
+REGISTERS_USED = [registers_used(op.code) for op in OPS]
+
+@functools.lru_cache(maxsize=None)
+def _block_code(opcode: int, operand: int, rom_top: int) -> str:
+    op = OPS[opcode]
+    code = tracked(with_operands(op.code, op.size, operand, rom_top))
+    return re.sub(r"s\.invalidate\(\w+\)", r"\g<0>; _hit = True", code)
+
+def _decode_block(mem, start: int, end: int) -> list[tuple[int, Op]]:
+    """The straight-line instructions from start up to and including the first flow instruction."""
+    block = []
+    addr = start
+    while len(block) < BLOCK_INSTRUCTIONS and addr < end:
+        op = OPS[mem[addr]]
+        if addr + op.size > end:
+            break
+        block.append((addr, op))
+        addr += op.size
+        if op.flow:
+            break
+    return block
+
+def block_worst(block: list[tuple[int, Op]]) -> int:
+    return sum(worst_cycles(op) for _, op in block)
+
+def _successors(mem, block: list[tuple[int, Op]]) -> list[int]:
+    """Addresses the block can continue at that are known before it runs."""
+    at, op = block[-1]
+    after = (at + op.size) & 0xFFFF
+    if not op.flow:
+        return [after]
+    name = op.mnemonic.split()[0]
+    target = mem[at + 1] | mem[at + 2] << 8 if op.size == 3 else None
+    if name in ("JMP", "CALL"):
+        return [target]
+    if target is not None:                  # Jcc, Ccc, JK, JNK
+        return [target, after]
+    if name == "RST":
+        return [int(op.mnemonic.split()[1]) * 8]
+    if name == "RSTV":
+        return [0x40, after]
+    if name != "RET" and name[0] == "R":    # Rcc
+        return [after]
+    return []                               # RET, PCHL, HLT, EI, DI, SIM, IN, OUT: back to the caller
+
+def region_blocks(mem, start: int, end: int, rom_top: int) -> dict[int, list[tuple[int, Op]]]:
+    """The blocks of the region at start by address, the first one first; empty if none fits.
+
+    A region is the blocks reachable from start through jumps, calls and
+    fall-throughs whose targets are known from the code alone: at most
+    REGION_BLOCKS, all on start's side of rom_top and below end.
+    """
+    low = 0 if start < rom_top else rom_top
+    blocks: dict[int, list[tuple[int, Op]]] = {}
+    queue = [start]
+    while queue and len(blocks) < REGION_BLOCKS:
+        addr = queue.pop(0)
+        if addr in blocks or not low <= addr < end:
+            continue
+        block = _decode_block(mem, addr, end)
+        if not block:
+            if addr == start:
+                break
+            continue
+        blocks[addr] = block
+        queue += _successors(mem, block)
+    return blocks
+
+def region_source(mem, blocks: dict[int, list[tuple[int, Op]]], rom_top: int) -> str:
+    """Source of blk(s, budget) for the blocks of region_blocks.
+
+    blk runs the first block and then moves from block to block while the
+    next one's worst case fits in budget T-states; it returns the T-states
+    it took.  Its writes are tracked like handlers(track=True), and one that
+    hits cached code ends the region right after the instruction that made
+    it, so a store into a later instruction of the same block takes effect.
+    """
+    index = {addr: i for i, addr in enumerate(blocks)}
+    worst = {addr: block_worst(block) for addr, block in blocks.items()}
+
+    used: set[str] = set()
+    assigned: set[str] = set()
+    bodies = []
+    for addr, block in blocks.items():
+        body = [f"T += {sum(op.cycles for _, op in block)}"]
+        for i, (at, op) in enumerate(block):
+            after = (at + op.size) & 0xFFFF
+            regs, sets = REGISTERS_USED[mem[at]]
+            used.update(regs)
+            assigned.update(sets)
+            if i == len(block) - 1:
+                body.append(f"PC = {after}")
+            operand = mem[at + 1] if op.size == 2 else mem[at + 1] | mem[at + 2] << 8 if op.size == 3 else 0
+            code = _block_code(mem[at], operand, rom_top) if op.code else ""
+            if code:
+                body.append(code)
+            if "_hit" not in code:
+                continue
+            if i == len(block) - 1:
+                body.append("if _hit:\n    break")
+            else:                               # leave before the rest of the block, which may be stale
+                rest = sum(later.cycles for _, later in block[i + 1:])
+                body.append(f"if _hit:\n    PC = {after}\n    T -= {rest}\n    break")
+        for target in dict.fromkeys(_successors(mem, block)):
+            if target in index:
+                body.append(f"if PC == {target} and T + {worst[target]} <= budget:\n"
+                            f"    _b = {index[target]}\n    continue")
+        body.append("break")
+        bodies.append("\n".join(body))
+    code = "\n".join(f"{'if' if i == 0 else 'elif'} _b == {i}:\n{_indent(body)}" for i, body in enumerate(bodies))
+    lines = ["def blk(s, budget):", "    M = s.mem"]
+    if "CODE[" in code:
+        lines.append("    CODE = s.code")
+    lines += [f"    {r} = s.{r.lower()}" for r in REGISTER_NAMES if r in used and r != "PC"]
+    lines += ["    T = 0", "    _b = 0"]
+    if "_hit" in code:
+        lines.append("    _hit = False")
+    lines += ["    while True:", _indent(_indent(code))]
+    lines += [f"    s.{r.lower()} = {r}" for r in REGISTER_NAMES if r in assigned and r != "PC"]
+    lines += ["    s.pc = PC", "    return T"]
+    return "\n".join(lines)
+
+_REGIONS: dict[tuple, object] = {}
+
+def compile_region(mem, start: int, end: int, rom_top: int):
+    """(blk, worst case of its first block, byte ranges it was decoded from) for the region at start.
+
+    The compiled functions are shared by every CPU in the process, keyed by
+    the bytes they were decoded from.  None if no block fits at start.
+    """
+    blocks = region_blocks(mem, start, end, rom_top)
+    if not blocks:
+        return None
+    ranges = [(addr, block[-1][0] + block[-1][1].size) for addr, block in blocks.items()]
+    key = (rom_top, start, *(bytes(mem[a:b]) for a, b in ranges))
+    blk = _REGIONS.get(key)
+    if blk is None:
+        env = {"SZP": SZP, "ROM_TOP": rom_top}
+        exec(region_source(mem, blocks, rom_top), env)
+        blk = _REGIONS[key] = env["blk"]
+    return blk, block_worst(blocks[start]), ranges
+
+def disassemble(mem, addr: int) -> tuple[str, int]:
+    """(instruction text, size) at addr."""
+    op = OPS[mem[addr & 0xFFFF]]
+    if op.size == 2:
+        return op.mnemonic.replace(",n", f",{mem[(addr + 1) & 0xFFFF]:02X}H").replace(" n", f" {mem[(addr + 1) & 0xFFFF]:02X}H"), 2
+    if op.size == 3:
+        nn = mem[(addr + 1) & 0xFFFF] | mem[(addr + 2) & 0xFFFF] << 8
+        return op.mnemonic.replace("nn", f"{nn:04X}H"), 3
+    return op.mnemonic, 1
+
+class CPU:
+    """8085 registers, 64 KiB of memory and the run loop."""
+
+    def __init__(self, rom_top: int = 0, cache: bool = False):
+        self.mem = bytearray(0x10000)
+        self.rom_top = rom_top
+        self.cache = cache
+        self.ops = handlers(rom_top, track=cache)
+        self.code = bytearray(0x10000)      # 1 where a cached region above rom_top was decoded from
+        self.ram_blocks: list = [None] * 0x10000
+        self._rom_banks: dict[object, list] = {}
+        self.select_rom(0)
+        self.a = self.b = self.c = self.d = self.e = self.h = self.l = self.f = 0
+        self.sp = self.pc = 0
+        self.ie = False
+        self.mask = 0x07          # SIM masks: bit 0 RST 5.5, bit 1 RST 6.5, bit 2 RST 7.5
+        self.pending75 = False    # the RST 7.5 latch
+        self.halted = False
+        self.cycles = 0
+        self.next_event = float("inf")
+        self.limit = 0
+        self.stopped: str | None = None
+
+    # Machine interface; the defaults model a bare CPU with nothing attached.
+    def port_in(self, port: int) -> int:
+        return 0xFF
+
+    def port_out(self, port: int, value: int) -> None:
+        pass
+
+    def on_halt(self) -> None:
+        """HLT at pc - 1 was executed: wait for the next event, or stop if nothing can wake us."""
+        if self.ie and self.next_event != float("inf"):
+            self.cycles = max(self.cycles, int(self.next_event))
+        else:
+            self.stop("halt")
+
+    def on_event(self) -> None:
+        self.next_event = float("inf")
+
+    def rim(self) -> int:
+        return self.mask | (8 if self.ie else 0) | (64 if self.pending75 else 0)
+
+    def sim(self, value: int) -> None:
+        if value & 0x08:
+            self.mask = value & 0x07
+        if value & 0x10:
+            self.pending75 = False
+
+    def stop(self, reason: str) -> None:
+        self.stopped = reason
+        self.limit = 0
+
+    def interrupt(self, vector: int) -> None:
+        """Take an interrupt: push PC and jump to vector with interrupts disabled."""
+        self.ie = False
+        self.halted = False
+        self.sp = (self.sp - 2) & 0xFFFF
+        for addr, value in ((self.sp, self.pc & 0xFF), ((self.sp + 1) & 0xFFFF, self.pc >> 8)):
+            if addr >= self.rom_top:
+                self.mem[addr] = value
+                if self.code[addr]:
+                    self.invalidate(addr)
+        self.pc = vector
+        self.cycles += 12
+
+    # Region cache.  Code below rom_top is compiled once per ROM image (select_rom
+    # names the image there now); code above it is dropped again when a write
+    # hits a byte one of its regions was decoded from.
+    def select_rom(self, key) -> None:
+        """Memory below rom_top now holds the image called key (e.g. a bank number)."""
+        blocks = self._rom_banks.get(key)
+        if blocks is None:
+            blocks = self._rom_banks[key] = [None] * self.rom_top
+        self.rom_blocks = blocks
+
+    def invalidate(self, addr: int) -> None:
+        """addr, a byte some cached region above rom_top was decoded from, was written."""
+        self.flush_cache()
+
+    def flush_cache(self) -> None:
+        """Forget every region above rom_top, e.g. after the host rewrote memory there."""
+        self.ram_blocks[:] = [None] * 0x10000
+        self.code[:] = bytes(0x10000)
+
+    def _compile(self, pc: int):
+        """(function of (s, budget), worst-case T-states of its first block) for the code at pc."""
+        end = self.rom_top if pc < self.rom_top else 0x10000
+        found = compile_region(self.mem, pc, end, self.rom_top)
+        if found is None:
+            op = OPS[self.mem[pc]]
+            return (lambda s, budget, handler=self.ops[self.mem[pc]]: handler(s)), worst_cycles(op)
+        blk, worst, ranges = found
+        if pc >= self.rom_top:
+            for start, after in ranges:
+                self.code[start:after] = b"\x01" * (after - start)
+        return blk, worst
+
+    def execute(self, t: int) -> int:
+        """Run instructions from cycle count t until it reaches self.limit; returns the new count.
+
+        With the cache, whole blocks run while their worst case stays within the
+        limit and single instructions finish the last few T-states, so events
+        land on the same instruction boundary as without it.  An entry point
+        is compiled the second time it is reached, so addresses an interrupt
+        only once split a block at stay uncompiled.
+        """
+        ops, mem = self.ops, self.mem
+        if not self.cache:
+            while t < self.limit:
+                t += ops[mem[self.pc]](self)
+            return t
+        top = self.rom_top
+        while t < self.limit:
+            pc = self.pc
+            blocks = self.rom_blocks if pc < top else self.ram_blocks
+            block = blocks[pc]
+            if not block:
+                if block is None:
+                    blocks[pc] = False
+                    t += ops[mem[pc]](self)
+                    continue
+                block = blocks[pc] = self._compile(pc)
+            if t + block[1] <= self.limit:
+                t += block[0](self, self.limit - t)
+            else:
+                t += ops[mem[pc]](self)
+        return t
+
+    def run(self, cycles: float = float("inf")) -> str:
+        """Execute for up to cycles T-states; returns why execution stopped."""
+        end = self.cycles + cycles
+        self.stopped = None
+        while self.stopped is None:
+            if self.halted:
+                self.halted = False
+                self.on_halt()
+                continue
+            if self.cycles >= self.next_event:
+                self.on_event()
+                continue
+            if self.pending75 and self.ie and not self.mask & 4:
+                self.pending75 = False
+                self.interrupt(0x3C)
+            if self.cycles >= end:
+                self.stop("cycles")
+                break
+            self.limit = min(end, self.next_event)
+            self.cycles = self.execute(self.cycles)
+        return self.stopped
+
+def main():
+    ap=argparse.ArgumentParser(description="Disassemble 8085 code.")
+    ap.add_argument("image", help="Binary image loaded at address 0")
+    ap.add_argument("start", nargs="?", default="0", help="Start address (hex), default 0")
+    ap.add_argument("count", nargs="?", type=int, default=32, help="Instructions to list, default %(default)s")
+    args=ap.parse_args()
+    mem=bytearray(0x10000)
+    data=pathlib.Path(args.image).read_bytes()[:0x10000]
+    mem[:len(data)]=data
+    addr=int(args.start, 16)
+    for _ in range(args.count):
+        text, size = disassemble(mem, addr)
+        raw=" ".join(f"{mem[(addr + i) & 0xFFFF]:02X}" for i in range(size))
+        print(f"{addr:04X}  {raw:<9} {text}")
+        addr=(addr + size) & 0xFFFF
+
+if __name__=="__main__":
+    sys.exit(main())
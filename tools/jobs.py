@@ -0,0 +1,12 @@
+"""
+Worker-count option shared by the tools that run a process pool (-j/--jobs).
+"""
+from __future__ import annotations
+import argparse, os
+
+def job_count(value: str) -> int:
+    """argparse type for --jobs: a count >= 0, where 0 means one worker per CPU."""
+    jobs = int(value)
+    if jobs < 0:
+        raise argparse.ArgumentTypeError("--jobs must be >= 0")
+    return jobs or os.cpu_count() or 1
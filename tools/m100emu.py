@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Headless TRS-80 Model 100 that runs an MFORTH option ROM (bin/MFORTH.BX).
+
+The option ROM runs on the 8085 core in i8085.py with 32 KiB of RAM at 8000H.
+There is no Main ROM image: MFORTH reaches the Main ROM only through STDCALL/
+INTCALL (see src/main.asm), so the Main ROM bank holds the three instruction
+sequences STDON relies on ($008E RET, $0363 EI/RET, $26C8 POP PSW/RET) and HLT
+everywhere else.  Executing one of those HLTs calls the stub for that address
+below and returns; any other Main ROM address stops the run with an error.
+
+  keyboard   CHGET/CHSNS read the queue filled by type(); polling an empty queue
+             stops the run with "input" so the caller can type more (or finish)
+  display    character output, CRLF, CLS and SETCUR are collected in lcd
+             (printer output after PRN in printer); the cursor position the
+             Main ROM keeps at 0F639H/0F63AH is maintained for GET-XY
+  files      .DO files given to the machine are laid out at 8000H with a RAM
+             directory at 0F962H, so SRCNAM (INCLUDED), NXTDIR and FREDIR work
+  clock      the clock update fills 0F923H-0F92EH from clock() (host time)
+  timer      RST 7.5 fires every 4 ms of T-states (2.4576 MHz) like the real
+             keyboard/clock interrupt, so MS and the tick counter advance
+
+Main ROM stubs take no time beyond the HLT and RET that enter and leave them.
+Code runs from i8085's region cache, one set of ROM regions per bank;
+cache=False (--no-cache) interprets it instruction by instruction instead.
+snapshot() and restore() save and return to a machine state, e.g. to carry
+on after a line of Forth that hung.
+
+    m = Model100(rom, {"TESTER": tester_fs, "DOUBLE": double_fs})
+    m.boot()
+    print(m.interpret('S" DOUBLE" INCLUDED'))
+
+Run as a script: m100emu.py ROM [FILE ...] [-i NAME] [-e TEXT] [--fail-on TEXT] [--require-ok]
+"""
+from __future__ import annotations
+import argparse, pathlib, sys, time
+
+import i8085
+
+ROM_SIZE = 0x8000
+RAM_START = 0x8000
+CLOCK_HZ = 2457600
+TICK_CYCLES = CLOCK_HZ // 250         # RST 7.5 every 4 ms
+TIB_SIZE = 80                         # tibsize in main.asm: longer typed lines are cut short
+MAX_CYCLES = 2_000_000_000            # default T-state budget of the scripted runs (about 13.5 min)
+
+# Main ROM routines MFORTH calls (and the interrupt handlers INTCALL forwards to).
+TRAP, RST55, RST65, RST75 = 0x0024, 0x002C, 0x0034, 0x003C
+CHGET, CHSNS, FLASH_CURSOR = 0x12CB, 0x13DB, 0x13C2
+UPDATE_CLOCK = 0x19A0
+SRCNAM, NXTDIR, FREDIR, LNKFIL = 0x20AF, 0x20D5, 0x20EC, 0x2146
+CRLF, CLS, SETCUR = 0x4222, 0x4231, 0x427C
+CHAR_OUT, LCD_OUTPUT, MAIN_MENU = 0x4B44, 0x4B92, 0x5797
+
+# Main ROM variables.
+SYSTEM_AREA = 0xF5F0            # Main ROM variables from here up; the menu's stack is below
+CURSOR_ROW, CURSOR_COL = 0xF639, 0xF63A
+PRINTER_FLAG = 0xF675
+CLOCK_DIGITS = 0xF923
+DIRECTORY, USER_DIRECTORY, DIR_ENTRY_SIZE, USER_SLOTS = 0xF962, 0xF9BA, 11, 19
+FRETOP = 0xFBB6
+FILNAM = 0xFC93
+PORT_E8_COPY = 0xFF45
+
+DO_FILE, ROM_ENTRY, EOF = 0xC0, 0xB0, 0x1A
+LCD_COLUMNS, LCD_ROWS = 40, 8
+SYSTEM_ENTRIES = ("BASIC", "TEXT", "TELCOM", "ADDRSS", "SCHEDL")
+
+SNAPSHOT_FIELDS = ("a", "b", "c", "d", "e", "h", "l", "f", "sp", "pc", "ie", "mask", "pending75", "halted",
+                   "cycles", "next_event", "option_selected", "key_pos", "error")
+
+def main_rom_image() -> bytes:
+    rom = bytearray([0x76]) * ROM_SIZE       # HLT: every other address is a stub or an error
+    rom[0x008E] = 0xC9                       # RET (STDON)
+    rom[0x0363:0x0365] = b"\xFB\xC9"         # EI; RET (STDCALL)
+    rom[0x26C8:0x26CA] = b"\xF1\xC9"         # POP PSW; RET (STDON)
+    return bytes(rom)
+
+def file_name(name: str) -> bytes:
+    """The 8-byte directory name of NAME.DO ("tester.fs" -> b"TESTERDO")."""
+    stem = pathlib.PurePath(name).stem if "." in name else name
+    stem = stem.upper()
+    if not 1 <= len(stem) <= 6:
+        raise ValueError(f"'{name}': Model 100 file names are 1 to 6 characters")
+    return stem.encode("ascii").ljust(6) + b"DO"
+
+def do_text(text: str | bytes) -> bytes:
+    """Host text as a .DO file: CRLF line ends, ending with EOF."""
+    data = text.encode("latin-1", "replace") if isinstance(text, str) else bytes(text)
+    data = data.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n").split(bytes([EOF]), 1)[0]
+    return data + bytes([EOF])
+
+class Model100(i8085.CPU):
+    """A Model 100 with MFORTH in the option ROM socket."""
+
+    def __init__(self, rom: bytes, files: dict[str, str | bytes] | None = None, *, timer: bool = True,
+                 clock=time.localtime, cache: bool = True):
+        super().__init__(rom_top=RAM_START, cache=cache)
+        if len(rom) != ROM_SIZE:
+            raise ValueError(f"MFORTH ROM was {len(rom)} bytes long; expected {ROM_SIZE} bytes.")
+        self.option_rom = bytes(rom)
+        self.main_rom = main_rom_image()
+        self.files = {file_name(name): do_text(text) for name, text in (files or {}).items()}
+        self.timer = timer
+        self.clock = clock
+        self.stubs = {
+            TRAP: None, RST55: None, RST65: None, RST75: None, FLASH_CURSOR: None, LNKFIL: None,
+            CHGET: self._chget, CHSNS: self._chsns, UPDATE_CLOCK: self._update_clock,
+            SRCNAM: self._srcnam, NXTDIR: self._nxtdir, FREDIR: self._fredir,
+            CRLF: self._crlf, CLS: self._cls, SETCUR: self._setcur, CHAR_OUT: self._char_out,
+            LCD_OUTPUT: self._lcd_output, MAIN_MENU: self._main_menu,
+        }
+        self.reset()
+
+    def reset(self) -> None:
+        """Power on with MFORTH just selected from the menu: RAM files in place, PC at 0000H."""
+        mem = self.mem
+        mem[:] = bytes(0x10000)
+        self.option_selected = True
+        mem[:ROM_SIZE] = self.option_rom
+        self.select_rom(True)
+        self.flush_cache()
+        self.keys = bytearray()
+        self.key_pos = 0
+        self.lcd = bytearray()
+        self.printer = bytearray()
+        self.error: str | None = None
+
+        entry = DIRECTORY
+        for name in SYSTEM_ENTRIES:
+            mem[entry] = ROM_ENTRY
+            mem[entry + 3:entry + 11] = name.encode("ascii").ljust(8)
+            entry += DIR_ENTRY_SIZE
+        while entry < USER_DIRECTORY:
+            entry += DIR_ENTRY_SIZE
+        if len(self.files) > USER_SLOTS - 1:      # leave one slot for MFORTH's ROM trigger file
+            raise ValueError(f"at most {USER_SLOTS - 1} files fit in the RAM directory")
+        addr = RAM_START
+        for name, data in self.files.items():
+            mem[entry] = DO_FILE
+            mem[entry + 1] = addr & 0xFF
+            mem[entry + 2] = addr >> 8
+            mem[entry + 3:entry + 11] = name
+            mem[addr:addr + len(data)] = data
+            addr += len(data)
+            entry += DIR_ENTRY_SIZE
+        mem[USER_DIRECTORY + USER_SLOTS * DIR_ENTRY_SIZE] = 0xFF
+        if addr > 0xC000:
+            raise ValueError(f"files use {addr - RAM_START} bytes; MFORTH needs the rest of RAM")
+        mem[FRETOP] = addr & 0xFF
+        mem[FRETOP + 1] = addr >> 8
+        mem[PORT_E8_COPY] = 0x01
+        mem[CURSOR_ROW] = mem[CURSOR_COL] = 1
+
+        self.a = self.b = self.c = self.d = self.e = self.h = self.l = self.f = 0
+        self.sp = SYSTEM_AREA - 2                 # the menu CALLs the option ROM; RST0 drops the return
+        self.pc = 0
+        self.ie = False
+        self.mask = 0x03                          # RST 7.5 unmasked, as the Main ROM leaves it
+        self.pending75 = False
+        self.halted = False
+        self.cycles = 0
+        self.next_event = TICK_CYCLES if self.timer else float("inf")
+
+    # --- Host side ------------------------------------------------------
+
+    def type(self, text: str | bytes) -> None:
+        """Queue keystrokes; newlines become ENTER."""
+        data = text.encode("latin-1", "replace") if isinstance(text, str) else bytes(text)
+        del self.keys[:self.key_pos]
+        self.key_pos = 0
+        self.keys += data.replace(b"\r\n", b"\n").replace(b"\n", b"\r")
+
+    def boot(self, cycles: float = float("inf")) -> str:
+        """Run from reset until MFORTH waits for the keyboard (returns "input") or stops otherwise."""
+        self.reset()
+        return self.run(cycles)
+
+    def interpret(self, text: str, cycles: float = float("inf")) -> str:
+        """Type text (one ENTER added) and run until the keyboard is drained; returns the new output."""
+        start = len(self.lcd)
+        self.type(text if text.endswith("\n") else text + "\n")
+        self.run(cycles)
+        return self.output(start)
+
+    def output(self, start: int = 0) -> str:
+        """LCD output from byte offset start, with CRLF as newline."""
+        return self.lcd[start:].decode("latin-1").replace("\r\n", "\n")
+
+    def snapshot(self) -> dict:
+        """Everything restore() needs to put the machine back where it is now."""
+        state = {name: getattr(self, name) for name in SNAPSHOT_FIELDS}
+        state.update(mem=bytes(self.mem), keys=bytes(self.keys), lcd=bytes(self.lcd), printer=bytes(self.printer))
+        return state
+
+    def restore(self, state: dict) -> None:
+        """Return to a snapshot(), e.g. after a line of Forth hung."""
+        for name in SNAPSHOT_FIELDS:
+            setattr(self, name, state[name])
+        self.mem[:] = state["mem"]
+        self.keys, self.lcd, self.printer = bytearray(state["keys"]), bytearray(state["lcd"]), bytearray(state["printer"])
+        self.select_rom(self.option_selected)
+        self.flush_cache()
+
+    # --- Machine --------------------------------------------------------
+
+    def port_out(self, port: int, value: int) -> None:
+        if port == 0xE8:
+            selected = bool(value & 1)
+            if selected != self.option_selected:
+                self.option_selected = selected
+                self.mem[:ROM_SIZE] = self.option_rom if selected else self.main_rom
+                self.select_rom(selected)
+
+    def on_event(self) -> None:
+        self.pending75 = True
+        self.next_event += TICK_CYCLES
+
+    def on_halt(self) -> None:
+        addr = (self.pc - 1) & 0xFFFF
+        if self.option_selected or addr >= ROM_SIZE:
+            return super().on_halt()
+        if addr not in self.stubs:
+            self.error = f"call to unsupported Main ROM routine {addr:04X}H"
+            return self.stop("error")
+        stub = self.stubs[addr]
+        if stub is not None and stub() is False:
+            self.pc = addr                        # not done: run the stub again when resumed
+            return
+        sp = self.sp
+        self.pc = self.mem[sp] | self.mem[(sp + 1) & 0xFFFF] << 8
+        self.sp = (sp + 2) & 0xFFFF
+        self.cycles += 10
+
+    def _set_z(self, zero: bool) -> None:
+        self.f = self.f | i8085.Z_FLAG if zero else self.f & ~i8085.Z_FLAG
+
+    def _chget(self):
+        if self.key_pos >= len(self.keys):
+            self.stop("input")
+            return False
+        self.a = self.keys[self.key_pos]
+        self.key_pos += 1
+
+    def _chsns(self):
+        if self.key_pos >= len(self.keys):
+            return self._chget()                  # KEY waits in a KEY? PAUSE loop: stop here too
+        self._set_z(False)
+
+    def _update_clock(self):
+        now = self.clock()
+        fields = (now.tm_sec, now.tm_min, now.tm_hour, now.tm_mday)
+        digits = [d for v in fields for d in (v % 10, v // 10)]
+        digits += [(now.tm_wday + 1) % 7, now.tm_mon, now.tm_year % 10, now.tm_year // 10 % 10]
+        self.mem[CLOCK_DIGITS:CLOCK_DIGITS + len(digits)] = bytes(digits)
+
+    def _entries(self, start: int):
+        entry = start
+        while self.mem[entry] != 0xFF:
+            yield entry
+            entry += DIR_ENTRY_SIZE
+
+    def _srcnam(self):
+        name = self.mem[FILNAM:FILNAM + 8]
+        for entry in self._entries(DIRECTORY):
+            if self.mem[entry] & 0x80 and self.mem[entry + 3:entry + 11] == name:
+                self.d, self.e = self.mem[entry + 2], self.mem[entry + 1]
+                self.h, self.l = entry >> 8, entry & 0xFF
+                return self._set_z(False)
+        self._set_z(True)
+
+    def _nxtdir(self):
+        entry = (self.h << 8 | self.l) + DIR_ENTRY_SIZE
+        while self.mem[entry] != 0xFF and not self.mem[entry] & 0x80:
+            entry += DIR_ENTRY_SIZE
+        self.h, self.l = entry >> 8, entry & 0xFF
+        self._set_z(self.mem[entry] == 0xFF)
+
+    def _fredir(self):
+        for entry in self._entries(USER_DIRECTORY):
+            if not self.mem[entry] & 0x80:
+                self.h, self.l = entry >> 8, entry & 0xFF
+                return
+        self.error = "RAM directory full"
+        self.stop("error")
+        return False
+
+    def _char_out(self, ch: int | None = None):
+        ch = self.a if ch is None else ch
+        mem = self.mem
+        if mem[PRINTER_FLAG]:
+            self.printer.append(ch)
+            return
+        self.lcd.append(ch)
+        row, col = mem[CURSOR_ROW], mem[CURSOR_COL]
+        if ch == 13:
+            col = 1
+        elif ch == 10:
+            row = min(row + 1, LCD_ROWS)
+        elif ch == 8:
+            col = max(col - 1, 1)
+        elif ch == 12:
+            row = col = 1
+        elif ch >= 32:
+            col += 1
+            if col > LCD_COLUMNS:
+                row, col = min(row + 1, LCD_ROWS), 1
+        mem[CURSOR_ROW], mem[CURSOR_COL] = row, col
+
+    def _crlf(self):
+        self._char_out(13)
+        self._char_out(10)
+
+    def _cls(self):
+        self._char_out(12)
+
+    def _setcur(self):
+        self.mem[CURSOR_COL], self.mem[CURSOR_ROW] = self.h, self.l
+
+    def _lcd_output(self):
+        self.mem[PRINTER_FLAG] = 0
+
+    def _main_menu(self):
+        self.stop("bye")
+        return False
+
+def main():
+    ap=argparse.ArgumentParser(description="Run MFORTH headlessly on an emulated Model 100.")
+    ap.add_argument("rom", help="MFORTH ROM image (bin/MFORTH.BX)")
+    ap.add_argument("files", nargs="*", help="Host files to put in RAM as NAME.DO (name from the file stem)")
+    ap.add_argument("-i", "--include", action="append", default=[], metavar="NAME",
+                    help='Type S" NAME" INCLUDED after booting; may be repeated')
+    ap.add_argument("-e", "--eval", action="append", default=[], metavar="TEXT", help="Type a line of Forth")
+    ap.add_argument("--stdin", action="store_true", help="Also type everything read from standard input")
+    ap.add_argument("--max-cycles", type=float, default=float("inf"), help="Stop after this many T-states")
+    ap.add_argument("--fail-on", action="append", default=[], metavar="TEXT",
+                    help="Exit with status 1 if the output contains TEXT (e.g. INCORRECT RESULT)")
+    ap.add_argument("--require-ok", action="store_true",
+                    help="Exit with status 1 unless the last line typed ended with \"ok\" (no error aborted it)")
+    ap.add_argument("--no-timer", action="store_true", help="Do not raise the 4 ms RST 7.5 interrupt")
+    ap.add_argument("--stats", action="store_true", help="Print T-states and emulation speed to stderr")
+    ap.add_argument("--no-cache", action="store_true", help="Interpret instruction by instruction (no region cache)")
+    args=ap.parse_args()
+
+    rom=pathlib.Path(args.rom).read_bytes()
+    try:
+        machine=Model100(rom, {p: pathlib.Path(p).read_bytes() for p in args.files}, timer=not args.no_timer,
+                        cache=not args.no_cache)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    for name in args.include:
+        machine.type(f'S" {name.upper()}" INCLUDED\n')
+    for text in args.eval:
+        machine.type(text + "\n")
+    if args.stdin:
+        machine.type(sys.stdin.read())
+
+    started=time.perf_counter()
+    reason=machine.run(args.max_cycles)
+    elapsed=time.perf_counter() - started
+    text=machine.output()
+    sys.stdout.write(text if text.endswith("\n") else text + "\n")
+    if args.stats:
+        print(f"{reason}: {machine.cycles} T-states ({machine.cycles / CLOCK_HZ:.2f} s of Model 100 time) "
+              f"in {elapsed:.2f} s, {machine.cycles / max(elapsed, 1e-9) / 1e6:.2f} MHz", file=sys.stderr)
+    if reason == "error":
+        print(f"m100emu: {machine.error} (PC {machine.pc:04X})", file=sys.stderr)
+        return 1
+    if reason not in ("input", "bye"):
+        print(f"m100emu: stopped: {reason} (PC {machine.pc:04X})", file=sys.stderr)
+        return 1
+    failed=[t for t in args.fail_on if t in text]
+    if failed:
+        print(f"m100emu: output contains {', '.join(repr(t) for t in failed)}", file=sys.stderr)
+        return 1
+    if args.require_ok and not text.rstrip().endswith("ok"):
+        print("m100emu: the last line did not end with ok", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__=="__main__":
+    sys.exit(main())
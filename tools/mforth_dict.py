@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+MFORTH ROM dictionary access shared by the build tools (the Python side of phashgen's toollib).
+
+A dictionary header sits just below a word's code field (see src/main.asm):
+the name is stored backwards ending in a byte with bit 7 set, the NFA holds
+the length (low 6 bits, bit 7 = immediate), and the link field at NFA+1
+points to the previous word's NFA (0 ends the list).  A PROFILER build puts
+the execution count cell at NFA+3, moving the code field from NFA+3 to NFA+5.
+
+words()/Word read a whole word list eagerly into tuples.  Rom reads an image
+(memory-mapped with Rom.open) lazily: WordRef records decode nothing until a
+field is asked for, and Rom.find() builds the name index on first use.
+
+    rom = Rom.open("bin/MFORTH.BX", head=0x2806)
+    dup = rom.find("dup")
+    dup.nfa, dup.lfa, dup.cfa, dup.pfa, dup.pec, dup.count
+
+Run as a script to list a ROM's words: mforth_dict.py ROM [NAME ...]
+"""
+from __future__ import annotations
+import argparse, mmap, pathlib, sys
+from typing import Iterator, NamedTuple
+
+ROM_SIZE = 0x8000
+LATEST_WORD_PTR_ADDR = 0x7FFE
+NFATOLFASZ = 1
+NFATOCFASZ = 3              # nfasz + lfasz
+NFATOCFASZ_PROFILER = 5     # nfasz + lfasz + pecsz
+NFATOPECSZ = 3              # PROFILER builds only
+CFATOPFASZ = 3              # the code field is JMP xxxx
+
+class Word(NamedTuple):
+    name: str
+    nfa: int
+    next_word_addr: int
+    immediate: bool
+
+    @property
+    def header_start(self) -> int:
+        return self.nfa - len(self.name)
+
+def load_rom(path: str | pathlib.Path) -> bytes:
+    rom = pathlib.Path(path).read_bytes()
+    if len(rom) != ROM_SIZE:
+        raise ValueError(f"MFORTH ROM was only {len(rom)} bytes long; expected {ROM_SIZE} bytes.")
+    return rom
+
+def get_u16(rom: bytes, addr: int) -> int:
+    return rom[addr] | (rom[addr + 1] << 8)
+
+def latest_word_addr(rom: bytes) -> int:
+    return get_u16(rom, LATEST_WORD_PTR_ADDR)
+
+def read_word(rom: bytes, nfa: int) -> Word:
+    count = rom[nfa]
+    length = count & 0x3F
+    chars = []
+    addr = nfa - 1
+    while addr >= 0 and len(chars) <= 0x3F:
+        c = rom[addr]
+        chars.append(chr(c & 0x7F))
+        if c & 0x80:
+            break
+        addr -= 1
+    name = "".join(chars)
+    if len(name) != length:
+        raise ValueError(f"Word '{name}' has NFA with incorrect length {length}.")
+    return Word(name, nfa, get_u16(rom, nfa + NFATOLFASZ), bool(count & 0x80))
+
+def words(rom: bytes, start: int | None = None) -> list[Word]:
+    """Walk a word list from the NFA at start (default: the pointer at 0x7FFE), latest first."""
+    out = []
+    seen = set()
+    cur = latest_word_addr(rom) if start is None else start
+    while cur:
+        word = read_word(rom, cur)
+        if word.name in seen:
+            raise ValueError(f"Duplicate word name found in dictionary: {word.name}")
+        seen.add(word.name)
+        out.append(word)
+        cur = word.next_word_addr
+    return out
+
+class WordRef:
+    """One dictionary header in a Rom, decoded on demand."""
+    __slots__ = ("rom", "nfa")
+
+    def __init__(self, rom: Rom, nfa: int):
+        self.rom = rom
+        self.nfa = nfa
+
+    def __repr__(self) -> str:
+        return f"WordRef({self.name!r}, nfa=0x{self.nfa:04X})"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, WordRef) and other.rom is self.rom and other.nfa == self.nfa
+
+    def __hash__(self) -> int:
+        return hash(self.nfa)
+
+    @property
+    def length(self) -> int:
+        return self.rom.view[self.nfa] & 0x3F
+
+    @property
+    def immediate(self) -> bool:
+        return bool(self.rom.view[self.nfa] & 0x80)
+
+    @property
+    def smudged(self) -> bool:
+        return bool(self.rom.view[self.nfa] & 0x40)
+
+    @property
+    def name_bytes(self) -> memoryview:
+        """The stored (reversed, last byte flagged) name, without copying."""
+        return self.rom.view[self.nfa - self.length:self.nfa]
+
+    @property
+    def name(self) -> str:
+        return bytes(self.name_bytes)[::-1].translate(_STRIP_HIGH).decode("ascii", "replace")
+
+    @property
+    def header_start(self) -> int:
+        return self.nfa - self.length
+
+    @property
+    def lfa(self) -> int:
+        return self.nfa + NFATOLFASZ
+
+    @property
+    def link(self) -> int:
+        """NFA of the previous word, 0 at the end of the list."""
+        return self.rom.u16(self.lfa)
+
+    @property
+    def cfa(self) -> int:
+        return self.nfa + self.rom.nfatocfasz
+
+    @property
+    def pfa(self) -> int:
+        return self.cfa + CFATOPFASZ
+
+    @property
+    def pec(self) -> int | None:
+        """Address of the profiler execution count, None in non-PROFILER builds."""
+        return self.nfa + NFATOPECSZ if self.rom.profiler else None
+
+    @property
+    def count(self) -> int | None:
+        pec = self.pec
+        return None if pec is None else self.rom.u16(pec)
+
+    def to_word(self) -> Word:
+        return Word(self.name, self.nfa, self.link, self.immediate)
+
+_STRIP_HIGH = bytes(b & 0x7F for b in range(256))
+
+class Rom:
+    """A ROM image (bytes, bytearray or mmap) with lazy dictionary access.
+
+    head is the NFA of the latest word (default: the pointer at 07FFEH, which only
+    a pass-1 image has).  nfatocfasz is 3, or 5 for a PROFILER build; when not given
+    it is detected: in a PROFILER image every header's count cell is still zero.
+    """
+    def __init__(self, data, head: int | None = None, nfatocfasz: int | None = None):
+        if len(data) != ROM_SIZE:
+            raise ValueError(f"MFORTH ROM was only {len(data)} bytes long; expected {ROM_SIZE} bytes.")
+        self.data = data
+        self.view = memoryview(data)
+        self.head = self.u16(LATEST_WORD_PTR_ADDR) if head is None else head
+        self._nfatocfasz = nfatocfasz
+        self._index: dict[str, WordRef] | None = None
+
+    @classmethod
+    def open(cls, path: str | pathlib.Path, head: int | None = None, nfatocfasz: int | None = None) -> Rom:
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), head, nfatocfasz)
+
+    def u16(self, addr: int) -> int:
+        view = self.view
+        return view[addr] | (view[addr + 1] << 8)
+
+    @property
+    def nfatocfasz(self) -> int:
+        if self._nfatocfasz is None:
+            counts = [self.u16(w.nfa + NFATOPECSZ) for w in self.iter_words()]
+            profiler = bool(counts) and not any(counts)
+            self._nfatocfasz = NFATOCFASZ_PROFILER if profiler else NFATOCFASZ
+        return self._nfatocfasz
+
+    @property
+    def profiler(self) -> bool:
+        return self.nfatocfasz == NFATOCFASZ_PROFILER
+
+    def iter_words(self, start: int | None = None) -> Iterator[WordRef]:
+        """Walk a word list from the NFA at start (default: head), latest first."""
+        cur = self.head if start is None else start
+        seen = set()
+        while cur:
+            if cur in seen or not 0 < cur < ROM_SIZE - NFATOLFASZ - 1:
+                raise ValueError(f"Bad link to {cur:04X} in the dictionary.")
+            seen.add(cur)
+            word = WordRef(self, cur)
+            yield word
+            cur = word.link
+
+    __iter__ = iter_words
+
+    def find(self, name: str) -> WordRef | None:
+        """The newest word called name (case-insensitive, like FIND)."""
+        if self._index is None:
+            index: dict[str, WordRef] = {}
+            for word in self.iter_words():
+                index.setdefault(word.name.upper(), word)
+            self._index = index
+        return self._index.get(name.upper())
+
+def main():
+    ap=argparse.ArgumentParser(description="List the words of an MFORTH ROM image.")
+    ap.add_argument("rom", help="ROM image (.BX)")
+    ap.add_argument("names", nargs="*", help="Only these words")
+    ap.add_argument("--head", help="NFA of the latest word in hex (default: pointer at 07FFEH)")
+    ap.add_argument("--profiler", action="store_true", default=None, help="PROFILER header layout")
+    args=ap.parse_intermixed_args()
+    try:
+        rom=Rom.open(args.rom, int(args.head, 16) if args.head else None,
+                     NFATOCFASZ_PROFILER if args.profiler else None)
+        found=[rom.find(n) for n in args.names] if args.names else list(rom)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    print(f"# {'PROFILER' if rom.profiler else 'standard'} layout, nfatocfasz {rom.nfatocfasz}")
+    print("# nfa  lfa  cfa  pfa  count imm name")
+    status=0
+    for name, word in zip(args.names or [None] * len(found), found):
+        if word is None:
+            print(f"{name}: not found", file=sys.stderr)
+            status=1
+            continue
+        count="-" if word.count is None else str(word.count)
+        print(f"{word.nfa:04X} {word.lfa:04X} {word.cfa:04X} {word.pfa:04X} {count:>5} "
+              f"{'I' if word.immediate else '-'}   {word.name}")
+    return status
+
+if __name__=="__main__":
+    sys.exit(main())
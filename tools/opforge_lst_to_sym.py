@@ -6,43 +6,47 @@ Extract a symbol table from an opForge .lst file into MFORTH's .SYM format:
 
 opForge's README: listing includes a symbol table. citeturn1view0
 We parse common patterns seen in assembler listings.
+
+The listing is read once.  Besides the text .sym (last non-link name per
+address), every name with its listing line is written to a binary index
+next to it (see symindex.py) for tools that need fast lookups both ways.
 """
 from __future__ import annotations
 import argparse, re, pathlib, sys
+from symindex import index_path, is_noise, write_index
 
 # Match patterns like:
 #   SYMBOL 1234
 #   SYMBOL = 1234
 #   SYMBOL: 1234
 #   1234 SYMBOL
-PATTERNS = [
-    re.compile(r'^\s*([A-Za-z_.$][\w.$]*)\s*[:=]?\s+([0-9A-Fa-f]{4})\b'),
-    re.compile(r'^\s*([0-9A-Fa-f]{4})\s+([A-Za-z_.$][\w.$]*)\b'),
-]
+# Both patterns as one regex, tried in this order at the start of each line.
+SYMBOL_RE = re.compile(
+    r'^\s*(?:(?P<name>[A-Za-z_.$][\w.$]*)\s*[:=]?\s+(?P<addr>[0-9A-Fa-f]{4})\b'
+    r'|(?P<addr2>[0-9A-Fa-f]{4})\s+(?P<name2>[A-Za-z_.$][\w.$]*)\b)'
+)
 
-def main():
-    ap=argparse.ArgumentParser()
-    ap.add_argument("lst", help="Input listing (.lst)")
-    ap.add_argument("sym", help="Output symbols (.sym)")
-    args=ap.parse_args()
+def parse_listing(text: str, source: str) -> list[tuple[int, str, str, int]]:
+    """Return (addr, name, source, line) for every symbol in the listing, in order."""
+    symbols=[]
+    for lineno, line in enumerate(text.splitlines(), 1):
+        m=SYMBOL_RE.match(line)
+        if not m:
+            continue
+        name=m.group("name") or m.group("name2")
+        addr=m.group("addr") or m.group("addr2")
+        symbols.append((int(addr,16), name, source, lineno))
+    return symbols
 
+def write_sym(sym_path, symbols: list[tuple[int, str, str, int]], index: bool = True) -> None:
+    """Write the text .sym (and its .symidx) for symbols from parse_listing."""
     syms={}
-    for line in pathlib.Path(args.lst).read_text(errors="ignore").splitlines():
-        line=line.rstrip()
-        for rx in PATTERNS:
-            m=rx.match(line)
-            if not m: 
-                continue
-            if rx is PATTERNS[0]:
-                name, addr = m.group(1), m.group(2)
-            else:
-                addr, name = m.group(1), m.group(2)
-            # filter obvious noise
-            if name.lower().startswith(("noname.","link_","last_")):
-                continue
-            # keep last occurrence
-            syms[int(addr,16)] = name
-            break
+    for addr, name, _, _ in symbols:
+        # filter obvious noise
+        if is_noise(name):
+            continue
+        # keep last occurrence
+        syms[addr] = name
 
     if not syms:
         raise SystemExit("ERROR: Could not find any symbols in listing; update parse patterns in tools_mac/opForge_lst_to_sym.py")
@@ -50,7 +54,19 @@ def main():
     out_lines=[]
     for addr in sorted(syms.keys()):
         out_lines.append(f"{syms[addr]} {addr:04X}")
-    pathlib.Path(args.sym).write_text("\n".join(out_lines)+"\n", encoding="ascii")
+    pathlib.Path(sym_path).write_text("\n".join(out_lines)+"\n", encoding="ascii")
+    if index:
+        write_index(index_path(sym_path), symbols)
+
+def main():
+    ap=argparse.ArgumentParser()
+    ap.add_argument("lst", help="Input listing (.lst)")
+    ap.add_argument("sym", help="Output symbols (.sym)")
+    ap.add_argument("--no-index", action="store_true", help="Do not write the binary index (.symidx)")
+    args=ap.parse_args()
+
+    lst=pathlib.Path(args.lst)
+    write_sym(args.sym, parse_listing(lst.read_text(errors="ignore"), lst.name), not args.no_index)
 
 if __name__=="__main__":
     main()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Perfect-hash (PHASH) tables for the MFORTH ROM dictionary: the Python side of phashgen's toollib.
+
+The hash of a name is two Pearson hashes of its upper-cased characters, one per aux table;
+H1 = (P1 << 8 | P2) & mask and H2 = (P2 << 8 | P1) & mask.  _swlphash in search.asm probes
+PHASHTAB at H1 first and H2 second, so every word placed at its H1 slot saves a probe.
+
+DotNetRandom, PearsonHash.shuffle and CuckooTable.add reproduce the Rust (and original C#)
+generator exactly, so a given seed yields the same phash.asm from either implementation.
+"""
+from __future__ import annotations
+from typing import NamedTuple
+
+AUX_TABLE_SIZE = 256
+HASH_TABLE_SIZE = 1024
+HASH_TABLE_RANDOM_SEED = 135960
+ROM_SIZE = 0x8000
+
+def aux1_org(table_size: int = HASH_TABLE_SIZE) -> int:
+    return ROM_SIZE - (table_size << 1) - 2 * AUX_TABLE_SIZE
+
+def aux2_org(table_size: int = HASH_TABLE_SIZE) -> int:
+    return ROM_SIZE - (table_size << 1) - AUX_TABLE_SIZE
+
+def tab_org(table_size: int = HASH_TABLE_SIZE) -> int:
+    return ROM_SIZE - (table_size << 1)
+
+class DotNetRandom:
+    """System.Random (seeded) as ported in toollib::pearson::DotNetRandom."""
+    MBIG = 2147483647
+    MSEED = 161803398
+
+    def __init__(self, seed: int):
+        seed_array = [0] * 56
+        mj = self.MSEED - abs(seed)
+        if mj < 0:
+            mj += self.MBIG
+        seed_array[55] = mj
+        mk = 1
+        for i in range(1, 55):
+            ii = (21 * i) % 55
+            seed_array[ii] = mk
+            mk = mj - mk
+            if mk < 0:
+                mk += self.MBIG
+            mj = seed_array[ii]
+        for _ in range(4):
+            for i in range(1, 56):
+                seed_array[i] -= seed_array[1 + (i + 30) % 55]
+                if seed_array[i] < 0:
+                    seed_array[i] += self.MBIG
+        self.seed_array = seed_array
+        self.inext = 0
+        self.inextp = 21
+
+    def _internal_sample(self) -> int:
+        inext = self.inext + 1
+        inextp = self.inextp + 1
+        if inext >= 56:
+            inext = 1
+        if inextp >= 56:
+            inextp = 1
+        ret = self.seed_array[inext] - self.seed_array[inextp]
+        if ret < 0:
+            ret += self.MBIG
+        self.seed_array[inext] = ret
+        self.inext = inext
+        self.inextp = inextp
+        return ret
+
+    def next(self, max_exclusive: int) -> int:
+        if max_exclusive <= 1:
+            return 0
+        return int(self._internal_sample() * (1.0 / self.MBIG) * max_exclusive)
+
+class PearsonHash:
+    def __init__(self, rng: DotNetRandom):
+        self.aux = bytearray(range(AUX_TABLE_SIZE))
+        self.shuffle(rng)
+
+    def shuffle(self, rng: DotNetRandom) -> None:
+        aux = self.aux
+        for i in range(len(aux), 0, -1):
+            j = rng.next(i)
+            aux[j], aux[i - 1] = aux[i - 1], aux[j]
+
+    def hash(self, data: bytes) -> int:
+        h = 0
+        aux = self.aux
+        for b in data:
+            h = aux[h ^ b]
+        return h
+
+class NameBatch:
+    """All dictionary names laid out column-wise for hashing every name at once.
+
+    Names are sorted longest first, so the names that still have a character at
+    position k are a prefix of the batch; each column is hashed with one big-int
+    XOR and one bytes.translate through the aux table.
+    """
+    def __init__(self, names: list[str]):
+        encoded = [name.upper().encode("ascii", "replace") for name in names]
+        self.order = sorted(range(len(encoded)), key=lambda i: -len(encoded[i]))
+        ordered = [encoded[i] for i in self.order]
+        longest = len(ordered[0]) if ordered else 0
+        self.columns = []
+        for k in range(longest):
+            col = bytes(name[k] for name in ordered if len(name) > k)
+            self.columns.append((len(col), int.from_bytes(col, "big")))
+        self.count = len(encoded)
+
+    def hash(self, aux: bytes) -> list[int]:
+        """Pearson hash of every name (in the original order) through aux."""
+        h = bytes(self.count)
+        for n, col in self.columns:
+            x = (int.from_bytes(h[:n], "big") ^ col).to_bytes(n, "big")
+            h = x.translate(aux) + h[n:]
+        out = [0] * self.count
+        for pos, i in enumerate(self.order):
+            out[i] = h[pos]
+        return out
+
+def slot_pairs(batch: NameBatch, aux1: bytes, aux2: bytes, mask: int) -> list[tuple[int, int]]:
+    """(H1, H2) for every name."""
+    p1 = batch.hash(bytes(aux1))
+    p2 = batch.hash(bytes(aux2))
+    return [(((a << 8) | b) & mask, ((b << 8) | a) & mask) for a, b in zip(p1, p2)]
+
+class CuckooTable:
+    """toollib::cuckoo::CuckooHashTable with words identified by index.
+
+    Kicked entries always move to their second slot and a second kick of the
+    same entry gives up, exactly like the generator this replaces.
+    """
+    def __init__(self):
+        self.slots: dict[int, list] = {}   # slot -> [h1, h2, word, seen]
+
+    def add(self, word: int, h1: int, h2: int) -> bool:
+        slots = self.slots
+        if h1 not in slots:
+            slots[h1] = [h1, h2, word, False]
+            return True
+        for existing in slots.values():
+            existing[3] = False
+        entry = [h1, h2, word, False]
+        while True:
+            if entry[1] not in slots:
+                slots[entry[1]] = entry
+                return True
+            kicked = slots.pop(entry[1])
+            if kicked[3]:
+                slots[kicked[1]] = kicked
+                return False
+            entry[3] = True
+            slots[entry[1]] = entry
+            kicked[3] = True
+            entry = kicked
+
+    def placement(self) -> dict[int, int]:
+        """slot -> word index."""
+        return {slot: e[2] for slot, e in self.slots.items()}
+
+def place(pairs: list[tuple[int, int]], size: int, gains: list[int] | None = None) -> dict[int, int] | None:
+    """Best slot -> word assignment for the given (H1, H2) pairs; None if none exists.
+
+    Each word is an edge between its two slots.  A component of that graph fits
+    if it has no more words than slots: a tree leaves one slot empty and is
+    oriented away from it, a single cycle is oriented one way or the other with
+    its trees pointing outwards.  Of those orientations the one with the most
+    gain at H1 is kept (gains[i] for word i, default 1 each).
+    """
+    count = len(pairs)
+    if count > size:
+        return None
+    gain = gains or [1] * count
+    adj: dict[int, list[int]] = {}
+    for i, (h1, h2) in enumerate(pairs):
+        adj.setdefault(h1, []).append(i)
+        if h2 != h1:
+            adj.setdefault(h2, []).append(i)
+
+    def other(i: int, slot: int) -> int:
+        h1, h2 = pairs[i]
+        return h2 if slot == h1 else h1
+
+    def value(i: int, slot: int) -> int:
+        return gain[i] if pairs[i][0] == slot else 0
+
+    slots: dict[int, int] = {}
+    seen: set[int] = set()
+    for start in adj:
+        if start in seen:
+            continue
+        comp = [start]
+        seen.add(start)
+        edges = set()
+        for v in comp:
+            for i in adj[v]:
+                edges.add(i)
+                u = other(i, v)
+                if u not in seen:
+                    seen.add(u)
+                    comp.append(u)
+        if len(edges) > len(comp):
+            return None
+        if len(edges) < len(comp):
+            # Tree: root it at comp[0], then move the empty root to wherever H1 gains most.
+            parent_edge = {start: None}
+            order = [start]
+            for v in order:
+                for i in adj[v]:
+                    u = other(i, v)
+                    if u not in parent_edge:
+                        parent_edge[u] = i
+                        order.append(u)
+            score = {start: sum(value(parent_edge[v], v) for v in order[1:])}
+            for v in order[1:]:
+                i = parent_edge[v]
+                p = other(i, v)
+                score[v] = score[p] - value(i, v) + value(i, p)
+            root = max(order, key=lambda v: score[v])
+            assigned = {root}
+            stack = [root]
+            while stack:
+                v = stack.pop()
+                for i in adj[v]:
+                    u = other(i, v)
+                    if u not in assigned:
+                        assigned.add(u)
+                        slots[u] = i
+                        stack.append(u)
+            continue
+        # One cycle: peel the trees off from their leaves inwards, then orient the cycle.
+        degree = {v: len(adj[v]) for v in comp}
+        free_edges = set(edges)
+        leaves = [v for v in comp if degree[v] == 1 and pairs[adj[v][0]][0] != pairs[adj[v][0]][1]]
+        while leaves:
+            v = leaves.pop()
+            i = next(i for i in adj[v] if i in free_edges)
+            free_edges.discard(i)
+            slots[v] = i
+            u = other(i, v)
+            degree[u] -= 1
+            if degree[u] == 1:
+                last = next(e for e in adj[u] if e in free_edges)
+                if pairs[last][0] != pairs[last][1]:
+                    leaves.append(u)
+        i = min(free_edges)
+        h1, h2 = pairs[i]
+        if h1 == h2:
+            slots[h1] = i
+            continue
+        forward, backward = [], []
+        v, prev = h2, i
+        forward.append((i, h2))
+        backward.append((i, h1))
+        while v != h1:
+            nxt = next(e for e in adj[v] if e in free_edges and e != prev)
+            u = other(nxt, v)
+            forward.append((nxt, u))
+            backward.append((nxt, v))
+            v, prev = u, nxt
+        best = max(forward, backward, key=lambda cycle: sum(value(e, slot) for e, slot in cycle))
+        for e, slot in best:
+            slots[slot] = e
+    return slots
+
+class Tables(NamedTuple):
+    seed: int
+    attempts: int
+    aux1: bytes
+    aux2: bytes
+    mask: int
+    slots: dict[int, int]   # slot -> word index
+    first: int              # words found at their H1 slot
+    weight: int = 0         # summed weights of those words, when build() was given weights
+
+def insertion_order(weights: list[int]) -> list[int]:
+    """Heaviest words first, so they claim their H1 slots before lighter words can."""
+    return sorted(range(len(weights)), key=lambda i: -weights[i])
+
+def build(batch: NameBatch, seed: int, mask: int = HASH_TABLE_SIZE - 1, max_attempts: int = 100000,
+          weights: list[int] | None = None, exact: bool = False) -> Tables | None:
+    """Shuffle from seed until every word fits, like phashgen; None if max_attempts is exceeded.
+
+    Without weights words are inserted in dictionary order, as phashgen does; with
+    weights they are inserted heaviest first and Tables.weight is filled in.
+    exact=True places words with place() instead of the cuckoo table, which fits
+    far fuller tables and puts as much weight as possible at H1 (not phashgen-compatible).
+    """
+    rng = DotNetRandom(seed)
+    phf1 = PearsonHash(rng)
+    phf2 = PearsonHash(rng)
+    order = range(batch.count) if weights is None else insertion_order(weights)
+    gains = None if weights is None else [w * (batch.count + 1) + 1 for w in weights]
+    for attempt in range(1, max_attempts + 1):
+        pairs = slot_pairs(batch, phf1.aux, phf2.aux, mask)
+        if exact:
+            slots = place(pairs, mask + 1, gains)
+        else:
+            table = CuckooTable()
+            slots = table.placement() if all(table.add(i, *pairs[i]) for i in order) else None
+        if slots is not None:
+            if len(slots) == batch.count:
+                at_h1 = [i for slot, i in slots.items() if pairs[i][0] == slot]
+                weight = sum(weights[i] for i in at_h1) if weights is not None else 0
+                return Tables(seed, attempt, bytes(phf1.aux), bytes(phf2.aux), mask, slots, len(at_h1), weight)
+        phf1.shuffle(rng)
+        phf2.shuffle(rng)
+    return None
+
+def write_byte_data(lines: list[str], data: bytes) -> None:
+    for i in range(0, len(data), 8):
+        lines.append("            .BYTE   " + ",".join(str(b) for b in data[i:i + 8]))
+
+def phash_asm(tables: Tables, labels: list[str]) -> str:
+    """phash.asm text in phashgen's format; labels[i] is the CFA label of word i."""
+    size = tables.mask + 1
+    lines = [f"PHASHMASK =    0{tables.mask >> 8:02X}H"]
+    for label, org, aux in (("PHASHAUX1", aux1_org(size), tables.aux1), ("PHASHAUX2", aux2_org(size), tables.aux2)):
+        lines.append(f"            .ORG    0{org:04X}H")
+        lines.append(f"{label}:")
+        write_byte_data(lines, aux)
+    lines.append(f"            .ORG    0{tab_org(size):04X}H")
+    lines.append("PHASHTAB:")
+    for slot in range(size):
+        word = tables.slots.get(slot)
+        lines.append("            .WORD   0" if word is None else f"            .WORD   {labels[word]}-NFATOCFASZ")
+    return "\n".join(lines) + "\n"
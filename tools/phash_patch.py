@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Single-assembly PHASH build: patch the hash tables straight into an assembled ROM.
+
+The two-pass build assembles without PHASH, generates phash.asm from that image and
+assembles again.  The tables only fill a region at the top of the ROM, so instead:
+
+  phash_patch.py --reserve build/mforth_single/phash.asm [--size N]
+      writes a phash.asm that reserves the region (zero-filled PHASHAUX1/PHASHAUX2/PHASHTAB
+      at aux1_org/aux2_org/tab_org) so the -DPHASH assembly has its final layout;
+  phash_patch.py IMAGE SYM OUT [phashgen.py seed options]
+      walks the dictionary from _latestforth, generates the tables for the reserved size,
+      resolves every PHASHTAB entry through the symbol index (CFA label - nfatocfasz, as
+      phash.asm would), writes the mask into the ANI operand at _swlphash1 and saves OUT.
+
+The code bytes that address the tables (MVI D in _phash, ADI in _swlphash1) are checked
+against the reserved region before anything is written.  For a given seed the result is
+the image the two-pass build produces.
+"""
+from __future__ import annotations
+import argparse, pathlib, sys
+
+import mforth_dict
+import phash
+import phashgen
+import wordfreq
+from jobs import job_count
+from symindex import Symbols
+
+ANI, ADI, MVI_D = 0xE6, 0xC6, 0x16
+
+# (symbol, offset of the opcode, opcode, what its operand must be) -- see search.asm.
+def operand_checks(aux1: int, aux2: int, tab: int) -> list[tuple[str, int, int, int]]:
+    return [
+        ("_phashnext1", 4, MVI_D, aux1 >> 8),    # XTHL, MOV B,A, XRA H, MOV E,A, MVI D,phashaux1>>8
+        ("_phashnext1", 11, MVI_D, aux2 >> 8),   # LDAX D, MOV H,A, MOV A,B, XRA L, MOV E,A, MVI D,phashaux2>>8
+        ("_swlphash1", 5, ADI, tab >> 8),        # ANI, MOV H,A, DAD H, MOV A,H, ADI phashtab>>8
+    ]
+
+def reserve_asm(size: int) -> str:
+    empty = phash.Tables(0, 0, bytes(phash.AUX_TABLE_SIZE), bytes(phash.AUX_TABLE_SIZE), size - 1, {}, 0)
+    return phash.phash_asm(empty, [])
+
+def require(symbols: Symbols, name: str) -> int:
+    addr = symbols.get(name)
+    if addr is None:
+        raise SystemExit(f"symbol '{name}' is not in the .sym; was the image assembled with -DPHASH?")
+    return addr
+
+def patch(image: bytearray, tables: phash.Tables, entries: list[int], aux1: int, aux2: int, tab: int,
+          mask_at: int) -> None:
+    image[aux1:aux1 + phash.AUX_TABLE_SIZE] = tables.aux1
+    image[aux2:aux2 + phash.AUX_TABLE_SIZE] = tables.aux2
+    cells = bytearray(2 * (tables.mask + 1))
+    for slot, word in tables.slots.items():
+        cells[2 * slot] = entries[word] & 0xFF
+        cells[2 * slot + 1] = entries[word] >> 8
+    image[tab:tab + len(cells)] = cells
+    image[mask_at] = tables.mask >> 8
+
+def main():
+    ap=argparse.ArgumentParser(description="Generate the PHASH tables and patch them into an assembled ROM.")
+    ap.add_argument("image", nargs="?", help="ROM assembled with -DPHASH and a reserved phash.asm")
+    ap.add_argument("sym", nargs="?", help="Symbols for the image (.sym)")
+    ap.add_argument("out", nargs="?", help="Patched ROM (may be the image itself)")
+    ap.add_argument("--reserve", metavar="ASM", help="Only write a phash.asm reserving the PHASH region")
+    ap.add_argument("--size", type=int, default=phash.HASH_TABLE_SIZE, help="Entries to reserve, default %(default)s")
+    ap.add_argument("--asm", help="Also write the equivalent phash.asm here")
+    ap.add_argument("--seed", type=int, default=phash.HASH_TABLE_RANDOM_SEED, help="First seed, default %(default)s")
+    ap.add_argument("--seeds", type=int, default=1, help="Number of consecutive seeds to search, default 1")
+    ap.add_argument("-j", "--jobs", type=job_count, default=0, help="Worker processes (0 = one per CPU)")
+    ap.add_argument("--max-attempts", type=int, default=100000, help="Give up on a seed after this many reshuffles")
+    ap.add_argument("--freq", action="append", default=[], metavar="FILE", help="Weight words by lookup frequency")
+    ap.add_argument("--exact", action="store_true", help="Place words optimally instead of like phashgen")
+    args=ap.parse_args()
+
+    if args.reserve:
+        if args.size < phash.AUX_TABLE_SIZE or args.size & (args.size - 1):
+            raise SystemExit("--size must be a power of two of at least 256")
+        pathlib.Path(args.reserve).write_text(reserve_asm(args.size))
+        return 0
+    if not (args.image and args.sym and args.out):
+        ap.error("image, sym and out are required unless --reserve is given")
+
+    image=bytearray(pathlib.Path(args.image).read_bytes())
+    if len(image) != mforth_dict.ROM_SIZE:
+        raise SystemExit(f"MFORTH ROM was only {len(image)} bytes long; expected {mforth_dict.ROM_SIZE} bytes.")
+    symbols=Symbols(pathlib.Path(args.sym))
+    aux1, aux2, tab=(require(symbols, n) for n in ("phashaux1", "phashaux2", "phashtab"))
+    size=(mforth_dict.ROM_SIZE - tab) // 2
+    if size < phash.AUX_TABLE_SIZE or size & (size - 1) or (aux1, aux2) != (phash.aux1_org(size), phash.aux2_org(size)):
+        raise SystemExit(f"PHASH region {aux1:04X}/{aux2:04X}/{tab:04X} is not a reserved {size}-entry layout")
+    for name, offset, opcode, operand in operand_checks(aux1, aux2, tab):
+        at=require(symbols, name) + offset
+        if image[at] != opcode or image[at + 1] != operand:
+            raise SystemExit(f"{name}+{offset} ({at:04X}) is {image[at]:02X} {image[at + 1]:02X}, "
+                             f"expected {opcode:02X} {operand:02X}")
+    mask_at=require(symbols, "_swlphash1") + 1
+    if image[mask_at - 1] != ANI:
+        raise SystemExit(f"_swlphash1 ({mask_at - 1:04X}) is not ANI phashmask")
+
+    nfatocfasz=require(symbols, "nfatocfasz")
+    head=require(symbols, "_latestforth") - nfatocfasz
+    try:
+        words=mforth_dict.words(bytes(image), head)
+        labels=phashgen.cfa_labels(words, phashgen.load_symbols(args.sym))
+    except ValueError as e:
+        raise SystemExit(str(e))
+    entries=[]
+    for word, label in zip(words, labels):
+        addr=symbols.get(label)
+        if addr is None or addr - nfatocfasz != word.nfa:
+            raise SystemExit(f"symbol '{label}' does not resolve to the CFA of '{word.name}'")
+        entries.append(addr - nfatocfasz)
+
+    weights=None
+    if args.freq:
+        weights=wordfreq.weights_for([w.name for w in words], wordfreq.load_any(args.freq))
+    seeds=list(range(args.seed, args.seed + max(1, args.seeds)))
+    tables, ok=phashgen.search([w.name for w in words], seeds, args.jobs, size - 1, args.max_attempts,
+                               weights, args.exact)
+    if tables is None:
+        raise SystemExit(f"No seed produced a complete {size}-entry hash table for {len(words)} words; "
+                         f"reserve a larger table or try --exact.")
+    patch(image, tables, entries, aux1, aux2, tab, mask_at)
+    out=pathlib.Path(args.out)
+    tmp=out.with_name(out.name + ".tmp")
+    tmp.write_bytes(image)
+    tmp.replace(out)
+    if args.asm:
+        pathlib.Path(args.asm).write_text(phash.phash_asm(tables, labels))
+    print(f"Patched {out}: seed {tables.seed} ({ok} of {len(seeds)} seeds succeeded), {size} entries, "
+          f"{len(words)} words, {tables.first} at first hash location", file=sys.stderr)
+    return 0
+
+if __name__=="__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Generate src/phash.asm from a pass-1 ROM and its symbols (same arguments and output as phashgen).
+
+With --seeds N the seeds SEED..SEED+N-1 are tried across a process pool and the tables that
+put the most words at their first (H1) slot are kept; every word there costs _swlphash one
+probe less on each FIND.  With the defaults the output is identical to phashgen's.
+
+--freq FILE weights each word by how often it is looked up (PRINT-PROFILE counts, or token
+counts of .DO/.fs sources, see wordfreq.py): words are then inserted heaviest first and the
+tables that put the most lookups, rather than the most words, at H1 are kept.
+
+--min-size looks for the smallest table (256 << k entries; search.asm masks only H1's high
+byte) whose mean probe count per ROM-word lookup stays within --max-probes, and reports the
+ROM freed below the PHASH region.  It and --exact place words optimally (phash.place)
+instead of with phashgen's cuckoo insertion, so the tables differ from phashgen's.
+"""
+from __future__ import annotations
+import argparse, pathlib, sys
+from concurrent.futures import ProcessPoolExecutor
+
+import mforth_dict
+import phash
+import wordfreq
+from jobs import job_count
+from symindex import load_entries
+
+def load_symbols(sym_path: str | pathlib.Path) -> dict[int, str]:
+    """addr -> name, from the .symidx next to the .sym when it is current, else the text .sym."""
+    return {addr: name for addr, name in load_entries(sym_path)}   # listing order: last name wins
+
+def cfa_labels(words: list[mforth_dict.Word], symbols: dict[int, str]) -> list[str]:
+    labels = []
+    for word in words:
+        label = symbols.get((word.nfa + 3) & 0xFFFF) or symbols.get((word.nfa + 5) & 0xFFFF)
+        if label is None:
+            raise ValueError(f"missing symbol for word '{word.name}'")
+        labels.append(label)
+    return labels
+
+_batch: phash.NameBatch | None = None
+_mask = phash.HASH_TABLE_SIZE - 1
+_max_attempts = 0
+_weights: list[int] | None = None
+_exact = False
+
+def _init_worker(names: list[str], mask: int, max_attempts: int, weights: list[int] | None = None,
+                 exact: bool = False) -> None:
+    global _batch, _mask, _max_attempts, _weights, _exact
+    _batch = phash.NameBatch(names)
+    _mask = mask
+    _max_attempts = max_attempts
+    _weights = weights
+    _exact = exact
+
+def _build_worker(seed: int) -> phash.Tables | None:
+    return phash.build(_batch, seed, _mask, _max_attempts, _weights, _exact)
+
+def search(names: list[str], seeds: list[int], jobs: int = 1, mask: int = phash.HASH_TABLE_SIZE - 1,
+           max_attempts: int = 100000, weights: list[int] | None = None,
+           exact: bool = False) -> tuple[phash.Tables | None, int]:
+    """Best tables over seeds and how many seeds succeeded.
+
+    Best is the most first-slot lookups (Tables.weight) when weights are given, then the
+    most first-slot words, then the earliest seed.
+    """
+    if jobs > 1 and len(seeds) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(seeds)), initializer=_init_worker,
+                                 initargs=(names, mask, max_attempts, weights, exact)) as pool:
+            results = list(pool.map(_build_worker, seeds, chunksize=max(1, len(seeds) // (jobs * 8))))
+    else:
+        _init_worker(names, mask, max_attempts, weights, exact)
+        results = [_build_worker(seed) for seed in seeds]
+    best = None
+    for tables in results:
+        if tables is not None and (best is None or (tables.weight, tables.first) > (best.weight, best.first)):
+            best = tables
+    return best, sum(1 for t in results if t is not None)
+
+def mean_probes(tables: phash.Tables, count: int, weights: list[int] | None = None) -> float:
+    """PHASHTAB probes per successful lookup of a ROM word: 1 at H1, 2 at H2."""
+    if weights is None:
+        return 2.0 - tables.first / count
+    return 2.0 - tables.weight / sum(weights)
+
+def code_end(rom: bytes) -> int:
+    """First address after the last non-zero byte below the standard PHASH region."""
+    end = phash.aux1_org()
+    while end and rom[end - 1] == 0:
+        end -= 1
+    return end
+
+def min_size(names: list[str], seeds: list[int], jobs: int, max_probes: float, max_attempts: int,
+             weights: list[int] | None = None) -> tuple[phash.Tables | None, int, list[tuple[int, float | None]]]:
+    """Smallest table within max_probes: (tables, seeds that fit it, [(size, best mean probes or None)])."""
+    size = phash.AUX_TABLE_SIZE
+    while size < len(names):
+        size <<= 1
+    tried = []
+    while size <= phash.HASH_TABLE_SIZE:
+        tables, ok = search(names, seeds, jobs, size - 1, max_attempts, weights, exact=True)
+        probes = None if tables is None else mean_probes(tables, len(names), weights)
+        tried.append((size, probes))
+        if probes is not None and probes <= max_probes:
+            return tables, ok, tried
+        size <<= 1
+    return None, 0, tried
+
+def main():
+    ap=argparse.ArgumentParser()
+    ap.add_argument("rom", help="Pass-1 ROM image (32 KiB, latest word pointer at 07FFEH)")
+    ap.add_argument("sym", help="Symbols for the ROM (.sym)")
+    ap.add_argument("outasm", help="Output phash.asm")
+    ap.add_argument("--seed", type=int, default=phash.HASH_TABLE_RANDOM_SEED, help="First seed, default %(default)s")
+    ap.add_argument("--seeds", type=int, default=1, help="Number of consecutive seeds to search, default 1")
+    ap.add_argument("-j", "--jobs", type=job_count, default=0, help="Worker processes (0 = one per CPU)")
+    ap.add_argument("--max-attempts", type=int, default=100000, help="Give up on a seed after this many reshuffles")
+    ap.add_argument("--freq", action="append", default=[], metavar="FILE",
+                    help="Weight words by lookup frequency: PRINT-PROFILE output, NAME COUNT lines, "
+                         "or Forth sources (.DO/.fs); may be repeated")
+    ap.add_argument("--exact", action="store_true", help="Place words optimally instead of like phashgen")
+    ap.add_argument("--min-size", action="store_true", help="Use the smallest table within --max-probes")
+    ap.add_argument("--max-probes", type=float, default=1.25,
+                    help="Largest acceptable mean probes per ROM-word lookup for --min-size, default %(default)s")
+    args=ap.parse_args()
+
+    try:
+        rom=mforth_dict.load_rom(args.rom)
+        words=mforth_dict.words(rom)
+        labels=cfa_labels(words, load_symbols(args.sym))
+    except ValueError as e:
+        raise SystemExit(str(e))
+    weights=None
+    if args.freq:
+        weights=wordfreq.weights_for([w.name for w in words], wordfreq.load_any(args.freq))
+        if not any(weights):
+            raise SystemExit("No word in the frequency file(s) is in the dictionary.")
+
+    print(f"Generating PHASH tables: {args.seeds} seed(s) from {args.seed} ...", flush=True)
+    seeds=list(range(args.seed, args.seed + max(1, args.seeds)))
+    names=[w.name for w in words]
+    if args.min_size:
+        tables, ok, tried = min_size(names, seeds, args.jobs, args.max_probes, args.max_attempts, weights)
+        for size, probes in tried:
+            result = "no fit" if probes is None else f"{probes:.3f} probes per lookup"
+            print(f"  {size:5d} entries: {result}")
+        if tables is None:
+            raise SystemExit(f"No table size up to {phash.HASH_TABLE_SIZE} fits within {args.max_probes} probes.")
+    else:
+        tables, ok = search(names, seeds, args.jobs, max_attempts=args.max_attempts, weights=weights,
+                            exact=args.exact)
+    if tables is None:
+        raise SystemExit(f"No seed produced a complete hash table for {len(words)} words.")
+    print(f"Done! seed {tables.seed} ({ok} of {len(seeds)} seeds succeeded; {tables.attempts} shuffle(s))")
+    print(f"Total words: {len(words)}; at first hash location: {tables.first}; "
+          f"at second hash location: {len(words) - tables.first}")
+    if weights is not None:
+        total=sum(weights)
+        print(f"Weighted lookups at first hash location: {tables.weight} of {total} "
+              f"({100.0 * tables.weight / total:.1f}%)")
+    size=tables.mask + 1
+    if size != phash.HASH_TABLE_SIZE:
+        freed=phash.aux1_org(size) - phash.aux1_org()
+        print(f"Table size: {size} entries (PHASHMASK 0{tables.mask >> 8:02X}H); PHASH region "
+              f"{phash.aux1_org(size):04X}-7FFF; frees {freed} bytes of ROM")
+    print(f"Code ends at {code_end(rom):04X}; {phash.aux1_org(size) - code_end(rom)} bytes free below the PHASH region")
+    pathlib.Path(args.outasm).write_text(phash.phash_asm(tables, labels))
+
+if __name__=="__main__":
+    main()
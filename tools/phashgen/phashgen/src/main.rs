@@ -19,6 +19,9 @@ struct Args {
     rom: PathBuf,
     sym: PathBuf,
     outasm: PathBuf,
+    /// Seed for the aux-table shuffles.
+    #[arg(long, default_value_t = HASH_TABLE_RANDOM_SEED, allow_hyphen_values = true)]
+    seed: i32,
 }
 
 fn main() -> Result<()> {
@@ -34,7 +37,7 @@ fn run(args: Args) -> Result<()> {
     print!("Generating PHASH tables: ");
     io::stdout().flush().ok();
 
-    let mut rng = DotNetRandom::new(HASH_TABLE_RANDOM_SEED);
+    let mut rng = DotNetRandom::new(args.seed);
     let mut phf1 = PearsonHashFunction::new(&mut rng);
     let mut phf2 = PearsonHashFunction::new(&mut rng);
 
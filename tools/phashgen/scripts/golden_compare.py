@@ -1,89 +1,287 @@
 #!/usr/bin/env python3
+"""Compare phashgen implementations across many seeds, ROMs and dictionary perturbations.
+
+Each generator is built once, then every case (ROM variant x seed) is run through all of
+them in a pool of worker processes and the phash.asm texts are compared:
+
+  python   tools/phash.py, run in-process in the worker
+  rust     tools/phashgen (cargo build --release, once)
+  csharp   the old PhashGen project (dotnet build, once); it has no seed option, so it
+           only takes part in cases with the default seed
+
+Dictionary perturbations are derived from each ROM deterministically: the newest words
+dropped (0x7FFE moved down the chain), a word unlinked from the middle of the chain, or a
+letter of a name changed.  The symbols stay valid because no address moves.
+
+Every divergence is reported (case, the two implementations, the number of differing
+lines and the first one); the exit status is 1 if there was any.
+"""
 import argparse
+import json
+import os
+import random
+import shutil
 import subprocess
+import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT / "tools"))
+
+import mforth_dict  # noqa: E402
+import phash  # noqa: E402
+import phashgen  # noqa: E402
+
+IMPLEMENTATIONS = ("python", "rust", "csharp")
+
 
 def run(cmd, cwd=None):
     subprocess.run(cmd, cwd=cwd, check=True)
 
 
-def compare_files(a: Path, b: Path) -> int:
-    a_lines = a.read_text().splitlines()
-    b_lines = b.read_text().splitlines()
-    if a_lines == b_lines:
-        return 0
-    max_len = max(len(a_lines), len(b_lines))
-    for i in range(max_len):
+# ----------------------------------------------------------------------
+# Dictionary perturbations
+
+
+def perturb(rom: bytes, kind: str, rng: random.Random) -> tuple[bytes, str]:
+    """A copy of rom with the dictionary changed, and a description of the change."""
+    out = bytearray(rom)
+    words = mforth_dict.words(rom)
+    if kind == "drop":
+        k = rng.randrange(1, max(2, len(words) // 4))
+        head = words[k].nfa
+        out[mforth_dict.LATEST_WORD_PTR_ADDR:mforth_dict.LATEST_WORD_PTR_ADDR + 2] = head.to_bytes(2, "little")
+        return bytes(out), f"drop {k} newest"
+    if kind == "unlink":
+        k = rng.randrange(1, len(words) - 1)
+        lfa = words[k - 1].nfa + mforth_dict.NFATOLFASZ
+        out[lfa:lfa + 2] = words[k + 1].nfa.to_bytes(2, "little")
+        return bytes(out), f"unlink {words[k].name}"
+    if kind == "rename":
+        names = {w.name for w in words}
+        for _ in range(100):
+            word = rng.choice(words)
+            pos = rng.randrange(len(word.name))
+            if not word.name[pos].isalpha():
+                continue
+            letter = chr(rng.randrange(ord("A"), ord("Z") + 1))
+            renamed = word.name[:pos] + letter + word.name[pos + 1:]
+            if renamed in names:
+                continue
+            addr = word.nfa - 1 - pos  # names are stored backwards
+            out[addr] = (out[addr] & 0x80) | ord(letter)
+            return bytes(out), f"rename {word.name} -> {renamed}"
+        return bytes(out), "rename (none found)"
+    raise ValueError(kind)
+
+
+def variants(rom_path: Path, count: int, kinds: list[str]) -> list[tuple[str, bytes]]:
+    """(label, image) for the ROM itself and count perturbations of it."""
+    rom = mforth_dict.load_rom(rom_path)
+    out = [(rom_path.name, rom)]
+    rng = random.Random(rom_path.name)
+    for i in range(count):
+        image, what = perturb(rom, kinds[i % len(kinds)], rng)
+        out.append((f"{rom_path.name}#{i + 1} ({what})", image))
+    return out
+
+
+# ----------------------------------------------------------------------
+# Generators
+
+
+def build_generators(wanted: list[str], cargo_dir: Path, csproj: Path, out_dir: Path) -> dict[str, list[str] | None]:
+    """impl -> command prefix (None for the in-process Python generator)."""
+    gens: dict[str, list[str] | None] = {}
+    for impl in wanted:
+        if impl == "python":
+            gens[impl] = None
+        elif impl == "rust":
+            print("== Building Rust phashgen ==", flush=True)
+            run(["cargo", "build", "--release", "-p", "phashgen"], cwd=cargo_dir)
+            gens[impl] = [str(cargo_dir / "target" / "release" / "phashgen")]
+        elif impl == "csharp":
+            print("== Building C# PhashGen ==", flush=True)
+            run(["dotnet", "build", "-c", "Release", str(csproj), "-o", str(out_dir / "csharp")])
+            gens[impl] = ["dotnet", str(out_dir / "csharp" / "PhashGen.dll")]
+    return gens
+
+
+def available(cargo_dir: Path, csproj: Path) -> list[str]:
+    found = ["python"]
+    if shutil.which("cargo") and (cargo_dir / "Cargo.toml").exists():
+        found.append("rust")
+    if shutil.which("dotnet") and csproj.exists():
+        found.append("csharp")
+    return found
+
+
+def generate_python(rom: Path, sym: Path, seed: int) -> str:
+    words = mforth_dict.words(mforth_dict.load_rom(rom))
+    labels = phashgen.cfa_labels(words, phashgen.load_symbols(sym))
+    tables = phash.build(phash.NameBatch([w.name for w in words]), seed)
+    if tables is None:
+        raise RuntimeError("no complete hash table")
+    return phash.phash_asm(tables, labels)
+
+
+def generate(impl: str, cmd: list[str] | None, rom: Path, sym: Path, seed: int, out: Path, timeout: float) -> str:
+    if cmd is None:
+        return generate_python(rom, sym, seed)
+    args = cmd + [str(rom), str(sym), str(out)]
+    if impl == "rust":
+        args += ["--seed", str(seed)]
+    subprocess.run(args, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout)
+    return out.read_text()
+
+
+# ----------------------------------------------------------------------
+# Comparison
+
+
+def first_difference(a: str, b: str) -> tuple[int, int, str, str]:
+    """(differing line count, first differing line number, left, right)."""
+    a_lines = a.splitlines()
+    b_lines = b.splitlines()
+    first = None
+    count = 0
+    for i in range(max(len(a_lines), len(b_lines))):
         left = a_lines[i] if i < len(a_lines) else "<EOF>"
         right = b_lines[i] if i < len(b_lines) else "<EOF>"
         if left != right:
-            print(f"Mismatch at line {i+1}:")
-            print(f"  C#:  {left}")
-            print(f"  Rust:{right}")
-            return 1
-    return 1
+            count += 1
+            if first is None:
+                first = (i + 1, left, right)
+    return (count, *first) if first else (0, 0, "", "")
+
+
+_gens: dict[str, list[str] | None] = {}
+_timeout = 60.0
+
+
+def _init_worker(gens, timeout):
+    global _gens, _timeout
+    _gens = gens
+    _timeout = timeout
+
+
+def run_case(case: tuple[str, bytes, str, int]) -> dict:
+    """Run every generator on one case; returns outputs' agreement and any divergences."""
+    label, image, sym, seed = case
+    result = {"case": label, "seed": seed, "ran": [], "errors": {}, "divergences": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        rom = tmp_path / "rom.bx"
+        rom.write_bytes(image)
+        outputs = {}
+        for impl, cmd in _gens.items():
+            if impl == "csharp" and seed != phash.HASH_TABLE_RANDOM_SEED:
+                continue
+            try:
+                outputs[impl] = generate(impl, cmd, rom, Path(sym), seed, tmp_path / f"{impl}.asm", _timeout)
+            except subprocess.CalledProcessError as e:
+                result["errors"][impl] = (e.stderr or b"").decode(errors="replace").strip()[-200:] or str(e)
+            except Exception as e:  # a generator that fails is a result, not a harness error
+                result["errors"][impl] = f"{type(e).__name__}: {e}"
+        result["ran"] = sorted(outputs) + sorted(result["errors"])
+    impls = sorted(outputs)
+    for i, a in enumerate(impls):
+        for b in impls[i + 1:]:
+            count, line, left, right = first_difference(outputs[a], outputs[b])
+            if count:
+                result["divergences"].append({"left": a, "right": b, "lines": count,
+                                              "first": line, "left_text": left, "right_text": right})
+    if outputs and result["errors"]:
+        for impl, err in result["errors"].items():
+            result["divergences"].append({"left": impl, "right": ",".join(impls), "lines": 0, "first": 0,
+                                          "left_text": f"failed: {err}", "right_text": "succeeded"})
+    return result
 
 
 def main():
-    repo_root = Path(__file__).resolve().parents[3]
-    parser = argparse.ArgumentParser(description="Compare Rust phashgen output to C# output.")
-    parser.add_argument("--rom", required=True, type=Path)
-    parser.add_argument("--sym", required=True, type=Path)
-    parser.add_argument("--csharp-out", type=Path)
-    parser.add_argument("--rust-out", type=Path)
-    parser.add_argument("--phashgen-csproj", type=Path, default=repo_root / "tools/depricated/PhashGenOld/PhashGen.csproj")
-    parser.add_argument("--cargo-dir", type=Path, default=repo_root / "tools/phashgen_rust")
+    parser = argparse.ArgumentParser(description="Compare phashgen implementations over many cases.")
+    parser.add_argument("--rom", nargs=2, action="append", metavar=("ROM", "SYM"), type=Path,
+                        help="Pass-1 ROM and its .sym (repeatable); default build/MFORTH_pass1.bin/.sym")
+    parser.add_argument("--seed", type=int, default=phash.HASH_TABLE_RANDOM_SEED, help="First seed")
+    parser.add_argument("--seeds", type=int, default=16, help="Consecutive seeds per ROM variant, default 16")
+    parser.add_argument("--perturb", type=int, default=8, help="Perturbed dictionaries per ROM, default 8")
+    parser.add_argument("--kinds", default="drop,unlink,rename", help="Perturbations to use, comma separated")
+    parser.add_argument("--impl", help=f"Implementations to compare, comma separated ({','.join(IMPLEMENTATIONS)}); "
+                                       "default: all that can be built here")
+    parser.add_argument("-j", "--jobs", type=int, default=0, help="Worker processes (0 = one per CPU)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds before a generator run is abandoned")
+    parser.add_argument("--limit", type=int, default=20, help="Show at most N divergences (0 = all)")
+    parser.add_argument("--json", type=Path, help="Also write the full report here")
+    parser.add_argument("--phashgen-csproj", type=Path, default=REPO_ROOT / "tools/depricated/PhashGenOld/PhashGen.csproj")
+    parser.add_argument("--cargo-dir", type=Path, default=REPO_ROOT / "tools/phashgen")
     args = parser.parse_args()
 
+    roms = args.rom or [(REPO_ROOT / "build/MFORTH_pass1.bin", REPO_ROOT / "build/MFORTH_pass1.sym")]
+    for rom, sym in roms:
+        if not rom.exists() or not sym.exists():
+            parser.error(f"missing {rom if not rom.exists() else sym} (run make, or pass --rom ROM SYM)")
+    wanted = args.impl.split(",") if args.impl else available(args.cargo_dir, args.phashgen_csproj)
+    unknown = [i for i in wanted if i not in IMPLEMENTATIONS]
+    if unknown:
+        parser.error(f"unknown implementation(s): {', '.join(unknown)}")
+    if len(wanted) < 2:
+        print(f"WARNING: only {','.join(wanted)} available; nothing to compare against", file=sys.stderr)
+    kinds = [k for k in args.kinds.split(",") if k]
+
     with tempfile.TemporaryDirectory() as tmp:
-        tmp_path = Path(tmp)
-        csharp_out = args.csharp_out or (tmp_path / "phash_csharp.asm")
-        rust_out = args.rust_out or (tmp_path / "phash_rust.asm")
-
-        # Build and run C# PhashGen
-        print("== C# PhashGen ==")
-        out_dir = tmp_path / "csharp"
-        run([
-            "dotnet",
-            "build",
-            "-c",
-            "Release",
-            str(args.phashgen_csproj),
-            "-o",
-            str(out_dir),
-        ])
-        run([
-            "dotnet",
-            str(out_dir / "PhashGen.dll"),
-            str(args.rom),
-            str(args.sym),
-            str(csharp_out),
-        ])
-
-        # Build and run Rust phashgen
-        print("== Rust phashgen ==")
-        run([
-            "cargo",
-            "build",
-            "-p",
-            "phashgen",
-        ], cwd=args.cargo_dir)
-        run([
-            str(args.cargo_dir / "target" / "debug" / "phashgen"),
-            str(args.rom),
-            str(args.sym),
-            str(rust_out),
-        ])
-
-        print("== Compare ==")
-        diff = compare_files(csharp_out, rust_out)
-        if diff == 0:
-            print("OK: outputs match")
+        gens = build_generators(wanted, args.cargo_dir, args.phashgen_csproj, Path(tmp))
+        seeds = range(args.seed, args.seed + max(1, args.seeds))
+        cases = [(label, image, str(sym), seed)
+                 for rom, sym in roms
+                 for label, image in variants(rom, args.perturb, kinds)
+                 for seed in seeds]
+        jobs = args.jobs or os.cpu_count() or 1
+        print(f"== {len(cases)} case(s) x {','.join(gens)} on {jobs} worker(s) ==", flush=True)
+        if jobs > 1:
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                     initargs=(gens, args.timeout)) as pool:
+                results = list(pool.map(run_case, cases, chunksize=max(1, len(cases) // (jobs * 4))))
         else:
-            print("ERROR: outputs differ")
-        raise SystemExit(diff)
+            _init_worker(gens, args.timeout)
+            results = [run_case(c) for c in cases]
+
+    divergent = [r for r in results if r["divergences"]]
+    failed_everywhere = [r for r in results if r["errors"] and len(r["errors"]) == len(r["ran"])]
+    pairs: dict[str, int] = {}
+    for r in divergent:
+        for d in r["divergences"]:
+            key = f"{d['left']} vs {d['right']}"
+            pairs[key] = pairs.get(key, 0) + 1
+
+    print("== Summary ==")
+    print(f"cases: {len(results)}  matching: {len(results) - len(divergent)}  divergent: {len(divergent)}"
+          f"  failed in every implementation: {len(failed_everywhere)}")
+    for key, n in sorted(pairs.items()):
+        print(f"  {key}: {n} case(s)")
+    shown = 0
+    for r in divergent:
+        for d in r["divergences"]:
+            if args.limit and shown >= args.limit:
+                break
+            shown += 1
+            print(f"{r['case']} seed {r['seed']}: {d['left']} vs {d['right']}: "
+                  f"{d['lines']} line(s) differ, first at line {d['first']}")
+            print(f"  {d['left']}: {d['left_text']}")
+            print(f"  {d['right']}: {d['right_text']}")
+    total = sum(len(r["divergences"]) for r in divergent)
+    if shown < total:
+        print(f"... {total - shown} more; use --limit 0 or --json")
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    if divergent:
+        print("ERROR: outputs differ")
+    elif failed_everywhere:
+        print("ERROR: every implementation failed on some case(s)")
+    else:
+        print("OK: outputs match")
+    raise SystemExit(1 if divergent or failed_everywhere else 0)
 
 
 if __name__ == "__main__":
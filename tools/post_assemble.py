@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Post-assembly stage: read an opForge pass's outputs once and write every artifact the build needs.
+
+Given the -o base of an opForge run (BASE.lst, BASE.hex) this writes
+  BASE.sym / BASE.symidx   symbols (opforge_lst_to_sym.py format and index)
+  BASE.words               one line per dictionary word: NFA, CFA, end, size, word list, CFA label, name
+  --bin PATH               the filled binary image (hex2bin_fill.py), if requested
+
+The word lists are walked from the _latestforth/_latestassembler symbols, falling back to the
+pointer at 07FFEH in a pass-1 image.  A word ends at the next dictionary header or at the end of
+the assembled data, whichever comes first.
+"""
+from __future__ import annotations
+import argparse, bisect, pathlib, sys
+
+import mforth_dict
+from hex2bin_fill import HexError, HexImage, parse_hex
+from opforge_lst_to_sym import parse_listing, write_sym
+from symindex import is_noise
+
+WORD_LISTS = (("forth", "_latestforth"), ("assembler", "_latestassembler"))
+
+def covered_runs(img: HexImage) -> list[tuple[int, int]]:
+    """Merged [start, end) address runs that the HEX file writes."""
+    runs: list[list[int]] = []
+    for a, data in sorted(img.segments):
+        if runs and a <= runs[-1][1]:
+            runs[-1][1] = max(runs[-1][1], a + len(data))
+        else:
+            runs.append([a, a + len(data)])
+    return [(a, b) for a, b in runs]
+
+def word_map(rom: bytes, img: HexImage, symbols: list[tuple[int, str, str, int]]) -> list[tuple]:
+    """(nfa, cfa, end, list name, cfa label, word, header start) for every word on every word list."""
+    by_name = {name.lower(): addr for addr, name, _, _ in symbols}
+    by_addr: dict[int, str] = {}
+    for addr, name, _, _ in symbols:
+        if not is_noise(name):
+            by_addr[addr] = name
+    nfatocfasz = by_name.get("nfatocfasz")
+
+    lists = []
+    for list_name, sym in WORD_LISTS:
+        latest = by_name.get(sym)
+        if latest is not None and nfatocfasz is not None:
+            lists.append((list_name, latest - nfatocfasz))
+        elif list_name == "forth":
+            lists.append((list_name, mforth_dict.latest_word_addr(rom)))
+
+    words = []
+    for list_name, head in lists:
+        # No constant in the listing: tell the header layouts apart from the image.
+        size = nfatocfasz if nfatocfasz is not None else mforth_dict.Rom(rom, head).nfatocfasz
+        for word in mforth_dict.words(rom, head):
+            cfa = word.nfa + size
+            words.append((word, list_name, cfa, by_addr.get(cfa, "-")))
+
+    starts = sorted(w.header_start for w, _, _, _ in words)
+    runs = covered_runs(img)
+    run_starts = [a for a, _ in runs]
+    out = []
+    for word, list_name, cfa, label in words:
+        end = cfa
+        i = bisect.bisect_right(run_starts, cfa) - 1
+        if i >= 0 and runs[i][1] > cfa:
+            end = runs[i][1]
+        j = bisect.bisect_right(starts, cfa)
+        if j < len(starts):
+            end = min(end, starts[j])
+        out.append((word.nfa, cfa, end, list_name, label, word.name, word.header_start))
+    out.sort()
+    return out
+
+def write_words(path: pathlib.Path, rows: list[tuple]) -> None:
+    lines = ["# nfa  cfa  end  size list label name"]
+    for nfa, cfa, end, list_name, label, name, header_start in rows:
+        lines.append(f"{nfa:04X} {cfa:04X} {end:04X} {end - header_start:4d} {list_name} {label} {name}")
+    path.write_text("\n".join(lines) + "\n", encoding="ascii", errors="replace")
+
+def main():
+    ap=argparse.ArgumentParser()
+    ap.add_argument("base", help="opForge output base (reads BASE.lst and BASE.hex)")
+    ap.add_argument("--sym", help="Symbols output, default BASE.sym")
+    ap.add_argument("--words", help="Word map output, default BASE.words")
+    ap.add_argument("--bin", help="Also write the filled binary image here")
+    ap.add_argument("--size", default="0x8000", help="Binary size, default 0x8000")
+    ap.add_argument("--fill", default="0x00", help="Fill byte for gaps, default 0x00")
+    ap.add_argument("--no-index", action="store_true", help="Do not write the binary symbol index")
+    args=ap.parse_args()
+    base=pathlib.Path(args.base)
+    lst=base.with_name(base.name+".lst")
+    hexfile=base.with_name(base.name+".hex")
+
+    symbols=parse_listing(lst.read_text(errors="ignore"), lst.name)
+    try:
+        img=parse_hex(hexfile.read_bytes(), str(hexfile))
+        rom=bytes(img.render(0, mforth_dict.ROM_SIZE, int(args.fill,0) & 0xFF))
+        image=img.render(0, int(args.size,0), int(args.fill,0) & 0xFF, strict=True) if args.bin else None
+    except HexError as e:
+        raise SystemExit(str(e))
+
+    write_sym(args.sym or base.with_name(base.name+".sym"), symbols, not args.no_index)
+    try:
+        rows=word_map(rom, img, symbols)
+    except ValueError as e:
+        raise SystemExit(f"ERROR: cannot walk the dictionary: {e}")
+    write_words(pathlib.Path(args.words or base.with_name(base.name+".words")), rows)
+    if image is not None:
+        pathlib.Path(args.bin).write_bytes(image)
+    print(f"{base.name}: {len(symbols)} symbols, {len(rows)} words", file=sys.stderr)
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Compare two ROM images and report what changed, by address range and symbol.
+
+Differing bytes are grouped into contiguous ranges.  Each range is annotated
+with the enclosing symbols from a .sym file (NAME XXXX per line, as written
+by opforge_lst_to_sym.py; its .symidx is used when current), and is checked
+for pure relocation: a block that is byte-identical to the other image at a
+small offset is reported as a shift instead of as changed bytes.  The exit
+status is 0 when the images are identical and 1 otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from bisect import bisect_right
+from pathlib import Path
+from typing import NamedTuple
+
+from symindex import load_entries
+
+BLOCK = 256
+MIN_SHIFT_RUN = 16
+
+
+class DiffRange(NamedTuple):
+    start: int
+    end: int  # exclusive
+
+
+class Piece(NamedTuple):
+    start: int
+    end: int
+    shift: int | None  # None: bytes differ; otherwise new[i] == old[i + shift]
+
+
+class Symbols:
+    def __init__(self, entries: list[tuple[int, str]]):
+        entries.sort(key=lambda e: e[0])  # stable: the last name listed at an address wins
+        self.addrs = [addr for addr, _ in entries]
+        self.names = [name for _, name in entries]
+
+    @classmethod
+    def load(cls, path: Path) -> Symbols:
+        """From a .sym, or its .symidx when that is current."""
+        return cls(load_entries(path))
+
+    def at(self, addr: int) -> str:
+        i = bisect_right(self.addrs, addr) - 1
+        if i < 0:
+            return f"{addr:04X}"
+        offset = addr - self.addrs[i]
+        return f"{self.names[i]}+{offset:X}" if offset else self.names[i]
+
+
+def diff_ranges(new: bytes, old: bytes, merge_gap: int = 0) -> list[DiffRange]:
+    """Return the ranges where new and old differ, comparing BLOCK bytes at a time."""
+    size = max(len(new), len(old))
+    ranges: list[DiffRange] = []
+    start = None
+    last = -1
+    for base in range(0, size, BLOCK):
+        a = new[base:base + BLOCK]
+        b = old[base:base + BLOCK]
+        if a == b:
+            continue
+        for i in range(max(len(a), len(b))):
+            if i < len(a) and i < len(b) and a[i] == b[i]:
+                continue
+            addr = base + i
+            if start is not None and addr - last - 1 <= merge_gap:
+                last = addr
+                continue
+            if start is not None:
+                ranges.append(DiffRange(start, last + 1))
+            start = last = addr
+    if start is not None:
+        ranges.append(DiffRange(start, last + 1))
+    return ranges
+
+
+def common_run(a: bytes, i: int, b: bytes, j: int, limit: int) -> int:
+    """Length of the common prefix of a[i:] and b[j:], at most limit."""
+    n = 0
+    step = 64
+    while n < limit:
+        k = min(step, limit - n)
+        if a[i + n:i + n + k] == b[j + n:j + n + k] and len(a[i + n:i + n + k]) == k:
+            n += k
+            continue
+        if step == 1:
+            break
+        step = max(1, step // 8)
+    return n
+
+
+def best_shift(new: bytes, old: bytes, pos: int, end: int, max_shift: int) -> tuple[int, int]:
+    """Find the offset at which new[pos:] matches old longest; returns (shift, run)."""
+    probe = new[pos:pos + 8]
+    best = (0, 0)
+    if len(probe) < 8:
+        return best
+    lo = max(0, pos - max_shift)
+    hi = min(len(old), pos + max_shift + len(probe))
+    j = old.find(probe, lo, hi)
+    while j >= 0:
+        shift = j - pos
+        if shift:
+            run = common_run(new, pos, old, j, min(end - pos, len(old) - j))
+            if run > best[1]:
+                best = (shift, run)
+        j = old.find(probe, j + 1, hi)
+    return best
+
+
+def explain(new: bytes, old: bytes, r: DiffRange, max_shift: int) -> list[Piece]:
+    """Split a differing range into relocated blocks and genuinely changed bytes."""
+    pieces: list[Piece] = []
+    pos = r.start
+    changed = None
+    while pos < r.end:
+        shift, run = best_shift(new, old, pos, r.end, max_shift) if max_shift else (0, 0)
+        if run >= MIN_SHIFT_RUN:
+            if changed is not None:
+                pieces.append(Piece(changed, pos, None))
+                changed = None
+            pieces.append(Piece(pos, pos + run, shift))
+            pos += run
+            continue
+        if changed is None:
+            changed = pos
+        pos += 1
+    if changed is not None:
+        pieces.append(Piece(changed, r.end, None))
+    return pieces
+
+
+def hex_bytes(data: bytes, limit: int) -> str:
+    text = data[:limit].hex(" ").upper()
+    return text + (" ..." if len(data) > limit else "")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare two ROM images by range and symbol.")
+    parser.add_argument("new", type=Path, help="Built image (e.g. bin/MFORTH.BX)")
+    parser.add_argument("old", type=Path, help="Reference image (e.g. test/Reference.bx)")
+    parser.add_argument("--sym", type=Path, help="Symbols for the built image (.sym)")
+    parser.add_argument("--merge-gap", type=int, default=2, help="Join ranges separated by at most N equal bytes")
+    parser.add_argument("--max-shift", type=int, default=512, help="Largest relocation offset to look for (0 = off)")
+    parser.add_argument("--limit", type=int, default=50, help="Show at most N ranges (0 = all)")
+    parser.add_argument("--bytes", type=int, default=16, help="Bytes of each side to show per range")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    new = args.new.read_bytes()
+    old = args.old.read_bytes()
+    syms = Symbols.load(args.sym) if args.sym else Symbols([])
+
+    ranges = diff_ranges(new, old, args.merge_gap)
+    report = []
+    for r in ranges:
+        pieces = explain(new, old, r, args.max_shift)
+        report.append((r, pieces))
+    shifted = sum(p.end - p.start for _, pieces in report for p in pieces if p.shift is not None)
+    differing = sum(r.end - r.start for r in ranges)
+
+    if args.json:
+        print(json.dumps({
+            "new": str(args.new),
+            "old": str(args.old),
+            "sizes": [len(new), len(old)],
+            "ranges": [
+                {
+                    "start": r.start,
+                    "end": r.end,
+                    "from": syms.at(r.start),
+                    "to": syms.at(r.end - 1),
+                    "pieces": [p._asdict() for p in pieces],
+                }
+                for r, pieces in report
+            ],
+        }, indent=2))
+        return 1 if ranges else 0
+
+    if not ranges:
+        print(f"IDENTICAL ({len(new)} bytes)")
+        return 0
+    if len(new) != len(old):
+        print(f"sizes differ: {args.new} {len(new)} bytes, {args.old} {len(old)} bytes")
+    print(f"DIFFER: {len(ranges)} range(s), {differing} bytes, {shifted} of them relocated")
+    shown = report if args.limit <= 0 else report[:args.limit]
+    for r, pieces in shown:
+        print(f"{r.start:04X}-{r.end - 1:04X} ({r.end - r.start} bytes)  {syms.at(r.start)} .. {syms.at(r.end - 1)}")
+        for p in pieces:
+            if p.shift is not None:
+                print(f"    {p.start:04X}-{p.end - 1:04X}  relocated {p.shift:+d}: "
+                      f"same as {args.old.name} {p.start + p.shift:04X}-{p.end - 1 + p.shift:04X}")
+                continue
+            print(f"    {p.start:04X}-{p.end - 1:04X}  changed  {syms.at(p.start)}")
+            print(f"        new: {hex_bytes(new[p.start:p.end], args.bytes)}")
+            print(f"        old: {hex_bytes(old[p.start:p.end], args.bytes)}")
+    if len(shown) < len(report):
+        print(f"... {len(report) - len(shown)} more range(s); use --limit 0 to show all")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
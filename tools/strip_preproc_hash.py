@@ -1,13 +1,22 @@
 #!/usr/bin/env python3
-"""Copy a source tree and strip leading '#' from opForge preprocessor directives."""
+"""Copy a source tree and strip leading '#' from opForge preprocessor directives.
+
+The copy is an incremental sync: only outputs whose content changed are
+rewritten, files that vanished from the source are removed, and unchanged
+outputs keep their mtime so make does not rerun the assembler passes.
+"""
 
 from __future__ import annotations
 
 import argparse
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import re
 
+from jobs import job_count
+
 
 PREPROC_RE = re.compile(
     r"^(\s*)([#.])(IFDEF|IFNDEF|IF|ELSEIF|ELSE|ENDIF|DEFINE|UNDEF|INCLUDE|ECHO)\b",
@@ -72,26 +81,89 @@ def normalize_preproc(text: str) -> str:
     return "".join(out)
 
 
-def copy_and_strip(src: Path, dst: Path) -> None:
+def stripped_bytes(path: Path) -> bytes:
+    """Contents the copy of path should have: .asm files are normalized."""
+    data = path.read_bytes()
+    if path.suffix != ".asm":
+        return data
+    try:
+        original = data.decode().replace("\r\n", "\n").replace("\r", "\n")
+    except UnicodeDecodeError:
+        return data
+    updated = normalize_preproc(original)
+    if updated == original:
+        return data
+    return updated.encode()
+
+
+def sync_file(src: Path, dst: Path) -> bool:
+    """Bring dst up to date with src; returns True if dst was written."""
+    data = stripped_bytes(src)
+    try:
+        if dst.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    shutil.copymode(src, tmp)
+    os.replace(tmp, dst)
+    return True
+
+
+def _sync_pair(pair: tuple[Path, Path]) -> bool:
+    return sync_file(*pair)
+
+
+def copy_and_strip(src: Path, dst: Path, jobs: int = 1) -> tuple[int, int, int]:
+    """Sync dst with the stripped contents of src.
+
+    Returns (written, deleted, unchanged) file counts.
+    """
+    sources = {path.relative_to(src) for path in src.rglob("*") if path.is_file()}
+    pairs = [(src / rel, dst / rel) for rel in sorted(sources)]
+    if jobs > 1 and len(pairs) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(pairs))) as pool:
+            written = sum(pool.map(_sync_pair, pairs, chunksize=max(1, len(pairs) // (jobs * 4))))
+    else:
+        written = sum(map(_sync_pair, pairs))
+
+    deleted = 0
     if dst.exists():
-        shutil.rmtree(dst)
-    shutil.copytree(src, dst)
-    for path in dst.rglob("*.asm"):
-        try:
-            original = path.read_text()
-        except UnicodeDecodeError:
-            continue
-        updated = normalize_preproc(original)
-        if updated != original:
-            path.write_text(updated)
+        for path in sorted(dst.rglob("*"), reverse=True):
+            rel = path.relative_to(dst)
+            if path.is_dir():
+                if not (src / rel).is_dir() and not any(path.iterdir()):
+                    path.rmdir()
+            elif rel not in sources:
+                path.unlink()
+                deleted += 1
+    return written, deleted, len(pairs) - written
 
 
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("src", type=Path)
     parser.add_argument("dst", type=Path)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=job_count,
+        default=1,
+        help="Worker processes (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--stamp",
+        type=Path,
+        help="Touch this file when any output changed (or it does not exist yet)",
+    )
     args = parser.parse_args()
-    copy_and_strip(args.src, args.dst)
+    written, deleted, unchanged = copy_and_strip(args.src, args.dst, args.jobs)
+    print(f"{args.dst}: {written} written, {deleted} deleted, {unchanged} unchanged")
+    if args.stamp and (written or deleted or not args.stamp.exists()):
+        args.stamp.parent.mkdir(parents=True, exist_ok=True)
+        args.stamp.touch()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Compact binary symbol index written next to a .sym file (NAME.sym -> NAME.symidx).
+
+The index holds every name for every address, in listing order, with the
+listing line that defined it, and can be looked up in both directions
+straight from an mmap without parsing anything:
+
+    idx = SymbolIndex.open("build/MFORTH.symidx")
+    idx.names_at(0x1234)      -> ["DUP", "_dup"]
+    idx.address_of("DUP")     -> 0x1234
+    idx.location(0x1234)      -> ("MFORTH.lst", 5310)
+
+Layout (little endian):
+  header   8s magic, u32 count, u32 file count, u32 string bytes
+  entries  count x (u16 addr, u16 file, u16 name length, u16 flags,
+                    u32 name offset, u32 line), sorted by address
+  by_name  count x u32 entry number, sorted by upper-cased name
+  files    file count x (u32 offset, u32 length)
+  strings  ASCII names and file names
+
+Run as a script to query an index: symindex.py FILE.symidx [NAME|ADDR ...]
+"""
+from __future__ import annotations
+import argparse, mmap, pathlib, struct, sys
+
+MAGIC = b"MFSYMIX1"
+HEADER = struct.Struct("<8sIII")
+ENTRY = struct.Struct("<HHHHII")
+U32 = struct.Struct("<I")
+FILE = struct.Struct("<II")
+
+# Names the text .sym leaves out (assembler-generated link chain labels).
+NOISE_PREFIXES = ("noname.", "link_", "last_")
+
+def is_noise(name: str) -> bool:
+    return name.lower().startswith(NOISE_PREFIXES)
+
+def index_path(sym_path: str | pathlib.Path) -> pathlib.Path:
+    return pathlib.Path(sym_path).with_suffix(".symidx")
+
+def write_index(path: str | pathlib.Path, symbols: list[tuple[int, str, str, int]]) -> None:
+    """symbols: (addr, name, file, line) in listing order."""
+    files: dict[str, int] = {}
+    strings = bytearray()
+    entries = []
+    for seq, (addr, name, file, line) in enumerate(symbols):
+        fidx = files.setdefault(file, len(files))
+        raw = name.encode("ascii", "replace")
+        entries.append((addr & 0xFFFF, seq, fidx, raw, len(strings), line))
+        strings += raw
+    entries.sort(key=lambda e: (e[0], e[1]))
+    file_table = bytearray()
+    for file in files:
+        raw = file.encode("utf-8")
+        file_table += FILE.pack(len(strings), len(raw))
+        strings += raw
+    by_name = sorted(range(len(entries)), key=lambda i: (entries[i][3].upper(), entries[i][0]))
+
+    out = bytearray(HEADER.pack(MAGIC, len(entries), len(files), len(strings)))
+    for addr, _, fidx, raw, off, line in entries:
+        out += ENTRY.pack(addr, fidx, len(raw), 0, off, line)
+    for i in by_name:
+        out += U32.pack(i)
+    out += file_table
+    out += strings
+    path = pathlib.Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(out)
+    tmp.replace(path)
+
+class SymbolIndex:
+    def __init__(self, data):
+        self.data = data
+        magic, self.count, self.file_count, _ = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("not a symbol index (bad magic)")
+        self.entries_at = HEADER.size
+        self.by_name_at = self.entries_at + self.count * ENTRY.size
+        self.files_at = self.by_name_at + self.count * U32.size
+        self.strings_at = self.files_at + self.file_count * FILE.size
+
+    @classmethod
+    def open(cls, path: str | pathlib.Path) -> SymbolIndex:
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _entry(self, i: int) -> tuple[int, int, int, int, int, int]:
+        return ENTRY.unpack_from(self.data, self.entries_at + i * ENTRY.size)
+
+    def _name(self, off: int, ln: int) -> str:
+        start = self.strings_at + off
+        return self.data[start:start + ln].decode("ascii")
+
+    def _file(self, fidx: int) -> str:
+        off, ln = FILE.unpack_from(self.data, self.files_at + fidx * FILE.size)
+        start = self.strings_at + off
+        return self.data[start:start + ln].decode("utf-8")
+
+    def _first_at(self, addr: int) -> int:
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry(mid)[0] < addr:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def names_at(self, addr: int) -> list[str]:
+        """Every name defined at addr, in listing order."""
+        names = []
+        i = self._first_at(addr)
+        while i < self.count:
+            a, _, ln, _, off, _ = self._entry(i)
+            if a != addr:
+                break
+            names.append(self._name(off, ln))
+            i += 1
+        return names
+
+    def name_at(self, addr: int) -> str | None:
+        """The name the text .sym uses for addr: the last one that is not noise."""
+        names = [n for n in self.names_at(addr) if not is_noise(n)]
+        return names[-1] if names else None
+
+    def location(self, addr: int) -> tuple[str, int] | None:
+        i = self._first_at(addr)
+        if i >= self.count or self._entry(i)[0] != addr:
+            return None
+        _, fidx, _, _, _, line = self._entry(i)
+        return self._file(fidx), line
+
+    def address_of(self, name: str) -> int | None:
+        """Address of name (case-insensitive)."""
+        key = name.upper().encode("ascii", "replace")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            (i,) = U32.unpack_from(self.data, self.by_name_at + mid * U32.size)
+            _, _, ln, _, off, _ = self._entry(i)
+            start = self.strings_at + off
+            if self.data[start:start + ln].upper() < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count:
+            (i,) = U32.unpack_from(self.data, self.by_name_at + lo * U32.size)
+            a, _, ln, _, off, _ = self._entry(i)
+            if self._name(off, ln).upper() == key.decode("ascii"):
+                return a
+        return None
+
+    def items(self):
+        """(addr, name, file, line) for every entry, sorted by address."""
+        for i in range(self.count):
+            a, fidx, ln, _, off, line = self._entry(i)
+            yield a, self._name(off, ln), self._file(fidx), line
+
+def _current_index(path: pathlib.Path) -> pathlib.Path | None:
+    """The index to read for path: path itself if it is one, else its .symidx if not older."""
+    idx = path if path.suffix == ".symidx" else index_path(path)
+    if idx.exists() and (idx == path or idx.stat().st_mtime >= path.stat().st_mtime):
+        return idx
+    return None
+
+def _read_sym(path: pathlib.Path) -> list[tuple[int, str]]:
+    """(addr, name) per "NAME XXXX" line of a text .sym, skipping malformed lines."""
+    entries = []
+    for line in path.read_text(errors="ignore").splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            try:
+                entries.append((int(parts[1], 16), parts[0]))
+            except ValueError:
+                continue
+    return entries
+
+def load_entries(path: str | pathlib.Path) -> list[tuple[int, str]]:
+    """(addr, name) from a .sym or .symidx (the index when it is current), noise names left out."""
+    path = pathlib.Path(path)
+    idx = _current_index(path)
+    if idx is not None:
+        return [(addr, name) for addr, name, _, _ in SymbolIndex.open(idx).items() if not is_noise(name)]
+    return [(addr, name) for addr, name in _read_sym(path) if not is_noise(name)]
+
+class Symbols:
+    """Case-insensitive name -> address from a .sym (its .symidx when current)."""
+    def __init__(self, path: pathlib.Path | None):
+        self.idx = None
+        self.table: dict[str, int] = {}
+        if path is None:
+            return
+        path = pathlib.Path(path)
+        idx = _current_index(path)
+        if idx is not None:
+            self.idx = SymbolIndex.open(idx)
+            return
+        for addr, name in _read_sym(path):
+            self.table.setdefault(name.lower(), addr)
+
+    def get(self, name: str) -> int | None:
+        if self.idx is not None:
+            return self.idx.address_of(name)
+        return self.table.get(name.lower())
+
+def main():
+    ap=argparse.ArgumentParser(description="Query a binary symbol index.")
+    ap.add_argument("index", help="Index file (.symidx)")
+    ap.add_argument("keys", nargs="*", help="Symbol names, or hex addresses (e.g. 0x1234 or 1234h)")
+    args=ap.parse_args()
+    idx=SymbolIndex.open(args.index)
+    if not args.keys:
+        for addr, name, file, line in idx.items():
+            print(f"{addr:04X} {name} {file}:{line}")
+        return 0
+    status=0
+    for key in args.keys:
+        addr=idx.address_of(key)
+        if addr is None and (key.lower().startswith("0x") or key.lower().endswith("h")):
+            try:
+                addr=int(key[:-1] if key.lower().endswith("h") else key, 16)
+            except ValueError:
+                addr=None
+        if addr is None or not idx.names_at(addr):
+            print(f"{key}: not found", file=sys.stderr)
+            status=1
+            continue
+        loc=idx.location(addr)
+        print(f"{addr:04X} {' '.join(idx.names_at(addr))} {loc[0]}:{loc[1]}")
+    return status
+
+if __name__=="__main__":
+    sys.exit(main())
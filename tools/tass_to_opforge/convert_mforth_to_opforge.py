@@ -2,9 +2,16 @@
 """Convert TASM-style MFORTH sources into opForge syntax."""
 
 import argparse
+import functools
+import hashlib
+import json
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, NamedTuple, TextIO
 
 INDENT = "            "  # 12 spaces to match opForge formatting in this repo
 
@@ -59,9 +66,22 @@ DEFINE_RE = re.compile(
 )
 
 ADDINSTR_RE = re.compile(r"^(\s*)\.?ADDINSTR\b", re.IGNORECASE)
-LINKTO_EMPTY_RE = re.compile(r"\bLINKTO\((.*),\s*\"\"\s*\)", re.IGNORECASE)
+ECHO_RE = re.compile(r"^\s*[#.]?ECHO\b", re.IGNORECASE)
+LINKTO_EMPTY_RE = re.compile(r"\bLINKTO\((.*),\s*\uE000\s*\)", re.IGNORECASE)
 LABEL_LINE_RE = re.compile(r"^(\s*)([A-Za-z_.$][\w.$]*)(\s+)(.*)$")
 LABEL_DEF_RE = re.compile(r"^(\s*)([A-Za-z_.$][\w.$]*):(\s*)(.*)$")
+LABEL_START_RE = re.compile(r"^([A-Za-z_.$][\w.$]*)(\s+)(.*)$")
+LABEL_COLON_LINE_RE = re.compile(r"^(\s*)([A-Za-z_.$][\w.$]*:)(\s*)(.*)$")
+MACRO_NAME_PREFIX_RE = re.compile(r"^[.#]?([A-Za-z_.$][\w.$]*)")
+MACRO_NAME_RE = re.compile(r"^([A-Za-z_.$][\w.$]*)(.*)$")
+DATA_RE = re.compile(r"^(\s*(?:[A-Za-z_.$][\w.$]*\s+)?)(\.byte|\.word)\b(.*)$", re.IGNORECASE)
+IDENT_RE = re.compile(r"\b\.?[A-Za-z_.$][\w.$]*\b")
+REVCHARS_ARG_RE = re.compile(r",\s*revchars\b", re.IGNORECASE)
+DEFINE_NAME_RE = re.compile(r"^\s*[#.]?DEFINE\s+([A-Za-z_.$][\w.$]*)\b", re.IGNORECASE)
+PAREN_RE = re.compile(r"[()]")
+SHIFT_RE = re.compile(r"<<|>>")
+SPACED_SHIFT_RE = re.compile(r"\s*(<<|>>)\s*")
+TRAILING_COMMA_RE = re.compile(r",\s*$")
 
 REGISTERS = {
     "A", "B", "C", "D", "E", "H", "L", "M",
@@ -98,92 +118,110 @@ MACRO_TOKENS = [
 ]
 
 
-def is_escaped(text: str, idx: int) -> bool:
-    backslashes = 0
-    j = idx - 1
-    while j >= 0 and text[j] == "\\":
-        backslashes += 1
-        j -= 1
-    return (backslashes % 2) == 1
-
-
-def apply_outside_quotes(text: str, func) -> str:
-    out = []
-    start = 0
-    in_double = False
-    in_single = False
-    for i, ch in enumerate(text):
-        if ch == '"' and not in_single and not is_escaped(text, i):
-            if not in_double:
-                out.append(func(text[start:i]))
-                in_double = True
-                start = i
-            else:
-                out.append(text[start:i + 1])
-                in_double = False
-                start = i + 1
-        elif ch == "'" and not in_double and not is_escaped(text, i):
-            if not in_single:
-                out.append(func(text[start:i]))
-                in_single = True
-                start = i
+class Token(NamedTuple):
+    kind: str  # "code", "string" or "comment"
+    text: str
+
+
+# One left-to-right scan splits a line into code, string and comment tokens.
+# A run of backslashes outside a string is its own token so that an odd run
+# can swallow the quote it escapes (see tokenize()).
+TOKEN_RE = re.compile(
+    r"""
+    (?P<string>"(?:[^"\\]|\\.)*"?|'(?:[^'\\]|\\.)*'?)
+    |(?P<comment>;.*)
+    |(?P<escape>\\+)
+    |(?P<code>[^"';\\]+)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# String tokens are replaced in the code text by a single private-use
+# character so that the rewrite passes never have to track quotes.  The
+# empty string "" always gets EMPTY_STRING_MARK so rules can match it.
+STRING_MARK_BASE = 0xE000
+EMPTY_STRING_MARK = chr(STRING_MARK_BASE)
+STRING_MARK_RE = re.compile("[\uE000-\uF8FF]")
+
+
+def tokenize(text: str) -> list[Token]:
+    tokens = []
+    pos = 0
+    end_of_text = len(text)
+    while pos < end_of_text:
+        m = TOKEN_RE.match(text, pos)
+        kind = m.lastgroup
+        end = m.end()
+        if kind == "escape":
+            # An odd run of backslashes escapes a following quote, which
+            # then does not open a string.
+            if (end - pos) % 2 == 1 and end < end_of_text and text[end] in "\"'":
+                end += 1
+            kind = "code"
+        tokens.append(Token(kind, text[pos:end]))
+        pos = end
+    return tokens
+
+
+def split_line(text: str) -> tuple[str, str, list[str]]:
+    """Lex a line once into (masked code, comment, string table)."""
+    code = []
+    strings: list[str] = []
+    comment = ""
+    for token in tokenize(text):
+        if token.kind == "code":
+            code.append(token.text)
+        elif token.kind == "string":
+            if token.text == '""':
+                code.append(EMPTY_STRING_MARK)
             else:
-                out.append(text[start:i + 1])
-                in_single = False
-                start = i + 1
-    if in_double or in_single:
-        out.append(text[start:])
-    else:
-        out.append(func(text[start:]))
-    return "".join(out)
+                strings.append(token.text)
+                code.append(chr(STRING_MARK_BASE + len(strings)))
+        else:
+            comment = token.text
+    return "".join(code), comment, strings
 
 
-def split_comment(line: str) -> tuple[str, str]:
-    in_double = False
-    in_single = False
-    for i, ch in enumerate(line):
-        if ch == '"' and not in_single and not is_escaped(line, i):
-            in_double = not in_double
-        elif ch == "'" and not in_double and not is_escaped(line, i):
-            in_single = not in_single
-        if ch == ';' and not in_double and not in_single:
-            return line[:i], line[i:]
-    return line, ""
+def unmask(text: str, strings: list[str]) -> str:
+    """Put the string tokens that split_line() masked back into text."""
+    if EMPTY_STRING_MARK not in text and not strings:
+        return text
+
+    def repl(m: re.Match) -> str:
+        idx = ord(m.group(0)) - STRING_MARK_BASE
+        return strings[idx - 1] if idx else '""'
+
+    return STRING_MARK_RE.sub(repl, text)
 
 
 def split_backslash_segments(text: str) -> list[str]:
-    segments = []
-    current = []
-    in_double = False
-    in_single = False
-    for i, ch in enumerate(text):
-        if ch == '"' and not in_single and not is_escaped(text, i):
-            in_double = not in_double
-        elif ch == "'" and not in_double and not is_escaped(text, i):
-            in_single = not in_single
-        if ch == "\\" and not in_double and not in_single:
-            segments.append("".join(current))
-            current = []
-            continue
-        current.append(ch)
-    segments.append("".join(current))
-    return segments
+    return text.split("\\")
 
 
-def apply_param_escapes(text: str, params: list[str]) -> str:
-    if not params:
-        return text
+def _build_token_trie(tokens: list[str]) -> dict:
+    trie: dict = {}
+    for tok in tokens:
+        node = trie
+        for ch in tok:
+            node = node.setdefault(ch, {})
+        node[""] = tok
+    return trie
+
+
+MACRO_TOKEN_TRIE = _build_token_trie(MACRO_TOKENS)
+DIGITS_RE = re.compile(r"\d+")
 
-    def replace_segment(segment: str) -> str:
-        out = segment
-        for param in params:
-            if not param:
-                continue
-            pattern = rf"(?<!\\)\b{re.escape(param)}\b"
-            out = re.sub(pattern, rf"\\{param}", out, flags=re.IGNORECASE)
-        return out
 
-    return apply_outside_quotes(text, replace_segment)
+def match_macro_token(part: str, i: int) -> str | None:
+    """Return the longest MACRO_TOKENS entry starting at part[i], if any."""
+    node = MACRO_TOKEN_TRIE
+    longest = None
+    for j in range(i, len(part)):
+        node = node.get(part[j])
+        if node is None:
+            break
+        longest = node.get("", longest)
+    return longest
 
 
 def split_macro_tokens(name: str) -> list[str]:
@@ -192,31 +230,23 @@ def split_macro_tokens(name: str) -> list[str]:
         return []
     tokens = []
     parts = [p for p in name.split("_") if p]
-    macro_tokens = sorted(MACRO_TOKENS, key=len, reverse=True)
     for part in parts:
         i = 0
         while i < len(part):
             if part[i].isdigit():
-                j = i + 1
-                while j < len(part) and part[j].isdigit():
-                    j += 1
-                tokens.append(part[i:j])
-                i = j
+                digits = DIGITS_RE.match(part, i).group(0)
+                tokens.append(digits)
+                i += len(digits)
                 continue
-            matched = False
-            for tok in macro_tokens:
-                if part.startswith(tok, i):
-                    tokens.append(tok)
-                    i += len(tok)
-                    matched = True
-                    break
-            if matched:
-                continue
-            tokens.append(part[i])
-            i += 1
+            tok = match_macro_token(part, i)
+            if tok is None:
+                tok = part[i]
+            tokens.append(tok)
+            i += len(tok)
     return tokens
 
 
+@functools.lru_cache(maxsize=None)
 def style_macro_name(name: str) -> str:
     name_up = name.upper()
     tokens = split_macro_tokens(name_up)
@@ -232,53 +262,53 @@ def style_macro_name(name: str) -> str:
 
 
 def lowercase_identifiers(code: str, macro_names: set[str]) -> str:
-    ident_re = re.compile(r"\b\.?[A-Za-z_.$][\w.$]*\b")
-
-    def repl(segment: str) -> str:
-        def replace_token(m: re.Match) -> str:
-            token = m.group(0)
-            if token.startswith("."):
-                rest = token[1:]
-                rest_up = rest.upper()
-                if rest_up in macro_names:
-                    return "." + style_macro_name(rest_up)
-                return token.lower()
-            token_up = token.upper()
-            if token_up in OPCODES or token_up in REGISTERS:
-                return token
-            if token_up in macro_names:
-                return style_macro_name(token_up)
+    def replace_token(m: re.Match) -> str:
+        token = m.group(0)
+        if token.startswith("."):
+            rest = token[1:]
+            rest_up = rest.upper()
+            if rest_up in macro_names:
+                return "." + style_macro_name(rest_up)
             return token.lower()
+        token_up = token.upper()
+        if token_up in OPCODES or token_up in REGISTERS:
+            return token
+        if token_up in macro_names:
+            return style_macro_name(token_up)
+        return token.lower()
+
+    return IDENT_RE.sub(replace_token, code)
 
-        return ident_re.sub(replace_token, segment)
 
-    return apply_outside_quotes(code, repl)
+@functools.lru_cache(maxsize=None)
+def param_escape_re(params: tuple[str, ...]) -> re.Pattern | None:
+    names = sorted({param for param in params if param}, key=len, reverse=True)
+    if not names:
+        return None
+    return re.compile(rf"(?<!\\)\b(?:{'|'.join(map(re.escape, names))})\b", re.IGNORECASE)
+
+
+def apply_param_escapes(text: str, params: tuple[str, ...]) -> str:
+    pattern = param_escape_re(params)
+    if pattern is None:
+        return text
+    return pattern.sub(lambda m: "\\" + m.group(0).lower(), text)
 
 
 def parse_paren_args(text: str) -> tuple[str, str] | None:
-    idx = 0
-    while idx < len(text) and text[idx].isspace():
-        idx += 1
-    if idx >= len(text) or text[idx] != "(":
+    stripped = text.lstrip()
+    if not stripped.startswith("("):
         return None
+    idx = len(text) - len(stripped)
     depth = 0
-    in_double = False
-    in_single = False
     end = None
-    for i in range(idx, len(text)):
-        ch = text[i]
-        if ch == '"' and not in_single and not is_escaped(text, i):
-            in_double = not in_double
-        elif ch == "'" and not in_double and not is_escaped(text, i):
-            in_single = not in_single
-        if in_double or in_single:
-            continue
-        if ch == "(":
+    for m in PAREN_RE.finditer(text, idx):
+        if m.group(0) == "(":
             depth += 1
-        elif ch == ")":
+        else:
             depth -= 1
             if depth == 0:
-                end = i
+                end = m.start()
                 break
     if end is None:
         return None
@@ -287,67 +317,25 @@ def parse_paren_args(text: str) -> tuple[str, str] | None:
     return args, suffix
 
 
-def normalize_directives(code: str) -> str:
+def first_word(text: str) -> str:
+    words = text.split(None, 1)
+    return words[0] if words else ""
+
+
+def normalize_hex(expr: str) -> str:
     def repl(m: re.Match) -> str:
-        prefix = m.group(1)
-        has_dot = bool(m.group(2))
-        directive = m.group(3).upper()
-        rest = code[m.end():]
-        if not has_dot:
-            next_tok = re.split(r"\s+", rest.strip(), maxsplit=1)[0].upper() if rest.strip() else ""
-            if next_tok in OPCODES:
-                return m.group(0)
-        mapped = {
-            "DB": ".byte",
-            "BYTE": ".byte",
-            "DW": ".word",
-            "WORD": ".word",
-            "DS": ".ds",
-            "ORG": ".org",
-            "END": ".end",
-        }.get(directive, f".{directive.lower()}")
-        return f"{prefix}{mapped}"
-
-    return DIRECTIVE_RE.sub(repl, code)
-
-
-def normalize_preproc(code: str) -> str:
-    m = PREPROC_RE.match(code)
-    if not m:
-        return code
-    indent = m.group(1)
-    keyword = m.group(3).lower()
-    rest = code[m.end():]
-    return f"{indent}.{keyword}{rest}"
+        raw = m.group(1).upper()
+        if raw[0] in "ABCDEF":
+            raw = "0" + raw
+        return f"{raw}H"
 
+    expr = HEX_SUFFIX_RE.sub(repl, expr)
+    expr = HEX_0X_RE.sub(repl, expr)
+    return HEX_DOLLAR_RE.sub(repl, expr)
 
-def convert_undoc_opcodes(code: str) -> str:
-    m = UNDOC_OP_RE.match(code)
-    if not m:
-        return code
-    indent, label, ws, op, rest = m.groups()
-    label = label or ""
-    ws = ws or ""
-    if label and not ws and not label.endswith(":"):
-        ws = " "
-    op = op.upper()
-    rest_raw = rest.rstrip()
-    rest_stripped = rest.strip()
-    if op == "DSUB":
-        rep = ".byte 08H"
-    elif op == "RDEL":
-        rep = ".byte 18H"
-    elif op == "LDEH":
-        rep = f".byte 028H,{rest_raw}" if rest_stripped else ".byte 028H"
-    elif op == "LDES":
-        rep = f".byte 038H,{rest_raw}" if rest_stripped else ".byte 038H"
-    elif op == "LHLX":
-        rep = ".byte 0EDH"
-    elif op == "SHLX":
-        rep = ".byte 0D9H"
-    else:
-        rep = op
-    return f"{indent}{label}{ws}{rep}"
+
+def space_shifts(expr: str) -> str:
+    return SPACED_SHIFT_RE.sub(r" \1 ", expr)
 
 
 def convert_macro_invocation(code: str, macro_names: set[str]) -> str:
@@ -358,7 +346,7 @@ def convert_macro_invocation(code: str, macro_names: set[str]) -> str:
     ws = ""
     rest = code
 
-    m = re.match(r"^(\s*)([A-Za-z_.$][\w.$]*:)(\s*)(.*)$", code)
+    m = LABEL_COLON_LINE_RE.match(code)
     if m:
         indent, label, ws, rest = m.groups()
         label = label[:-1]
@@ -368,7 +356,7 @@ def convert_macro_invocation(code: str, macro_names: set[str]) -> str:
             indent, possible_label, ws, rest = m.groups()
             rest_stripped = rest.lstrip()
             if rest_stripped:
-                t = re.match(r"^[.#]?([A-Za-z_.$][\w.$]*)", rest_stripped)
+                t = MACRO_NAME_PREFIX_RE.match(rest_stripped)
                 if t:
                     token_up = t.group(1).upper()
                     first_up = possible_label.upper().lstrip(".")
@@ -389,7 +377,7 @@ def convert_macro_invocation(code: str, macro_names: set[str]) -> str:
     if rest and rest[0] in "#.":
         prefix = rest[0]
         rest_body = rest[1:]
-    tm = re.match(r"^([A-Za-z_.$][\w.$]*)(.*)$", rest_body)
+    tm = MACRO_NAME_RE.match(rest_body)
     if not tm:
         return code
     name = tm.group(1)
@@ -414,11 +402,356 @@ def convert_macro_invocation(code: str, macro_names: set[str]) -> str:
     return f"{indent}{new_rest}"
 
 
-def convert_define_macro(code: str, comment: str, line_ending: str, macro_names: set[str]) -> list[str] | None:
-    m = DEFINE_RE.match(code)
-    if not m:
+# ----------------------------------------------------------------------
+# Rewrite rules
+#
+# The conversion of a line is a sequence of Rules run by a RuleEngine.
+# Rules are declared once at import time with precompiled patterns.  A
+# rule that names keywords is only tried on lines that mention one of
+# them, so adding a rule for a rare construct costs one alternative in the
+# engine's keyword scan rather than another regex match on every line.
+
+
+class Line:
+    """State of one source line while the rewrite rules run over it."""
+
+    __slots__ = ("raw", "code", "comment", "line_ending", "strings", "macro_names", "params")
+
+    def __init__(
+        self,
+        raw: str,
+        code: str,
+        comment: str,
+        line_ending: str,
+        strings: list[str],
+        macro_names: set[str],
+        params: tuple[str, ...] = (),
+    ):
+        self.raw = raw
+        self.code = code  # masked code, see split_line()
+        self.comment = comment  # comment including the padding before it
+        self.line_ending = line_ending
+        self.strings = strings
+        self.macro_names = macro_names
+        self.params = params  # macro parameters (DEFINE bodies only)
+
+
+RuleAction = Callable[["re.Match | None", Line], "str | list[str] | None"]
+
+
+class Rule(NamedTuple):
+    """A declarative rewrite step.
+
+    The pattern is searched in the line's masked code and the rule is
+    skipped if it does not match; a rule without a pattern always runs.  The
+    action gets the match and the Line and returns the new code, None to
+    leave the code alone, or a list of finished output lines to end the
+    conversion of this line.  Rules with keywords only run on lines that
+    contain one of those words; provides names the keywords the rule may
+    introduce for the rules after it.
+    """
+
+    name: str
+    action: RuleAction
+    pattern: re.Pattern | None = None
+    keywords: frozenset[str] = frozenset()
+    provides: frozenset[str] = frozenset()
+
+
+class PassProfile:
+    """Cumulative time and call counts per conversion stage (--profile)."""
+
+    def __init__(self) -> None:
+        self.stats: dict[str, list[float]] = {}
+
+    def record(self, stage: str, seconds: float, calls: int = 1) -> None:
+        entry = self.stats.setdefault(stage, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += calls
+
+    def merge(self, stats: dict[str, list[float]]) -> None:
+        for stage, (seconds, calls) in stats.items():
+            self.record(stage, seconds, int(calls))
+
+    def take(self) -> dict[str, list[float]]:
+        """Return the stats gathered so far and start over."""
+        stats, self.stats = self.stats, {}
+        return stats
+
+    def as_json(self) -> dict:
+        return {
+            stage: {"seconds": seconds, "calls": int(calls)}
+            for stage, (seconds, calls) in sorted(self.stats.items(), key=lambda item: -item[1][0])
+        }
+
+    def format_table(self) -> str:
+        total = self.stats.get("convert_line", [0.0, 0])[0] or 1.0
+        rows = [f"{'stage':<28}{'calls':>10}{'total ms':>12}{'us/call':>10}{'% line':>8}"]
+        for stage, (seconds, calls) in sorted(self.stats.items(), key=lambda item: -item[1][0]):
+            per_call = seconds / calls * 1e6 if calls else 0.0
+            rows.append(f"{stage:<28}{int(calls):>10}{seconds * 1000:>12.2f}{per_call:>10.2f}{seconds / total * 100:>8.1f}")
+        return "\n".join(rows)
+
+
+# Set by enable_profiling(); None keeps the conversion path free of timing.
+_profile: PassProfile | None = None
+
+
+def profiled_rule(rule: Rule, stage: str, profile: PassProfile) -> Rule:
+    """Return a copy of rule that records its matching and rewriting time.
+
+    The copy has no pattern of its own, so the engine always calls it and it
+    may add its provided keywords without having matched; that only widens
+    the keyword prefilter for the rules after it.
+    """
+
+    def action(m: re.Match | None, line: Line) -> str | list[str] | None:
+        start = time.perf_counter()
+        try:
+            if rule.pattern is not None:
+                m = rule.pattern.search(line.code)
+                if m is None:
+                    return None
+            return rule.action(m, line)
+        finally:
+            profile.record(stage, time.perf_counter() - start)
+
+    return rule._replace(action=action, pattern=None)
+
+
+class RuleEngine:
+    """Run an ordered list of Rules, selecting them with one keyword scan."""
+
+    def __init__(self, rules: list[Rule], stage_prefix: str = ""):
+        self.rules = tuple(rules)
+        self.stage_prefix = stage_prefix
+        keywords = sorted({kw for rule in rules for kw in rule.keywords}, key=len, reverse=True)
+        self.keyword_re = (
+            re.compile(rf"\b(?:{'|'.join(map(re.escape, keywords))})\b", re.IGNORECASE)
+            if keywords
+            else None
+        )
+
+    def run(self, line: Line) -> list[str] | None:
+        found = set()
+        if self.keyword_re is not None:
+            found = {m.group(0).upper() for m in self.keyword_re.finditer(line.code)}
+        for rule in self.rules:
+            if rule.keywords and found.isdisjoint(rule.keywords):
+                continue
+            m = None
+            if rule.pattern is not None:
+                m = rule.pattern.search(line.code)
+                if m is None:
+                    continue
+            result = rule.action(m, line)
+            if isinstance(result, list):
+                return result
+            if result is not None:
+                line.code = result
+            found |= rule.provides
+        return None
+
+    def instrument(self, profile: PassProfile) -> None:
+        self.rules = tuple(profiled_rule(rule, self.stage_prefix + rule.name, profile) for rule in self.rules)
+
+
+def drop_addinstr(m: re.Match, line: Line) -> list[str]:
+    # opforge doesn't support custom mnemonics
+    return ["; " + line.raw.lstrip()]
+
+
+def echo_to_comment(m: re.Match, line: Line) -> list[str]:
+    # opforge has no .echo
+    code = "; ECHO" + line.code[m.end():]
+    return [unmask(code, line.strings) + line.comment + line.line_ending]
+
+
+def label_org(m: re.Match, line: Line) -> list[str]:
+    # label: ORG x -> .org x, then the label on the next line
+    indent, label, _, rest = m.groups()
+    rest = rest.rstrip()
+    org_indent = indent if indent else " "
+    org_line = f"{org_indent}.org{rest}"
+    org_line = unmask(normalize_hex(space_shifts(org_line)), line.strings)
+    return [org_line + line.comment + line.line_ending, f"{label.lower()}{line.line_ending}"]
+
+
+def label_equ(m: re.Match, line: Line) -> str:
+    # label: EQU/SET x -> label = x / label := x
+    indent, label, directive, rest = m.groups()
+    op = "=" if directive.upper() == "EQU" else ":="
+    return f"{indent}{label.lower()} {op}{rest}"
+
+
+def label_assign(m: re.Match, line: Line) -> str:
+    # label EQU/SET x (no colon) -> label = x / label := x
+    indent, label, _ws, directive, rest = m.groups()
+    op = "=" if directive.upper() == "EQU" else ":="
+    return f"{indent}{label.lower()} {op}{rest}"
+
+
+def normalize_preproc(m: re.Match, line: Line) -> str | None:
+    # #IFDEF -> .ifdef, except for labels named like a conditional (IF:)
+    if LABEL_RE.match(line.code):
+        return None
+    return f"{m.group(1)}.{m.group(3).lower()}{line.code[m.end():]}"
+
+
+def linkto_empty(m: re.Match, line: Line) -> str:
+    # LINKTO(...,"") -> LINKTO0(...)
+    return f"{line.code[:m.start()]}LINKTO0({m.group(1)}){line.code[m.end():]}"
+
+
+def strip_label_colon(m: re.Match, line: Line) -> str:
+    # label: rest -> label rest
+    indent, label, _ws, rest = m.groups()
+    rest = rest.lstrip()
+    if rest:
+        return f"{indent}{label.lower()} {rest}"
+    return f"{indent}{label.lower()}"
+
+
+def add_label(m: re.Match, line: Line) -> str | None:
+    # Lower-case labels in column 1 that precede an opcode (PLUSLOOP JMP ...)
+    if ":" in line.code:
         return None
+    label, _ws, rest = m.groups()
+    first = label.upper().lstrip(".")
+    second = first_word(rest).upper()
+    if first not in DIRECTIVES and first not in OPCODES and second in OPCODES:
+        return f"{label.lower()} {rest.lstrip()}"
+    return None
+
+
+DIRECTIVE_MAP = {
+    "DB": ".byte",
+    "BYTE": ".byte",
+    "DW": ".word",
+    "WORD": ".word",
+    "DS": ".ds",
+    "ORG": ".org",
+    "END": ".end",
+}
+
+
+def normalize_directives(m: re.Match, line: Line) -> str | None:
+    prefix = m.group(1)
+    has_dot = bool(m.group(2))
+    directive = m.group(3).upper()
+    rest = line.code[m.end():]
+    if not has_dot and first_word(rest).upper() in OPCODES:
+        return None
+    mapped = DIRECTIVE_MAP.get(directive, f".{directive.lower()}")
+    return f"{prefix}{mapped}{rest}"
+
+
+UNDOC_BYTES = {
+    "DSUB": "08H",
+    "RDEL": "18H",
+    "LDEH": "028H",
+    "LDES": "038H",
+    "LHLX": "0EDH",
+    "SHLX": "0D9H",
+}
+UNDOC_WITH_OPERAND = {"LDEH", "LDES"}
+
+
+def convert_undoc_opcodes(m: re.Match, line: Line) -> str:
+    indent, label, ws, op, rest = m.groups()
+    label = label or ""
+    ws = ws or ""
+    if label and not ws and not label.endswith(":"):
+        ws = " "
+    op = op.upper()
+    rep = f".byte {UNDOC_BYTES[op]}"
+    if op in UNDOC_WITH_OPERAND and rest.strip():
+        rep += f",{rest.rstrip()}"
+    return f"{indent}{label}{ws}{rep}"
+
+
+def strip_data_comma(m: re.Match, line: Line) -> str:
+    # Remove a trailing comma from .byte/.word without reformatting spacing
+    prefix, directive, rest = m.groups()
+    return f"{prefix}{directive.lower()}{TRAILING_COMMA_RE.sub('', rest)}"
+
+
+def indent_opcode(m: None, line: Line) -> str | None:
+    # Indent opcode-only lines starting at column 1
+    code = line.code
+    if code[:1].isspace():
+        return None
+    if first_word(code).upper().lstrip(".") in OPCODES:
+        return INDENT + code.lstrip()
+    return None
+
+
+DIRECTIVE_KEYWORDS = frozenset({"ORG", "BYTE", "WORD", "DB", "DW", "DS", "END"})
+PREPROC_KEYWORDS = frozenset(
+    {"IFDEF", "IFNDEF", "IF", "ELSEIF", "ELSE", "ENDIF", "DEFINE", "UNDEF", "INCLUDE", "ECHO"}
+)
+UNDOC_KEYWORDS = frozenset(UNDOC_BYTES)
+DATA_KEYWORDS = frozenset({"BYTE", "WORD"})
+
+DIRECTIVES_RULE = Rule("directives", normalize_directives, DIRECTIVE_RE, DIRECTIVE_KEYWORDS, DATA_KEYWORDS)
+UNDOC_RULE = Rule("undoc-opcodes", convert_undoc_opcodes, UNDOC_OP_RE, UNDOC_KEYWORDS, frozenset({"BYTE"}))
+HEX_RULE = Rule("hex", lambda m, line: normalize_hex(line.code))
+SHIFTS_RULE = Rule("shifts", lambda m, line: space_shifts(line.code), SHIFT_RE)
+MACRO_CALL_RULE = Rule("macro-call", lambda m, line: convert_macro_invocation(line.code, line.macro_names))
+LOWERCASE_RULE = Rule("lowercase", lambda m, line: lowercase_identifiers(line.code, line.macro_names))
+
+LINE_RULES = RuleEngine([
+    Rule("addinstr", drop_addinstr, ADDINSTR_RE, frozenset({"ADDINSTR"})),
+    Rule("echo", echo_to_comment, ECHO_RE, frozenset({"ECHO"})),
+    Rule("define", lambda m, line: convert_define_macro(m, line), DEFINE_RE, frozenset({"DEFINE"})),
+    Rule("label-org", label_org, LABEL_ORG_RE, frozenset({"ORG"})),
+    Rule("label-equ", label_equ, LABEL_EQU_RE, frozenset({"EQU", "SET"})),
+    Rule("label-assign", label_assign, LABEL_ASSIGN_RE, frozenset({"EQU", "SET"})),
+    Rule("preproc", normalize_preproc, PREPROC_RE, PREPROC_KEYWORDS),
+    Rule("linkto-empty", linkto_empty, LINKTO_EMPTY_RE, frozenset({"LINKTO"})),
+    Rule("label-colon", strip_label_colon, LABEL_DEF_RE),
+    Rule("label-add", add_label, LABEL_START_RE),
+    DIRECTIVES_RULE,
+    UNDOC_RULE,
+    HEX_RULE,
+    SHIFTS_RULE,
+    Rule("data-comma", strip_data_comma, DATA_RE, DATA_KEYWORDS),
+    MACRO_CALL_RULE,
+    LOWERCASE_RULE,
+    Rule("indent-opcode", indent_opcode),
+])
+
+MACRO_BODY_RULES = RuleEngine(stage_prefix="macro-body/", rules=[
+    LOWERCASE_RULE,
+    Rule("param-escapes", lambda m, line: apply_param_escapes(line.code, line.params)),
+    DIRECTIVES_RULE,
+    HEX_RULE,
+    SHIFTS_RULE,
+    MACRO_CALL_RULE,
+    UNDOC_RULE,
+])
+
+
+def convert_macro_body(body: str, line: Line, params: tuple[str, ...], linkto0: bool = False) -> list[str]:
+    lines = []
+    for segment in split_backslash_segments(body):
+        seg = segment.strip()
+        if not seg:
+            continue
+        if linkto0:
+            seg = REVCHARS_ARG_RE.sub("", seg)
+            seg = seg.replace("10000000b|lastchar,", "10000000b|lastchar")
+        seg_line = Line(segment, seg, "", line.line_ending, line.strings, line.macro_names, params)
+        MACRO_BODY_RULES.run(seg_line)
+        lines.append(f"{INDENT}{unmask(seg_line.code, line.strings)}{line.line_ending}")
+    return lines
+
+
+def convert_define_macro(m: re.Match, line: Line) -> list[str]:
     indent, name, args_raw, body = m.groups()
+    comment = line.comment
+    line_ending = line.line_ending
+    macro_names = line.macro_names
     name_upper = name.upper()
     styled_name = style_macro_name(name_upper)
     args = []
@@ -426,10 +759,11 @@ def convert_define_macro(code: str, comment: str, line_ending: str, macro_names:
         args = [arg.strip().lower() for arg in args_raw.split(",") if arg.strip()]
 
     body = body.rstrip()
+    raw_body = unmask(body, line.strings)
 
     # Treat simple value-only defines as preprocessor constants.
-    if not args and body and "\\" not in body and len(body.split()) == 1:
-        define_line = f"{indent}.define {name.lower()}={body}"
+    if not args and raw_body and "\\" not in raw_body and len(raw_body.split()) == 1:
+        define_line = f"{indent}.define {name.lower()}={raw_body}"
         if comment:
             define_line += comment
         return [define_line + line_ending]
@@ -443,332 +777,370 @@ def convert_define_macro(code: str, comment: str, line_ending: str, macro_names:
         macro_header += comment
 
     lines = [macro_header + line_ending]
-
-    for segment in split_backslash_segments(body):
-        seg = segment.strip()
-        if not seg:
-            continue
-        seg = lowercase_identifiers(seg, macro_names)
-        seg = apply_param_escapes(seg, args)
-        seg = normalize_directives(seg)
-        seg = normalize_hex(seg)
-        seg = space_shifts(seg)
-        seg = convert_macro_invocation(seg, macro_names)
-        seg = convert_undoc_opcodes(seg)
-        lines.append(f"{INDENT}{seg}{line_ending}")
-
+    lines.extend(convert_macro_body(body, line, tuple(args)))
     lines.append(f"{indent}.endmacro{line_ending}")
 
     # Auto-generate LINKTO0 macro alongside LINKTO.
-    args_lower = [arg.lower() for arg in args]
-    if name_upper == "LINKTO" and args_lower == ["prev", "isimm", "len", "lastchar", "revchars"]:
+    if name_upper == "LINKTO" and args == ["prev", "isimm", "len", "lastchar", "revchars"]:
         macro_names.add("LINKTO0")
-        linkto0_args = ["prev", "isimm", "len", "lastchar"]
+        linkto0_args = ("prev", "isimm", "len", "lastchar")
         linkto0_header = f"{indent}{style_macro_name('LINKTO0')} .macro " + ", ".join(linkto0_args)
         lines.append(linkto0_header + line_ending)
-        for segment in split_backslash_segments(body):
-            seg = segment.strip()
-            if not seg:
-                continue
-            seg = re.sub(r",\s*revchars\b", "", seg, flags=re.IGNORECASE)
-            seg = seg.replace("10000000b|lastchar,", "10000000b|lastchar")
-            seg = lowercase_identifiers(seg, macro_names)
-            seg = apply_param_escapes(seg, linkto0_args)
-            seg = normalize_directives(seg)
-            seg = normalize_hex(seg)
-            seg = space_shifts(seg)
-            seg = convert_macro_invocation(seg, macro_names)
-            seg = convert_undoc_opcodes(seg)
-            lines.append(f"{INDENT}{seg}{line_ending}")
+        lines.extend(convert_macro_body(body, line, linkto0_args, linkto0=True))
         lines.append(f"{indent}.endmacro{line_ending}")
 
     return lines
 
 
-def normalize_hex(expr: str) -> str:
-    def repl_suffix(m: re.Match) -> str:
-        raw = m.group(1).upper()
-        if raw[0] in "ABCDEF":
-            raw = "0" + raw
-        return f"{raw}H"
+def convert_line(line: str, macro_names: set[str]) -> list[str]:
+    stripped = line.lstrip()
+    if not stripped or stripped[0] == ";":
+        return [line]
 
-    def repl_0x(m: re.Match) -> str:
-        raw = m.group(1).upper()
-        if raw[0] in "ABCDEF":
-            raw = "0" + raw
-        return f"{raw}H"
+    if _profile is not None:
+        start = time.perf_counter()
+        try:
+            return _convert_line(line, macro_names)
+        finally:
+            _profile.record("convert_line", time.perf_counter() - start)
+    return _convert_line(line, macro_names)
 
-    def repl_dollar(m: re.Match) -> str:
-        raw = m.group(1).upper()
-        if raw[0] in "ABCDEF":
-            raw = "0" + raw
-        return f"{raw}H"
 
-    def apply(segment: str) -> str:
-        segment = HEX_SUFFIX_RE.sub(repl_suffix, segment)
-        segment = HEX_0X_RE.sub(repl_0x, segment)
-        segment = HEX_DOLLAR_RE.sub(repl_dollar, segment)
-        return segment
-
-    out = []
-    start = 0
-    in_quote = False
-    for i, ch in enumerate(expr):
-        if ch == '"' and not is_escaped(expr, i):
-            if not in_quote:
-                out.append(apply(expr[start:i]))
-                in_quote = True
-                start = i
-            else:
-                out.append(expr[start:i + 1])
-                in_quote = False
-                start = i + 1
-    if in_quote:
-        out.append(expr[start:])
+def _convert_line(line: str, macro_names: set[str]) -> list[str]:
+    line_ending = "\n" if line.endswith("\n") else ""
+    if _profile is not None:
+        start = time.perf_counter()
+        code, comment, strings = split_line(line[:-1] if line_ending else line)
+        _profile.record("split_line", time.perf_counter() - start)
     else:
-        out.append(apply(expr[start:]))
-    return "".join(out)
+        code, comment, strings = split_line(line[:-1] if line_ending else line)
+    if not code.strip():
+        return [line]
+
+    # Preserve original spacing before comments
+    if comment:
+        stripped = code.rstrip()
+        comment = code[len(stripped):] + comment
+        code = stripped
 
+    state = Line(line, code, comment, line_ending, strings, macro_names)
+    result = LINE_RULES.run(state)
+    if result is not None:
+        return result
+    return [unmask(state.code, strings) + comment + line_ending]
 
-def space_shifts(expr: str) -> str:
-    out = []
-    i = 0
-    in_quote = False
-    while i < len(expr):
-        ch = expr[i]
-        if ch == '"' and not is_escaped(expr, i):
-            in_quote = not in_quote
-            out.append(ch)
-            i += 1
-            continue
-        if not in_quote and expr[i:i+2] in ("<<", ">>"):
-            op = expr[i:i+2]
-            out.append(f" {op} ")
-            i += 2
+
+def iter_convert(lines: Iterable[str], macro_names: set[str]) -> Iterator[str]:
+    """Yield the converted lines for each input line as it arrives."""
+    for line in lines:
+        yield from convert_line(line, macro_names)
+
+
+def enable_profiling() -> PassProfile:
+    """Start timing every stage of convert_line; returns the collector."""
+    global _profile
+    if _profile is None:
+        _profile = PassProfile()
+        LINE_RULES.instrument(_profile)
+        MACRO_BODY_RULES.instrument(_profile)
+    return _profile
+
+
+def convert_text(text: str, macro_names: set[str]) -> str:
+    return "".join(iter_convert(text.splitlines(keepends=True), macro_names))
+
+
+def note_macro_name(line: str, names: set[str]) -> None:
+    m = DEFINE_NAME_RE.match(line)
+    if not m:
+        return
+    name = m.group(1).upper()
+    names.add(name)
+    if name == "LINKTO":
+        names.add("LINKTO0")
+
+
+def collect_macro_names(paths: list[Path]) -> set[str]:
+    names: set[str] = set()
+    for path in paths:
+        try:
+            with path.open(errors="ignore") as f:
+                for line in f:
+                    note_macro_name(line, names)
+        except OSError:
             continue
-        out.append(ch)
-        i += 1
-    return "".join(out)
+    return names
 
 
-def convert_line(line: str, macro_names: set[str]) -> list[str]:
-    if not line.strip():
-        return [line]
+def convert_stream(src: TextIO, dst: TextIO, macro_names: set[str]) -> None:
+    """Convert src to dst line by line without holding either in memory.
 
-    code, comment = split_comment(line)
-    if not code.strip():
-        return [line]
+    A stream cannot be scanned for DEFINEs up front, so macro names are
+    learned as their definitions go by; TASM needs a macro defined before
+    it is used anyway.
+    """
 
-    line_ending = "\n" if line.endswith("\n") else ""
-    if code.endswith("\n"):
-        code = code[:-1]
-    if comment.endswith("\n"):
-        comment = comment[:-1]
+    def learn(lines: Iterable[str]) -> Iterator[str]:
+        for line in lines:
+            note_macro_name(line, macro_names)
+            yield line
 
-    # Drop .ADDINSTR lines (opforge doesn't support custom mnemonics)
-    if ADDINSTR_RE.match(code.strip()):
-        return ["; " + line.lstrip()]
+    dst.writelines(iter_convert(learn(src), macro_names))
 
-    # Normalize ECHO into comments (opforge has no .echo)
-    if re.match(r"^\s*[#.]?ECHO\b", code, re.IGNORECASE):
-        code = re.sub(r"^\s*[#.]?ECHO", "; ECHO", code, count=1, flags=re.IGNORECASE)
-        return [code + comment + line_ending]
 
-    # Preserve original spacing before comments
-    comment_pad = ""
-    if comment:
-        m = re.search(r"(\s*)$", code)
-        comment_pad = m.group(1)
-        code = code.rstrip()
+def convert_file(src: Path, dst: TextIO, macro_names: set[str]) -> None:
+    with src.open(errors="ignore") as f:
+        dst.writelines(iter_convert(f, macro_names))
 
-    comment_full = f"{comment_pad}{comment}" if comment else ""
 
-    macro_lines = convert_define_macro(code, comment_full, line_ending, macro_names)
-    if macro_lines:
-        return macro_lines
+def write_output(dst: Path, converted: str) -> bool:
+    """Write converted text to dst unless dst already holds exactly that text.
 
-    # Convert label: ORG to .ORG then label on next line
-    m = LABEL_ORG_RE.match(code)
-    if m:
-        indent, label, _, rest = m.groups()
-        rest = rest.rstrip()
-        org_indent = indent if indent else " "
-        org_line = f"{org_indent}.org{rest}"
-        org_line = normalize_hex(space_shifts(org_line))
-        if comment:
-            org_line += comment_full
-        return [org_line + line_ending, f"{label.lower()}{line_ending}"]
+    Leaving identical outputs alone keeps their mtime, so make does not
+    rebuild everything that depends on them.  Returns True if dst was written.
+    """
+    try:
+        if dst.read_text(errors="ignore") == converted:
+            return False
+    except OSError:
+        pass
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    dst.write_text(converted)
+    return True
 
-    # Convert label: EQU/SET to opforge assignments
-    m = LABEL_EQU_RE.match(code)
-    if m:
-        indent, label, directive, rest = m.groups()
-        op = "=" if directive.upper() == "EQU" else ":="
-        code = f"{indent}{label.lower()} {op}{rest}"
 
-    # Convert label EQU/SET without colon
-    m = LABEL_ASSIGN_RE.match(code)
-    if m:
-        indent, label, _ws, directive, rest = m.groups()
-        op = "=" if directive.upper() == "EQU" else ":="
-        code = f"{indent}{label.lower()} {op}{rest}"
+def source_text(data: bytes) -> str:
+    """File bytes as text with universal newlines, as open() in text mode reads them."""
+    return data.decode(errors="ignore").replace("\r\n", "\n").replace("\r", "\n")
 
-    # Normalize preprocessor/conditional directives (dot-prefixed)
-    if not LABEL_RE.match(code):
-        code = normalize_preproc(code)
 
-    # LINKTO(...,"") -> LINKTO0(...)
-    code = LINKTO_EMPTY_RE.sub(r"LINKTO0(\1)", code)
+def converter_version() -> str:
+    """Digest of this script, so any change to the converter invalidates the cache."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
 
-    # Strip label colons and lower-case labels (label: rest -> label rest)
-    m = LABEL_DEF_RE.match(code)
-    if m:
-        indent, label, _ws, rest = m.groups()
-        rest = rest.lstrip()
-        if rest:
-            code = f"{indent}{label.lower()} {rest}"
-        else:
-            code = f"{indent}{label.lower()}"
 
-    # Add missing label colons (e.g., "PLUSLOOP    JMP" -> "PLUSLOOP: JMP")
-    if ":" not in code:
-        m = LABEL_LINE_RE.match(code)
-        if m:
-            indent, label, ws, rest = m.groups()
-            if indent:
-                m = None
-            if m:
-                first = label.upper().lstrip(".")
-                second = re.split(r"\s+", rest.strip(), maxsplit=1)[0].upper()
-                if (
-                    first not in DIRECTIVES
-                    and first not in OPCODES
-                    and second in OPCODES
-                ):
-                    code = f"{indent}{label.lower()} {rest.lstrip()}"
-
-    # Normalize directives, undocumented opcodes, and hex formatting
-    code = normalize_directives(code)
-    code = convert_undoc_opcodes(code)
-    code = normalize_hex(code)
-    code = space_shifts(code)
-
-    # Remove trailing comma for .BYTE/.WORD without reformatting spacing
-    data_match = re.match(r"^(\s*(?:[A-Za-z_.$][\w.$]*\s+)?)(\.byte|\.word)\b(.*)$", code, re.IGNORECASE)
-    if data_match:
-        prefix, directive, rest = data_match.groups()
-
-        def strip_trailing(segment: str) -> str:
-            return re.sub(r",\s*$", "", segment)
-
-        out = []
-        start = 0
-        in_quote = False
-        for i, ch in enumerate(rest):
-            if ch == '"':
-                if not in_quote:
-                    out.append(strip_trailing(rest[start:i]))
-                    in_quote = True
-                    start = i
-                else:
-                    out.append(rest[start:i + 1])
-                    in_quote = False
-                    start = i + 1
-        if in_quote:
-            out.append(rest[start:])
-        else:
-            out.append(strip_trailing(rest[start:]))
-        code = f"{prefix}{directive.lower()}{''.join(out)}"
+class ConversionCache:
+    """Content-addressed on-disk store of converted files.
 
-    # Macro invocations: NAME(...) -> #NAME ...
-    code = convert_macro_invocation(code, macro_names)
+    An entry is keyed by the source bytes, the global macro-name set and the
+    converter version, and holds the converted text.  Entries are written
+    atomically so that concurrent builds can share one cache directory.
 
-    # Lower-case symbols and directives (but keep opcodes/registers)
-    code = lowercase_identifiers(code, macro_names)
+    In-place conversions also record the digest of each output, so a file
+    that still holds what the converter wrote last time is recognized as
+    unchanged instead of being converted again.
+    """
 
-    # Indent opcode-only lines starting at column 1
-    stripped = code.lstrip()
-    leading = code[: len(code) - len(stripped)]
-    if not leading:
-        token = re.split(r"\s+", stripped, maxsplit=1)[0]
-        token_up = token.upper().lstrip(".")
-        if token_up in OPCODES:
-            code = INDENT + stripped
-
-    # Reattach comment
-    if comment:
-        code = f"{code}{comment_pad}{comment}"
+    def __init__(self, root: Path):
+        self.root = root
+        self.version = converter_version()
 
-    return [code + line_ending]
+    def key(self, data: bytes, macro_names: frozenset[str]) -> str:
+        h = hashlib.sha256()
+        h.update(self.version.encode("ascii"))
+        h.update(b"\0")
+        h.update("\n".join(sorted(macro_names)).encode("ascii", errors="replace"))
+        h.update(b"\0")
+        h.update(data)
+        return h.hexdigest()
 
+    def output_key(self, data: bytes) -> str:
+        h = hashlib.sha256()
+        h.update(self.version.encode("ascii"))
+        h.update(b"\0output\0")
+        h.update(data)
+        return h.hexdigest()
 
-def convert_text(text: str, macro_names: set[str]) -> str:
-    out_lines = []
-    for line in text.splitlines(keepends=True):
-        converted = convert_line(line, macro_names)
-        out_lines.extend(converted)
-    return "".join(out_lines)
+    def is_output(self, data: bytes) -> bool:
+        return self._path(self.output_key(data)).exists()
 
+    def mark_output(self, converted: str) -> None:
+        self.put(self.output_key(converted.encode("utf-8")), "")
 
-def collect_macro_names(paths: list[Path]) -> set[str]:
-    names: set[str] = set()
-    define_name_re = re.compile(r"^\s*[#.]?DEFINE\s+([A-Za-z_.$][\w.$]*)\b", re.IGNORECASE)
-    for path in paths:
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def get(self, key: str) -> str | None:
         try:
-            text = path.read_text(errors="ignore")
-        except OSError:
+            return self._path(key).read_bytes().decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def put(self, key: str, converted: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{key}.{os.getpid()}.tmp")
+        tmp.write_bytes(converted.encode("utf-8"))
+        os.replace(tmp, path)
+
+
+# Global macro set for pool workers; sent once per worker by the pool
+# initializer instead of once per file.
+_worker_macro_names: frozenset[str] = frozenset()
+
+
+def _init_worker(macro_names: frozenset[str], profile: bool) -> None:
+    global _worker_macro_names
+    _worker_macro_names = macro_names
+    if profile:
+        enable_profiling()
+
+
+def _convert_worker(text: str) -> tuple[str, dict[str, list[float]] | None]:
+    converted = convert_text(text, set(_worker_macro_names))
+    return converted, _profile.take() if _profile is not None else None
+
+
+def merge_worker_profile(converted: str, stats: dict[str, list[float]] | None) -> str:
+    if stats and _profile is not None:
+        _profile.merge(stats)
+    return converted
+
+
+def convert_tree(
+    pairs: list[tuple[Path, Path]],
+    macro_names: set[str],
+    jobs: int = 1,
+    cache: ConversionCache | None = None,
+) -> None:
+    """Convert (src, dst) pairs, optionally across a pool of worker processes.
+
+    Every file starts from its own copy of the global macro set, so the result
+    does not depend on conversion order.  Files found in the cache are not
+    converted again.  Outputs are written by this process in the order of
+    pairs.
+    """
+    frozen = frozenset(macro_names)
+    results: list[str | None] = []
+    pending = []
+    for index, (src, dst) in enumerate(pairs):
+        data = src.read_bytes()
+        if cache and src == dst and cache.is_output(data):
+            results.append(source_text(data))
             continue
-        for line in text.splitlines():
-            m = define_name_re.match(line)
-            if not m:
-                continue
-            name = m.group(1).upper()
-            names.add(name)
-            if name == "LINKTO":
-                names.add("LINKTO0")
-    return names
-
-
-def convert_file(src: Path, dst: Path | None, macro_names: set[str]) -> None:
-    data = src.read_text(errors="ignore")
-    converted = convert_text(data, macro_names)
-    if dst is None:
-        sys.stdout.write(converted)
-        return
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    dst.write_text(converted)
+        key = cache.key(data, frozen) if cache else None
+        converted = cache.get(key) if cache else None
+        results.append(converted)
+        if converted is None:
+            pending.append((index, key, source_text(data)))
+
+    if jobs <= 1 or len(pending) <= 1:
+        converted_iter = (convert_text(text, set(frozen)) for _, _, text in pending)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(
+            max_workers=min(jobs, len(pending)),
+            initializer=_init_worker,
+            initargs=(frozen, _profile is not None),
+        )
+        converted_iter = (
+            merge_worker_profile(converted, stats)
+            for converted, stats in pool.map(_convert_worker, [text for _, _, text in pending])
+        )
+    try:
+        for (index, key, _), converted in zip(pending, converted_iter):
+            results[index] = converted
+            if cache:
+                cache.put(key, converted)
+                src, dst = pairs[index]
+                if src == dst:
+                    cache.mark_output(converted)
+    finally:
+        if pool:
+            pool.shutdown()
+
+    for (_, dst), converted in zip(pairs, results):
+        write_output(dst, converted)
+
+
+STDIO_PATH = Path("-")
+
+
+def job_count(value: str) -> int:
+    jobs = int(value)
+    if jobs < 0:
+        raise argparse.ArgumentTypeError("--jobs must be >= 0")
+    return jobs or os.cpu_count() or 1
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Convert TASM-style MFORTH .asm files to opforge syntax.")
-    parser.add_argument("src", type=Path, help="Source file or directory")
-    parser.add_argument("dst", nargs="?", type=Path, help="Destination file or directory")
+    parser.add_argument("src", type=Path, help="Source file or directory, or - for stdin")
+    parser.add_argument("dst", nargs="?", type=Path, help="Destination file or directory, or - for stdout")
     parser.add_argument("--in-place", action="store_true", help="Convert files in place (directory only)")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=job_count,
+        default=1,
+        help="Worker processes for directory conversion (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Reuse conversions of unchanged files from this cache directory",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print time and call counts per conversion stage to stderr",
+    )
+    parser.add_argument(
+        "--profile-json",
+        type=Path,
+        metavar="FILE",
+        help="Write the per-stage profile to FILE as JSON",
+    )
     args = parser.parse_args()
 
+    profile = enable_profiling() if args.profile or args.profile_json else None
+    try:
+        return run(parser, args)
+    finally:
+        if profile is not None:
+            if args.profile_json:
+                args.profile_json.write_text(json.dumps(profile.as_json(), indent=2) + "\n")
+            if args.profile:
+                print(profile.format_table(), file=sys.stderr)
+
+
+def run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    cache = ConversionCache(args.cache_dir) if args.cache_dir else None
+
     if args.src.is_dir():
-        all_sources = list(args.src.rglob("*.asm"))
+        all_sources = sorted(args.src.rglob("*.asm"))
         macro_names = collect_macro_names(all_sources)
         if args.in_place:
             if args.dst is not None:
                 parser.error("--in-place cannot be used with a destination path")
-            for path in all_sources:
-                convert_file(path, path, macro_names)
+            convert_tree([(path, path) for path in all_sources], macro_names, args.jobs, cache)
             return 0
-        if args.dst is None:
+        if args.dst is None or args.dst == STDIO_PATH:
             parser.error("destination directory required when converting a directory")
-        for path in all_sources:
-            rel = path.relative_to(args.src)
-            convert_file(path, args.dst / rel, macro_names)
+        pairs = [(path, args.dst / path.relative_to(args.src)) for path in all_sources]
+        convert_tree(pairs, macro_names, args.jobs, cache)
         return 0
 
-    if args.dst is None:
-        macro_names = collect_macro_names([args.src])
-        convert_file(args.src, None, macro_names)
-        return 0
+    to_stdout = args.dst is None or args.dst == STDIO_PATH
+    try:
+        if args.src == STDIO_PATH:
+            sys.stdin.reconfigure(errors="ignore")
+            if to_stdout:
+                convert_stream(sys.stdin, sys.stdout, set())
+            else:
+                with args.dst.open("w") as f:
+                    convert_stream(sys.stdin, f, set())
+            return 0
+        if to_stdout:
+            convert_file(args.src, sys.stdout, collect_macro_names([args.src]))
+            return 0
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); exit quietly.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
 
     macro_names = collect_macro_names([args.src])
-    convert_file(args.src, args.dst, macro_names)
+    convert_tree([(args.src, args.dst)], macro_names, cache=cache)
     return 0
 
 
@@ -0,0 +1,47 @@
+; Sample TASM-style MFORTH source
+#DEFINE MFORTH_MAJOR 1
+#define LINKTO(prev,isimm,len,lastchar,revchars) .BYTE 10000000b|lastchar,revchars\ .BYTE (isimm<<7)|len\ .WORD prev-NFATOCFASZ
+#DEFINE NEXT LHLX\ INX D\ INX D\ PCHL
+#DEFINE RSPUSH(hi,lo) MOV A,hi\ STAX B\ DCX B\ MOV A,lo\ STAX B\ DCX B
+#DEFINE SAVEDE XCHG\ SHLD SAVED
+#DEFINE MSG(x) .BYTE "a;b\"c",x,'q'\ .WORD $FF,0x1A
+FRETOP:     .EQU    0FBB6h      ; Beginning of free space
+STKTOP      .EQU    0F678H
+ALTBGN:     .SET    $FCC0
+            .ORG    0000h
+RST0:       INX     SP
+            JMP     INIT
+INIT:       .ORG    0040h       ; comment
+            #IFDEF PROFILER
+            DSUB
+LBL         LDES    2
+            LDEH    0CFASZ
+            LHLX
+            SHLX
+            RDEL
+            #ENDIF
+            .ECHO "hello"
+#ECHO   "hi"
+            .ADDINSTR DSUB "" 08 1 NOP 1
+            LINKTO(LINK_CORE,0,3,'P',"UD")
+DUP:        POP     H
+            PUSH    H
+            PUSH    H
+            NEXT
+            LINKTO(DUP,0,4,'P',"")
+            .BYTE   'a',"x;y",0AH,
+            DB      1,2,3,
+            DW      LBL,0x10
+PLUSLOOP    JMP     PLUSLOOP
+            MVI     A,(ALTBGN>>8)&0FFh
+            LXI     H,1<<4
+            RSPUSH(D,E)
+LOOP1:      RSPUSH(H,L) ; push
+            SAVEDE
+            MSG(3)
+IF:         NOP
+ELSE        NOP
+            #IF (STDONRET != 008Eh)
+            #ECHO "\t*** ERROR ***\n"
+            #ENDIF
+            .END
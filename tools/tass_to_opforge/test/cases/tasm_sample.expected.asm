@@ -0,0 +1,75 @@
+; Sample TASM-style MFORTH source
+.define mforth_major=1
+linkTo .macro prev, isimm, len, lastchar, revchars
+            .byte 10000000b|\lastchar,\revchars
+            .byte (\isimm << 7)|\len
+            .word \prev-nfatocfasz
+.endmacro
+linkTo0 .macro prev, isimm, len, lastchar
+            .byte 10000000b|\lastchar
+            .byte (\isimm << 7)|\len
+            .word \prev-nfatocfasz
+.endmacro
+next .macro
+            .byte 0EDH
+            INX D
+            INX D
+            PCHL
+.endmacro
+rsPush .macro hi, lo
+            MOV A,\hi
+            STAX B
+            DCX B
+            MOV A,\lo
+            STAX B
+            DCX B
+.endmacro
+saveDe .macro
+            XCHG
+            SHLD saved
+.endmacro
+mSG .macro x
+            .byte "a;b\"c",\x,'q'
+            .word 0FFH,1AH
+.endmacro
+fretop =    0FBB6H      ; Beginning of free space
+stktop =    0F678H
+altbgn :=    0FCC0H
+            .org    0000H
+rst0 INX     SP
+            JMP     init
+ .org    0040H       ; comment
+init
+            .ifdef profiler
+            .byte 08H
+lbl .byte 038H,    2
+            .byte 028H,    0CFASZ
+            .byte 0EDH
+            .byte 0D9H
+            .byte 18H
+            .endif
+; ECHO "hello"
+; ECHO   "hi"
+; .ADDINSTR DSUB "" 08 1 NOP 1
+            .linkTo link_core,0,3,'P',"UD"
+dup POP     H
+            PUSH    H
+            PUSH    H
+            .next
+            .linkTo0 dup,0,4,'P'
+            .byte   'a',"x;y",0AH
+            .byte      1,2,3
+            .word      lbl,10H
+plusloop JMP     plusloop
+            MVI     A,(altbgn >> 8)&0FFH
+            LXI     H,1 << 4
+            .rsPush D,E
+loop1 .rsPush H,L ; push
+            .saveDe
+            .mSG 3
+if NOP
+else        NOP
+            .if (stdonret != 008EH)
+; ECHO "\t*** ERROR ***\n"
+            .endif
+            .end
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""Golden-output check and throughput benchmark for the TASM -> opForge converter.
+
+Three corpora are converted with convert_mforth_to_opforge.convert_text:
+
+  cases      hand-written TASM samples in cases/*.asm, compared line by line
+             against cases/*.expected.asm
+  src        every .asm file under src/, with the macro names collected from
+             the whole tree exactly as a directory conversion does
+  synthetic  generated stress inputs: long DEFINE macros with many backslash
+             segments, heavy string quoting and dense hex literals
+
+The src and synthetic outputs are compared with expected/src/ and
+expected/synthetic/ (the synthetic ones only at the default --scale).  Any
+difference fails the run (exit status 1) and is shown as a unified diff.
+After an intentional change to the converter or to src/, check the diff and
+rerun with --update to rewrite the expected outputs.
+"""
+
+import argparse
+import difflib
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+HERE = Path(__file__).resolve().parent
+ROOT = HERE.parents[2]
+CASES = HERE / "cases"
+EXPECTED = HERE / "expected"
+DEFAULT_SCALE = 4
+
+sys.path.insert(0, str(HERE.parent))
+import convert_mforth_to_opforge as conv  # noqa: E402
+
+
+class Input(NamedTuple):
+    corpus: str
+    name: str
+    text: str
+    macro_names: frozenset[str]
+
+
+class Result(NamedTuple):
+    corpus: str
+    name: str
+    lines: int
+    seconds: float
+    output: str
+
+
+# ----------------------------------------------------------------------
+# Synthetic stress inputs
+
+
+def synth_define_macros(rng: random.Random, count: int) -> str:
+    ops = ["MOV A,M", "INX H", "DCX B", "STAX B", "LHLX", "XCHG", "SHLD SAVED", "LDES 2", "DSUB", "PCHL"]
+    out = ["; long DEFINE macros with backslash segments\n"]
+    names = []
+    for i in range(count):
+        name = f"STRESS_MACRO_{i}"
+        params = [f"p{j}" for j in range(rng.randint(0, 4))]
+        body = []
+        for _ in range(rng.randint(8, 40)):
+            op = rng.choice(ops)
+            if params and rng.random() < 0.4:
+                op = f"MVI A,{rng.choice(params)}+0{rng.randint(0, 255):02X}h"
+            body.append(op)
+        head = f"{name}({','.join(params)})" if params else name
+        out.append(f"#DEFINE {head} {chr(92).join(body)}\n")
+        names.append((name, len(params)))
+    for _ in range(count * 4):
+        name, nargs = rng.choice(names)
+        args = ",".join(str(rng.randint(0, 9)) for _ in range(nargs))
+        call = f"{name}({args})" if nargs else name
+        out.append(f"LBL{rng.randint(0, 999)}:      {call}    ; call\n")
+    return "".join(out)
+
+
+def synth_quoting(rng: random.Random, count: int) -> str:
+    pieces = ['"a;b"', '"x\\"y;z"', "'q'", "';'", '""', '"\\\\"', '"(nest)"', "'\"'"]
+    out = ["; heavy quoting\n"]
+    for i in range(count):
+        items = ",".join(rng.choice(pieces + [str(rng.randint(0, 255))]) for _ in range(rng.randint(2, 12)))
+        directive = rng.choice([".BYTE", "DB", "BYTE"])
+        comment = rng.choice(["", ' ; "quoted; comment"', " ; it's"])
+        out.append(f"STR{i}:      {directive}   {items}{comment}\n")
+        out.append(f'            #ECHO "msg {i}; \\"done\\""\n')
+    return "".join(out)
+
+
+def synth_hex_literals(rng: random.Random, count: int) -> str:
+    forms = [
+        lambda v: f"0{v:04X}h",
+        lambda v: f"${v:X}",
+        lambda v: f"0x{v:x}",
+        lambda v: f"{v:X}H",
+        lambda v: str(v & 0xFF),
+    ]
+    out = ["; dense hex literals\n"]
+    for i in range(count):
+        vals = ",".join(rng.choice(forms)(rng.randint(0, 0xFFFF)) for _ in range(rng.randint(4, 16)))
+        out.append(f"            .WORD   {vals},\n")
+        out.append(f"            LXI     H,(0{rng.randint(0, 0xFFFF):04X}h>>8)|(1<<{rng.randint(0, 7)})\n")
+        out.append(f"HEX{i}        .EQU    ${rng.randint(0, 0xFFFF):04X}\n")
+    return "".join(out)
+
+
+SYNTHETIC: dict[str, Callable[[random.Random, int], str]] = {
+    "define_macros": synth_define_macros,
+    "quoting": synth_quoting,
+    "hex_literals": synth_hex_literals,
+}
+
+
+# ----------------------------------------------------------------------
+# Corpora
+
+
+def case_inputs() -> list[Input]:
+    inputs = []
+    for path in sorted(CASES.glob("*.asm")):
+        if path.name.endswith(".expected.asm"):
+            continue
+        macro_names = frozenset(conv.collect_macro_names([path]))
+        inputs.append(Input("cases", path.name, path.read_text(errors="ignore"), macro_names))
+    return inputs
+
+
+def src_inputs(src: Path) -> list[Input]:
+    paths = sorted(src.rglob("*.asm"))
+    macro_names = frozenset(conv.collect_macro_names(paths))
+    return [
+        Input("src", path.relative_to(src).as_posix(), path.read_text(errors="ignore"), macro_names)
+        for path in paths
+    ]
+
+
+def synthetic_inputs(scale: int) -> list[Input]:
+    inputs = []
+    for name, generate in SYNTHETIC.items():
+        text = generate(random.Random(name), 50 * scale)
+        names: set[str] = set()
+        for line in text.splitlines():
+            conv.note_macro_name(line, names)
+        macro_names = frozenset(names)
+        inputs.append(Input("synthetic", f"{name}.asm", text, macro_names))
+    return inputs
+
+
+def convert(item: Input, repeat: int) -> Result:
+    best = float("inf")
+    output = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = conv.convert_text(item.text, set(item.macro_names))
+        best = min(best, time.perf_counter() - start)
+    return Result(item.corpus, item.name, item.text.count("\n"), best, output)
+
+
+# ----------------------------------------------------------------------
+# Golden comparison
+
+
+def expected_path(r: Result) -> Path:
+    if r.corpus == "cases":
+        return CASES / r.name.replace(".asm", ".expected.asm")
+    return EXPECTED / r.corpus / r.name
+
+
+def write_expected(results: list[Result]) -> None:
+    for r in results:
+        path = expected_path(r)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(r.output)
+    for corpus in {r.corpus for r in results} - {"cases"}:
+        seen = {expected_path(r) for r in results if r.corpus == corpus}
+        for path in (EXPECTED / corpus).rglob("*.asm"):
+            if path not in seen:
+                path.unlink()
+
+
+def check_result(r: Result, diff_lines: int) -> list[str] | None:
+    """None when r matches its expected output, else a message and the diff."""
+    expected = expected_path(r)
+    name = expected.relative_to(HERE).as_posix()
+    if not expected.exists():
+        return [f"{r.corpus}/{r.name}: missing {name}"]
+    want = expected.read_text()
+    if want == r.output:
+        return None
+    diff = list(difflib.unified_diff(want.splitlines(), r.output.splitlines(), name, f"{r.corpus}/{r.name}",
+                                     lineterm=""))
+    problems = [f"{r.corpus}/{r.name}: output differs from {name}"]
+    if diff_lines and len(diff) > diff_lines:
+        problems += diff[:diff_lines] + [f"... {len(diff) - diff_lines} more diff line(s)"]
+    else:
+        problems += diff
+    return problems
+
+
+def check(results: list[Result], diff_lines: int) -> list[list[str]]:
+    """One entry per problem: its message lines."""
+    problems = [p for p in (check_result(r, diff_lines) for r in results) if p]
+    for corpus in sorted({r.corpus for r in results} - {"cases"}):
+        seen = {expected_path(r) for r in results if r.corpus == corpus}
+        for path in sorted((EXPECTED / corpus).rglob("*.asm")):
+            if path not in seen:
+                problems.append([f"{path.relative_to(HERE).as_posix()}: expected output has no input"])
+    return problems
+
+
+# ----------------------------------------------------------------------
+# Report
+
+
+def report(results: list[Result], per_file: int) -> None:
+    corpora = sorted({r.corpus for r in results})
+    print(f"{'corpus':<12}{'files':>7}{'lines':>10}{'seconds':>10}{'lines/s':>12}")
+    total_lines = total_seconds = 0.0
+    for corpus in corpora:
+        rows = [r for r in results if r.corpus == corpus]
+        lines = sum(r.lines for r in rows)
+        seconds = sum(r.seconds for r in rows)
+        total_lines += lines
+        total_seconds += seconds
+        print(f"{corpus:<12}{len(rows):>7}{lines:>10}{seconds:>10.3f}{lines / seconds:>12,.0f}")
+    print(f"{'total':<12}{len(results):>7}{int(total_lines):>10}{total_seconds:>10.3f}{total_lines / total_seconds:>12,.0f}")
+    if per_file:
+        print()
+        print("slowest files (ms, lines/s):")
+        for r in sorted(results, key=lambda r: r.seconds, reverse=True)[:per_file]:
+            rate = r.lines / r.seconds if r.seconds else 0.0
+            print(f"  {r.seconds * 1000:9.2f} {rate:>10,.0f}  {r.corpus}/{r.name}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check converter output against the expected outputs and report throughput.")
+    parser.add_argument("--src", type=Path, default=ROOT / "src", help="MFORTH source tree (default: src/)")
+    parser.add_argument("--scale", type=int, default=DEFAULT_SCALE,
+                        help="Size multiplier for the synthetic inputs (checked only at the default)")
+    parser.add_argument("--repeat", type=int, default=1, help="Convert each input N times and keep the best time")
+    parser.add_argument("--per-file", type=int, default=10, metavar="N", help="Show the N slowest files (0 = none)")
+    parser.add_argument("--json", type=Path, help="Also write per-file timings to this JSON file")
+    parser.add_argument("--diff-lines", type=int, default=40, metavar="N",
+                        help="Show at most N diff lines per differing file (0 = all)")
+    parser.add_argument("--update", action="store_true", help="Rewrite the expected outputs from the current output")
+    args = parser.parse_args()
+
+    inputs = case_inputs() + src_inputs(args.src) + synthetic_inputs(args.scale)
+    results = [convert(item, max(1, args.repeat)) for item in inputs]
+
+    report(results, args.per_file)
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                [
+                    {"corpus": r.corpus, "file": r.name, "lines": r.lines, "seconds": r.seconds}
+                    for r in results
+                ],
+                indent=2,
+            )
+            + "\n"
+        )
+
+    checked = [r for r in results if r.corpus != "synthetic" or args.scale == DEFAULT_SCALE]
+    if args.update:
+        write_expected(checked)
+        print(f"\nupdated {EXPECTED.relative_to(ROOT)} and the expected case outputs")
+        return 0
+
+    problems = check(checked, args.diff_lines)
+    print()
+    if problems:
+        print("\n".join(line for problem in problems for line in problem))
+        print(f"FAIL: {len(problems)} mismatch(es) with the expected outputs")
+        return 1
+    print("OK: output matches the expected outputs")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
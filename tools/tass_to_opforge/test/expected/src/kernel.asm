@@ -0,0 +1,251 @@
+; Copyright (c) 2009-2010, Michael Alyn Miller <malyn@strangeGizmo.com>.
+; All rights reserved.
+;
+; Redistribution and use in source and binary forms, with or without
+; modification, are permitted provided that the following conditions are met:
+;
+; 1. Redistributions of source code must retain the above copyright notice
+;    unmodified, this list of conditions, and the following disclaimer.
+; 2. Redistributions in binary form must reproduce the above copyright notice,
+;    this list of conditions and the following disclaimer in the documentation
+;    and/or other materials provided with the distribution.
+; 3. Neither the name of Michael Alyn Miller nor the names of the contributors
+;    to this software may be used to endorse or promote products derived from
+;    this software without specific prior written permission.
+;
+; THIS SOFTWARE IS PROVIDED BY THE AUTHOR AND CONTRIBUTORS "AS IS" AND ANY
+; EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+; WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+; DISCLAIMED. IN NO EVENT SHALL THE AUTHOR OR CONTRIBUTORS BE LIABLE FOR ANY
+; DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+; (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+; ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+; (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF
+; THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+; ======================================================================
+; MFORTH Address Interpreter
+; ======================================================================
+
+; ----------------------------------------------------------------------
+; Return stack macros
+;
+; The Return Stack Pointer is stored in BC and always points at the next
+; available location in the return stack.  The return stack grows downward
+; and is confined to the 64 bytes (32 cells) between $xx7F and $xx40 in the
+; Task Page.
+
+;RSPUSH:    MOV     A,E         ;[1. 5]
+;           STAX    B           ;[1. 7]
+;           DCX     B           ;[1. 5]
+;           MOV     A,D         ;[1. 5]
+;           STAX    B           ;[1. 7]
+;           DCX     B           ;[1. 5]
+;                               ;[6.34]
+rspush .macro hi, lo
+            MOV A,\hi
+            STAX B
+            DCX B
+            MOV A,\lo
+            STAX B
+            DCX B
+.endmacro
+
+;RSPOP:     INX     B           ;[1. 5]
+;           LDAX    B           ;[1. 7]
+;           MOV     D,A         ;[1. 5]
+;           INX     B           ;[1. 5]
+;           LDAX    B           ;[1. 7]
+;           MOV     E,A         ;[1. 5]
+;                               ;[6.34]
+rspop .macro hi, lo
+            INX B
+            LDAX B
+            MOV \lo,A
+            INX B
+            LDAX B
+            MOV \hi,A
+.endmacro
+
+;RSFETCH:   INX     B           ;[1. 5]
+;           LDAX    B           ;[1. 7]
+;           MOV     D,A         ;[1. 5]
+;           INX     B           ;[1. 5]
+;           LDAX    B           ;[1. 7]
+;           MOV     E,A         ;[1. 5]
+;           DCX     B           ;[1. 5]
+;           DCX     B           ;[1. 5]
+;                               ;[8.44]
+rsfetch .macro hi, lo
+            .rspop \hi,\lo
+            DCX B
+            DCX B
+.endmacro
+
+;RSPICK2:   INX     B           ;[1. 5]
+;           INX     B           ;[1. 5]
+;           INX     B           ;[1. 5]
+;           INX     B           ;[1. 5]
+;           INX     B           ;[1. 5]
+;           LDAX    B           ;[1. 7]
+;           MOV     D,A         ;[1. 5]
+;           INX     B           ;[1. 5]
+;           LDAX    B           ;[1. 7]
+;           MOV     E,A         ;[1. 5]
+;           DCX     B           ;[1. 5]
+;           DCX     B           ;[1. 5]
+;           DCX     B           ;[1. 5]
+;           DCX     B           ;[1. 5]
+;           DCX     B           ;[1. 5]
+;           DCX     B           ;[1. 5]
+;                               ;[8.44]
+rspick2 .macro hi, lo
+            INX B
+            INX B
+            INX B
+            INX B
+            .rspop \hi,\lo
+            DCX B
+            DCX B
+            DCX B
+            DCX B
+            DCX B
+            DCX B
+.endmacro
+
+
+; ----------------------------------------------------------------------
+; Direct-threaded code interpreter
+;
+; DE is the Instruction Pointer and an undocumented 8085 opcode is used
+; to transfer the location pointed to by DE into HL, the Word pointer.
+
+.ifndef profiler
+;NEXT:      LHLX                ;[1.10] (IP) -> W
+;           INX     D           ;[1. 5] IP+1 -> IP
+;           INX     D           ;[1. 5] IP+1 -> IP
+;           PCHL                ;[1. 5] JMP W
+;                               ;[4.25]
+next .macro
+            .byte 0EDH
+            INX D
+            INX D
+            PCHL
+.endmacro
+.else
+profilenext LHLD    profiling   ; Don't increment the Execution Count
+            MOV     A,L         ; ..if the profiling
+            ORA     H           ; ..flag
+            JZ      _profnext1  ; ..is zero.
+            .byte 0EDH                ; (IP) -> W
+            DCX     H           ; Decrement HL
+            DCX     H           ; ..to the low byte of the Execution Count.
+            INR     M           ; Increment the low byte of the count
+            JNZ     _profnext1  ; ..and skip the high byte if we didn't wrap.
+            INX     H           ; Increment to the high byte of the count.
+            INR     M           ; Increment the high byte of the count.
+_profnext1 .byte 0EDH                ; (IP) -> W
+            INX     D           ; IP+1 -> IP
+            INX     D           ; IP+1 -> IP
+            PCHL                ; JMP W
+next .macro
+            JMP profilenext
+.endmacro
+.endif
+
+
+; ----------------------------------------------------------------------
+; ENTER (a.k.a. DOCOLON) for use by high-level definitions
+
+docolon
+enter .rspush D,E         ;[6.34]
+            .byte 028H, cfasz          ;[2.10] W+CFASZ -> IP
+            .next                ;[4.25]
+                                ;[12.69]
+
+
+; ----------------------------------------------------------------------
+; DODOES for use by high-level CREATE..DOES> definitions
+
+dodoes .inxcfatopfa H      ; Skip over the CFA so that HL points to PFA.
+            XTHL                ; Swap PFA with the address of the high-level
+                                ; ..word that appears after DOES>.  That addr
+                                ; ..is on the stack because we CALL DODOES.
+            .rspush D,E         ; We're about to call a new word, so push IP.
+            XCHG                ; Move address of high-level thread to IP.
+            .next
+
+
+; ----------------------------------------------------------------------
+; DOCREATE and DOVARIABLE for use by high-level CREATE and VARIABLE definitions.
+
+docreate
+dovariable .inxcfatopfa H      ; Skip over the CFA so that HL points to PFA.
+            PUSH    H           ; Push PFA to the stack.
+            .next
+
+
+; ----------------------------------------------------------------------
+; DOCONSTANT for use by high-level CONSTANT definitions.
+
+doconstant .inxcfatopfa H      ; Skip over the CFA so that HL points to PFA.
+            MOV     A,M         ; Get the low byte of the constant in A,
+            INX     H           ; ..then increment to the high byte,
+            MOV     H,M         ; ..get the high byte into H,
+            MOV     L,A         ; ..move the low byte into L,
+            PUSH    H           ; ..and push the constant to the stack.
+            .next
+
+
+; ----------------------------------------------------------------------
+; DOUSER for use by high-level USER variables.
+
+douser .inxcfatopfa H      ; Skip over the CFA so that HL points to PFA.
+            MOV     L,M         ; Put USER variable offset into L.
+            MOV     H,B         ; Put Task Page into H.
+            PUSH    H           ; Push USER variable address onto stack.
+            .next
+
+
+
+; ======================================================================
+; MFORTH Dictionary
+; ======================================================================
+
+; ----------------------------------------------------------------------
+; Dictionary-linking macro
+;
+; LINKTO is used like so (for a word named "FOUND?" that links to FIND):
+;
+;   LINKTO(FIND,0,6,'?',"DNUOF")
+;
+; Notice that the name is in reverse order and that the last character is
+; specified as a separate byte.
+
+.ifndef profiler
+linkto .macro prev, isimm, len, lastchar, revchars
+            .byte 10000000b|\lastchar,\revchars
+            .byte (\isimm << 7)|\len
+            .word \prev-nfatocfasz
+.endmacro
+linkto0 .macro prev, isimm, len, lastchar
+            .byte 10000000b|\lastchar
+            .byte (\isimm << 7)|\len
+            .word \prev-nfatocfasz
+.endmacro
+.else
+linkto .macro prev, isimm, len, lastchar, revchars
+            .byte 10000000b|\lastchar,\revchars
+            .byte (\isimm << 7)|\len
+            .word \prev-nfatocfasz
+            .word 0
+.endmacro
+linkto0 .macro prev, isimm, len, lastchar
+            .byte 10000000b|\lastchar
+            .byte (\isimm << 7)|\len
+            .word \prev-nfatocfasz
+            .word 0
+.endmacro
+.endif
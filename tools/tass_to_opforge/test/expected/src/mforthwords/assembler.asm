@@ -0,0 +1,453 @@
+; Copyright (c) 2011, Michael Alyn Miller <malyn@strangeGizmo.com>.
+; All rights reserved.
+;
+; Redistribution and use in source and binary forms, with or without
+; modification, are permitted provided that the following conditions are met:
+;
+; 1. Redistributions of source code must retain the above copyright notice
+;    unmodified, this list of conditions, and the following disclaimer.
+; 2. Redistributions in binary form must reproduce the above copyright notice,
+;    this list of conditions and the following disclaimer in the documentation
+;    and/or other materials provided with the distribution.
+; 3. Neither the name of Michael Alyn Miller nor the names of the contributors
+;    to this software may be used to endorse or promote products derived from
+;    this software without specific prior written permission.
+;
+; THIS SOFTWARE IS PROVIDED BY THE AUTHOR AND CONTRIBUTORS "AS IS" AND ANY
+; EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+; WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+; DISCLAIMED. IN NO EVENT SHALL THE AUTHOR OR CONTRIBUTORS BE LIABLE FOR ANY
+; DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+; (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+; ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+; (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF
+; THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+; ======================================================================
+; Assembler Words
+; ======================================================================
+
+; ----------------------------------------------------------------------
+; END-CODE [MFORTH] ( -- )
+;
+; End the current code definition.  If the data-space pointer is not
+; aligned, reserve enough data space to align it.  Restore the previous
+; search order.
+;
+; ---
+; : END-CODE ( -- )   PREVIOUS ;
+
+            .linkto link_assembler,0,8,'E',"DOC-DNE"
+endcode JMP     enter
+            .word   previous
+            .word   exit
+
+
+; ----------------------------------------------------------------------
+; NEXT [MFORTH] ( -- )
+;
+; Compile the code for NEXT into the current code definition.
+
+            .linkto endcode,0,4,'T',"XEN"
+asmnext JMP     enter
+.ifndef profiler
+            .word   asmlhlx
+            .word   asmopd,asminx
+            .word   asmopd,asminx
+            .word   asmpchl
+.else
+            .word   lit,profilenext,asmjmp
+.endif
+            .word   exit
+
+
+; ----------------------------------------------------------------------
+; ROMCALL [MFORTH] ( addr -- )
+;
+; Call the Main ROM routine identified by addr.
+
+            .linkto asmnext,0,7,'L',"LACMOR"
+asmromcall JMP  enter
+            .word   lit,stdcall,asmcall
+            .word   comma
+            .word   exit
+
+
+; ----------------------------------------------------------------------
+; RESTOREREGS [MFORTH] ( -- )
+;
+; Restore BC and DE (corrupts HL).
+
+            .linkto asmromcall,0,11,'S',"GEREROTSER"
+asmrestoreregs JMP  enter
+            .word   lit,saveb,asmlhld
+            .word   asmoph,asmopb,asmmov
+            .word   asmopl,asmopc,asmmov
+            .word   lit,saved,asmlhld
+            .word   asmxchg
+            .word   exit
+
+
+; ----------------------------------------------------------------------
+; SAVEREGS [MFORTH] ( -- )
+;
+; Save BC and DE (corrupts HL).
+
+            .linkto asmrestoreregs,0,8,'S',"GEREVAS"
+asmsaveregs JMP     enter
+            .word   asmopb,asmoph,asmmov
+            .word   asmopc,asmopl,asmmov
+            .word   lit,saveb,asmshld
+            .word   asmxchg
+            .word   lit,saved,asmshld
+            .word   exit
+
+
+
+; ======================================================================
+; Control Flow Words
+; ======================================================================
+
+            .linkto asmsaveregs,0,2,'=',"0"
+asmzeroequals JMP   enter
+            .word   lit,0C2H,exit
+
+            .linkto asmzeroequals,0,2,'>',"0"
+asmzerogreater JMP  enter
+            .word   lit,0FAH,exit
+
+            .linkto asmzerogreater,0,2,'<',"0"
+asmzeroless JMP     enter
+            .word   lit,0F2H,exit
+
+            .linkto asmzeroless,0,3,'>',"<0"
+asmzeronotequals JMP enter
+            .word   lit,0CAH,exit
+
+            .linkto asmzeronotequals,0,2,'C',"C"
+asmcc JMP     enter
+            .word   lit,0DAH,exit
+
+            .linkto asmcc,0,2,'S',"C"
+asmcs JMP     enter
+            .word   lit,0D2H,exit
+
+            .linkto asmcs,0,5,'N',"IGEB"
+asmbegin JMP     enter
+            .word   here,exit
+
+            .linkto asmbegin,0,4,'E',"SLE"
+asmelse JMP     enter
+            .word   lit,0C3H,asmif,swap,asmthen,exit
+
+            .linkto asmelse,0,2,'F',"I"
+asmif JMP     enter
+            .word   ccomma,here,zero,comma,exit
+
+            .linkto asmif,0,4,'N',"EHT"
+asmthen JMP     enter
+            .word   here,swap,store,exit
+
+            .linkto asmthen,0,6,'T',"AEPER"
+asmrepeat JMP     enter
+            .word   swap,lit,0C3H,ccomma,comma,asmthen,exit
+
+            .linkto asmrepeat,0,5,'L',"ITNU"
+asmuntil JMP     enter
+            .word   ccomma,comma,exit
+
+            .linkto asmuntil,0,5,'E',"LIHW"
+asmwhile JMP     enter
+            .word   asmif,exit
+
+
+; ======================================================================
+; 8085 Assembly Instructions
+; ======================================================================
+
+; ----------------------------------------------------------------------
+; Operands
+;
+
+asmop .macro value
+            LXI H,\value
+            PUSH H
+            .next
+.endmacro
+
+            .linkto0 asmwhile,0,1,'A'
+asmopa .asmop 7
+
+            .linkto0 asmopa,0,1,'B'
+asmopb .asmop 0
+
+            .linkto0 asmopb,0,1,'C'
+asmopc .asmop 1
+
+            .linkto0 asmopc,0,1,'D'
+asmopd .asmop 2
+
+            .linkto0 asmopd,0,1,'E'
+asmope .asmop 3
+
+            .linkto0 asmope,0,1,'H'
+asmoph .asmop 4
+
+            .linkto0 asmoph,0,1,'L'
+asmopl .asmop 5
+
+            .linkto0 asmopl,0,1,'M'
+asmopm .asmop 6
+
+            .linkto asmopm,0,3,'W',"SP"
+asmoppsw .asmop 6
+
+            .linkto asmoppsw,0,2,'P',"S"
+asmopsp .asmop 6
+
+
+; ----------------------------------------------------------------------
+; Zero-operand instructions
+;
+
+asmzeroop .macro opcode
+            JMP enter
+            .word lit,\opcode,ccomma,exit
+.endmacro
+
+            .linkto asmopsp,0,4,'R',"HSA"
+asmashr .asmzeroop 10H
+
+            .linkto asmashr,0,3,'A',"MC"
+asmcma .asmzeroop 2FH
+
+            .linkto asmcma,0,3,'C',"MC"
+asmcmc .asmzeroop 3FH
+
+            .linkto asmcmc,0,3,'A',"AD"
+asmdaa .asmzeroop 27H
+
+            .linkto asmdaa,0,2,'I',"D"
+asmdi .asmzeroop 0F3H
+
+            .linkto asmdi,0,4,'B',"USD"
+asmdsub .asmzeroop 08H
+
+            .linkto asmdsub,0,2,'I',"E"
+asmei .asmzeroop 0FBH
+
+            .linkto asmei,0,3,'T',"LH"
+asmhlt .asmzeroop 76H
+
+            .linkto asmhlt,0,4,'X',"LHL"
+asmlhlx .asmzeroop 0EDH
+
+            .linkto asmlhlx,0,3,'P',"ON"
+asmnop .asmzeroop 00H
+
+            .linkto asmnop,0,4,'L',"HCP"
+asmpchl .asmzeroop 0E9H
+
+            .linkto asmpchl,0,3,'L',"AR"
+asmral .asmzeroop 17H
+
+            .linkto asmral,0,3,'R',"AR"
+asmrar .asmzeroop 1FH
+
+            .linkto asmrar,0,4,'L',"EDR"
+asmrdel .asmzeroop 18H
+
+            .linkto asmrdel,0,3,'T',"ER"
+asmret .asmzeroop 0C9H
+
+            .linkto asmret,0,3,'M',"IR"
+asmrim .asmzeroop 20H
+
+            .linkto asmrim,0,3,'C',"LR"
+asmrlc .asmzeroop 07H
+
+            .linkto asmrlc,0,3,'C',"RR"
+asmrrc .asmzeroop 0FH
+
+            .linkto asmrrc,0,4,'X',"LHS"
+asmshlx .asmzeroop 0D9H
+
+            .linkto asmshlx,0,3,'M',"IS"
+asmsim .asmzeroop 30H
+
+            .linkto asmsim,0,4,'L',"HPS"
+asmsphl .asmzeroop 0F9H
+
+            .linkto asmsphl,0,3,'C',"TS"
+asmstc .asmzeroop 37H
+
+            .linkto asmstc,0,4,'G',"HCX"
+asmxchg .asmzeroop 0EBH
+
+            .linkto asmxchg,0,4,'L',"HTX"
+asmxthl .asmzeroop 0E3H
+
+
+; ----------------------------------------------------------------------
+; Register instructions
+;
+
+asmregop .macro opcode
+            JMP enter
+            .word lit,\opcode,plus,ccomma,exit
+.endmacro
+
+            .linkto asmxthl,0,3,'C',"DA"
+asmadc .asmregop 88H
+
+            .linkto asmadc,0,3,'D',"DA"
+asmadd .asmregop 80H
+
+            .linkto asmadd,0,3,'A',"NA"
+asmana .asmregop 0A0H
+
+            .linkto asmana,0,3,'P',"MC"
+asmcmp .asmregop 0B8H
+
+            .linkto asmcmp,0,3,'R',"DC"
+asmdcr JMP     enter
+            .word   eightstar,lit,05H,plus,ccomma,exit
+
+            .linkto asmdcr,0,3,'R',"NI"
+asminr JMP     enter
+            .word   eightstar,lit,04H,plus,ccomma,exit
+
+            .linkto asminr,0,3,'A',"RO"
+asmora .asmregop 0B0H
+
+            .linkto asmora,0,3,'B',"BS"
+asmsbb .asmregop 98H
+
+            .linkto asmsbb,0,3,'B',"US"
+asmsub .asmregop 90H
+
+            .linkto asmsub,0,3,'A',"RX"
+asmxra .asmregop 0A8H
+
+
+; ----------------------------------------------------------------------
+; Register pair instructions
+;
+
+asmregpairop .macro opcode
+            JMP enter
+            .word eightstar,lit,\opcode,plus,ccomma,exit
+.endmacro
+
+            .linkto asmxra,0,3,'D',"AD"
+asmdad .asmregpairop 09H
+
+            .linkto asmdad,0,3,'X',"CD"
+asmdcx .asmregpairop 0BH
+
+            .linkto asmdcx,0,3,'X',"NI"
+asminx .asmregpairop 03H
+
+            .linkto asminx,0,4,'X',"ADL"
+asmldax .asmregpairop 0AH
+
+            .linkto asmldax,0,3,'P',"OP"
+asmpop .asmregpairop 0C1H
+
+            .linkto asmpop,0,4,'H',"SUP"
+asmpush .asmregpairop 0C5H
+
+            .linkto asmpush,0,4,'X',"ATS"
+asmstax .asmregpairop 02H
+
+
+; ----------------------------------------------------------------------
+; Byte operand instructions
+;
+
+asmbyteop .macro opcode
+            JMP enter
+            .word lit,\opcode,ccomma,ccomma,exit
+.endmacro
+
+            .linkto asmstax,0,3,'I',"CA"
+asmaci .asmbyteop 0CEH
+
+            .linkto asmaci,0,3,'I',"DA"
+asmadi .asmbyteop 0C6H
+
+            .linkto asmadi,0,3,'I',"NA"
+asmani .asmbyteop 0E6H
+
+            .linkto asmani,0,3,'I',"PC"
+asmcpi .asmbyteop 0FEH
+
+            .linkto asmcpi,0,2,'N',"I"
+asmin .asmbyteop 0DBH
+
+            .linkto asmin,0,3,'I',"RO"
+asmori .asmbyteop 0F6H
+
+            .linkto asmori,0,3,'T',"UO"
+asmout .asmbyteop 0D3H
+
+            .linkto asmout,0,3,'T',"SR"
+asmrst JMP     enter
+            .word   eightstar,lit,0C7H,plus,ccomma,exit
+
+            .linkto asmrst,0,3,'I',"BS"
+asmsbi .asmbyteop 0DEH
+
+            .linkto asmsbi,0,3,'I',"US"
+asmsui .asmbyteop 0D6H
+
+            .linkto asmsui,0,3,'I',"RX"
+asmxri .asmbyteop 0EEH
+
+
+; ----------------------------------------------------------------------
+; Word operand instructions
+;
+
+asmwordop .macro opcode
+            JMP enter
+            .word lit,\opcode,ccomma,comma,exit
+.endmacro
+
+            .linkto asmxri,0,4,'L',"LAC"
+asmcall .asmwordop 0CDH
+
+            .linkto asmcall,0,3,'P',"MJ"
+asmjmp .asmwordop 0C3H
+
+            .linkto asmjmp,0,3,'A',"DL"
+asmlda .asmwordop 3AH
+
+            .linkto asmlda,0,4,'D',"LHL"
+asmlhld .asmwordop 2AH
+
+            .linkto asmlhld,0,4,'D',"LHS"
+asmshld .asmwordop 22H
+
+            .linkto asmshld,0,3,'A',"TS"
+asmsta .asmwordop 32H
+
+
+; ----------------------------------------------------------------------
+; Move and Load Immediate instructions
+;
+
+            .linkto asmsta,0,3,'I',"XL"
+asmlxi JMP     enter
+            .word   eightstar,oneplus,ccomma,comma,exit
+
+            .linkto asmlxi,0,3,'V',"OM"
+asmmov JMP     enter
+            .word   eightstar,lit,40H,plus,plus,ccomma,exit
+
+            .linkto asmmov,0,3,'I',"VM"
+last_assembler
+asmmvi JMP     enter
+            .word   eightstar,lit,06H,plus,ccomma,ccomma,exit
@@ -0,0 +1,6004 @@
+; long DEFINE macros with backslash segments
+sTRESSMACRO0 .macro p0, p1, p2, p3
+            MVI A,\p1+089H
+            MVI A,\p1+0FBH
+            MVI A,\p0+0E7H
+            MVI A,\p2+0D5H
+            INX H
+            MVI A,\p3+06DH
+            MVI A,\p2+0B3H
+            MVI A,\p1+057H
+            .byte 038H, 2
+            MVI A,\p1+0E5H
+            XCHG
+            PCHL
+            XCHG
+            MVI A,\p2+09BH
+            DCX B
+            INX H
+            MVI A,\p1+060H
+            MVI A,\p1+0ACH
+            MVI A,\p3+0B0H
+            .byte 08H
+            INX H
+            SHLD saved
+            MVI A,\p0+057H
+            MVI A,\p3+0D9H
+            MVI A,\p0+07CH
+            MVI A,\p1+019H
+            MVI A,\p3+04EH
+            MOV A,M
+            .byte 0EDH
+            STAX B
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO1 .macro p0, p1, p2, p3
+            .byte 0EDH
+            MVI A,\p1+0B5H
+            XCHG
+            .byte 0EDH
+            MVI A,\p0+0E8H
+            MVI A,\p0+05BH
+            XCHG
+            .byte 038H, 2
+            STAX B
+            MVI A,\p3+064H
+            SHLD saved
+            .byte 038H, 2
+            DCX B
+            MVI A,\p0+005H
+            SHLD saved
+            SHLD saved
+            MVI A,\p2+04AH
+            .byte 038H, 2
+            MVI A,\p0+013H
+            MOV A,M
+            XCHG
+            MVI A,\p1+09FH
+            MVI A,\p0+099H
+            .byte 0EDH
+            INX H
+            MVI A,\p2+0C1H
+            MVI A,\p1+03CH
+            PCHL
+            STAX B
+.endmacro
+sTRESSMACRO2 .macro p0, p1, p2
+            MVI A,\p1+0A0H
+            MVI A,\p0+0F5H
+            XCHG
+            INX H
+            XCHG
+            MVI A,\p2+0D0H
+            MVI A,\p0+065H
+            MVI A,\p2+051H
+            SHLD saved
+            MVI A,\p2+08FH
+            INX H
+            MVI A,\p2+009H
+.endmacro
+sTRESSMACRO3 .macro p0, p1
+            MVI A,\p0+049H
+            PCHL
+            INX H
+            MVI A,\p0+04AH
+            MVI A,\p1+046H
+            .byte 0EDH
+            .byte 0EDH
+            MVI A,\p0+013H
+            .byte 038H, 2
+            MVI A,\p0+098H
+            MVI A,\p1+04DH
+            MVI A,\p1+095H
+            MVI A,\p0+02AH
+            .byte 08H
+            MVI A,\p0+0F8H
+            DCX B
+            XCHG
+            INX H
+            SHLD saved
+            SHLD saved
+            MVI A,\p1+02EH
+            MVI A,\p0+0FBH
+.endmacro
+sTRESSMACRO4 .macro p0, p1, p2, p3
+            MVI A,\p3+04AH
+            MOV A,M
+            INX H
+            INX H
+            INX H
+            .byte 038H, 2
+            MVI A,\p1+070H
+            PCHL
+            MVI A,\p2+010H
+            MVI A,\p2+0B6H
+            SHLD saved
+            XCHG
+            MVI A,\p1+09BH
+            PCHL
+            MOV A,M
+            DCX B
+            XCHG
+            MVI A,\p1+0EFH
+            PCHL
+            STAX B
+            MVI A,\p2+0B6H
+            MVI A,\p3+080H
+            INX H
+            STAX B
+            MVI A,\p0+018H
+            MOV A,M
+            XCHG
+            MVI A,\p0+070H
+            XCHG
+            .byte 038H, 2
+            .byte 0EDH
+            MVI A,\p3+061H
+            MVI A,\p2+0E1H
+            STAX B
+            MVI A,\p2+094H
+.endmacro
+sTRESSMACRO5 .macro p0, p1, p2
+            INX H
+            .byte 08H
+            MOV A,M
+            SHLD saved
+            MVI A,\p1+0E8H
+            STAX B
+            MVI A,\p2+0A2H
+            PCHL
+            SHLD saved
+            SHLD saved
+            MVI A,\p1+06EH
+            MVI A,\p2+072H
+            MOV A,M
+            .byte 08H
+            MOV A,M
+            .byte 038H, 2
+            MVI A,\p1+097H
+            INX H
+.endmacro
+sTRESSMACRO6 .macro p0, p1, p2
+            .byte 0EDH
+            XCHG
+            MVI A,\p1+0DFH
+            MVI A,\p1+059H
+            MVI A,\p2+0E3H
+            MVI A,\p1+0D9H
+            .byte 0EDH
+            INX H
+.endmacro
+sTRESSMACRO7 .macro p0, p1, p2
+            SHLD saved
+            STAX B
+            MVI A,\p2+0E9H
+            STAX B
+            .byte 08H
+            MVI A,\p2+04EH
+            INX H
+            MVI A,\p0+0E9H
+            XCHG
+            .byte 038H, 2
+            MVI A,\p0+02BH
+            STAX B
+            MVI A,\p0+05CH
+            MOV A,M
+            MVI A,\p0+009H
+            MVI A,\p1+0DFH
+            MVI A,\p1+021H
+            MVI A,\p2+035H
+            PCHL
+            MVI A,\p2+037H
+            STAX B
+            .byte 0EDH
+            .byte 08H
+            INX H
+            SHLD saved
+            MVI A,\p1+0E3H
+.endmacro
+sTRESSMACRO8 .macro
+            PCHL
+            .byte 08H
+            .byte 0EDH
+            DCX B
+            .byte 08H
+            SHLD saved
+            .byte 038H, 2
+            XCHG
+            .byte 08H
+            .byte 08H
+            XCHG
+            PCHL
+.endmacro
+sTRESSMACRO9 .macro p0, p1, p2, p3
+            SHLD saved
+            MVI A,\p2+00CH
+            SHLD saved
+            PCHL
+            MVI A,\p1+0F2H
+            MOV A,M
+            STAX B
+            INX H
+            MVI A,\p1+035H
+            INX H
+.endmacro
+sTRESSMACRO10 .macro p0
+            MVI A,\p0+06FH
+            MVI A,\p0+000H
+            MVI A,\p0+0E0H
+            INX H
+            INX H
+            .byte 038H, 2
+            INX H
+            SHLD saved
+            MOV A,M
+            MVI A,\p0+09EH
+            MVI A,\p0+01BH
+            MOV A,M
+            MVI A,\p0+0B7H
+            MVI A,\p0+0CFH
+            MVI A,\p0+025H
+            MVI A,\p0+079H
+            .byte 08H
+            MOV A,M
+            MVI A,\p0+003H
+            MVI A,\p0+03DH
+            STAX B
+            XCHG
+            .byte 08H
+            MVI A,\p0+006H
+            MVI A,\p0+046H
+            MVI A,\p0+028H
+            PCHL
+            DCX B
+            MVI A,\p0+051H
+            MVI A,\p0+0FCH
+.endmacro
+sTRESSMACRO11 .macro p0, p1
+            STAX B
+            XCHG
+            .byte 0EDH
+            .byte 0EDH
+            MVI A,\p1+06FH
+            INX H
+            .byte 0EDH
+            MVI A,\p0+0D5H
+            MVI A,\p1+02DH
+            .byte 038H, 2
+            STAX B
+            INX H
+            MVI A,\p1+083H
+            INX H
+            MOV A,M
+            MVI A,\p0+04CH
+            DCX B
+            XCHG
+            INX H
+            MVI A,\p0+031H
+            MVI A,\p1+07DH
+.endmacro
+sTRESSMACRO12 .macro p0, p1
+            .byte 0EDH
+            SHLD saved
+            MVI A,\p0+0F4H
+            XCHG
+            MVI A,\p0+03CH
+            .byte 0EDH
+            .byte 0EDH
+            PCHL
+            STAX B
+            DCX B
+            DCX B
+            .byte 08H
+            INX H
+            MVI A,\p1+06BH
+            PCHL
+            PCHL
+            .byte 0EDH
+            MVI A,\p1+07BH
+            MVI A,\p0+071H
+            MVI A,\p0+00BH
+            .byte 08H
+            MVI A,\p1+03DH
+            MVI A,\p0+0E6H
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO13 .macro p0, p1, p2
+            .byte 08H
+            .byte 08H
+            .byte 0EDH
+            INX H
+            MVI A,\p1+081H
+            MVI A,\p2+013H
+            DCX B
+            .byte 0EDH
+            XCHG
+            .byte 0EDH
+            INX H
+            DCX B
+            .byte 038H, 2
+            DCX B
+            XCHG
+            MVI A,\p2+042H
+            MVI A,\p2+0FCH
+            MVI A,\p2+089H
+            PCHL
+            MVI A,\p1+03EH
+            MVI A,\p1+05AH
+.endmacro
+sTRESSMACRO14 .macro p0
+            .byte 08H
+            .byte 038H, 2
+            MVI A,\p0+0D5H
+            MVI A,\p0+0F4H
+            .byte 0EDH
+            .byte 08H
+            MVI A,\p0+096H
+            XCHG
+            PCHL
+            MVI A,\p0+067H
+            MVI A,\p0+01AH
+            MVI A,\p0+0E7H
+            MVI A,\p0+0F5H
+            STAX B
+            MVI A,\p0+07FH
+            MVI A,\p0+027H
+            MVI A,\p0+01BH
+            INX H
+.endmacro
+sTRESSMACRO15 .macro p0, p1, p2
+            MOV A,M
+            MVI A,\p2+096H
+            MVI A,\p0+0DEH
+            .byte 038H, 2
+            MVI A,\p2+019H
+            STAX B
+            PCHL
+            DCX B
+            .byte 08H
+            MOV A,M
+            MVI A,\p0+0DCH
+            MVI A,\p1+026H
+            .byte 0EDH
+            MVI A,\p2+042H
+            .byte 08H
+            .byte 08H
+            MVI A,\p2+0EEH
+            INX H
+            MVI A,\p2+0DFH
+            MVI A,\p2+05FH
+            .byte 08H
+            INX H
+            .byte 0EDH
+            DCX B
+            PCHL
+            .byte 038H, 2
+            MVI A,\p0+0EEH
+            MVI A,\p1+038H
+            STAX B
+            MVI A,\p2+01FH
+            MOV A,M
+.endmacro
+sTRESSMACRO16 .macro
+            STAX B
+            .byte 0EDH
+            MOV A,M
+            STAX B
+            .byte 08H
+            .byte 038H, 2
+            XCHG
+            DCX B
+            DCX B
+            .byte 08H
+            .byte 038H, 2
+            MOV A,M
+            XCHG
+            PCHL
+            .byte 08H
+            .byte 038H, 2
+            PCHL
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO17 .macro p0
+            MVI A,\p0+097H
+            MVI A,\p0+064H
+            .byte 038H, 2
+            MVI A,\p0+00BH
+            MVI A,\p0+0D0H
+            .byte 08H
+            SHLD saved
+            MVI A,\p0+02DH
+            MVI A,\p0+05DH
+            MVI A,\p0+0ACH
+            .byte 08H
+            MVI A,\p0+0F9H
+            SHLD saved
+            MVI A,\p0+03AH
+            MOV A,M
+            MVI A,\p0+07FH
+            INX H
+            MVI A,\p0+069H
+            MOV A,M
+            MVI A,\p0+01BH
+            MVI A,\p0+0ABH
+.endmacro
+sTRESSMACRO18 .macro p0, p1, p2, p3
+            .byte 038H, 2
+            MVI A,\p1+063H
+            MOV A,M
+            MVI A,\p0+069H
+            MVI A,\p1+021H
+            STAX B
+            SHLD saved
+            XCHG
+            DCX B
+            PCHL
+            INX H
+            INX H
+            DCX B
+            SHLD saved
+            MOV A,M
+            MOV A,M
+            DCX B
+            DCX B
+            INX H
+            MVI A,\p0+0F3H
+            PCHL
+            SHLD saved
+            MVI A,\p1+06BH
+            MVI A,\p1+04AH
+            MVI A,\p1+098H
+            DCX B
+.endmacro
+sTRESSMACRO19 .macro p0, p1, p2
+            MVI A,\p0+0BCH
+            MVI A,\p0+0C4H
+            MOV A,M
+            SHLD saved
+            MVI A,\p1+082H
+            MVI A,\p1+0DEH
+            MVI A,\p0+0D0H
+            MOV A,M
+            MVI A,\p1+005H
+            MVI A,\p1+0E7H
+            .byte 0EDH
+            MVI A,\p2+0A6H
+.endmacro
+sTRESSMACRO20 .macro p0, p1, p2, p3
+            XCHG
+            .byte 08H
+            XCHG
+            MOV A,M
+            MVI A,\p3+066H
+            INX H
+            SHLD saved
+            .byte 038H, 2
+            SHLD saved
+            MVI A,\p3+084H
+            DCX B
+            STAX B
+            .byte 08H
+            MVI A,\p3+091H
+            MVI A,\p3+0D9H
+            MVI A,\p0+04BH
+            PCHL
+            .byte 0EDH
+            DCX B
+            MVI A,\p3+0C9H
+            MVI A,\p3+001H
+            DCX B
+            INX H
+            .byte 0EDH
+            .byte 08H
+            INX H
+            MVI A,\p1+0AFH
+            MVI A,\p0+042H
+            STAX B
+            MVI A,\p1+06AH
+            MOV A,M
+            .byte 08H
+            MVI A,\p3+013H
+            INX H
+            MVI A,\p1+024H
+.endmacro
+sTRESSMACRO21 .macro p0, p1
+            PCHL
+            DCX B
+            MVI A,\p0+026H
+            MVI A,\p0+0C5H
+            MVI A,\p0+0D0H
+            MVI A,\p1+0F4H
+            INX H
+            DCX B
+            MVI A,\p0+098H
+            .byte 038H, 2
+            SHLD saved
+            MVI A,\p1+091H
+            .byte 038H, 2
+            DCX B
+            MVI A,\p0+02AH
+            .byte 08H
+            MVI A,\p0+0C3H
+            MOV A,M
+            XCHG
+            MVI A,\p1+07FH
+            MVI A,\p0+006H
+            MVI A,\p0+085H
+            STAX B
+            STAX B
+            MVI A,\p0+014H
+            MVI A,\p1+077H
+.endmacro
+sTRESSMACRO22 .macro p0, p1
+            MVI A,\p1+06EH
+            MVI A,\p1+001H
+            SHLD saved
+            .byte 038H, 2
+            MOV A,M
+            INX H
+            .byte 038H, 2
+            SHLD saved
+            MVI A,\p1+02AH
+            MVI A,\p1+003H
+            STAX B
+            MVI A,\p1+091H
+            SHLD saved
+            INX H
+.endmacro
+sTRESSMACRO23 .macro
+            .byte 0EDH
+            XCHG
+            STAX B
+            XCHG
+            .byte 08H
+            .byte 08H
+            XCHG
+            PCHL
+            .byte 0EDH
+            .byte 038H, 2
+            .byte 038H, 2
+            .byte 08H
+            .byte 0EDH
+            MOV A,M
+            .byte 08H
+            SHLD saved
+            XCHG
+            STAX B
+            .byte 08H
+            .byte 08H
+.endmacro
+sTRESSMACRO24 .macro p0, p1, p2, p3
+            MVI A,\p2+04BH
+            .byte 0EDH
+            .byte 08H
+            MVI A,\p3+097H
+            XCHG
+            MVI A,\p3+09AH
+            MVI A,\p2+09FH
+            .byte 0EDH
+            MVI A,\p0+0D5H
+            PCHL
+            MVI A,\p2+088H
+            PCHL
+            MVI A,\p0+0FDH
+            MVI A,\p1+0FFH
+            MVI A,\p3+0B0H
+            MVI A,\p2+0B0H
+            MVI A,\p3+0DFH
+            PCHL
+            MVI A,\p0+098H
+            DCX B
+.endmacro
+sTRESSMACRO25 .macro
+            MOV A,M
+            STAX B
+            .byte 0EDH
+            STAX B
+            STAX B
+            DCX B
+            STAX B
+            STAX B
+            STAX B
+            STAX B
+            .byte 0EDH
+            DCX B
+            XCHG
+            .byte 0EDH
+            DCX B
+            SHLD saved
+            .byte 0EDH
+            STAX B
+            INX H
+            MOV A,M
+            MOV A,M
+            .byte 038H, 2
+            STAX B
+            XCHG
+            MOV A,M
+            .byte 08H
+            STAX B
+            STAX B
+            STAX B
+            .byte 08H
+            .byte 0EDH
+            .byte 038H, 2
+            .byte 0EDH
+            DCX B
+            MOV A,M
+            .byte 038H, 2
+            .byte 0EDH
+            INX H
+            INX H
+            .byte 0EDH
+.endmacro
+sTRESSMACRO26 .macro
+            SHLD saved
+            XCHG
+            .byte 038H, 2
+            .byte 038H, 2
+            INX H
+            XCHG
+            PCHL
+            XCHG
+            .byte 0EDH
+            STAX B
+            DCX B
+            PCHL
+            SHLD saved
+            STAX B
+            INX H
+            PCHL
+            MOV A,M
+            MOV A,M
+            XCHG
+            DCX B
+            PCHL
+            XCHG
+            STAX B
+            STAX B
+            .byte 0EDH
+            .byte 08H
+            .byte 038H, 2
+            PCHL
+            PCHL
+            XCHG
+.endmacro
+sTRESSMACRO27 .macro p0, p1
+            MVI A,\p0+0CDH
+            MVI A,\p1+0E1H
+            STAX B
+            SHLD saved
+            DCX B
+            MVI A,\p0+091H
+            XCHG
+            MVI A,\p1+0CFH
+            STAX B
+            PCHL
+            MVI A,\p0+083H
+            MVI A,\p1+086H
+            MVI A,\p1+0E5H
+            MVI A,\p0+056H
+            INX H
+            PCHL
+            PCHL
+            MVI A,\p1+009H
+            MVI A,\p1+090H
+            MVI A,\p1+02FH
+            MVI A,\p0+04DH
+            .byte 08H
+            INX H
+            MVI A,\p1+04FH
+            MVI A,\p0+033H
+            XCHG
+            DCX B
+            MOV A,M
+.endmacro
+sTRESSMACRO28 .macro p0, p1, p2
+            MOV A,M
+            MVI A,\p1+0E3H
+            XCHG
+            SHLD saved
+            XCHG
+            SHLD saved
+            INX H
+            .byte 08H
+            STAX B
+            PCHL
+            XCHG
+            .byte 0EDH
+            MVI A,\p0+083H
+            MVI A,\p1+0CEH
+            STAX B
+            MVI A,\p2+0DBH
+            STAX B
+            MVI A,\p2+071H
+            STAX B
+            MVI A,\p0+03EH
+.endmacro
+sTRESSMACRO29 .macro
+            PCHL
+            .byte 038H, 2
+            INX H
+            INX H
+            .byte 0EDH
+            DCX B
+            .byte 0EDH
+            MOV A,M
+            .byte 038H, 2
+            STAX B
+            INX H
+            .byte 038H, 2
+            PCHL
+            DCX B
+            STAX B
+            .byte 038H, 2
+            PCHL
+            INX H
+            INX H
+            SHLD saved
+            MOV A,M
+            DCX B
+            PCHL
+            MOV A,M
+            .byte 038H, 2
+            SHLD saved
+            INX H
+            .byte 038H, 2
+            .byte 038H, 2
+            INX H
+            .byte 08H
+            STAX B
+            INX H
+            .byte 038H, 2
+            STAX B
+.endmacro
+sTRESSMACRO30 .macro p0, p1, p2
+            SHLD saved
+            MVI A,\p1+017H
+            MVI A,\p1+05BH
+            MVI A,\p1+0B0H
+            DCX B
+            MVI A,\p1+077H
+            MVI A,\p1+035H
+            MOV A,M
+            MVI A,\p1+042H
+            MVI A,\p0+0DBH
+            XCHG
+            MVI A,\p2+0B2H
+            SHLD saved
+            PCHL
+            MVI A,\p0+0B0H
+            MVI A,\p1+034H
+            SHLD saved
+            MVI A,\p2+0C8H
+            MVI A,\p1+0BDH
+            MVI A,\p1+0A5H
+            MVI A,\p1+04CH
+            MVI A,\p2+074H
+            STAX B
+            MVI A,\p2+0FBH
+            SHLD saved
+            XCHG
+            .byte 08H
+            .byte 0EDH
+            .byte 08H
+            MVI A,\p2+0D2H
+            SHLD saved
+            MVI A,\p0+0F2H
+            DCX B
+            .byte 08H
+            MVI A,\p2+071H
+            XCHG
+            MVI A,\p0+0FAH
+            .byte 038H, 2
+            MVI A,\p2+091H
+            SHLD saved
+.endmacro
+sTRESSMACRO31 .macro p0, p1, p2
+            SHLD saved
+            MVI A,\p2+01FH
+            MVI A,\p2+09EH
+            .byte 038H, 2
+            SHLD saved
+            .byte 08H
+            MVI A,\p0+0BBH
+            STAX B
+            MVI A,\p0+064H
+            MVI A,\p2+0B0H
+            MVI A,\p2+0D0H
+.endmacro
+sTRESSMACRO32 .macro p0, p1
+            XCHG
+            MVI A,\p1+0F1H
+            STAX B
+            MVI A,\p0+0A0H
+            MVI A,\p0+06BH
+            .byte 0EDH
+            MVI A,\p1+0A5H
+            MVI A,\p0+05DH
+            .byte 038H, 2
+            MVI A,\p1+025H
+            MVI A,\p0+027H
+            .byte 0EDH
+            STAX B
+            .byte 08H
+            .byte 0EDH
+            XCHG
+            MVI A,\p0+0D4H
+            MVI A,\p1+072H
+            MOV A,M
+            MOV A,M
+            .byte 038H, 2
+            MVI A,\p1+0D9H
+            MOV A,M
+            MOV A,M
+.endmacro
+sTRESSMACRO33 .macro p0, p1, p2, p3
+            PCHL
+            MVI A,\p3+09CH
+            .byte 038H, 2
+            MVI A,\p0+00DH
+            XCHG
+            MVI A,\p3+04EH
+            MVI A,\p2+08BH
+            MVI A,\p0+03DH
+            MVI A,\p3+07CH
+            PCHL
+            .byte 08H
+            MVI A,\p2+06AH
+            MVI A,\p1+05BH
+            SHLD saved
+            INX H
+.endmacro
+sTRESSMACRO34 .macro p0, p1, p2
+            STAX B
+            DCX B
+            MVI A,\p2+07CH
+            MVI A,\p1+0ECH
+            .byte 0EDH
+            PCHL
+            MVI A,\p0+0EEH
+            .byte 08H
+            MVI A,\p2+0C1H
+            MVI A,\p1+07BH
+            MVI A,\p1+0E8H
+            STAX B
+            MVI A,\p2+09DH
+            .byte 08H
+            MVI A,\p2+061H
+            .byte 038H, 2
+            STAX B
+            STAX B
+            MVI A,\p2+03DH
+            MVI A,\p0+043H
+            DCX B
+            MVI A,\p1+03FH
+            XCHG
+            MVI A,\p1+013H
+            .byte 08H
+.endmacro
+sTRESSMACRO35 .macro
+            .byte 08H
+            XCHG
+            MOV A,M
+            MOV A,M
+            .byte 0EDH
+            .byte 08H
+            .byte 0EDH
+            SHLD saved
+            SHLD saved
+            .byte 08H
+            DCX B
+            DCX B
+.endmacro
+sTRESSMACRO36 .macro p0
+            DCX B
+            MVI A,\p0+075H
+            XCHG
+            MVI A,\p0+03EH
+            STAX B
+            MVI A,\p0+0B0H
+            SHLD saved
+            MVI A,\p0+08FH
+            .byte 0EDH
+            .byte 0EDH
+.endmacro
+sTRESSMACRO37 .macro p0, p1, p2
+            MVI A,\p1+066H
+            .byte 038H, 2
+            XCHG
+            MVI A,\p2+0CCH
+            PCHL
+            .byte 038H, 2
+            DCX B
+            INX H
+            .byte 0EDH
+            DCX B
+            SHLD saved
+            MVI A,\p0+049H
+            MVI A,\p2+05FH
+            DCX B
+            MVI A,\p2+08BH
+            MVI A,\p1+0B5H
+            .byte 0EDH
+            MVI A,\p1+071H
+            MVI A,\p1+045H
+            INX H
+            MVI A,\p2+026H
+            DCX B
+            MVI A,\p2+099H
+            DCX B
+            XCHG
+            MOV A,M
+            MVI A,\p2+00CH
+            SHLD saved
+            MVI A,\p0+032H
+            MVI A,\p1+009H
+            DCX B
+.endmacro
+sTRESSMACRO38 .macro p0
+            MVI A,\p0+05FH
+            MVI A,\p0+0F7H
+            MVI A,\p0+048H
+            DCX B
+            MVI A,\p0+01FH
+            MVI A,\p0+09EH
+            DCX B
+            .byte 038H, 2
+            MVI A,\p0+0FFH
+            PCHL
+            MVI A,\p0+038H
+            INX H
+            MVI A,\p0+0C4H
+            SHLD saved
+            MVI A,\p0+0F2H
+            MVI A,\p0+0FAH
+            MOV A,M
+            MVI A,\p0+049H
+            .byte 0EDH
+            MOV A,M
+            SHLD saved
+            MVI A,\p0+01CH
+            MVI A,\p0+043H
+            DCX B
+            MVI A,\p0+01BH
+            MVI A,\p0+0AAH
+            SHLD saved
+            INX H
+            INX H
+            MVI A,\p0+0C9H
+            .byte 0EDH
+            SHLD saved
+            .byte 038H, 2
+            SHLD saved
+.endmacro
+sTRESSMACRO39 .macro p0
+            MOV A,M
+            XCHG
+            .byte 038H, 2
+            .byte 038H, 2
+            PCHL
+            MVI A,\p0+09CH
+            INX H
+            SHLD saved
+            DCX B
+            MOV A,M
+            MVI A,\p0+006H
+            MVI A,\p0+078H
+            .byte 0EDH
+            XCHG
+            MVI A,\p0+090H
+            MVI A,\p0+04CH
+            MVI A,\p0+012H
+            MVI A,\p0+01DH
+            STAX B
+            PCHL
+            .byte 0EDH
+            INX H
+            MVI A,\p0+0BDH
+            MVI A,\p0+0A6H
+            MVI A,\p0+0CDH
+            STAX B
+            MOV A,M
+            STAX B
+            MVI A,\p0+0DEH
+            DCX B
+            INX H
+            MVI A,\p0+0B3H
+            MVI A,\p0+081H
+            .byte 0EDH
+            MVI A,\p0+0B1H
+            STAX B
+            DCX B
+            MVI A,\p0+05CH
+            MVI A,\p0+0FCH
+.endmacro
+sTRESSMACRO40 .macro p0, p1
+            SHLD saved
+            MVI A,\p1+0CFH
+            XCHG
+            STAX B
+            MVI A,\p0+057H
+            MVI A,\p0+011H
+            MOV A,M
+            INX H
+            PCHL
+            XCHG
+            XCHG
+            PCHL
+            MVI A,\p0+086H
+            .byte 08H
+            DCX B
+            XCHG
+            .byte 08H
+            PCHL
+            MVI A,\p1+0E6H
+            .byte 0EDH
+            XCHG
+            XCHG
+            SHLD saved
+            SHLD saved
+            .byte 038H, 2
+            MVI A,\p1+043H
+.endmacro
+sTRESSMACRO41 .macro p0
+            MVI A,\p0+08CH
+            DCX B
+            .byte 08H
+            .byte 0EDH
+            MVI A,\p0+02AH
+            MVI A,\p0+0C1H
+            XCHG
+            INX H
+            INX H
+            MOV A,M
+            .byte 08H
+            PCHL
+            XCHG
+            MOV A,M
+            INX H
+            MOV A,M
+            PCHL
+            .byte 038H, 2
+            MVI A,\p0+0C2H
+            .byte 038H, 2
+            MVI A,\p0+0DDH
+            MOV A,M
+            .byte 08H
+            MVI A,\p0+0B3H
+.endmacro
+sTRESSMACRO42 .macro
+            MOV A,M
+            STAX B
+            .byte 08H
+            DCX B
+            .byte 08H
+            .byte 038H, 2
+            XCHG
+            STAX B
+            SHLD saved
+            INX H
+            MOV A,M
+            .byte 0EDH
+            XCHG
+            .byte 08H
+            PCHL
+            PCHL
+            PCHL
+            PCHL
+            INX H
+            SHLD saved
+            STAX B
+            XCHG
+            MOV A,M
+            SHLD saved
+            STAX B
+            .byte 0EDH
+            STAX B
+            .byte 0EDH
+            INX H
+            STAX B
+            .byte 08H
+            DCX B
+            SHLD saved
+.endmacro
+sTRESSMACRO43 .macro p0, p1, p2
+            .byte 08H
+            MOV A,M
+            INX H
+            SHLD saved
+            DCX B
+            .byte 08H
+            MVI A,\p2+0C3H
+            MVI A,\p1+09AH
+            .byte 08H
+            DCX B
+            MVI A,\p0+0DBH
+            MOV A,M
+            INX H
+            MVI A,\p0+027H
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO44 .macro p0
+            MVI A,\p0+0D7H
+            STAX B
+            MOV A,M
+            STAX B
+            MVI A,\p0+073H
+            MVI A,\p0+022H
+            MVI A,\p0+053H
+            MVI A,\p0+053H
+            INX H
+            DCX B
+            MVI A,\p0+012H
+            MVI A,\p0+09DH
+            MVI A,\p0+01EH
+            MVI A,\p0+077H
+            MOV A,M
+            INX H
+            .byte 08H
+            MVI A,\p0+0F9H
+            .byte 0EDH
+            MVI A,\p0+0B9H
+            PCHL
+            MVI A,\p0+0D3H
+            MVI A,\p0+0D4H
+            MOV A,M
+            MVI A,\p0+0FFH
+.endmacro
+sTRESSMACRO45 .macro p0
+            XCHG
+            MVI A,\p0+088H
+            STAX B
+            MOV A,M
+            DCX B
+            .byte 08H
+            SHLD saved
+            MOV A,M
+            XCHG
+            MVI A,\p0+0C6H
+            PCHL
+            MVI A,\p0+024H
+            MVI A,\p0+041H
+            MOV A,M
+            MVI A,\p0+0EAH
+            INX H
+            MVI A,\p0+051H
+            XCHG
+            MVI A,\p0+02FH
+            MVI A,\p0+0FFH
+            MOV A,M
+            INX H
+            MVI A,\p0+05BH
+            MVI A,\p0+050H
+.endmacro
+sTRESSMACRO46 .macro
+            XCHG
+            PCHL
+            INX H
+            DCX B
+            SHLD saved
+            MOV A,M
+            .byte 08H
+            .byte 0EDH
+            XCHG
+            STAX B
+            INX H
+            .byte 08H
+            .byte 0EDH
+            MOV A,M
+            MOV A,M
+            INX H
+.endmacro
+sTRESSMACRO47 .macro p0, p1
+            DCX B
+            MVI A,\p0+046H
+            MVI A,\p1+017H
+            .byte 0EDH
+            PCHL
+            .byte 0EDH
+            PCHL
+            MVI A,\p1+007H
+            MVI A,\p0+04AH
+            MVI A,\p0+0CFH
+            INX H
+            .byte 038H, 2
+            STAX B
+            MVI A,\p0+00EH
+            DCX B
+            MVI A,\p1+0A6H
+            .byte 038H, 2
+            PCHL
+            .byte 038H, 2
+            MVI A,\p0+0ECH
+            MVI A,\p0+090H
+            DCX B
+            .byte 0EDH
+.endmacro
+sTRESSMACRO48 .macro p0
+            DCX B
+            MVI A,\p0+080H
+            MVI A,\p0+0D1H
+            .byte 08H
+            MVI A,\p0+0BCH
+            .byte 08H
+            .byte 0EDH
+            SHLD saved
+            MVI A,\p0+043H
+            SHLD saved
+            SHLD saved
+            STAX B
+            MOV A,M
+            SHLD saved
+            MVI A,\p0+02AH
+            MVI A,\p0+071H
+            MVI A,\p0+0D1H
+            MVI A,\p0+02CH
+            MVI A,\p0+029H
+            MVI A,\p0+0B0H
+            MVI A,\p0+0D1H
+            MVI A,\p0+010H
+            MVI A,\p0+026H
+            INX H
+            MVI A,\p0+082H
+            XCHG
+            .byte 08H
+            MOV A,M
+            MVI A,\p0+042H
+            MVI A,\p0+0D7H
+            MVI A,\p0+087H
+            STAX B
+            MVI A,\p0+094H
+.endmacro
+sTRESSMACRO49 .macro p0
+            .byte 038H, 2
+            .byte 0EDH
+            SHLD saved
+            MOV A,M
+            MVI A,\p0+041H
+            SHLD saved
+            .byte 0EDH
+            MVI A,\p0+01CH
+            .byte 08H
+            .byte 0EDH
+            MVI A,\p0+027H
+            MVI A,\p0+029H
+            .byte 0EDH
+            .byte 08H
+            MVI A,\p0+08AH
+            XCHG
+            INX H
+            MVI A,\p0+0E9H
+            INX H
+            STAX B
+            MVI A,\p0+041H
+            MVI A,\p0+067H
+            MVI A,\p0+029H
+            MOV A,M
+            MVI A,\p0+049H
+            MVI A,\p0+08CH
+            MOV A,M
+            .byte 0EDH
+            DCX B
+            MVI A,\p0+00CH
+            MVI A,\p0+0DCH
+            .byte 08H
+            .byte 0EDH
+            MVI A,\p0+06CH
+            XCHG
+            INX H
+            .byte 0EDH
+.endmacro
+sTRESSMACRO50 .macro p0, p1, p2
+            MVI A,\p1+0F5H
+            XCHG
+            MVI A,\p2+0FEH
+            DCX B
+            MVI A,\p0+03DH
+            XCHG
+            MVI A,\p1+007H
+            MVI A,\p0+05EH
+            MVI A,\p1+0E4H
+            MVI A,\p1+09DH
+            MVI A,\p2+01BH
+            MVI A,\p0+04BH
+            MVI A,\p2+0D6H
+            MVI A,\p1+019H
+.endmacro
+sTRESSMACRO51 .macro p0, p1, p2, p3
+            MVI A,\p2+040H
+            STAX B
+            PCHL
+            SHLD saved
+            STAX B
+            PCHL
+            PCHL
+            MVI A,\p3+0F3H
+            MVI A,\p0+018H
+            MVI A,\p3+0FCH
+            PCHL
+            MVI A,\p0+09EH
+            .byte 0EDH
+            MVI A,\p1+009H
+            MVI A,\p3+057H
+            PCHL
+            INX H
+            MVI A,\p1+09DH
+            MVI A,\p3+05AH
+            MVI A,\p0+082H
+            XCHG
+            INX H
+            XCHG
+.endmacro
+sTRESSMACRO52 .macro
+            .byte 08H
+            XCHG
+            DCX B
+            STAX B
+            STAX B
+            .byte 038H, 2
+            INX H
+            .byte 0EDH
+            DCX B
+            .byte 038H, 2
+            STAX B
+.endmacro
+sTRESSMACRO53 .macro p0, p1
+            PCHL
+            XCHG
+            SHLD saved
+            INX H
+            STAX B
+            MVI A,\p0+038H
+            PCHL
+            STAX B
+            MVI A,\p1+0D7H
+            MVI A,\p1+084H
+.endmacro
+sTRESSMACRO54 .macro
+            PCHL
+            PCHL
+            .byte 08H
+            STAX B
+            INX H
+            .byte 0EDH
+            PCHL
+            MOV A,M
+            STAX B
+            INX H
+            DCX B
+            SHLD saved
+            SHLD saved
+            .byte 038H, 2
+            XCHG
+.endmacro
+sTRESSMACRO55 .macro p0, p1, p2, p3
+            .byte 08H
+            MOV A,M
+            MVI A,\p1+0A8H
+            DCX B
+            MVI A,\p2+0D0H
+            SHLD saved
+            .byte 038H, 2
+            .byte 08H
+            .byte 038H, 2
+            INX H
+            STAX B
+            MOV A,M
+.endmacro
+sTRESSMACRO56 .macro p0
+            DCX B
+            DCX B
+            MVI A,\p0+003H
+            XCHG
+            MVI A,\p0+07FH
+            .byte 0EDH
+            MVI A,\p0+02AH
+            PCHL
+            .byte 08H
+            .byte 038H, 2
+            MVI A,\p0+077H
+.endmacro
+sTRESSMACRO57 .macro p0, p1
+            MVI A,\p0+0E4H
+            MVI A,\p0+08CH
+            MVI A,\p1+090H
+            MVI A,\p1+074H
+            XCHG
+            DCX B
+            PCHL
+            MVI A,\p1+080H
+            .byte 08H
+            SHLD saved
+            XCHG
+            .byte 0EDH
+            MVI A,\p1+010H
+            .byte 038H, 2
+            INX H
+            MVI A,\p0+005H
+            .byte 0EDH
+            .byte 038H, 2
+            MVI A,\p0+054H
+            MVI A,\p0+008H
+            SHLD saved
+            SHLD saved
+            MVI A,\p1+05DH
+.endmacro
+sTRESSMACRO58 .macro p0, p1
+            .byte 038H, 2
+            .byte 038H, 2
+            MVI A,\p0+071H
+            PCHL
+            MVI A,\p1+014H
+            MVI A,\p1+06DH
+            .byte 08H
+            MVI A,\p1+0AEH
+            MVI A,\p1+0F2H
+            MVI A,\p1+074H
+            INX H
+            MVI A,\p0+05FH
+            MOV A,M
+            MVI A,\p1+03DH
+            MVI A,\p0+0CFH
+            XCHG
+            .byte 0EDH
+            STAX B
+            MVI A,\p1+0FAH
+            MVI A,\p0+021H
+            .byte 038H, 2
+            MOV A,M
+            SHLD saved
+            MVI A,\p1+056H
+            INX H
+            SHLD saved
+            PCHL
+            INX H
+            MOV A,M
+.endmacro
+sTRESSMACRO59 .macro p0, p1
+            MVI A,\p1+0F1H
+            DCX B
+            MVI A,\p1+0B6H
+            MOV A,M
+            MVI A,\p0+0A6H
+            XCHG
+            MVI A,\p0+090H
+            DCX B
+            MVI A,\p0+031H
+            DCX B
+            MVI A,\p0+07FH
+            SHLD saved
+            MVI A,\p0+0D5H
+            DCX B
+            MVI A,\p0+0ADH
+            XCHG
+            MVI A,\p0+080H
+            SHLD saved
+            MVI A,\p1+097H
+            MVI A,\p1+030H
+            MVI A,\p1+03EH
+            MOV A,M
+            SHLD saved
+            SHLD saved
+            DCX B
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO60 .macro
+            DCX B
+            SHLD saved
+            .byte 0EDH
+            PCHL
+            SHLD saved
+            XCHG
+            MOV A,M
+            XCHG
+            XCHG
+.endmacro
+sTRESSMACRO61 .macro p0, p1, p2
+            PCHL
+            MVI A,\p0+090H
+            MVI A,\p1+02CH
+            MVI A,\p1+045H
+            XCHG
+            INX H
+            MVI A,\p1+09DH
+            .byte 08H
+            MVI A,\p1+0AAH
+            DCX B
+            MVI A,\p2+065H
+            .byte 08H
+            INX H
+            MVI A,\p2+0F2H
+            .byte 038H, 2
+            STAX B
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO62 .macro p0, p1, p2
+            .byte 08H
+            STAX B
+            .byte 038H, 2
+            MOV A,M
+            .byte 0EDH
+            SHLD saved
+            STAX B
+            STAX B
+            MVI A,\p1+065H
+            MVI A,\p0+01AH
+            MVI A,\p0+07CH
+            STAX B
+            MVI A,\p0+002H
+            .byte 038H, 2
+            STAX B
+            MVI A,\p1+01CH
+            SHLD saved
+            STAX B
+            MVI A,\p1+091H
+            MVI A,\p2+035H
+            SHLD saved
+            MVI A,\p1+0B4H
+            SHLD saved
+            DCX B
+            DCX B
+            .byte 08H
+            XCHG
+            MVI A,\p0+099H
+            SHLD saved
+            INX H
+            MOV A,M
+            .byte 0EDH
+            MVI A,\p2+08AH
+            STAX B
+            INX H
+            PCHL
+.endmacro
+sTRESSMACRO63 .macro p0, p1, p2
+            MVI A,\p1+023H
+            .byte 038H, 2
+            DCX B
+            MVI A,\p0+031H
+            MVI A,\p0+05FH
+            .byte 08H
+            SHLD saved
+            MVI A,\p1+0E9H
+            MOV A,M
+            PCHL
+            STAX B
+            MVI A,\p0+066H
+            .byte 038H, 2
+            MVI A,\p0+0CEH
+            .byte 0EDH
+            MVI A,\p0+03DH
+            STAX B
+            .byte 08H
+            XCHG
+            STAX B
+            MVI A,\p2+016H
+            .byte 08H
+            MVI A,\p0+0D7H
+.endmacro
+sTRESSMACRO64 .macro p0, p1
+            MVI A,\p1+043H
+            MVI A,\p1+0E0H
+            MVI A,\p0+0C5H
+            SHLD saved
+            .byte 0EDH
+            .byte 0EDH
+            MOV A,M
+            .byte 0EDH
+            MVI A,\p0+0A0H
+            STAX B
+            MVI A,\p1+06EH
+            XCHG
+            .byte 08H
+            XCHG
+            XCHG
+            PCHL
+            MVI A,\p1+02CH
+            .byte 0EDH
+            MVI A,\p0+01FH
+            PCHL
+            .byte 08H
+            .byte 0EDH
+            PCHL
+            XCHG
+            MVI A,\p1+056H
+            .byte 0EDH
+            .byte 08H
+.endmacro
+sTRESSMACRO65 .macro p0
+            MOV A,M
+            PCHL
+            MVI A,\p0+0D7H
+            INX H
+            PCHL
+            MVI A,\p0+0A8H
+            STAX B
+            .byte 08H
+            MVI A,\p0+010H
+            MOV A,M
+.endmacro
+sTRESSMACRO66 .macro p0
+            .byte 08H
+            SHLD saved
+            MVI A,\p0+0A1H
+            .byte 0EDH
+            MVI A,\p0+046H
+            MOV A,M
+            .byte 038H, 2
+            MVI A,\p0+0A6H
+            MVI A,\p0+066H
+            MVI A,\p0+078H
+            MVI A,\p0+0E2H
+            DCX B
+            DCX B
+            MVI A,\p0+0D9H
+            DCX B
+            .byte 0EDH
+            MVI A,\p0+0A2H
+            .byte 038H, 2
+            MVI A,\p0+0F6H
+            MVI A,\p0+017H
+            MVI A,\p0+002H
+            PCHL
+            MVI A,\p0+071H
+            MVI A,\p0+076H
+            MVI A,\p0+053H
+            MVI A,\p0+0CBH
+            .byte 038H, 2
+            .byte 0EDH
+            SHLD saved
+            STAX B
+            SHLD saved
+            MVI A,\p0+0FFH
+            MVI A,\p0+0DAH
+            MVI A,\p0+0CEH
+            MVI A,\p0+023H
+            MVI A,\p0+0AFH
+            .byte 08H
+            PCHL
+            MVI A,\p0+0EDH
+            XCHG
+.endmacro
+sTRESSMACRO67 .macro p0, p1
+            MVI A,\p0+07CH
+            MVI A,\p1+068H
+            PCHL
+            PCHL
+            INX H
+            MVI A,\p0+0D6H
+            SHLD saved
+            .byte 0EDH
+            MVI A,\p1+053H
+            MVI A,\p0+0C5H
+            .byte 038H, 2
+            STAX B
+            SHLD saved
+            MVI A,\p1+012H
+            SHLD saved
+            PCHL
+            .byte 08H
+            MVI A,\p1+0D0H
+            MVI A,\p0+09DH
+            PCHL
+            XCHG
+            MVI A,\p0+001H
+            PCHL
+            PCHL
+            MVI A,\p0+063H
+            MVI A,\p0+077H
+            MOV A,M
+            MVI A,\p0+066H
+.endmacro
+sTRESSMACRO68 .macro p0, p1, p2, p3
+            XCHG
+            MOV A,M
+            .byte 08H
+            PCHL
+            INX H
+            STAX B
+            MOV A,M
+            MVI A,\p1+0CCH
+            MVI A,\p2+0E1H
+            .byte 08H
+            SHLD saved
+            MVI A,\p1+05DH
+            DCX B
+.endmacro
+sTRESSMACRO69 .macro p0, p1, p2, p3
+            MVI A,\p2+01AH
+            SHLD saved
+            STAX B
+            MVI A,\p2+0D8H
+            MVI A,\p1+0B5H
+            MVI A,\p3+001H
+            MVI A,\p2+0EEH
+            MVI A,\p1+07DH
+            MVI A,\p3+044H
+            .byte 0EDH
+            XCHG
+            SHLD saved
+            MVI A,\p1+074H
+            MVI A,\p2+05FH
+            INX H
+            MVI A,\p3+052H
+            MVI A,\p0+054H
+            MVI A,\p2+0BCH
+            MVI A,\p1+0E2H
+            MVI A,\p2+006H
+            MVI A,\p2+014H
+            SHLD saved
+            MVI A,\p3+079H
+            DCX B
+            DCX B
+            MVI A,\p1+070H
+            .byte 08H
+            SHLD saved
+            XCHG
+            .byte 08H
+            MOV A,M
+            PCHL
+            INX H
+            SHLD saved
+            MVI A,\p2+0ECH
+            STAX B
+            INX H
+            MVI A,\p0+068H
+.endmacro
+sTRESSMACRO70 .macro p0, p1, p2
+            MOV A,M
+            .byte 08H
+            .byte 08H
+            .byte 08H
+            .byte 0EDH
+            MVI A,\p1+062H
+            .byte 08H
+            MOV A,M
+            MVI A,\p0+0FEH
+            XCHG
+            MOV A,M
+.endmacro
+sTRESSMACRO71 .macro p0, p1, p2
+            XCHG
+            INX H
+            MVI A,\p2+0EDH
+            MVI A,\p0+0AAH
+            MVI A,\p0+082H
+            DCX B
+            MVI A,\p0+05DH
+            MVI A,\p2+0D0H
+            MVI A,\p1+06AH
+.endmacro
+sTRESSMACRO72 .macro p0, p1, p2
+            PCHL
+            STAX B
+            MVI A,\p1+008H
+            DCX B
+            MVI A,\p0+019H
+            .byte 08H
+            MVI A,\p1+083H
+            .byte 0EDH
+            .byte 0EDH
+            MVI A,\p0+077H
+            INX H
+            MVI A,\p1+0DDH
+            DCX B
+            MVI A,\p1+04FH
+            MOV A,M
+            .byte 08H
+            SHLD saved
+            MVI A,\p2+088H
+            .byte 0EDH
+            .byte 0EDH
+.endmacro
+sTRESSMACRO73 .macro p0
+            MOV A,M
+            MVI A,\p0+02AH
+            MOV A,M
+            MVI A,\p0+066H
+            MVI A,\p0+02EH
+            MVI A,\p0+02FH
+            MVI A,\p0+0A2H
+            MVI A,\p0+049H
+            .byte 038H, 2
+            MVI A,\p0+0A4H
+            MOV A,M
+            SHLD saved
+            STAX B
+            DCX B
+            XCHG
+            MVI A,\p0+0F6H
+            MVI A,\p0+010H
+            .byte 0EDH
+            MVI A,\p0+080H
+            .byte 08H
+            .byte 0EDH
+.endmacro
+sTRESSMACRO74 .macro p0, p1, p2, p3
+            MVI A,\p3+093H
+            MVI A,\p0+08DH
+            DCX B
+            MOV A,M
+            INX H
+            INX H
+            .byte 038H, 2
+            STAX B
+            .byte 038H, 2
+            STAX B
+            .byte 08H
+            MVI A,\p0+055H
+            MVI A,\p1+043H
+            .byte 0EDH
+            MVI A,\p1+06FH
+            MVI A,\p2+008H
+            XCHG
+            MVI A,\p1+09BH
+            MVI A,\p1+0B7H
+            XCHG
+            XCHG
+            STAX B
+            MVI A,\p3+0DEH
+.endmacro
+sTRESSMACRO75 .macro p0
+            MVI A,\p0+023H
+            MVI A,\p0+022H
+            .byte 038H, 2
+            INX H
+            .byte 0EDH
+            PCHL
+            INX H
+            MOV A,M
+            .byte 08H
+            MVI A,\p0+065H
+            INX H
+            MVI A,\p0+0CFH
+            MVI A,\p0+0FAH
+            INX H
+            MVI A,\p0+006H
+            .byte 038H, 2
+            MVI A,\p0+026H
+            MVI A,\p0+02DH
+            XCHG
+            INX H
+            MVI A,\p0+097H
+            SHLD saved
+            MVI A,\p0+018H
+            .byte 08H
+            .byte 0EDH
+            MVI A,\p0+03FH
+            .byte 0EDH
+            XCHG
+            INX H
+            .byte 038H, 2
+            MVI A,\p0+0A9H
+            MVI A,\p0+0DCH
+            MVI A,\p0+092H
+            MVI A,\p0+04BH
+            MVI A,\p0+096H
+            MVI A,\p0+0AAH
+            STAX B
+            XCHG
+            MVI A,\p0+03EH
+.endmacro
+sTRESSMACRO76 .macro p0, p1
+            PCHL
+            .byte 08H
+            .byte 08H
+            MVI A,\p1+069H
+            .byte 08H
+            .byte 08H
+            INX H
+            MVI A,\p0+09AH
+            MVI A,\p1+00DH
+            MVI A,\p0+0DDH
+            STAX B
+            MOV A,M
+            SHLD saved
+            MVI A,\p1+0BAH
+            STAX B
+            DCX B
+            MVI A,\p0+000H
+            MVI A,\p0+0CAH
+            MVI A,\p1+04EH
+            MVI A,\p1+01AH
+            .byte 038H, 2
+            .byte 038H, 2
+            MVI A,\p0+027H
+            XCHG
+            .byte 038H, 2
+            .byte 0EDH
+            MVI A,\p0+048H
+.endmacro
+sTRESSMACRO77 .macro
+            XCHG
+            .byte 0EDH
+            XCHG
+            SHLD saved
+            INX H
+            PCHL
+            MOV A,M
+            MOV A,M
+            XCHG
+            .byte 0EDH
+.endmacro
+sTRESSMACRO78 .macro
+            MOV A,M
+            .byte 08H
+            MOV A,M
+            .byte 08H
+            .byte 038H, 2
+            INX H
+            .byte 038H, 2
+            SHLD saved
+            DCX B
+            .byte 038H, 2
+            XCHG
+            .byte 08H
+            XCHG
+            PCHL
+            XCHG
+            XCHG
+            INX H
+            XCHG
+            .byte 0EDH
+            STAX B
+            PCHL
+            .byte 0EDH
+            DCX B
+            DCX B
+            INX H
+            MOV A,M
+            SHLD saved
+            XCHG
+            DCX B
+            SHLD saved
+            INX H
+.endmacro
+sTRESSMACRO79 .macro p0, p1
+            STAX B
+            MVI A,\p1+006H
+            .byte 038H, 2
+            MOV A,M
+            XCHG
+            .byte 038H, 2
+            MVI A,\p1+09BH
+            MVI A,\p1+05AH
+            STAX B
+            INX H
+            .byte 0EDH
+            MVI A,\p1+0B5H
+            STAX B
+            MVI A,\p1+0D4H
+            .byte 038H, 2
+            MVI A,\p0+022H
+            MVI A,\p0+09FH
+            DCX B
+            STAX B
+            MVI A,\p1+0ECH
+            .byte 0EDH
+            STAX B
+            MVI A,\p1+030H
+            PCHL
+            .byte 08H
+            MVI A,\p1+0C3H
+            MOV A,M
+            .byte 08H
+            MVI A,\p0+0DDH
+            .byte 038H, 2
+            .byte 08H
+            MVI A,\p0+0B7H
+            MVI A,\p1+01DH
+            SHLD saved
+.endmacro
+sTRESSMACRO80 .macro p0
+            DCX B
+            PCHL
+            MVI A,\p0+0B3H
+            XCHG
+            DCX B
+            PCHL
+            .byte 08H
+            MVI A,\p0+016H
+            PCHL
+            MVI A,\p0+0ADH
+            MVI A,\p0+0A3H
+            STAX B
+            MVI A,\p0+06FH
+            INX H
+            INX H
+            MVI A,\p0+09FH
+            .byte 08H
+            MVI A,\p0+0C2H
+.endmacro
+sTRESSMACRO81 .macro p0
+            .byte 038H, 2
+            MVI A,\p0+0A9H
+            .byte 038H, 2
+            SHLD saved
+            XCHG
+            MVI A,\p0+03BH
+            MVI A,\p0+061H
+            MVI A,\p0+0F1H
+            INX H
+            PCHL
+            MVI A,\p0+0C1H
+            INX H
+            MVI A,\p0+095H
+            XCHG
+            MVI A,\p0+08DH
+            MVI A,\p0+00CH
+            MVI A,\p0+0D1H
+            MVI A,\p0+010H
+            .byte 08H
+            INX H
+            PCHL
+            MVI A,\p0+09FH
+            PCHL
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO82 .macro p0, p1, p2, p3
+            XCHG
+            .byte 08H
+            XCHG
+            SHLD saved
+            MVI A,\p3+006H
+            .byte 038H, 2
+            DCX B
+            MVI A,\p2+058H
+            .byte 08H
+            MVI A,\p1+0EBH
+            MVI A,\p3+095H
+            MVI A,\p1+043H
+            PCHL
+            .byte 08H
+            MOV A,M
+            .byte 038H, 2
+            MVI A,\p3+012H
+            MVI A,\p1+088H
+            MVI A,\p1+069H
+            STAX B
+            .byte 08H
+            DCX B
+.endmacro
+sTRESSMACRO83 .macro p0, p1, p2, p3
+            .byte 08H
+            INX H
+            MVI A,\p0+0D0H
+            INX H
+            MVI A,\p3+06CH
+            DCX B
+            MOV A,M
+            .byte 08H
+            SHLD saved
+            INX H
+            STAX B
+            SHLD saved
+            DCX B
+            INX H
+            .byte 0EDH
+            PCHL
+            XCHG
+            PCHL
+            INX H
+            MVI A,\p1+0F5H
+            MVI A,\p1+0A0H
+            MVI A,\p3+01FH
+            XCHG
+            PCHL
+            MVI A,\p0+077H
+            XCHG
+            .byte 08H
+            PCHL
+            PCHL
+            INX H
+            SHLD saved
+.endmacro
+sTRESSMACRO84 .macro p0
+            INX H
+            MVI A,\p0+0BEH
+            MVI A,\p0+05EH
+            MVI A,\p0+052H
+            MVI A,\p0+010H
+            STAX B
+            MOV A,M
+            PCHL
+.endmacro
+sTRESSMACRO85 .macro p0, p1, p2, p3
+            .byte 0EDH
+            PCHL
+            MVI A,\p2+0F3H
+            MVI A,\p2+045H
+            STAX B
+            .byte 038H, 2
+            MVI A,\p0+018H
+            PCHL
+            MVI A,\p2+03AH
+            MVI A,\p3+0ABH
+            XCHG
+            MVI A,\p1+064H
+            MVI A,\p2+085H
+            XCHG
+            MVI A,\p1+0B0H
+            MVI A,\p1+0DCH
+            .byte 038H, 2
+            MVI A,\p1+0A0H
+            PCHL
+            MVI A,\p2+0FAH
+            XCHG
+            SHLD saved
+            PCHL
+            STAX B
+            STAX B
+            XCHG
+            MVI A,\p0+04AH
+            .byte 038H, 2
+            INX H
+            PCHL
+            STAX B
+            DCX B
+            MVI A,\p1+030H
+            MVI A,\p3+02EH
+            MVI A,\p3+042H
+            .byte 08H
+            SHLD saved
+            MVI A,\p2+0A6H
+.endmacro
+sTRESSMACRO86 .macro p0
+            MVI A,\p0+093H
+            MVI A,\p0+017H
+            MVI A,\p0+0FAH
+            .byte 08H
+            MVI A,\p0+094H
+            MVI A,\p0+08BH
+            .byte 038H, 2
+            MVI A,\p0+006H
+            .byte 0EDH
+            STAX B
+            MVI A,\p0+075H
+            MVI A,\p0+051H
+            MVI A,\p0+012H
+            XCHG
+            .byte 0EDH
+            .byte 08H
+            MVI A,\p0+06DH
+            MVI A,\p0+0BCH
+            .byte 038H, 2
+            MVI A,\p0+0E5H
+            XCHG
+            STAX B
+            MVI A,\p0+006H
+            STAX B
+            XCHG
+            MVI A,\p0+0E9H
+            SHLD saved
+            .byte 08H
+            MOV A,M
+            MVI A,\p0+045H
+.endmacro
+sTRESSMACRO87 .macro p0, p1, p2
+            XCHG
+            MVI A,\p2+029H
+            MVI A,\p1+084H
+            MVI A,\p1+0AEH
+            .byte 038H, 2
+            XCHG
+            MVI A,\p1+0DFH
+            MVI A,\p2+0D5H
+            MVI A,\p1+0CCH
+            XCHG
+            .byte 0EDH
+            MOV A,M
+            XCHG
+            SHLD saved
+            DCX B
+            .byte 0EDH
+            SHLD saved
+            INX H
+            MVI A,\p2+077H
+            MVI A,\p1+0FEH
+            DCX B
+            MVI A,\p2+077H
+            STAX B
+            MVI A,\p0+052H
+            SHLD saved
+            MOV A,M
+            DCX B
+            INX H
+            .byte 038H, 2
+            MVI A,\p2+0E7H
+            SHLD saved
+            .byte 038H, 2
+            SHLD saved
+            MVI A,\p1+04CH
+            MVI A,\p1+03CH
+            MVI A,\p0+029H
+            .byte 038H, 2
+            PCHL
+            INX H
+.endmacro
+sTRESSMACRO88 .macro
+            MOV A,M
+            .byte 08H
+            SHLD saved
+            STAX B
+            PCHL
+            STAX B
+            PCHL
+            MOV A,M
+            STAX B
+            DCX B
+            .byte 0EDH
+            XCHG
+            PCHL
+            STAX B
+            SHLD saved
+            .byte 0EDH
+            MOV A,M
+            .byte 08H
+            STAX B
+            DCX B
+            INX H
+            STAX B
+            PCHL
+            STAX B
+            .byte 0EDH
+.endmacro
+sTRESSMACRO89 .macro p0, p1
+            MVI A,\p1+07AH
+            MVI A,\p0+0B1H
+            MVI A,\p0+0C7H
+            DCX B
+            .byte 038H, 2
+            MVI A,\p0+02AH
+            MVI A,\p0+09AH
+            STAX B
+            MVI A,\p1+0AFH
+            SHLD saved
+            DCX B
+            DCX B
+            STAX B
+            MVI A,\p1+0ADH
+            MVI A,\p1+01AH
+            MVI A,\p0+0E2H
+            MVI A,\p1+07EH
+            MOV A,M
+            .byte 0EDH
+            XCHG
+            XCHG
+            MVI A,\p1+0E2H
+            MVI A,\p0+0DEH
+            .byte 038H, 2
+            .byte 08H
+            MVI A,\p0+052H
+            .byte 038H, 2
+            MVI A,\p0+084H
+            SHLD saved
+            STAX B
+.endmacro
+sTRESSMACRO90 .macro p0, p1, p2, p3
+            MVI A,\p3+0A3H
+            SHLD saved
+            DCX B
+            MVI A,\p2+0ACH
+            STAX B
+            MVI A,\p1+056H
+            INX H
+            INX H
+            MVI A,\p3+084H
+            .byte 038H, 2
+            MVI A,\p0+0F4H
+            STAX B
+            .byte 0EDH
+            STAX B
+            MVI A,\p3+0B3H
+            DCX B
+            MVI A,\p1+098H
+            MVI A,\p2+020H
+            DCX B
+            MVI A,\p0+092H
+            MOV A,M
+            MVI A,\p3+03CH
+            STAX B
+            .byte 08H
+            DCX B
+            DCX B
+            MVI A,\p0+0CEH
+            MVI A,\p2+099H
+            PCHL
+            PCHL
+            MVI A,\p2+004H
+.endmacro
+sTRESSMACRO91 .macro p0, p1
+            MVI A,\p0+058H
+            XCHG
+            SHLD saved
+            MVI A,\p0+01BH
+            INX H
+            .byte 0EDH
+            .byte 038H, 2
+            MVI A,\p0+027H
+            MVI A,\p1+026H
+            STAX B
+            MVI A,\p1+054H
+            MOV A,M
+            INX H
+            DCX B
+            XCHG
+            MVI A,\p0+025H
+            .byte 0EDH
+            STAX B
+            INX H
+            MOV A,M
+            MVI A,\p1+038H
+            INX H
+            MVI A,\p0+0F1H
+            MOV A,M
+            MVI A,\p0+06AH
+            .byte 038H, 2
+            DCX B
+            PCHL
+            MVI A,\p0+01BH
+            DCX B
+            SHLD saved
+            .byte 0EDH
+            SHLD saved
+            SHLD saved
+            MVI A,\p1+0E0H
+            INX H
+            INX H
+            MVI A,\p1+0ADH
+            MVI A,\p0+079H
+            MVI A,\p0+03DH
+.endmacro
+sTRESSMACRO92 .macro p0, p1, p2
+            .byte 038H, 2
+            MVI A,\p2+0A9H
+            MVI A,\p2+0F2H
+            MVI A,\p0+04EH
+            .byte 08H
+            MVI A,\p0+030H
+            STAX B
+            MVI A,\p0+09DH
+            MVI A,\p0+0F6H
+            .byte 0EDH
+            PCHL
+            PCHL
+            .byte 0EDH
+            .byte 038H, 2
+            MVI A,\p0+0EDH
+            .byte 0EDH
+            MVI A,\p1+008H
+            INX H
+            MVI A,\p2+0A1H
+            MVI A,\p0+061H
+            MVI A,\p0+06EH
+            MVI A,\p2+038H
+.endmacro
+sTRESSMACRO93 .macro
+            .byte 08H
+            .byte 0EDH
+            .byte 0EDH
+            .byte 08H
+            .byte 08H
+            PCHL
+            INX H
+            .byte 08H
+            XCHG
+            STAX B
+            STAX B
+            SHLD saved
+            PCHL
+            .byte 038H, 2
+            .byte 038H, 2
+            PCHL
+            .byte 0EDH
+            MOV A,M
+            PCHL
+            PCHL
+            .byte 0EDH
+            XCHG
+            STAX B
+            STAX B
+            XCHG
+            XCHG
+            SHLD saved
+            .byte 0EDH
+            STAX B
+.endmacro
+sTRESSMACRO94 .macro p0, p1, p2
+            MVI A,\p1+0D2H
+            PCHL
+            XCHG
+            MVI A,\p2+012H
+            SHLD saved
+            XCHG
+            PCHL
+            XCHG
+            MVI A,\p2+082H
+            MVI A,\p0+02FH
+            MOV A,M
+            MVI A,\p2+074H
+            MVI A,\p1+036H
+.endmacro
+sTRESSMACRO95 .macro
+            .byte 08H
+            .byte 08H
+            INX H
+            XCHG
+            SHLD saved
+            INX H
+            PCHL
+            DCX B
+            STAX B
+            PCHL
+            PCHL
+            MOV A,M
+            .byte 038H, 2
+            MOV A,M
+            .byte 038H, 2
+            INX H
+            .byte 0EDH
+            MOV A,M
+            .byte 038H, 2
+            DCX B
+            PCHL
+            .byte 038H, 2
+            XCHG
+            .byte 08H
+            .byte 0EDH
+            SHLD saved
+            PCHL
+            MOV A,M
+            STAX B
+            INX H
+            .byte 0EDH
+            DCX B
+            INX H
+            MOV A,M
+            .byte 08H
+            .byte 08H
+            PCHL
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO96 .macro p0, p1, p2, p3
+            MOV A,M
+            INX H
+            MVI A,\p2+02BH
+            DCX B
+            MVI A,\p0+0BFH
+            SHLD saved
+            INX H
+            SHLD saved
+            MVI A,\p2+0FFH
+            MVI A,\p1+007H
+            MVI A,\p3+051H
+            .byte 0EDH
+            .byte 08H
+            DCX B
+            MVI A,\p0+027H
+            STAX B
+            MVI A,\p3+054H
+            STAX B
+            .byte 038H, 2
+            MOV A,M
+            XCHG
+            .byte 08H
+            MVI A,\p3+07BH
+            PCHL
+            XCHG
+            MOV A,M
+            DCX B
+            STAX B
+            STAX B
+            MVI A,\p3+01BH
+            MVI A,\p2+080H
+.endmacro
+sTRESSMACRO97 .macro p0
+            DCX B
+            .byte 038H, 2
+            .byte 038H, 2
+            MVI A,\p0+0C1H
+            PCHL
+            MVI A,\p0+084H
+            MVI A,\p0+010H
+            MVI A,\p0+00CH
+            MVI A,\p0+06BH
+            MVI A,\p0+0D2H
+            INX H
+            SHLD saved
+            .byte 0EDH
+            STAX B
+            MVI A,\p0+03FH
+            .byte 0EDH
+            MVI A,\p0+07AH
+            MVI A,\p0+00BH
+            MVI A,\p0+08FH
+            MOV A,M
+            MVI A,\p0+00AH
+            XCHG
+            MVI A,\p0+0A7H
+            SHLD saved
+            STAX B
+            MVI A,\p0+025H
+            MVI A,\p0+0E7H
+            SHLD saved
+            SHLD saved
+.endmacro
+sTRESSMACRO98 .macro
+            INX H
+            XCHG
+            MOV A,M
+            .byte 0EDH
+            .byte 038H, 2
+            PCHL
+            MOV A,M
+            DCX B
+            DCX B
+            .byte 08H
+            MOV A,M
+            STAX B
+            XCHG
+            DCX B
+            SHLD saved
+            SHLD saved
+            .byte 0EDH
+            XCHG
+            PCHL
+.endmacro
+sTRESSMACRO99 .macro p0, p1
+            MVI A,\p1+0BDH
+            .byte 08H
+            .byte 0EDH
+            .byte 038H, 2
+            MVI A,\p1+016H
+            MVI A,\p0+0FFH
+            DCX B
+            .byte 038H, 2
+            MVI A,\p0+02AH
+            MVI A,\p1+0EEH
+            .byte 0EDH
+            INX H
+            XCHG
+.endmacro
+sTRESSMACRO100 .macro p0
+            MVI A,\p0+036H
+            STAX B
+            XCHG
+            PCHL
+            MVI A,\p0+088H
+            XCHG
+            MVI A,\p0+0AFH
+            MVI A,\p0+0A0H
+            MVI A,\p0+05DH
+            MVI A,\p0+0B9H
+            MVI A,\p0+03AH
+            PCHL
+            DCX B
+            MVI A,\p0+075H
+            .byte 08H
+            PCHL
+            SHLD saved
+            STAX B
+            MVI A,\p0+0F6H
+            MVI A,\p0+000H
+            MVI A,\p0+063H
+            MVI A,\p0+0A6H
+            MVI A,\p0+0BFH
+            MVI A,\p0+06AH
+            MVI A,\p0+0C9H
+            MVI A,\p0+04EH
+            MVI A,\p0+023H
+            .byte 0EDH
+            XCHG
+            MOV A,M
+            .byte 0EDH
+            MVI A,\p0+08EH
+            MVI A,\p0+08CH
+            MVI A,\p0+06BH
+            MVI A,\p0+0CDH
+            DCX B
+.endmacro
+sTRESSMACRO101 .macro
+            DCX B
+            .byte 0EDH
+            SHLD saved
+            XCHG
+            INX H
+            INX H
+            INX H
+            STAX B
+            MOV A,M
+            .byte 0EDH
+            XCHG
+.endmacro
+sTRESSMACRO102 .macro p0, p1, p2, p3
+            INX H
+            .byte 038H, 2
+            MVI A,\p1+0E9H
+            STAX B
+            .byte 08H
+            INX H
+            XCHG
+            MVI A,\p3+0AEH
+            MVI A,\p0+021H
+            MVI A,\p3+00CH
+            PCHL
+            STAX B
+            MVI A,\p0+069H
+            MVI A,\p3+000H
+            .byte 0EDH
+            MVI A,\p0+0E7H
+.endmacro
+sTRESSMACRO103 .macro p0, p1, p2
+            MVI A,\p2+070H
+            MVI A,\p2+04BH
+            MOV A,M
+            .byte 0EDH
+            .byte 0EDH
+            MVI A,\p2+030H
+            .byte 08H
+            .byte 038H, 2
+            MVI A,\p1+051H
+            MVI A,\p1+04DH
+            PCHL
+            DCX B
+            MVI A,\p1+0CDH
+            .byte 038H, 2
+            INX H
+            MVI A,\p2+043H
+            MVI A,\p1+013H
+            MVI A,\p0+0BDH
+            XCHG
+            .byte 038H, 2
+            PCHL
+            MVI A,\p2+09DH
+            .byte 038H, 2
+            MVI A,\p2+06EH
+            MVI A,\p1+0F8H
+            MOV A,M
+            STAX B
+            MVI A,\p0+01FH
+            INX H
+            MVI A,\p0+05DH
+            MVI A,\p1+0E1H
+            MVI A,\p1+044H
+            MOV A,M
+            .byte 0EDH
+            MVI A,\p2+067H
+            MOV A,M
+            MOV A,M
+.endmacro
+sTRESSMACRO104 .macro p0, p1
+            MVI A,\p0+0E4H
+            .byte 038H, 2
+            SHLD saved
+            MVI A,\p0+07BH
+            MOV A,M
+            SHLD saved
+            MVI A,\p1+051H
+            SHLD saved
+            .byte 038H, 2
+            MVI A,\p1+003H
+            XCHG
+.endmacro
+sTRESSMACRO105 .macro p0
+            MVI A,\p0+0E8H
+            MOV A,M
+            DCX B
+            .byte 038H, 2
+            MVI A,\p0+05EH
+            .byte 08H
+            MVI A,\p0+09BH
+            MVI A,\p0+024H
+            .byte 038H, 2
+            MVI A,\p0+000H
+            STAX B
+            MOV A,M
+            XCHG
+            STAX B
+            XCHG
+            MVI A,\p0+0D8H
+            MVI A,\p0+057H
+            MVI A,\p0+0FEH
+            MVI A,\p0+0F0H
+            XCHG
+.endmacro
+sTRESSMACRO106 .macro p0, p1, p2
+            MOV A,M
+            MVI A,\p1+0A1H
+            STAX B
+            MVI A,\p2+0EFH
+            MVI A,\p1+062H
+            MVI A,\p1+065H
+            MVI A,\p2+013H
+            DCX B
+            MVI A,\p2+0C2H
+            STAX B
+            MOV A,M
+            .byte 08H
+            DCX B
+            SHLD saved
+            .byte 08H
+            DCX B
+            MVI A,\p2+051H
+            .byte 038H, 2
+            STAX B
+            DCX B
+            PCHL
+            MOV A,M
+            MVI A,\p2+0D4H
+            MVI A,\p1+042H
+            XCHG
+            MVI A,\p1+075H
+            .byte 038H, 2
+            STAX B
+            .byte 08H
+            MVI A,\p2+06BH
+            PCHL
+            MVI A,\p2+0FDH
+            MVI A,\p1+0FAH
+            MVI A,\p0+051H
+            .byte 0EDH
+            MVI A,\p2+0E3H
+.endmacro
+sTRESSMACRO107 .macro p0
+            STAX B
+            XCHG
+            XCHG
+            MVI A,\p0+03AH
+            MVI A,\p0+04CH
+            MVI A,\p0+023H
+            STAX B
+            STAX B
+            SHLD saved
+            MVI A,\p0+049H
+            MVI A,\p0+0F9H
+            PCHL
+            STAX B
+            SHLD saved
+.endmacro
+sTRESSMACRO108 .macro
+            .byte 08H
+            .byte 038H, 2
+            .byte 08H
+            XCHG
+            INX H
+            MOV A,M
+            .byte 038H, 2
+            INX H
+            INX H
+            PCHL
+            STAX B
+            MOV A,M
+            .byte 0EDH
+            MOV A,M
+            PCHL
+            STAX B
+            MOV A,M
+            .byte 038H, 2
+            PCHL
+            STAX B
+            .byte 038H, 2
+            .byte 08H
+            XCHG
+            DCX B
+            STAX B
+            SHLD saved
+            .byte 08H
+            .byte 038H, 2
+            MOV A,M
+.endmacro
+sTRESSMACRO109 .macro
+            .byte 038H, 2
+            STAX B
+            .byte 0EDH
+            SHLD saved
+            DCX B
+            PCHL
+            .byte 0EDH
+            .byte 0EDH
+            PCHL
+            .byte 08H
+            .byte 0EDH
+            XCHG
+            .byte 0EDH
+            XCHG
+            XCHG
+            XCHG
+            STAX B
+            .byte 08H
+            PCHL
+            DCX B
+            INX H
+            .byte 0EDH
+            .byte 08H
+.endmacro
+sTRESSMACRO110 .macro
+            .byte 0EDH
+            STAX B
+            .byte 038H, 2
+            .byte 038H, 2
+            DCX B
+            .byte 08H
+            MOV A,M
+            PCHL
+            .byte 038H, 2
+            XCHG
+            INX H
+            INX H
+            DCX B
+            MOV A,M
+            INX H
+            .byte 038H, 2
+            SHLD saved
+            PCHL
+            .byte 038H, 2
+            XCHG
+            INX H
+            DCX B
+            SHLD saved
+            STAX B
+.endmacro
+sTRESSMACRO111 .macro p0
+            .byte 08H
+            DCX B
+            XCHG
+            DCX B
+            MVI A,\p0+01BH
+            MVI A,\p0+0B8H
+            MVI A,\p0+0FDH
+            PCHL
+            MVI A,\p0+055H
+            STAX B
+            INX H
+            PCHL
+            XCHG
+            .byte 08H
+            .byte 0EDH
+            MVI A,\p0+064H
+            STAX B
+            INX H
+            MVI A,\p0+0E5H
+            MVI A,\p0+077H
+            SHLD saved
+            INX H
+            .byte 08H
+            XCHG
+.endmacro
+sTRESSMACRO112 .macro p0, p1
+            .byte 038H, 2
+            MOV A,M
+            MVI A,\p0+0D0H
+            MVI A,\p1+0FBH
+            .byte 08H
+            .byte 038H, 2
+            MVI A,\p0+001H
+            DCX B
+            PCHL
+            SHLD saved
+            MVI A,\p0+069H
+            INX H
+            MOV A,M
+            INX H
+            .byte 038H, 2
+            .byte 038H, 2
+            INX H
+            STAX B
+            MVI A,\p1+037H
+            .byte 08H
+            MVI A,\p0+083H
+            MVI A,\p0+0B9H
+            .byte 08H
+            MVI A,\p1+084H
+.endmacro
+sTRESSMACRO113 .macro p0, p1, p2, p3
+            .byte 08H
+            MVI A,\p0+0E8H
+            MVI A,\p0+047H
+            SHLD saved
+            MOV A,M
+            MVI A,\p1+072H
+            MVI A,\p3+07AH
+            MVI A,\p1+0C1H
+            .byte 038H, 2
+            .byte 0EDH
+            MVI A,\p2+097H
+            .byte 0EDH
+            MVI A,\p1+02CH
+            MVI A,\p1+035H
+            MVI A,\p1+0DAH
+            .byte 038H, 2
+            DCX B
+            MVI A,\p0+0CEH
+            SHLD saved
+            MOV A,M
+            MVI A,\p2+0A6H
+            DCX B
+            INX H
+            DCX B
+            MVI A,\p1+055H
+            MVI A,\p2+009H
+            PCHL
+            .byte 0EDH
+.endmacro
+sTRESSMACRO114 .macro p0
+            STAX B
+            PCHL
+            PCHL
+            .byte 08H
+            .byte 038H, 2
+            MVI A,\p0+0B1H
+            MVI A,\p0+008H
+            STAX B
+            MVI A,\p0+054H
+            .byte 08H
+            XCHG
+            MVI A,\p0+030H
+            MVI A,\p0+04DH
+            SHLD saved
+            XCHG
+            .byte 0EDH
+            XCHG
+.endmacro
+sTRESSMACRO115 .macro
+            DCX B
+            .byte 038H, 2
+            STAX B
+            STAX B
+            .byte 038H, 2
+            PCHL
+            .byte 08H
+            XCHG
+            MOV A,M
+            .byte 038H, 2
+            .byte 0EDH
+            .byte 038H, 2
+            STAX B
+            MOV A,M
+            XCHG
+            STAX B
+            SHLD saved
+.endmacro
+sTRESSMACRO116 .macro p0, p1, p2
+            MVI A,\p1+077H
+            MVI A,\p0+075H
+            .byte 0EDH
+            .byte 0EDH
+            DCX B
+            MVI A,\p1+024H
+            .byte 08H
+            .byte 08H
+            STAX B
+            MOV A,M
+            MVI A,\p0+0BDH
+            MVI A,\p1+059H
+            MVI A,\p2+03BH
+            DCX B
+            MVI A,\p1+096H
+            PCHL
+            MVI A,\p0+08AH
+            MVI A,\p1+045H
+            MVI A,\p2+0FFH
+            DCX B
+            MVI A,\p1+0DFH
+            MVI A,\p0+07EH
+            MVI A,\p2+067H
+            MOV A,M
+            MVI A,\p2+047H
+            INX H
+            MVI A,\p0+0CDH
+            SHLD saved
+            MOV A,M
+            MVI A,\p1+0B6H
+            MVI A,\p1+0C3H
+            MVI A,\p1+0C8H
+            .byte 08H
+            MVI A,\p1+043H
+            MVI A,\p0+03AH
+.endmacro
+sTRESSMACRO117 .macro p0
+            MVI A,\p0+08DH
+            MVI A,\p0+0F4H
+            .byte 08H
+            PCHL
+            MOV A,M
+            PCHL
+            STAX B
+            MVI A,\p0+080H
+            MVI A,\p0+008H
+            MVI A,\p0+0F7H
+            MOV A,M
+            .byte 038H, 2
+            MVI A,\p0+0B3H
+            .byte 08H
+            MVI A,\p0+08BH
+            MVI A,\p0+0A1H
+            STAX B
+            PCHL
+            MVI A,\p0+0CAH
+            MVI A,\p0+00BH
+            .byte 0EDH
+            MVI A,\p0+015H
+            MVI A,\p0+018H
+            MOV A,M
+            STAX B
+            MVI A,\p0+0EDH
+            .byte 038H, 2
+            XCHG
+            XCHG
+            MVI A,\p0+069H
+            XCHG
+            MVI A,\p0+01DH
+.endmacro
+sTRESSMACRO118 .macro p0, p1
+            SHLD saved
+            DCX B
+            MVI A,\p1+0A5H
+            SHLD saved
+            .byte 08H
+            MVI A,\p0+080H
+            XCHG
+            MVI A,\p1+0D6H
+            STAX B
+            MVI A,\p0+09AH
+            MVI A,\p1+0C1H
+            PCHL
+            MVI A,\p1+06AH
+            INX H
+            MOV A,M
+            MVI A,\p1+0F8H
+            STAX B
+            MVI A,\p1+059H
+            MVI A,\p1+0E9H
+            DCX B
+            SHLD saved
+            DCX B
+            .byte 0EDH
+            MVI A,\p0+051H
+            MVI A,\p1+08EH
+.endmacro
+sTRESSMACRO119 .macro p0, p1
+            XCHG
+            INX H
+            MVI A,\p1+006H
+            MVI A,\p0+0C6H
+            STAX B
+            .byte 08H
+            .byte 0EDH
+            .byte 038H, 2
+            INX H
+            .byte 0EDH
+            .byte 08H
+            PCHL
+            INX H
+            .byte 0EDH
+            MOV A,M
+            .byte 08H
+.endmacro
+sTRESSMACRO120 .macro p0, p1, p2, p3
+            DCX B
+            MVI A,\p1+02FH
+            MOV A,M
+            INX H
+            XCHG
+            STAX B
+            .byte 0EDH
+            STAX B
+            INX H
+            DCX B
+            MVI A,\p2+06BH
+            STAX B
+            .byte 0EDH
+            STAX B
+            MOV A,M
+            MVI A,\p1+050H
+            .byte 0EDH
+            MVI A,\p2+078H
+            MVI A,\p0+02FH
+            XCHG
+            MVI A,\p2+0CAH
+            MVI A,\p1+030H
+            XCHG
+            MVI A,\p3+06DH
+            STAX B
+            MVI A,\p3+072H
+            MVI A,\p0+0F6H
+            MOV A,M
+            MVI A,\p3+06CH
+.endmacro
+sTRESSMACRO121 .macro
+            SHLD saved
+            SHLD saved
+            DCX B
+            .byte 038H, 2
+            PCHL
+            .byte 08H
+            PCHL
+            XCHG
+            SHLD saved
+            .byte 038H, 2
+            DCX B
+            MOV A,M
+            DCX B
+            XCHG
+            DCX B
+.endmacro
+sTRESSMACRO122 .macro p0, p1, p2, p3
+            SHLD saved
+            MVI A,\p0+0EDH
+            XCHG
+            PCHL
+            .byte 0EDH
+            MVI A,\p0+08EH
+            MVI A,\p1+0EAH
+            MVI A,\p2+0D6H
+            SHLD saved
+            MVI A,\p2+077H
+            MVI A,\p2+0EAH
+            MOV A,M
+            MVI A,\p1+0B2H
+            .byte 038H, 2
+            MOV A,M
+            XCHG
+            MVI A,\p2+0F6H
+            STAX B
+            MOV A,M
+            MVI A,\p1+012H
+            .byte 0EDH
+            .byte 0EDH
+            MVI A,\p0+0AAH
+            DCX B
+            .byte 038H, 2
+            .byte 0EDH
+            MVI A,\p0+0A0H
+            XCHG
+.endmacro
+sTRESSMACRO123 .macro
+            XCHG
+            INX H
+            INX H
+            INX H
+            PCHL
+            XCHG
+            XCHG
+            .byte 038H, 2
+            PCHL
+            DCX B
+            .byte 0EDH
+            PCHL
+            MOV A,M
+            MOV A,M
+            STAX B
+            .byte 0EDH
+            XCHG
+            INX H
+            .byte 0EDH
+            MOV A,M
+            STAX B
+            .byte 038H, 2
+            SHLD saved
+.endmacro
+sTRESSMACRO124 .macro p0, p1, p2, p3
+            MVI A,\p0+0F1H
+            SHLD saved
+            MVI A,\p2+03BH
+            .byte 038H, 2
+            MVI A,\p0+0F1H
+            XCHG
+            MVI A,\p3+098H
+            DCX B
+            .byte 038H, 2
+            .byte 0EDH
+            MVI A,\p2+01EH
+            .byte 0EDH
+            MVI A,\p2+0D0H
+            MVI A,\p1+059H
+            MVI A,\p1+0BAH
+            XCHG
+            MVI A,\p3+0DDH
+            MVI A,\p3+006H
+            MVI A,\p2+0F7H
+            XCHG
+            XCHG
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO125 .macro p0
+            .byte 08H
+            SHLD saved
+            MVI A,\p0+09FH
+            MVI A,\p0+007H
+            SHLD saved
+            SHLD saved
+            PCHL
+            STAX B
+            PCHL
+            XCHG
+            .byte 0EDH
+            MVI A,\p0+04BH
+            XCHG
+            MVI A,\p0+051H
+            MVI A,\p0+095H
+            .byte 0EDH
+            MVI A,\p0+003H
+            .byte 038H, 2
+            PCHL
+.endmacro
+sTRESSMACRO126 .macro p0, p1, p2
+            STAX B
+            PCHL
+            MVI A,\p1+06DH
+            PCHL
+            MVI A,\p2+0ECH
+            .byte 08H
+            MVI A,\p0+0E4H
+            MVI A,\p0+02AH
+            MVI A,\p0+0CEH
+            .byte 038H, 2
+            MVI A,\p2+0F1H
+            INX H
+            MVI A,\p2+014H
+            MVI A,\p1+0D0H
+            XCHG
+            MVI A,\p2+04AH
+            PCHL
+            MVI A,\p0+006H
+            MVI A,\p1+0E7H
+            MOV A,M
+            MVI A,\p2+042H
+            MVI A,\p1+076H
+.endmacro
+sTRESSMACRO127 .macro
+            INX H
+            .byte 038H, 2
+            INX H
+            MOV A,M
+            DCX B
+            SHLD saved
+            INX H
+            STAX B
+            MOV A,M
+            .byte 038H, 2
+            DCX B
+            .byte 0EDH
+            .byte 0EDH
+            STAX B
+            .byte 0EDH
+            MOV A,M
+            .byte 038H, 2
+            .byte 0EDH
+            XCHG
+            STAX B
+            .byte 08H
+            .byte 08H
+            PCHL
+            .byte 08H
+            MOV A,M
+            DCX B
+            INX H
+            .byte 038H, 2
+            PCHL
+            STAX B
+            INX H
+            SHLD saved
+            SHLD saved
+            MOV A,M
+            .byte 0EDH
+            .byte 038H, 2
+            STAX B
+            DCX B
+.endmacro
+sTRESSMACRO128 .macro p0, p1, p2, p3
+            .byte 0EDH
+            STAX B
+            STAX B
+            .byte 038H, 2
+            MVI A,\p3+00BH
+            MVI A,\p1+048H
+            XCHG
+            INX H
+            MVI A,\p3+064H
+            STAX B
+            .byte 0EDH
+            SHLD saved
+            .byte 08H
+            MOV A,M
+            .byte 08H
+            MVI A,\p0+0E8H
+            SHLD saved
+            MVI A,\p3+08AH
+            MVI A,\p2+0E1H
+            MOV A,M
+            PCHL
+            SHLD saved
+.endmacro
+sTRESSMACRO129 .macro p0, p1
+            SHLD saved
+            MVI A,\p0+0DDH
+            .byte 038H, 2
+            .byte 038H, 2
+            .byte 08H
+            MVI A,\p1+0F8H
+            .byte 08H
+            MVI A,\p0+06FH
+            MVI A,\p0+0E9H
+            .byte 038H, 2
+            STAX B
+            .byte 038H, 2
+            MVI A,\p0+09DH
+            PCHL
+            DCX B
+            SHLD saved
+            MVI A,\p0+004H
+            .byte 038H, 2
+            INX H
+            .byte 0EDH
+            MVI A,\p0+074H
+            MVI A,\p1+050H
+            INX H
+            XCHG
+            INX H
+            DCX B
+            DCX B
+            SHLD saved
+            PCHL
+            MVI A,\p0+03AH
+            PCHL
+            MVI A,\p1+03CH
+            DCX B
+            .byte 038H, 2
+            INX H
+            MVI A,\p1+024H
+            INX H
+            PCHL
+            SHLD saved
+.endmacro
+sTRESSMACRO130 .macro p0, p1, p2
+            MVI A,\p0+0AEH
+            INX H
+            MVI A,\p1+036H
+            MVI A,\p2+03EH
+            INX H
+            PCHL
+            MVI A,\p2+0D0H
+            MVI A,\p2+0F9H
+            .byte 08H
+            .byte 08H
+            DCX B
+            SHLD saved
+            MVI A,\p1+038H
+            PCHL
+.endmacro
+sTRESSMACRO131 .macro p0, p1, p2
+            SHLD saved
+            MVI A,\p2+053H
+            PCHL
+            INX H
+            XCHG
+            .byte 038H, 2
+            MVI A,\p0+0F6H
+            MVI A,\p1+0E4H
+            PCHL
+            SHLD saved
+            MVI A,\p2+0ADH
+            MOV A,M
+            MOV A,M
+            MVI A,\p0+0C1H
+            MVI A,\p2+094H
+            .byte 038H, 2
+            MVI A,\p1+022H
+            MOV A,M
+            .byte 08H
+            MVI A,\p2+071H
+            MOV A,M
+            SHLD saved
+            .byte 08H
+            MOV A,M
+.endmacro
+sTRESSMACRO132 .macro p0, p1, p2
+            DCX B
+            .byte 0EDH
+            .byte 0EDH
+            PCHL
+            MVI A,\p1+0FFH
+            STAX B
+            MVI A,\p1+039H
+            MVI A,\p2+076H
+            XCHG
+            MVI A,\p0+017H
+            PCHL
+            MVI A,\p2+06AH
+            MVI A,\p1+0E0H
+            INX H
+            MVI A,\p2+0E5H
+            MVI A,\p1+03BH
+            MVI A,\p1+037H
+            MVI A,\p2+049H
+            .byte 038H, 2
+            MVI A,\p1+006H
+            .byte 038H, 2
+            MVI A,\p0+031H
+            DCX B
+            SHLD saved
+            .byte 08H
+            PCHL
+            MOV A,M
+            MVI A,\p0+050H
+            MVI A,\p1+00FH
+.endmacro
+sTRESSMACRO133 .macro p0, p1, p2
+            DCX B
+            .byte 0EDH
+            MVI A,\p0+08FH
+            MVI A,\p0+030H
+            MVI A,\p0+075H
+            .byte 08H
+            MVI A,\p0+059H
+            PCHL
+            .byte 08H
+            MOV A,M
+            MVI A,\p1+01DH
+            MVI A,\p1+039H
+            MVI A,\p2+0F6H
+            SHLD saved
+            INX H
+            MVI A,\p1+0CBH
+            XCHG
+            MVI A,\p1+037H
+            INX H
+            SHLD saved
+            MVI A,\p2+051H
+            XCHG
+            DCX B
+            MOV A,M
+            .byte 038H, 2
+            MVI A,\p0+043H
+            MVI A,\p2+0A2H
+            .byte 0EDH
+            MVI A,\p1+08AH
+            PCHL
+            MOV A,M
+            INX H
+            .byte 0EDH
+            SHLD saved
+            MVI A,\p2+02DH
+            MVI A,\p1+098H
+            INX H
+            MVI A,\p1+034H
+            SHLD saved
+.endmacro
+sTRESSMACRO134 .macro p0, p1
+            INX H
+            MVI A,\p1+009H
+            MVI A,\p1+089H
+            MVI A,\p0+073H
+            XCHG
+            MOV A,M
+            MVI A,\p1+026H
+            .byte 0EDH
+            PCHL
+            SHLD saved
+            DCX B
+            .byte 08H
+            .byte 08H
+            .byte 038H, 2
+            .byte 038H, 2
+            MVI A,\p0+077H
+            DCX B
+            MVI A,\p1+01DH
+            INX H
+            MVI A,\p1+0FDH
+            PCHL
+            MVI A,\p0+04AH
+            XCHG
+            MVI A,\p0+082H
+            INX H
+            MVI A,\p0+0DBH
+            MVI A,\p0+0BFH
+.endmacro
+sTRESSMACRO135 .macro p0, p1, p2, p3
+            SHLD saved
+            MVI A,\p1+079H
+            INX H
+            MVI A,\p0+043H
+            MVI A,\p3+031H
+            STAX B
+            MVI A,\p3+02EH
+            MVI A,\p2+0EFH
+            MVI A,\p3+058H
+            MVI A,\p3+0F3H
+            .byte 0EDH
+            MVI A,\p3+0B1H
+            .byte 0EDH
+            MVI A,\p0+0FEH
+            PCHL
+            INX H
+            MOV A,M
+.endmacro
+sTRESSMACRO136 .macro p0
+            PCHL
+            MVI A,\p0+0C1H
+            INX H
+            .byte 038H, 2
+            MOV A,M
+            MVI A,\p0+0D0H
+            PCHL
+            MVI A,\p0+040H
+            .byte 038H, 2
+            SHLD saved
+            SHLD saved
+            MOV A,M
+            MVI A,\p0+037H
+            .byte 08H
+            MOV A,M
+            MVI A,\p0+02EH
+            .byte 08H
+            MVI A,\p0+0FEH
+            MVI A,\p0+0D8H
+.endmacro
+sTRESSMACRO137 .macro
+            .byte 0EDH
+            INX H
+            SHLD saved
+            SHLD saved
+            XCHG
+            .byte 038H, 2
+            SHLD saved
+            STAX B
+            .byte 038H, 2
+            PCHL
+            MOV A,M
+            SHLD saved
+            PCHL
+            .byte 0EDH
+            SHLD saved
+            .byte 0EDH
+            INX H
+            INX H
+            PCHL
+            PCHL
+.endmacro
+sTRESSMACRO138 .macro p0, p1
+            MVI A,\p1+0E2H
+            MOV A,M
+            MVI A,\p1+076H
+            XCHG
+            INX H
+            MVI A,\p0+041H
+            INX H
+            MVI A,\p1+066H
+            MVI A,\p0+007H
+            MOV A,M
+            MVI A,\p0+0A6H
+            MOV A,M
+            .byte 038H, 2
+            MVI A,\p1+048H
+            MVI A,\p1+098H
+            MVI A,\p0+0DEH
+            DCX B
+            XCHG
+            DCX B
+            MVI A,\p0+052H
+            MVI A,\p0+0FCH
+            MVI A,\p0+03DH
+            PCHL
+            .byte 08H
+            .byte 038H, 2
+            MVI A,\p1+08FH
+            PCHL
+            MVI A,\p0+005H
+            MVI A,\p1+0ADH
+            PCHL
+            SHLD saved
+            MVI A,\p0+0A8H
+.endmacro
+sTRESSMACRO139 .macro p0, p1, p2, p3
+            INX H
+            MOV A,M
+            MOV A,M
+            STAX B
+            MVI A,\p3+08FH
+            MOV A,M
+            INX H
+            MVI A,\p0+05CH
+            MVI A,\p1+035H
+            DCX B
+.endmacro
+sTRESSMACRO140 .macro p0, p1, p2, p3
+            MVI A,\p0+0ECH
+            PCHL
+            DCX B
+            MVI A,\p2+0C4H
+            MVI A,\p3+0A1H
+            PCHL
+            .byte 038H, 2
+            MVI A,\p3+045H
+            MOV A,M
+.endmacro
+sTRESSMACRO141 .macro p0, p1, p2
+            PCHL
+            MOV A,M
+            MVI A,\p1+0B9H
+            MOV A,M
+            DCX B
+            MVI A,\p1+0DBH
+            MVI A,\p2+033H
+            .byte 038H, 2
+            SHLD saved
+            MVI A,\p2+0EFH
+            MOV A,M
+            MVI A,\p0+069H
+            MOV A,M
+            .byte 038H, 2
+            .byte 0EDH
+            MVI A,\p0+08BH
+            MVI A,\p1+0CBH
+            MOV A,M
+            MVI A,\p2+0AFH
+            .byte 038H, 2
+            .byte 08H
+            MVI A,\p1+0E3H
+            DCX B
+            MVI A,\p0+01EH
+            PCHL
+            MVI A,\p2+060H
+            MOV A,M
+            MVI A,\p2+0EBH
+            INX H
+            .byte 0EDH
+            MVI A,\p0+0BEH
+            SHLD saved
+            MVI A,\p2+018H
+            MVI A,\p2+0F1H
+.endmacro
+sTRESSMACRO142 .macro p0, p1
+            MVI A,\p1+01AH
+            XCHG
+            MVI A,\p1+0F7H
+            MVI A,\p0+034H
+            DCX B
+            .byte 08H
+            MOV A,M
+            .byte 08H
+            MVI A,\p1+0E4H
+            MOV A,M
+            MVI A,\p0+092H
+            MVI A,\p0+002H
+            PCHL
+            XCHG
+            .byte 038H, 2
+            INX H
+            MVI A,\p0+02AH
+            MOV A,M
+            MVI A,\p1+065H
+            SHLD saved
+            STAX B
+            PCHL
+            MVI A,\p0+07AH
+            STAX B
+            MVI A,\p1+086H
+            INX H
+            MVI A,\p1+060H
+            MVI A,\p1+0C5H
+            .byte 0EDH
+            MOV A,M
+            INX H
+            DCX B
+            XCHG
+            MVI A,\p1+0E1H
+            MVI A,\p1+01EH
+            SHLD saved
+.endmacro
+sTRESSMACRO143 .macro p0, p1, p2, p3
+            MVI A,\p3+016H
+            MVI A,\p1+02EH
+            .byte 038H, 2
+            MVI A,\p1+0FBH
+            MVI A,\p1+0E6H
+            INX H
+            PCHL
+            PCHL
+            MVI A,\p1+02BH
+            MVI A,\p1+07BH
+            SHLD saved
+            MOV A,M
+            XCHG
+            .byte 0EDH
+            MVI A,\p0+099H
+            SHLD saved
+            MVI A,\p1+06AH
+            MVI A,\p1+028H
+            MVI A,\p1+057H
+            .byte 038H, 2
+            PCHL
+            XCHG
+            SHLD saved
+.endmacro
+sTRESSMACRO144 .macro p0, p1
+            MVI A,\p0+0C9H
+            INX H
+            MVI A,\p0+041H
+            .byte 0EDH
+            MVI A,\p0+032H
+            MVI A,\p1+0E1H
+            DCX B
+            MVI A,\p0+0B2H
+            MVI A,\p1+089H
+            .byte 038H, 2
+            .byte 0EDH
+            .byte 08H
+            PCHL
+            XCHG
+            .byte 0EDH
+            .byte 08H
+            PCHL
+            .byte 0EDH
+            INX H
+            PCHL
+            MVI A,\p1+0F8H
+.endmacro
+sTRESSMACRO145 .macro p0, p1
+            .byte 08H
+            .byte 038H, 2
+            SHLD saved
+            PCHL
+            MOV A,M
+            .byte 08H
+            MOV A,M
+            .byte 038H, 2
+            .byte 038H, 2
+            MVI A,\p0+0EAH
+            MVI A,\p1+0F6H
+            MVI A,\p1+0F8H
+.endmacro
+sTRESSMACRO146 .macro p0
+            SHLD saved
+            XCHG
+            MVI A,\p0+0F7H
+            MVI A,\p0+00EH
+            DCX B
+            MVI A,\p0+051H
+            STAX B
+            MVI A,\p0+0C5H
+.endmacro
+sTRESSMACRO147 .macro p0
+            PCHL
+            PCHL
+            STAX B
+            STAX B
+            SHLD saved
+            STAX B
+            .byte 038H, 2
+            MOV A,M
+            MVI A,\p0+0EFH
+            .byte 08H
+            .byte 0EDH
+            STAX B
+            MVI A,\p0+0CAH
+            PCHL
+            MVI A,\p0+03DH
+            MVI A,\p0+033H
+            MVI A,\p0+03DH
+            STAX B
+            MVI A,\p0+0C7H
+            MVI A,\p0+02BH
+            MVI A,\p0+02DH
+            SHLD saved
+.endmacro
+sTRESSMACRO148 .macro p0
+            SHLD saved
+            PCHL
+            .byte 0EDH
+            MVI A,\p0+097H
+            .byte 0EDH
+            MVI A,\p0+056H
+            MVI A,\p0+0EAH
+            STAX B
+            INX H
+            .byte 0EDH
+            MVI A,\p0+01CH
+            MVI A,\p0+099H
+            MVI A,\p0+0C4H
+            SHLD saved
+            MVI A,\p0+060H
+            INX H
+            PCHL
+            STAX B
+            .byte 08H
+            DCX B
+            INX H
+            .byte 08H
+            .byte 038H, 2
+            MVI A,\p0+0E4H
+            .byte 038H, 2
+            .byte 08H
+            MVI A,\p0+08CH
+            DCX B
+            XCHG
+.endmacro
+sTRESSMACRO149 .macro p0, p1
+            .byte 0EDH
+            SHLD saved
+            MVI A,\p1+0B4H
+            PCHL
+            MVI A,\p0+08BH
+            INX H
+            MVI A,\p0+03EH
+            DCX B
+            MVI A,\p1+0ACH
+            .byte 08H
+            MVI A,\p0+0CBH
+            SHLD saved
+            INX H
+            MVI A,\p1+07AH
+            INX H
+            MVI A,\p0+039H
+            MVI A,\p0+0E0H
+.endmacro
+sTRESSMACRO150 .macro
+            DCX B
+            INX H
+            .byte 0EDH
+            .byte 038H, 2
+            XCHG
+            DCX B
+            .byte 0EDH
+            .byte 038H, 2
+            DCX B
+            INX H
+            PCHL
+            .byte 038H, 2
+            SHLD saved
+            .byte 0EDH
+            PCHL
+            .byte 038H, 2
+            STAX B
+            INX H
+            .byte 08H
+            INX H
+            SHLD saved
+            .byte 0EDH
+            SHLD saved
+            STAX B
+.endmacro
+sTRESSMACRO151 .macro p0, p1, p2
+            MVI A,\p1+0C0H
+            SHLD saved
+            .byte 038H, 2
+            MOV A,M
+            MVI A,\p2+0FEH
+            MVI A,\p0+099H
+            MVI A,\p0+035H
+            INX H
+            DCX B
+            XCHG
+            XCHG
+            DCX B
+            MVI A,\p0+0DCH
+            MVI A,\p2+004H
+            .byte 08H
+            MVI A,\p1+0D8H
+            MOV A,M
+            MOV A,M
+            DCX B
+            XCHG
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO152 .macro p0, p1, p2
+            SHLD saved
+            STAX B
+            PCHL
+            MVI A,\p0+095H
+            MVI A,\p1+03FH
+            MVI A,\p0+05CH
+            STAX B
+            .byte 038H, 2
+            MVI A,\p0+0A5H
+            XCHG
+            MVI A,\p0+06DH
+            STAX B
+            MOV A,M
+            .byte 038H, 2
+            MVI A,\p1+027H
+            .byte 08H
+            PCHL
+            MVI A,\p0+0DCH
+            MOV A,M
+            MVI A,\p0+009H
+            XCHG
+            MVI A,\p1+02EH
+            DCX B
+            MVI A,\p1+03EH
+            MVI A,\p1+03AH
+.endmacro
+sTRESSMACRO153 .macro p0
+            .byte 038H, 2
+            .byte 038H, 2
+            MVI A,\p0+0A2H
+            MVI A,\p0+0F6H
+            SHLD saved
+            MVI A,\p0+0E8H
+            MVI A,\p0+02CH
+            MVI A,\p0+00CH
+            SHLD saved
+            MVI A,\p0+0DAH
+            .byte 038H, 2
+            DCX B
+            PCHL
+            MVI A,\p0+0D4H
+            .byte 0EDH
+            .byte 038H, 2
+            .byte 08H
+            MVI A,\p0+0DAH
+            INX H
+            MVI A,\p0+032H
+            MVI A,\p0+065H
+            INX H
+            MOV A,M
+            MVI A,\p0+0E0H
+            .byte 038H, 2
+            MVI A,\p0+0A8H
+            .byte 0EDH
+            DCX B
+            .byte 038H, 2
+            .byte 08H
+.endmacro
+sTRESSMACRO154 .macro p0, p1, p2
+            .byte 08H
+            INX H
+            XCHG
+            .byte 038H, 2
+            XCHG
+            MVI A,\p0+062H
+            MVI A,\p2+04CH
+            .byte 038H, 2
+            XCHG
+            XCHG
+            MVI A,\p2+074H
+            XCHG
+            STAX B
+            MVI A,\p2+001H
+            MOV A,M
+            MVI A,\p2+090H
+            MVI A,\p2+032H
+.endmacro
+sTRESSMACRO155 .macro p0, p1
+            DCX B
+            .byte 08H
+            XCHG
+            .byte 08H
+            .byte 0EDH
+            STAX B
+            .byte 038H, 2
+            SHLD saved
+            MVI A,\p1+024H
+            MVI A,\p1+079H
+            INX H
+.endmacro
+sTRESSMACRO156 .macro p0
+            MVI A,\p0+09AH
+            MVI A,\p0+094H
+            MVI A,\p0+0C3H
+            MVI A,\p0+0EFH
+            DCX B
+            MVI A,\p0+002H
+            MVI A,\p0+032H
+            .byte 038H, 2
+            .byte 0EDH
+            DCX B
+            XCHG
+            STAX B
+            DCX B
+            .byte 0EDH
+            XCHG
+            XCHG
+            XCHG
+            MVI A,\p0+031H
+            MVI A,\p0+02DH
+            PCHL
+            XCHG
+            DCX B
+            DCX B
+            MVI A,\p0+038H
+            MVI A,\p0+097H
+            SHLD saved
+            MOV A,M
+            XCHG
+            .byte 038H, 2
+            SHLD saved
+            MVI A,\p0+099H
+            .byte 038H, 2
+            MVI A,\p0+034H
+            MOV A,M
+            MVI A,\p0+093H
+            INX H
+            .byte 0EDH
+            XCHG
+.endmacro
+sTRESSMACRO157 .macro
+            INX H
+            MOV A,M
+            PCHL
+            PCHL
+            STAX B
+            PCHL
+            XCHG
+            .byte 038H, 2
+            MOV A,M
+            .byte 08H
+            .byte 0EDH
+            SHLD saved
+            XCHG
+            SHLD saved
+.endmacro
+sTRESSMACRO158 .macro p0
+            .byte 038H, 2
+            MVI A,\p0+033H
+            MVI A,\p0+038H
+            SHLD saved
+            XCHG
+            SHLD saved
+            STAX B
+            INX H
+            MVI A,\p0+06EH
+            MVI A,\p0+01AH
+            .byte 038H, 2
+            SHLD saved
+            MVI A,\p0+041H
+            .byte 08H
+            DCX B
+            INX H
+            MVI A,\p0+04AH
+            MVI A,\p0+083H
+            INX H
+            .byte 038H, 2
+            MOV A,M
+            PCHL
+            MVI A,\p0+0A4H
+            MVI A,\p0+06AH
+            MVI A,\p0+041H
+            MVI A,\p0+0E7H
+            PCHL
+            MVI A,\p0+0FBH
+            .byte 038H, 2
+            .byte 0EDH
+            SHLD saved
+            MVI A,\p0+0E2H
+            .byte 038H, 2
+            .byte 0EDH
+            .byte 0EDH
+            MVI A,\p0+065H
+.endmacro
+sTRESSMACRO159 .macro p0
+            MVI A,\p0+062H
+            STAX B
+            XCHG
+            MVI A,\p0+0B4H
+            MVI A,\p0+0E2H
+            STAX B
+            .byte 038H, 2
+            MVI A,\p0+0F9H
+            .byte 038H, 2
+            XCHG
+            MVI A,\p0+00FH
+            XCHG
+            MVI A,\p0+02EH
+            .byte 08H
+            .byte 038H, 2
+            STAX B
+            SHLD saved
+            MVI A,\p0+014H
+            MVI A,\p0+020H
+            XCHG
+            XCHG
+            MVI A,\p0+087H
+            .byte 08H
+            MVI A,\p0+0A1H
+            MVI A,\p0+008H
+            MVI A,\p0+0C0H
+            MOV A,M
+            STAX B
+            MVI A,\p0+0C2H
+            INX H
+            INX H
+            MVI A,\p0+0C7H
+            PCHL
+            STAX B
+.endmacro
+sTRESSMACRO160 .macro p0
+            MVI A,\p0+08BH
+            .byte 08H
+            SHLD saved
+            MVI A,\p0+042H
+            MVI A,\p0+0EEH
+            MVI A,\p0+0CEH
+            DCX B
+            MVI A,\p0+022H
+            MVI A,\p0+039H
+            .byte 038H, 2
+            STAX B
+            MVI A,\p0+09CH
+            MVI A,\p0+0EEH
+            XCHG
+            MVI A,\p0+0DDH
+            MVI A,\p0+0CCH
+            MVI A,\p0+01CH
+            MVI A,\p0+03AH
+            MVI A,\p0+0D5H
+            STAX B
+            DCX B
+.endmacro
+sTRESSMACRO161 .macro p0
+            MVI A,\p0+03CH
+            MVI A,\p0+0B6H
+            MVI A,\p0+055H
+            MVI A,\p0+016H
+            MVI A,\p0+04FH
+            INX H
+            XCHG
+            INX H
+            .byte 08H
+            XCHG
+            XCHG
+            .byte 038H, 2
+            MVI A,\p0+0FAH
+            MOV A,M
+            .byte 0EDH
+.endmacro
+sTRESSMACRO162 .macro p0
+            MVI A,\p0+072H
+            MOV A,M
+            MVI A,\p0+069H
+            MVI A,\p0+095H
+            MVI A,\p0+0EEH
+            .byte 08H
+            STAX B
+            XCHG
+            MVI A,\p0+05CH
+            XCHG
+            .byte 038H, 2
+            MOV A,M
+            MVI A,\p0+08CH
+            MVI A,\p0+07CH
+            MVI A,\p0+05CH
+            STAX B
+            DCX B
+            .byte 038H, 2
+            SHLD saved
+            .byte 08H
+            XCHG
+            MVI A,\p0+078H
+            .byte 0EDH
+            MVI A,\p0+092H
+            MVI A,\p0+0B9H
+            INX H
+            MVI A,\p0+07EH
+.endmacro
+sTRESSMACRO163 .macro
+            STAX B
+            .byte 038H, 2
+            XCHG
+            PCHL
+            INX H
+            XCHG
+            SHLD saved
+            XCHG
+            MOV A,M
+            .byte 08H
+            SHLD saved
+            INX H
+            PCHL
+            PCHL
+            DCX B
+            MOV A,M
+            STAX B
+            .byte 038H, 2
+            MOV A,M
+            .byte 0EDH
+            XCHG
+            STAX B
+            INX H
+            DCX B
+            SHLD saved
+            .byte 0EDH
+            .byte 08H
+            MOV A,M
+.endmacro
+sTRESSMACRO164 .macro p0
+            MVI A,\p0+0E0H
+            PCHL
+            MVI A,\p0+05AH
+            PCHL
+            .byte 038H, 2
+            MVI A,\p0+027H
+            MVI A,\p0+09FH
+            XCHG
+            PCHL
+.endmacro
+sTRESSMACRO165 .macro p0, p1, p2
+            MVI A,\p0+007H
+            .byte 0EDH
+            MVI A,\p0+0DCH
+            MOV A,M
+            STAX B
+            MVI A,\p1+04FH
+            MVI A,\p2+046H
+            .byte 08H
+            MOV A,M
+            MVI A,\p1+008H
+            MVI A,\p2+0EBH
+            INX H
+            XCHG
+            .byte 038H, 2
+            PCHL
+            MVI A,\p0+091H
+            .byte 038H, 2
+            MVI A,\p2+053H
+            MVI A,\p2+07DH
+            MVI A,\p1+015H
+            MVI A,\p1+0ABH
+            INX H
+            STAX B
+            MVI A,\p0+048H
+.endmacro
+sTRESSMACRO166 .macro
+            .byte 0EDH
+            .byte 0EDH
+            .byte 08H
+            PCHL
+            .byte 038H, 2
+            SHLD saved
+            SHLD saved
+            .byte 0EDH
+            MOV A,M
+            .byte 08H
+            .byte 0EDH
+            DCX B
+            STAX B
+            SHLD saved
+            MOV A,M
+            DCX B
+            .byte 0EDH
+            .byte 038H, 2
+            .byte 038H, 2
+            SHLD saved
+            .byte 038H, 2
+            MOV A,M
+            INX H
+            MOV A,M
+            DCX B
+            MOV A,M
+            .byte 08H
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO167 .macro p0, p1
+            MVI A,\p0+093H
+            .byte 08H
+            MVI A,\p1+0A2H
+            MVI A,\p0+07AH
+            STAX B
+            PCHL
+            XCHG
+            MVI A,\p0+0CDH
+            .byte 08H
+            MVI A,\p1+0B3H
+            MOV A,M
+.endmacro
+sTRESSMACRO168 .macro p0
+            MVI A,\p0+086H
+            STAX B
+            .byte 038H, 2
+            STAX B
+            .byte 038H, 2
+            MVI A,\p0+0B7H
+            MVI A,\p0+0BCH
+            DCX B
+            .byte 08H
+            INX H
+.endmacro
+sTRESSMACRO169 .macro p0, p1, p2
+            DCX B
+            DCX B
+            DCX B
+            MVI A,\p2+076H
+            MVI A,\p2+0A3H
+            MVI A,\p1+0C7H
+            MVI A,\p2+004H
+            STAX B
+            DCX B
+.endmacro
+sTRESSMACRO170 .macro p0, p1, p2, p3
+            .byte 038H, 2
+            .byte 08H
+            .byte 08H
+            .byte 038H, 2
+            PCHL
+            MVI A,\p0+049H
+            MVI A,\p1+053H
+            MVI A,\p1+0F1H
+            MOV A,M
+            MVI A,\p3+0C1H
+            .byte 08H
+            STAX B
+            INX H
+            MVI A,\p0+0DFH
+            .byte 0EDH
+            MVI A,\p3+082H
+            XCHG
+            MVI A,\p3+092H
+            MVI A,\p3+0D7H
+            MVI A,\p0+057H
+            MVI A,\p3+0FFH
+            MVI A,\p2+06CH
+            INX H
+            MVI A,\p3+06DH
+            SHLD saved
+            PCHL
+            .byte 038H, 2
+            .byte 038H, 2
+            XCHG
+            MVI A,\p0+016H
+            INX H
+            MVI A,\p1+058H
+            .byte 0EDH
+            STAX B
+            INX H
+            PCHL
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO171 .macro p0, p1
+            SHLD saved
+            MVI A,\p1+0CEH
+            XCHG
+            .byte 0EDH
+            SHLD saved
+            MVI A,\p1+0F6H
+            MVI A,\p0+078H
+            MVI A,\p1+09CH
+            PCHL
+            MVI A,\p0+016H
+            PCHL
+            MVI A,\p1+033H
+            .byte 038H, 2
+            XCHG
+            STAX B
+            MVI A,\p0+075H
+            MVI A,\p1+070H
+            STAX B
+            SHLD saved
+            MVI A,\p1+00FH
+            .byte 0EDH
+            PCHL
+            MOV A,M
+            XCHG
+            MVI A,\p1+059H
+            MVI A,\p1+0DAH
+            MVI A,\p0+019H
+            PCHL
+            XCHG
+            MVI A,\p1+0E3H
+            XCHG
+            MVI A,\p1+05CH
+            PCHL
+            MVI A,\p0+000H
+            INX H
+.endmacro
+sTRESSMACRO172 .macro p0, p1, p2
+            MVI A,\p0+034H
+            MVI A,\p2+073H
+            MVI A,\p1+07BH
+            .byte 0EDH
+            MVI A,\p1+099H
+            MVI A,\p0+046H
+            MVI A,\p0+0CBH
+            MVI A,\p1+0E9H
+            MVI A,\p0+088H
+            XCHG
+            MOV A,M
+            .byte 038H, 2
+            MVI A,\p0+015H
+            MVI A,\p2+05AH
+.endmacro
+sTRESSMACRO173 .macro p0, p1, p2, p3
+            .byte 08H
+            DCX B
+            MVI A,\p2+010H
+            STAX B
+            SHLD saved
+            DCX B
+            MVI A,\p1+0F0H
+            MVI A,\p1+01FH
+            .byte 08H
+            MVI A,\p1+0F3H
+            .byte 0EDH
+            .byte 038H, 2
+            XCHG
+            MVI A,\p1+04AH
+            MVI A,\p0+032H
+            .byte 038H, 2
+            XCHG
+            XCHG
+            SHLD saved
+            DCX B
+            MVI A,\p2+002H
+            INX H
+            MVI A,\p1+059H
+            DCX B
+            SHLD saved
+            MVI A,\p3+0A0H
+            MVI A,\p3+0C3H
+            MVI A,\p0+054H
+            MVI A,\p2+020H
+            .byte 0EDH
+            DCX B
+            SHLD saved
+            MOV A,M
+.endmacro
+sTRESSMACRO174 .macro p0, p1
+            MOV A,M
+            MVI A,\p1+046H
+            MVI A,\p0+002H
+            PCHL
+            MVI A,\p1+05EH
+            INX H
+            MVI A,\p1+03CH
+            MVI A,\p1+02DH
+            .byte 038H, 2
+            MOV A,M
+            MOV A,M
+            MVI A,\p1+016H
+            STAX B
+            MVI A,\p0+034H
+            MOV A,M
+            .byte 0EDH
+.endmacro
+sTRESSMACRO175 .macro p0
+            .byte 08H
+            .byte 038H, 2
+            MVI A,\p0+014H
+            DCX B
+            MOV A,M
+            MVI A,\p0+080H
+            PCHL
+            MVI A,\p0+041H
+            STAX B
+            MVI A,\p0+0B0H
+            MVI A,\p0+020H
+            .byte 038H, 2
+            MVI A,\p0+0A3H
+            MVI A,\p0+07DH
+            .byte 038H, 2
+            MVI A,\p0+0FEH
+            MVI A,\p0+087H
+            .byte 08H
+            .byte 08H
+            MVI A,\p0+028H
+            DCX B
+            MOV A,M
+            MVI A,\p0+06BH
+            MVI A,\p0+0CDH
+            MVI A,\p0+076H
+            XCHG
+            MVI A,\p0+067H
+            MVI A,\p0+00DH
+            .byte 08H
+            MVI A,\p0+035H
+            MVI A,\p0+078H
+            MVI A,\p0+0FCH
+            .byte 0EDH
+            STAX B
+            PCHL
+            MVI A,\p0+027H
+            SHLD saved
+            MVI A,\p0+07DH
+            DCX B
+            STAX B
+.endmacro
+sTRESSMACRO176 .macro p0, p1, p2, p3
+            SHLD saved
+            DCX B
+            MOV A,M
+            MVI A,\p2+0D7H
+            MVI A,\p1+0BFH
+            SHLD saved
+            .byte 08H
+            INX H
+            STAX B
+            MVI A,\p2+0C7H
+            MOV A,M
+            PCHL
+            MOV A,M
+            .byte 08H
+            MVI A,\p2+042H
+            STAX B
+            .byte 0EDH
+            MVI A,\p3+088H
+            STAX B
+            .byte 08H
+            .byte 0EDH
+            XCHG
+            MVI A,\p3+0A7H
+            .byte 0EDH
+            SHLD saved
+            MVI A,\p0+0AAH
+            .byte 0EDH
+            .byte 08H
+            DCX B
+            SHLD saved
+            STAX B
+            SHLD saved
+            MVI A,\p3+07FH
+            MVI A,\p1+0FFH
+            XCHG
+            .byte 038H, 2
+            SHLD saved
+            XCHG
+            MVI A,\p2+0E2H
+.endmacro
+sTRESSMACRO177 .macro
+            SHLD saved
+            XCHG
+            SHLD saved
+            MOV A,M
+            DCX B
+            .byte 08H
+            MOV A,M
+            STAX B
+            SHLD saved
+            .byte 038H, 2
+            MOV A,M
+            .byte 08H
+            PCHL
+            DCX B
+            XCHG
+            STAX B
+            XCHG
+            XCHG
+            XCHG
+            PCHL
+            .byte 038H, 2
+            MOV A,M
+            XCHG
+            .byte 08H
+            PCHL
+            XCHG
+            INX H
+.endmacro
+sTRESSMACRO178 .macro
+            .byte 038H, 2
+            .byte 0EDH
+            STAX B
+            MOV A,M
+            SHLD saved
+            SHLD saved
+            SHLD saved
+            STAX B
+            DCX B
+            .byte 08H
+            XCHG
+            .byte 08H
+            SHLD saved
+            SHLD saved
+            XCHG
+            .byte 038H, 2
+            INX H
+            .byte 0EDH
+            .byte 038H, 2
+            .byte 0EDH
+            MOV A,M
+            XCHG
+            XCHG
+            MOV A,M
+            .byte 038H, 2
+            DCX B
+            DCX B
+            SHLD saved
+            MOV A,M
+.endmacro
+sTRESSMACRO179 .macro
+            PCHL
+            PCHL
+            .byte 038H, 2
+            MOV A,M
+            .byte 038H, 2
+            MOV A,M
+            DCX B
+            .byte 038H, 2
+            SHLD saved
+            STAX B
+            STAX B
+            .byte 08H
+            .byte 038H, 2
+            .byte 038H, 2
+            SHLD saved
+            PCHL
+            .byte 0EDH
+            PCHL
+            .byte 08H
+            SHLD saved
+            .byte 038H, 2
+            .byte 0EDH
+            MOV A,M
+            .byte 0EDH
+            DCX B
+            .byte 0EDH
+            .byte 08H
+            DCX B
+            DCX B
+            .byte 0EDH
+            .byte 038H, 2
+            DCX B
+            SHLD saved
+            PCHL
+            MOV A,M
+            DCX B
+            .byte 038H, 2
+            INX H
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO180 .macro p0, p1, p2
+            INX H
+            MVI A,\p0+012H
+            .byte 08H
+            XCHG
+            INX H
+            PCHL
+            MVI A,\p2+000H
+            MVI A,\p0+05CH
+            PCHL
+            DCX B
+            XCHG
+            .byte 0EDH
+            MVI A,\p2+03CH
+            XCHG
+            MVI A,\p0+051H
+            MOV A,M
+            DCX B
+            INX H
+            SHLD saved
+            MVI A,\p2+01CH
+            INX H
+            STAX B
+            XCHG
+            MVI A,\p1+090H
+            MVI A,\p2+032H
+            .byte 0EDH
+            INX H
+            MVI A,\p2+036H
+            .byte 08H
+            INX H
+            MVI A,\p0+07DH
+.endmacro
+sTRESSMACRO181 .macro p0
+            XCHG
+            PCHL
+            MVI A,\p0+0D2H
+            .byte 0EDH
+            MVI A,\p0+074H
+            MVI A,\p0+0C1H
+            SHLD saved
+            STAX B
+            MVI A,\p0+0F6H
+            MVI A,\p0+087H
+            MVI A,\p0+0EDH
+            MVI A,\p0+0EEH
+            PCHL
+            MVI A,\p0+0F9H
+            INX H
+            MVI A,\p0+09AH
+            .byte 038H, 2
+            MVI A,\p0+010H
+            PCHL
+            MVI A,\p0+092H
+            MOV A,M
+            MVI A,\p0+0E7H
+            PCHL
+            MVI A,\p0+04BH
+            MVI A,\p0+045H
+            MVI A,\p0+0E3H
+            STAX B
+            .byte 038H, 2
+            MVI A,\p0+043H
+            MOV A,M
+            XCHG
+.endmacro
+sTRESSMACRO182 .macro p0
+            SHLD saved
+            XCHG
+            SHLD saved
+            MVI A,\p0+0ADH
+            DCX B
+            PCHL
+            SHLD saved
+            INX H
+            MOV A,M
+            STAX B
+            MVI A,\p0+0D1H
+            XCHG
+            .byte 0EDH
+.endmacro
+sTRESSMACRO183 .macro p0
+            MVI A,\p0+007H
+            MVI A,\p0+0A8H
+            SHLD saved
+            .byte 038H, 2
+            .byte 038H, 2
+            MVI A,\p0+036H
+            STAX B
+            MVI A,\p0+028H
+            .byte 0EDH
+            MVI A,\p0+09CH
+            .byte 08H
+            MVI A,\p0+0F1H
+            MVI A,\p0+076H
+            DCX B
+            MVI A,\p0+04AH
+            INX H
+            .byte 038H, 2
+            STAX B
+            MVI A,\p0+04EH
+            DCX B
+            .byte 038H, 2
+            MVI A,\p0+082H
+            STAX B
+            MVI A,\p0+06AH
+            MVI A,\p0+003H
+            MVI A,\p0+0F4H
+            XCHG
+            MVI A,\p0+0F3H
+            .byte 038H, 2
+            INX H
+            MVI A,\p0+01DH
+            DCX B
+            .byte 08H
+            MVI A,\p0+0B8H
+.endmacro
+sTRESSMACRO184 .macro
+            .byte 038H, 2
+            STAX B
+            XCHG
+            XCHG
+            INX H
+            SHLD saved
+            MOV A,M
+            DCX B
+            .byte 0EDH
+            XCHG
+            PCHL
+            SHLD saved
+            INX H
+            SHLD saved
+            .byte 038H, 2
+            PCHL
+            .byte 038H, 2
+            XCHG
+            DCX B
+            MOV A,M
+            .byte 08H
+            MOV A,M
+            XCHG
+            PCHL
+            .byte 08H
+            .byte 0EDH
+            INX H
+            XCHG
+            INX H
+.endmacro
+sTRESSMACRO185 .macro p0
+            DCX B
+            INX H
+            MVI A,\p0+0F4H
+            DCX B
+            INX H
+            DCX B
+            MVI A,\p0+00DH
+            PCHL
+            PCHL
+            MVI A,\p0+024H
+            PCHL
+            MVI A,\p0+0C0H
+            SHLD saved
+            .byte 0EDH
+            MOV A,M
+            MVI A,\p0+0B5H
+            MVI A,\p0+02AH
+            .byte 0EDH
+            .byte 08H
+            MVI A,\p0+052H
+            XCHG
+            MVI A,\p0+031H
+            MVI A,\p0+05DH
+            MVI A,\p0+0DDH
+            MOV A,M
+            MVI A,\p0+07FH
+            MOV A,M
+            MVI A,\p0+0DDH
+            STAX B
+            MOV A,M
+            .byte 0EDH
+            MVI A,\p0+0DBH
+            MOV A,M
+            MVI A,\p0+023H
+            MVI A,\p0+046H
+            STAX B
+            DCX B
+            MVI A,\p0+0C3H
+            STAX B
+            MVI A,\p0+0C9H
+.endmacro
+sTRESSMACRO186 .macro p0
+            MVI A,\p0+09BH
+            .byte 038H, 2
+            MVI A,\p0+06CH
+            MVI A,\p0+030H
+            MVI A,\p0+002H
+            PCHL
+            .byte 08H
+            XCHG
+            .byte 08H
+            MVI A,\p0+021H
+            DCX B
+.endmacro
+sTRESSMACRO187 .macro p0, p1
+            PCHL
+            MVI A,\p1+0D1H
+            PCHL
+            MVI A,\p1+0EEH
+            PCHL
+            MVI A,\p1+095H
+            MVI A,\p1+03AH
+            MVI A,\p0+03FH
+            PCHL
+            .byte 08H
+            .byte 0EDH
+            INX H
+            SHLD saved
+            DCX B
+            .byte 0EDH
+            MVI A,\p0+03EH
+            MVI A,\p1+084H
+            STAX B
+            SHLD saved
+            INX H
+            .byte 0EDH
+            STAX B
+            MOV A,M
+            MVI A,\p0+0CCH
+            MVI A,\p0+0C9H
+            MVI A,\p0+015H
+            SHLD saved
+.endmacro
+sTRESSMACRO188 .macro p0, p1, p2
+            STAX B
+            MVI A,\p2+00AH
+            PCHL
+            MVI A,\p1+0AFH
+            DCX B
+            .byte 038H, 2
+            DCX B
+            MVI A,\p2+0FFH
+            .byte 038H, 2
+            MVI A,\p2+0ADH
+.endmacro
+sTRESSMACRO189 .macro p0, p1, p2
+            .byte 08H
+            MVI A,\p2+033H
+            MVI A,\p1+0B0H
+            MVI A,\p1+0CDH
+            MVI A,\p0+03FH
+            MVI A,\p0+041H
+            .byte 038H, 2
+            PCHL
+            MVI A,\p1+016H
+            .byte 0EDH
+            MVI A,\p2+053H
+            MVI A,\p2+0B4H
+            MVI A,\p0+00CH
+            SHLD saved
+            XCHG
+            MOV A,M
+            MVI A,\p0+071H
+            SHLD saved
+            MOV A,M
+            MVI A,\p0+09AH
+            INX H
+            .byte 08H
+            MOV A,M
+            MVI A,\p0+040H
+            PCHL
+            MVI A,\p2+0C6H
+            PCHL
+            MOV A,M
+            MVI A,\p1+0AEH
+            STAX B
+.endmacro
+sTRESSMACRO190 .macro p0, p1, p2, p3
+            .byte 038H, 2
+            MVI A,\p0+036H
+            .byte 038H, 2
+            .byte 0EDH
+            .byte 038H, 2
+            XCHG
+            MVI A,\p0+09DH
+            XCHG
+            MVI A,\p1+085H
+            DCX B
+            STAX B
+            .byte 08H
+            DCX B
+            PCHL
+            INX H
+            .byte 0EDH
+            MVI A,\p2+072H
+            MVI A,\p2+08BH
+.endmacro
+sTRESSMACRO191 .macro
+            INX H
+            XCHG
+            PCHL
+            DCX B
+            PCHL
+            STAX B
+            MOV A,M
+            STAX B
+            PCHL
+            DCX B
+            SHLD saved
+            INX H
+            MOV A,M
+            DCX B
+            DCX B
+            MOV A,M
+            SHLD saved
+            SHLD saved
+            .byte 0EDH
+            SHLD saved
+            .byte 08H
+            SHLD saved
+            .byte 08H
+            INX H
+            MOV A,M
+            .byte 0EDH
+            .byte 0EDH
+            INX H
+            .byte 0EDH
+            INX H
+            PCHL
+            MOV A,M
+            DCX B
+            PCHL
+.endmacro
+sTRESSMACRO192 .macro
+            PCHL
+            PCHL
+            STAX B
+            PCHL
+            STAX B
+            SHLD saved
+            .byte 038H, 2
+            .byte 08H
+            SHLD saved
+            SHLD saved
+            SHLD saved
+            .byte 038H, 2
+            MOV A,M
+            MOV A,M
+            STAX B
+.endmacro
+sTRESSMACRO193 .macro p0, p1, p2
+            PCHL
+            DCX B
+            MOV A,M
+            MVI A,\p0+0DEH
+            MVI A,\p1+0AEH
+            MVI A,\p2+0A7H
+            MVI A,\p2+05AH
+            MVI A,\p0+0B9H
+            .byte 0EDH
+            MVI A,\p2+0E8H
+            MVI A,\p0+0C2H
+.endmacro
+sTRESSMACRO194 .macro
+            SHLD saved
+            INX H
+            .byte 038H, 2
+            .byte 08H
+            XCHG
+            INX H
+            .byte 08H
+            .byte 038H, 2
+            XCHG
+            INX H
+            .byte 038H, 2
+            SHLD saved
+            .byte 08H
+            .byte 038H, 2
+            STAX B
+            .byte 0EDH
+            XCHG
+            MOV A,M
+            .byte 08H
+            DCX B
+            PCHL
+            .byte 08H
+            DCX B
+            XCHG
+.endmacro
+sTRESSMACRO195 .macro p0, p1, p2
+            SHLD saved
+            MVI A,\p0+0D0H
+            XCHG
+            .byte 08H
+            SHLD saved
+            MVI A,\p2+0C4H
+            SHLD saved
+            MVI A,\p2+031H
+            MVI A,\p2+010H
+            STAX B
+            MVI A,\p2+056H
+            MVI A,\p2+041H
+            MVI A,\p1+061H
+            MVI A,\p2+080H
+            MVI A,\p1+0E6H
+            MVI A,\p1+061H
+            MVI A,\p0+044H
+            SHLD saved
+            SHLD saved
+            PCHL
+            XCHG
+            MVI A,\p0+0D8H
+            SHLD saved
+            MVI A,\p2+0FBH
+            STAX B
+            MVI A,\p0+0F4H
+            .byte 038H, 2
+.endmacro
+sTRESSMACRO196 .macro p0
+            MVI A,\p0+08AH
+            STAX B
+            MVI A,\p0+04BH
+            MVI A,\p0+037H
+            SHLD saved
+            MOV A,M
+            INX H
+            DCX B
+            MVI A,\p0+022H
+            INX H
+            MOV A,M
+            SHLD saved
+            MVI A,\p0+059H
+            MOV A,M
+            MOV A,M
+            DCX B
+            MVI A,\p0+037H
+            MVI A,\p0+034H
+            .byte 08H
+            DCX B
+            MVI A,\p0+033H
+            MVI A,\p0+0E2H
+            DCX B
+            STAX B
+            .byte 038H, 2
+            SHLD saved
+            .byte 038H, 2
+            XCHG
+            XCHG
+            MOV A,M
+            PCHL
+            STAX B
+            MVI A,\p0+02AH
+            .byte 08H
+            MVI A,\p0+090H
+            MVI A,\p0+08AH
+            PCHL
+            .byte 0EDH
+            DCX B
+            .byte 0EDH
+.endmacro
+sTRESSMACRO197 .macro p0, p1, p2, p3
+            MVI A,\p3+005H
+            DCX B
+            .byte 038H, 2
+            MVI A,\p0+098H
+            DCX B
+            MVI A,\p0+074H
+            MVI A,\p1+06CH
+            .byte 0EDH
+            MVI A,\p3+08BH
+            MVI A,\p1+0E0H
+            MVI A,\p0+065H
+            MVI A,\p1+06EH
+            MVI A,\p3+078H
+            PCHL
+            PCHL
+            STAX B
+            .byte 0EDH
+            PCHL
+            XCHG
+            MVI A,\p0+03EH
+            MOV A,M
+            STAX B
+            MVI A,\p0+0FBH
+            PCHL
+            XCHG
+            DCX B
+            MOV A,M
+            MOV A,M
+            SHLD saved
+            DCX B
+            STAX B
+            XCHG
+            MVI A,\p0+0A5H
+.endmacro
+sTRESSMACRO198 .macro p0, p1
+            MVI A,\p0+058H
+            PCHL
+            MVI A,\p1+007H
+            MVI A,\p0+04EH
+            .byte 08H
+            MVI A,\p0+04CH
+            MVI A,\p0+053H
+            INX H
+            MOV A,M
+            MVI A,\p0+033H
+            .byte 0EDH
+            MVI A,\p0+0AAH
+            SHLD saved
+            PCHL
+            MVI A,\p1+089H
+            .byte 08H
+            .byte 08H
+            MVI A,\p0+007H
+            MVI A,\p0+016H
+            MVI A,\p1+0B3H
+            MVI A,\p0+0CCH
+            PCHL
+            MVI A,\p0+076H
+            MVI A,\p0+06AH
+            PCHL
+            MOV A,M
+            MVI A,\p1+009H
+            DCX B
+            MVI A,\p1+098H
+            MVI A,\p0+0BAH
+            INX H
+.endmacro
+sTRESSMACRO199 .macro p0, p1
+            MVI A,\p0+0C7H
+            .byte 0EDH
+            SHLD saved
+            INX H
+            SHLD saved
+            MVI A,\p0+016H
+            MVI A,\p1+0F7H
+            MVI A,\p1+03CH
+            .byte 038H, 2
+            PCHL
+            INX H
+            .byte 038H, 2
+            STAX B
+            MVI A,\p1+0BEH
+            MVI A,\p1+062H
+            MVI A,\p0+055H
+            MVI A,\p1+00FH
+            INX H
+            MVI A,\p1+0C2H
+            PCHL
+            DCX B
+            MVI A,\p0+0DDH
+            .byte 08H
+            .byte 038H, 2
+            MVI A,\p1+0EAH
+            MVI A,\p0+0B0H
+            DCX B
+            MVI A,\p1+068H
+            MVI A,\p1+001H
+            .byte 08H
+            MVI A,\p0+005H
+            INX H
+            MVI A,\p0+047H
+            MVI A,\p1+017H
+            .byte 08H
+            MOV A,M
+            MOV A,M
+            DCX B
+            PCHL
+.endmacro
+lbl637 .stressmacro73 1    ; call
+lbl365 .stressmacro108    ; call
+lbl531 .stressmacro22 3,1    ; call
+lbl519 .stressmacro143 2,1,8,8    ; call
+lbl750 .stressmacro85 0,4,9,3    ; call
+lbl2 .stressmacro138 6,8    ; call
+lbl59 .stressmacro95    ; call
+lbl53 .stressmacro2 1,8,2    ; call
+lbl572 .stressmacro166    ; call
+lbl651 .stressmacro81 6    ; call
+lbl76 .stressmacro19 4,6,4    ; call
+lbl180 .stressmacro12 3,9    ; call
+lbl578 .stressmacro42    ; call
+lbl710 .stressmacro54    ; call
+lbl938 .stressmacro135 2,1,6,6    ; call
+lbl433 .stressmacro20 6,0,8,8    ; call
+lbl959 .stressmacro24 4,1,5,7    ; call
+lbl751 .stressmacro18 6,2,8,2    ; call
+lbl70 .stressmacro110    ; call
+lbl336 .stressmacro149 9,0    ; call
+lbl934 .stressmacro123    ; call
+lbl838 .stressmacro78    ; call
+lbl163 .stressmacro81 4    ; call
+lbl989 .stressmacro65 6    ; call
+lbl375 .stressmacro71 8,1,8    ; call
+lbl342 .stressmacro45 3    ; call
+lbl822 .stressmacro72 0,3,8    ; call
+lbl442 .stressmacro160 2    ; call
+lbl432 .stressmacro25    ; call
+lbl6 .stressmacro165 2,3,4    ; call
+lbl995 .stressmacro36 9    ; call
+lbl533 .stressmacro3 7,8    ; call
+lbl295 .stressmacro150    ; call
+lbl710 .stressmacro158 9    ; call
+lbl299 .stressmacro58 5,2    ; call
+lbl356 .stressmacro50 1,1,7    ; call
+lbl458 .stressmacro102 3,5,2,4    ; call
+lbl34 .stressmacro97 9    ; call
+lbl327 .stressmacro173 1,0,6,1    ; call
+lbl892 .stressmacro106 2,7,4    ; call
+lbl267 .stressmacro174 0,0    ; call
+lbl805 .stressmacro35    ; call
+lbl533 .stressmacro186 5    ; call
+lbl598 .stressmacro67 5,8    ; call
+lbl671 .stressmacro192    ; call
+lbl838 .stressmacro147 0    ; call
+lbl581 .stressmacro101    ; call
+lbl307 .stressmacro52    ; call
+lbl597 .stressmacro123    ; call
+lbl712 .stressmacro23    ; call
+lbl852 .stressmacro27 2,9    ; call
+lbl620 .stressmacro149 2,7    ; call
+lbl258 .stressmacro70 1,9,9    ; call
+lbl616 .stressmacro153 4    ; call
+lbl516 .stressmacro69 5,3,0,7    ; call
+lbl85 .stressmacro68 1,3,3,6    ; call
+lbl756 .stressmacro148 9    ; call
+lbl729 .stressmacro24 1,3,9,6    ; call
+lbl432 .stressmacro67 3,9    ; call
+lbl308 .stressmacro194    ; call
+lbl834 .stressmacro7 2,6,6    ; call
+lbl712 .stressmacro54    ; call
+lbl184 .stressmacro50 3,0,0    ; call
+lbl94 .stressmacro110    ; call
+lbl732 .stressmacro88    ; call
+lbl724 .stressmacro33 4,8,2,4    ; call
+lbl348 .stressmacro138 2,1    ; call
+lbl593 .stressmacro144 6,6    ; call
+lbl915 .stressmacro62 9,2,6    ; call
+lbl252 .stressmacro146 8    ; call
+lbl701 .stressmacro170 3,7,1,0    ; call
+lbl816 .stressmacro26    ; call
+lbl639 .stressmacro167 9,2    ; call
+lbl984 .stressmacro86 8    ; call
+lbl309 .stressmacro9 5,0,7,0    ; call
+lbl91 .stressmacro107 5    ; call
+lbl941 .stressmacro5 0,7,0    ; call
+lbl804 .stressmacro77    ; call
+lbl668 .stressmacro199 8,3    ; call
+lbl941 .stressmacro145 9,4    ; call
+lbl340 .stressmacro152 1,5,2    ; call
+lbl868 .stressmacro47 8,7    ; call
+lbl55 .stressmacro165 9,2,4    ; call
+lbl602 .stressmacro112 5,2    ; call
+lbl666 .stressmacro4 2,5,6,8    ; call
+lbl460 .stressmacro88    ; call
+lbl841 .stressmacro99 4,4    ; call
+lbl438 .stressmacro143 5,8,2,8    ; call
+lbl885 .stressmacro26    ; call
+lbl836 .stressmacro58 8,5    ; call
+lbl297 .stressmacro77    ; call
+lbl475 .stressmacro183 1    ; call
+lbl268 .stressmacro30 6,3,5    ; call
+lbl625 .stressmacro177    ; call
+lbl646 .stressmacro89 6,9    ; call
+lbl4 .stressmacro135 7,8,8,4    ; call
+lbl475 .stressmacro87 6,3,4    ; call
+lbl444 .stressmacro140 4,2,0,1    ; call
+lbl358 .stressmacro0 8,1,0,0    ; call
+lbl684 .stressmacro149 7,1    ; call
+lbl235 .stressmacro107 3    ; call
+lbl325 .stressmacro130 8,2,0    ; call
+lbl973 .stressmacro192    ; call
+lbl24 .stressmacro83 9,8,9,9    ; call
+lbl834 .stressmacro51 6,9,3,7    ; call
+lbl361 .stressmacro198 4,3    ; call
+lbl617 .stressmacro39 8    ; call
+lbl55 .stressmacro190 0,3,3,2    ; call
+lbl205 .stressmacro192    ; call
+lbl510 .stressmacro193 2,9,1    ; call
+lbl715 .stressmacro156 8    ; call
+lbl249 .stressmacro1 8,1,6,3    ; call
+lbl370 .stressmacro175 0    ; call
+lbl402 .stressmacro67 2,6    ; call
+lbl593 .stressmacro69 1,2,4,0    ; call
+lbl577 .stressmacro82 1,6,8,4    ; call
+lbl105 .stressmacro135 3,1,4,6    ; call
+lbl393 .stressmacro151 2,9,1    ; call
+lbl99 .stressmacro172 7,3,5    ; call
+lbl56 .stressmacro157    ; call
+lbl141 .stressmacro68 7,6,2,1    ; call
+lbl62 .stressmacro138 1,3    ; call
+lbl799 .stressmacro159 9    ; call
+lbl995 .stressmacro98    ; call
+lbl557 .stressmacro87 3,5,9    ; call
+lbl523 .stressmacro45 9    ; call
+lbl312 .stressmacro197 2,6,4,6    ; call
+lbl459 .stressmacro195 1,0,6    ; call
+lbl547 .stressmacro44 1    ; call
+lbl700 .stressmacro128 6,3,6,6    ; call
+lbl682 .stressmacro44 4    ; call
+lbl467 .stressmacro66 2    ; call
+lbl980 .stressmacro135 9,3,1,6    ; call
+lbl687 .stressmacro105 1    ; call
+lbl958 .stressmacro98    ; call
+lbl822 .stressmacro5 5,9,8    ; call
+lbl487 .stressmacro60    ; call
+lbl654 .stressmacro6 4,8,4    ; call
+lbl129 .stressmacro24 9,1,5,0    ; call
+lbl281 .stressmacro165 2,9,9    ; call
+lbl325 .stressmacro55 9,1,5,6    ; call
+lbl663 .stressmacro70 9,8,0    ; call
+lbl533 .stressmacro125 2    ; call
+lbl975 .stressmacro113 5,0,0,5    ; call
+lbl17 .stressmacro84 2    ; call
+lbl503 .stressmacro149 2,5    ; call
+lbl341 .stressmacro9 0,0,8,5    ; call
+lbl955 .stressmacro86 1    ; call
+lbl278 .stressmacro113 1,7,4,8    ; call
+lbl467 .stressmacro77    ; call
+lbl773 .stressmacro153 6    ; call
+lbl61 .stressmacro71 2,2,0    ; call
+lbl840 .stressmacro13 7,1,3    ; call
+lbl190 .stressmacro113 9,2,0,1    ; call
+lbl395 .stressmacro52    ; call
+lbl193 .stressmacro106 3,9,6    ; call
+lbl939 .stressmacro93    ; call
+lbl682 .stressmacro116 1,8,4    ; call
+lbl179 .stressmacro44 8    ; call
+lbl439 .stressmacro61 2,5,2    ; call
+lbl288 .stressmacro19 3,2,9    ; call
+lbl374 .stressmacro72 1,6,5    ; call
+lbl845 .stressmacro54    ; call
+lbl352 .stressmacro125 4    ; call
+lbl305 .stressmacro181 7    ; call
+lbl724 .stressmacro183 5    ; call
+lbl551 .stressmacro128 0,1,4,2    ; call
+lbl904 .stressmacro106 3,6,3    ; call
+lbl608 .stressmacro78    ; call
+lbl10 .stressmacro142 8,8    ; call
+lbl140 .stressmacro46    ; call
+lbl622 .stressmacro171 1,4    ; call
+lbl562 .stressmacro34 4,8,9    ; call
+lbl237 .stressmacro182 8    ; call
+lbl816 .stressmacro103 6,5,6    ; call
+lbl33 .stressmacro90 9,1,9,7    ; call
+lbl851 .stressmacro193 8,4,2    ; call
+lbl252 .stressmacro140 4,7,1,0    ; call
+lbl826 .stressmacro185 1    ; call
+lbl813 .stressmacro72 2,9,8    ; call
+lbl153 .stressmacro90 0,4,9,2    ; call
+lbl482 .stressmacro65 5    ; call
+lbl173 .stressmacro101    ; call
+lbl792 .stressmacro171 9,2    ; call
+lbl795 .stressmacro169 7,6,5    ; call
+lbl422 .stressmacro106 9,2,9    ; call
+lbl946 .stressmacro153 6    ; call
+lbl679 .stressmacro33 5,2,5,4    ; call
+lbl712 .stressmacro155 6,0    ; call
+lbl851 .stressmacro10 7    ; call
+lbl523 .stressmacro131 3,3,0    ; call
+lbl149 .stressmacro135 8,3,8,8    ; call
+lbl735 .stressmacro79 8,9    ; call
+lbl324 .stressmacro34 5,5,2    ; call
+lbl657 .stressmacro52    ; call
+lbl749 .stressmacro73 6    ; call
+lbl926 .stressmacro116 6,7,9    ; call
+lbl438 .stressmacro102 1,3,8,4    ; call
+lbl11 .stressmacro99 9,8    ; call
+lbl123 .stressmacro44 8    ; call
+lbl306 .stressmacro18 8,2,0,8    ; call
+lbl384 .stressmacro23    ; call
+lbl764 .stressmacro32 8,7    ; call
+lbl690 .stressmacro48 5    ; call
+lbl338 .stressmacro142 7,3    ; call
+lbl464 .stressmacro4 8,2,7,1    ; call
+lbl761 .stressmacro194    ; call
+lbl236 .stressmacro29    ; call
+lbl314 .stressmacro43 9,9,3    ; call
+lbl234 .stressmacro9 2,1,1,9    ; call
+lbl366 .stressmacro105 6    ; call
+lbl890 .stressmacro83 7,7,2,1    ; call
+lbl829 .stressmacro47 0,8    ; call
+lbl45 .stressmacro43 5,8,8    ; call
+lbl76 .stressmacro86 2    ; call
+lbl492 .stressmacro134 7,9    ; call
+lbl984 .stressmacro182 2    ; call
+lbl192 .stressmacro143 9,7,4,2    ; call
+lbl693 .stressmacro124 1,4,9,4    ; call
+lbl304 .stressmacro23    ; call
+lbl305 .stressmacro106 7,4,4    ; call
+lbl450 .stressmacro96 5,8,5,6    ; call
+lbl400 .stressmacro16    ; call
+lbl44 .stressmacro117 3    ; call
+lbl96 .stressmacro89 5,1    ; call
+lbl111 .stressmacro10 6    ; call
+lbl283 .stressmacro39 2    ; call
+lbl858 .stressmacro116 9,1,1    ; call
+lbl905 .stressmacro12 6,5    ; call
+lbl121 .stressmacro176 8,0,5,3    ; call
+lbl768 .stressmacro70 4,6,3    ; call
+lbl854 .stressmacro109    ; call
+lbl118 .stressmacro124 8,7,6,2    ; call
+lbl929 .stressmacro146 3    ; call
+lbl272 .stressmacro83 1,3,0,6    ; call
+lbl171 .stressmacro78    ; call
+lbl556 .stressmacro183 0    ; call
+lbl377 .stressmacro32 8,5    ; call
+lbl324 .stressmacro35    ; call
+lbl514 .stressmacro72 4,7,5    ; call
+lbl75 .stressmacro7 9,9,7    ; call
+lbl601 .stressmacro24 0,9,8,3    ; call
+lbl402 .stressmacro22 0,2    ; call
+lbl753 .stressmacro100 5    ; call
+lbl968 .stressmacro83 2,8,5,1    ; call
+lbl980 .stressmacro132 1,1,3    ; call
+lbl116 .stressmacro78    ; call
+lbl972 .stressmacro1 8,6,8,1    ; call
+lbl496 .stressmacro95    ; call
+lbl988 .stressmacro19 9,9,6    ; call
+lbl119 .stressmacro68 5,3,7,2    ; call
+lbl287 .stressmacro64 8,4    ; call
+lbl207 .stressmacro79 1,3    ; call
+lbl438 .stressmacro150    ; call
+lbl858 .stressmacro185 8    ; call
+lbl272 .stressmacro69 7,6,8,3    ; call
+lbl361 .stressmacro117 6    ; call
+lbl940 .stressmacro10 0    ; call
+lbl679 .stressmacro190 9,7,0,9    ; call
+lbl721 .stressmacro3 9,4    ; call
+lbl731 .stressmacro152 5,9,2    ; call
+lbl783 .stressmacro118 9,6    ; call
+lbl617 .stressmacro195 8,5,4    ; call
+lbl830 .stressmacro160 1    ; call
+lbl183 .stressmacro129 1,6    ; call
+lbl446 .stressmacro175 3    ; call
+lbl265 .stressmacro77    ; call
+lbl644 .stressmacro192    ; call
+lbl729 .stressmacro92 3,1,9    ; call
+lbl959 .stressmacro52    ; call
+lbl167 .stressmacro100 2    ; call
+lbl684 .stressmacro94 0,4,1    ; call
+lbl615 .stressmacro88    ; call
+lbl563 .stressmacro100 2    ; call
+lbl269 .stressmacro4 0,9,1,8    ; call
+lbl215 .stressmacro12 1,6    ; call
+lbl884 .stressmacro139 4,1,1,7    ; call
+lbl904 .stressmacro173 8,2,5,8    ; call
+lbl132 .stressmacro48 6    ; call
+lbl783 .stressmacro143 0,1,2,9    ; call
+lbl435 .stressmacro83 0,0,9,1    ; call
+lbl124 .stressmacro81 4    ; call
+lbl87 .stressmacro52    ; call
+lbl143 .stressmacro14 2    ; call
+lbl530 .stressmacro118 1,2    ; call
+lbl535 .stressmacro113 9,0,5,9    ; call
+lbl469 .stressmacro113 8,8,8,9    ; call
+lbl965 .stressmacro185 9    ; call
+lbl678 .stressmacro79 0,4    ; call
+lbl330 .stressmacro128 7,0,4,2    ; call
+lbl229 .stressmacro148 1    ; call
+lbl328 .stressmacro179    ; call
+lbl941 .stressmacro18 0,1,6,1    ; call
+lbl48 .stressmacro172 7,4,6    ; call
+lbl719 .stressmacro171 8,5    ; call
+lbl929 .stressmacro192    ; call
+lbl794 .stressmacro186 7    ; call
+lbl64 .stressmacro153 3    ; call
+lbl404 .stressmacro59 7,7    ; call
+lbl85 .stressmacro167 9,0    ; call
+lbl602 .stressmacro7 4,4,5    ; call
+lbl787 .stressmacro106 4,8,6    ; call
+lbl938 .stressmacro96 6,3,6,6    ; call
+lbl476 .stressmacro196 6    ; call
+lbl554 .stressmacro141 9,8,0    ; call
+lbl710 .stressmacro150    ; call
+lbl245 .stressmacro148 5    ; call
+lbl830 .stressmacro94 7,5,1    ; call
+lbl945 .stressmacro136 9    ; call
+lbl220 .stressmacro163    ; call
+lbl365 .stressmacro28 6,1,9    ; call
+lbl37 .stressmacro98    ; call
+lbl743 .stressmacro80 7    ; call
+lbl206 .stressmacro139 0,8,4,4    ; call
+lbl933 .stressmacro133 9,1,9    ; call
+lbl986 .stressmacro161 9    ; call
+lbl596 .stressmacro151 1,0,3    ; call
+lbl367 .stressmacro100 4    ; call
+lbl421 .stressmacro44 3    ; call
+lbl592 .stressmacro147 5    ; call
+lbl493 .stressmacro62 8,6,6    ; call
+lbl535 .stressmacro114 7    ; call
+lbl827 .stressmacro78    ; call
+lbl767 .stressmacro152 3,3,2    ; call
+lbl978 .stressmacro190 6,4,3,8    ; call
+lbl759 .stressmacro84 6    ; call
+lbl312 .stressmacro63 8,1,8    ; call
+lbl910 .stressmacro180 5,9,9    ; call
+lbl980 .stressmacro96 4,6,2,7    ; call
+lbl340 .stressmacro39 7    ; call
+lbl234 .stressmacro134 3,0    ; call
+lbl483 .stressmacro134 1,0    ; call
+lbl765 .stressmacro87 5,2,1    ; call
+lbl693 .stressmacro20 4,8,8,9    ; call
+lbl76 .stressmacro6 4,9,9    ; call
+lbl389 .stressmacro100 5    ; call
+lbl60 .stressmacro92 9,8,3    ; call
+lbl791 .stressmacro135 9,6,7,7    ; call
+lbl8 .stressmacro69 6,6,1,0    ; call
+lbl774 .stressmacro93    ; call
+lbl53 .stressmacro169 1,8,1    ; call
+lbl206 .stressmacro102 0,9,9,1    ; call
+lbl690 .stressmacro27 0,0    ; call
+lbl338 .stressmacro157    ; call
+lbl634 .stressmacro70 1,0,3    ; call
+lbl725 .stressmacro186 3    ; call
+lbl982 .stressmacro55 4,5,4,0    ; call
+lbl292 .stressmacro74 5,0,3,5    ; call
+lbl831 .stressmacro107 4    ; call
+lbl94 .stressmacro93    ; call
+lbl236 .stressmacro181 8    ; call
+lbl72 .stressmacro57 3,6    ; call
+lbl396 .stressmacro171 7,2    ; call
+lbl581 .stressmacro79 5,9    ; call
+lbl918 .stressmacro7 3,3,7    ; call
+lbl723 .stressmacro180 7,3,1    ; call
+lbl120 .stressmacro61 0,7,6    ; call
+lbl254 .stressmacro130 4,1,4    ; call
+lbl422 .stressmacro2 8,4,8    ; call
+lbl304 .stressmacro65 7    ; call
+lbl447 .stressmacro120 2,7,3,5    ; call
+lbl6 .stressmacro164 7    ; call
+lbl771 .stressmacro3 9,3    ; call
+lbl805 .stressmacro21 4,9    ; call
+lbl770 .stressmacro37 6,6,1    ; call
+lbl557 .stressmacro124 9,2,5,1    ; call
+lbl90 .stressmacro85 9,1,5,7    ; call
+lbl453 .stressmacro90 6,3,3,3    ; call
+lbl283 .stressmacro33 6,7,4,0    ; call
+lbl242 .stressmacro113 7,7,3,9    ; call
+lbl248 .stressmacro2 8,6,3    ; call
+lbl561 .stressmacro83 0,5,6,3    ; call
+lbl836 .stressmacro97 1    ; call
+lbl149 .stressmacro107 7    ; call
+lbl815 .stressmacro150    ; call
+lbl408 .stressmacro68 1,8,8,8    ; call
+lbl169 .stressmacro49 7    ; call
+lbl269 .stressmacro79 5,0    ; call
+lbl80 .stressmacro133 0,9,5    ; call
+lbl840 .stressmacro145 9,0    ; call
+lbl390 .stressmacro13 2,2,6    ; call
+lbl356 .stressmacro137    ; call
+lbl518 .stressmacro68 4,4,0,4    ; call
+lbl528 .stressmacro122 2,9,2,3    ; call
+lbl553 .stressmacro30 0,2,0    ; call
+lbl987 .stressmacro46    ; call
+lbl691 .stressmacro54    ; call
+lbl655 .stressmacro163    ; call
+lbl311 .stressmacro85 7,4,1,3    ; call
+lbl342 .stressmacro193 0,3,9    ; call
+lbl806 .stressmacro108    ; call
+lbl273 .stressmacro75 9    ; call
+lbl511 .stressmacro116 8,9,3    ; call
+lbl470 .stressmacro127    ; call
+lbl434 .stressmacro19 4,5,4    ; call
+lbl512 .stressmacro116 5,5,9    ; call
+lbl914 .stressmacro140 8,6,9,5    ; call
+lbl570 .stressmacro99 2,3    ; call
+lbl801 .stressmacro164 6    ; call
+lbl175 .stressmacro180 4,6,3    ; call
+lbl289 .stressmacro163    ; call
+lbl838 .stressmacro65 1    ; call
+lbl102 .stressmacro54    ; call
+lbl659 .stressmacro73 6    ; call
+lbl54 .stressmacro23    ; call
+lbl867 .stressmacro11 1,8    ; call
+lbl280 .stressmacro165 5,0,7    ; call
+lbl868 .stressmacro67 0,6    ; call
+lbl976 .stressmacro37 2,9,9    ; call
+lbl770 .stressmacro60    ; call
+lbl29 .stressmacro138 1,1    ; call
+lbl715 .stressmacro39 8    ; call
+lbl461 .stressmacro154 0,1,4    ; call
+lbl965 .stressmacro175 5    ; call
+lbl720 .stressmacro110    ; call
+lbl41 .stressmacro174 6,8    ; call
+lbl133 .stressmacro34 3,5,4    ; call
+lbl863 .stressmacro41 8    ; call
+lbl813 .stressmacro34 9,4,4    ; call
+lbl161 .stressmacro78    ; call
+lbl793 .stressmacro133 3,0,9    ; call
+lbl362 .stressmacro160 0    ; call
+lbl289 .stressmacro141 3,7,0    ; call
+lbl223 .stressmacro130 2,2,2    ; call
+lbl836 .stressmacro28 0,2,8    ; call
+lbl509 .stressmacro35    ; call
+lbl225 .stressmacro107 4    ; call
+lbl154 .stressmacro43 9,8,8    ; call
+lbl475 .stressmacro57 4,5    ; call
+lbl117 .stressmacro58 8,7    ; call
+lbl707 .stressmacro170 9,0,4,9    ; call
+lbl200 .stressmacro78    ; call
+lbl875 .stressmacro195 1,7,2    ; call
+lbl648 .stressmacro104 1,1    ; call
+lbl910 .stressmacro165 1,0,3    ; call
+lbl551 .stressmacro11 4,1    ; call
+lbl683 .stressmacro49 4    ; call
+lbl941 .stressmacro82 7,2,4,9    ; call
+lbl989 .stressmacro57 7,2    ; call
+lbl370 .stressmacro188 5,6,9    ; call
+lbl527 .stressmacro9 6,7,2,2    ; call
+lbl554 .stressmacro58 3,2    ; call
+lbl348 .stressmacro74 4,6,1,5    ; call
+lbl809 .stressmacro38 2    ; call
+lbl914 .stressmacro66 8    ; call
+lbl324 .stressmacro41 7    ; call
+lbl919 .stressmacro67 7,6    ; call
+lbl116 .stressmacro80 8    ; call
+lbl197 .stressmacro17 2    ; call
+lbl141 .stressmacro178    ; call
+lbl522 .stressmacro125 2    ; call
+lbl893 .stressmacro192    ; call
+lbl819 .stressmacro16    ; call
+lbl99 .stressmacro38 3    ; call
+lbl210 .stressmacro125 6    ; call
+lbl740 .stressmacro155 7,2    ; call
+lbl860 .stressmacro41 2    ; call
+lbl591 .stressmacro91 2,0    ; call
+lbl543 .stressmacro103 7,7,2    ; call
+lbl690 .stressmacro54    ; call
+lbl390 .stressmacro113 6,7,6,8    ; call
+lbl314 .stressmacro28 8,1,7    ; call
+lbl519 .stressmacro64 4,7    ; call
+lbl429 .stressmacro135 8,9,6,8    ; call
+lbl509 .stressmacro86 4    ; call
+lbl223 .stressmacro197 1,1,8,7    ; call
+lbl324 .stressmacro77    ; call
+lbl554 .stressmacro114 4    ; call
+lbl396 .stressmacro127    ; call
+lbl594 .stressmacro88    ; call
+lbl686 .stressmacro0 3,5,4,1    ; call
+lbl85 .stressmacro106 2,2,6    ; call
+lbl437 .stressmacro194    ; call
+lbl115 .stressmacro179    ; call
+lbl580 .stressmacro103 3,6,0    ; call
+lbl844 .stressmacro194    ; call
+lbl75 .stressmacro37 3,4,9    ; call
+lbl283 .stressmacro62 0,6,3    ; call
+lbl861 .stressmacro197 7,3,8,5    ; call
+lbl338 .stressmacro14 1    ; call
+lbl386 .stressmacro15 1,8,0    ; call
+lbl958 .stressmacro178    ; call
+lbl116 .stressmacro159 2    ; call
+lbl949 .stressmacro77    ; call
+lbl927 .stressmacro89 9,6    ; call
+lbl864 .stressmacro13 6,0,3    ; call
+lbl160 .stressmacro70 8,3,3    ; call
+lbl166 .stressmacro29    ; call
+lbl76 .stressmacro80 3    ; call
+lbl514 .stressmacro154 8,1,7    ; call
+lbl269 .stressmacro0 6,5,7,3    ; call
+lbl881 .stressmacro60    ; call
+lbl13 .stressmacro17 9    ; call
+lbl699 .stressmacro146 7    ; call
+lbl214 .stressmacro153 0    ; call
+lbl154 .stressmacro3 9,2    ; call
+lbl65 .stressmacro64 7,0    ; call
+lbl749 .stressmacro153 7    ; call
+lbl909 .stressmacro30 8,0,7    ; call
+lbl791 .stressmacro182 4    ; call
+lbl672 .stressmacro33 2,1,1,7    ; call
+lbl489 .stressmacro39 7    ; call
+lbl137 .stressmacro5 5,9,0    ; call
+lbl746 .stressmacro19 6,2,6    ; call
+lbl253 .stressmacro76 4,4    ; call
+lbl966 .stressmacro16    ; call
+lbl587 .stressmacro51 3,1,6,5    ; call
+lbl385 .stressmacro22 2,0    ; call
+lbl921 .stressmacro92 9,9,3    ; call
+lbl15 .stressmacro139 7,5,7,9    ; call
+lbl36 .stressmacro196 3    ; call
+lbl366 .stressmacro176 2,9,5,9    ; call
+lbl64 .stressmacro52    ; call
+lbl933 .stressmacro187 9,2    ; call
+lbl749 .stressmacro145 3,6    ; call
+lbl770 .stressmacro46    ; call
+lbl676 .stressmacro39 2    ; call
+lbl73 .stressmacro20 2,8,6,2    ; call
+lbl53 .stressmacro149 9,7    ; call
+lbl459 .stressmacro26    ; call
+lbl570 .stressmacro163    ; call
+lbl591 .stressmacro156 2    ; call
+lbl229 .stressmacro132 7,5,6    ; call
+lbl385 .stressmacro14 6    ; call
+lbl460 .stressmacro66 2    ; call
+lbl894 .stressmacro123    ; call
+lbl82 .stressmacro97 0    ; call
+lbl15 .stressmacro106 9,0,7    ; call
+lbl364 .stressmacro146 9    ; call
+lbl753 .stressmacro137    ; call
+lbl443 .stressmacro149 3,9    ; call
+lbl703 .stressmacro184    ; call
+lbl535 .stressmacro196 7    ; call
+lbl653 .stressmacro20 7,6,9,7    ; call
+lbl325 .stressmacro163    ; call
+lbl326 .stressmacro58 6,9    ; call
+lbl894 .stressmacro49 0    ; call
+lbl938 .stressmacro155 8,3    ; call
+lbl497 .stressmacro3 8,2    ; call
+lbl432 .stressmacro31 7,2,0    ; call
+lbl720 .stressmacro130 3,4,9    ; call
+lbl336 .stressmacro92 9,9,5    ; call
+lbl7 .stressmacro117 9    ; call
+lbl353 .stressmacro177    ; call
+lbl117 .stressmacro140 2,0,0,2    ; call
+lbl48 .stressmacro88    ; call
+lbl909 .stressmacro179    ; call
+lbl562 .stressmacro18 0,0,7,4    ; call
+lbl107 .stressmacro141 9,9,1    ; call
+lbl2 .stressmacro183 8    ; call
+lbl161 .stressmacro135 4,0,2,0    ; call
+lbl825 .stressmacro49 9    ; call
+lbl107 .stressmacro52    ; call
+lbl443 .stressmacro119 4,0    ; call
+lbl419 .stressmacro40 0,3    ; call
+lbl191 .stressmacro7 1,8,9    ; call
+lbl582 .stressmacro55 5,7,2,1    ; call
+lbl253 .stressmacro126 8,6,2    ; call
+lbl179 .stressmacro21 6,5    ; call
+lbl454 .stressmacro123    ; call
+lbl424 .stressmacro114 2    ; call
+lbl539 .stressmacro51 0,4,1,4    ; call
+lbl77 .stressmacro82 7,4,5,3    ; call
+lbl301 .stressmacro25    ; call
+lbl96 .stressmacro22 6,2    ; call
+lbl404 .stressmacro158 2    ; call
+lbl408 .stressmacro148 8    ; call
+lbl592 .stressmacro182 6    ; call
+lbl838 .stressmacro175 8    ; call
+lbl29 .stressmacro14 8    ; call
+lbl349 .stressmacro25    ; call
+lbl602 .stressmacro51 2,4,3,6    ; call
+lbl986 .stressmacro59 5,4    ; call
+lbl11 .stressmacro145 3,1    ; call
+lbl689 .stressmacro2 0,6,5    ; call
+lbl257 .stressmacro26    ; call
+lbl836 .stressmacro61 3,3,4    ; call
+lbl788 .stressmacro41 6    ; call
+lbl216 .stressmacro86 0    ; call
+lbl919 .stressmacro34 3,6,1    ; call
+lbl195 .stressmacro175 6    ; call
+lbl691 .stressmacro88    ; call
+lbl647 .stressmacro151 9,9,4    ; call
+lbl128 .stressmacro18 6,6,2,7    ; call
+lbl15 .stressmacro99 3,4    ; call
+lbl70 .stressmacro46    ; call
+lbl318 .stressmacro7 9,1,8    ; call
+lbl816 .stressmacro150    ; call
+lbl956 .stressmacro64 9,1    ; call
+lbl17 .stressmacro182 2    ; call
+lbl305 .stressmacro40 2,6    ; call
+lbl46 .stressmacro75 5    ; call
+lbl570 .stressmacro52    ; call
+lbl735 .stressmacro83 2,4,7,4    ; call
+lbl711 .stressmacro38 4    ; call
+lbl238 .stressmacro172 7,5,6    ; call
+lbl879 .stressmacro24 7,8,5,6    ; call
+lbl226 .stressmacro36 2    ; call
+lbl526 .stressmacro164 8    ; call
+lbl674 .stressmacro139 2,4,6,0    ; call
+lbl811 .stressmacro145 9,4    ; call
+lbl892 .stressmacro183 5    ; call
+lbl579 .stressmacro168 0    ; call
+lbl189 .stressmacro104 8,5    ; call
+lbl665 .stressmacro159 9    ; call
+lbl459 .stressmacro162 7    ; call
+lbl614 .stressmacro180 3,2,3    ; call
+lbl525 .stressmacro85 7,9,1,1    ; call
+lbl780 .stressmacro196 6    ; call
+lbl119 .stressmacro54    ; call
+lbl945 .stressmacro155 5,4    ; call
+lbl181 .stressmacro77    ; call
+lbl270 .stressmacro131 3,2,9    ; call
+lbl988 .stressmacro42    ; call
+lbl465 .stressmacro113 4,5,6,4    ; call
+lbl190 .stressmacro178    ; call
+lbl386 .stressmacro70 9,7,0    ; call
+lbl799 .stressmacro132 4,3,0    ; call
+lbl821 .stressmacro109    ; call
+lbl138 .stressmacro133 7,2,5    ; call
+lbl174 .stressmacro143 7,3,0,0    ; call
+lbl939 .stressmacro34 6,3,2    ; call
+lbl914 .stressmacro29    ; call
+lbl793 .stressmacro126 4,6,6    ; call
+lbl658 .stressmacro177    ; call
+lbl638 .stressmacro144 0,7    ; call
+lbl976 .stressmacro31 6,8,0    ; call
+lbl121 .stressmacro13 1,9,5    ; call
+lbl182 .stressmacro25    ; call
+lbl195 .stressmacro17 2    ; call
+lbl77 .stressmacro82 1,3,7,9    ; call
+lbl682 .stressmacro167 3,7    ; call
+lbl196 .stressmacro105 8    ; call
+lbl44 .stressmacro98    ; call
+lbl828 .stressmacro65 8    ; call
+lbl459 .stressmacro94 2,3,5    ; call
+lbl918 .stressmacro140 3,6,4,2    ; call
+lbl149 .stressmacro150    ; call
+lbl488 .stressmacro58 2,7    ; call
+lbl133 .stressmacro152 2,5,4    ; call
+lbl484 .stressmacro161 2    ; call
+lbl687 .stressmacro146 6    ; call
+lbl86 .stressmacro183 1    ; call
+lbl728 .stressmacro16    ; call
+lbl978 .stressmacro57 3,1    ; call
+lbl451 .stressmacro73 9    ; call
+lbl836 .stressmacro64 3,9    ; call
+lbl504 .stressmacro158 6    ; call
+lbl115 .stressmacro43 6,4,3    ; call
+lbl571 .stressmacro13 4,9,1    ; call
+lbl626 .stressmacro197 3,5,4,6    ; call
+lbl505 .stressmacro81 9    ; call
+lbl590 .stressmacro55 7,7,5,6    ; call
+lbl652 .stressmacro44 4    ; call
+lbl0 .stressmacro98    ; call
+lbl470 .stressmacro65 8    ; call
+lbl438 .stressmacro96 1,0,4,6    ; call
+lbl257 .stressmacro144 7,8    ; call
+lbl659 .stressmacro135 8,5,5,4    ; call
+lbl742 .stressmacro95    ; call
+lbl824 .stressmacro107 9    ; call
+lbl910 .stressmacro123    ; call
+lbl924 .stressmacro169 4,6,0    ; call
+lbl439 .stressmacro118 5,9    ; call
+lbl214 .stressmacro42    ; call
+lbl274 .stressmacro92 3,5,5    ; call
+lbl968 .stressmacro123    ; call
+lbl254 .stressmacro98    ; call
+lbl497 .stressmacro131 2,7,6    ; call
+lbl274 .stressmacro131 9,0,4    ; call
+lbl213 .stressmacro119 7,8    ; call
+lbl281 .stressmacro109    ; call
+lbl488 .stressmacro27 5,6    ; call
+lbl893 .stressmacro27 7,3    ; call
+lbl831 .stressmacro33 7,4,7,6    ; call
+lbl238 .stressmacro167 0,3    ; call
+lbl135 .stressmacro78    ; call
+lbl484 .stressmacro127    ; call
+lbl688 .stressmacro83 9,2,5,2    ; call
+lbl271 .stressmacro66 7    ; call
+lbl948 .stressmacro182 6    ; call
+lbl105 .stressmacro158 0    ; call
+lbl855 .stressmacro1 3,4,9,4    ; call
+lbl816 .stressmacro198 6,6    ; call
+lbl280 .stressmacro39 1    ; call
+lbl531 .stressmacro198 1,4    ; call
+lbl564 .stressmacro7 5,1,2    ; call
+lbl326 .stressmacro24 2,8,7,0    ; call
+lbl750 .stressmacro108    ; call
+lbl959 .stressmacro148 7    ; call
+lbl761 .stressmacro103 3,6,4    ; call
+lbl463 .stressmacro99 1,6    ; call
+lbl823 .stressmacro133 8,8,2    ; call
+lbl717 .stressmacro52    ; call
+lbl476 .stressmacro38 3    ; call
+lbl271 .stressmacro14 3    ; call
+lbl137 .stressmacro127    ; call
+lbl234 .stressmacro73 8    ; call
+lbl967 .stressmacro172 6,5,7    ; call
+lbl708 .stressmacro195 4,2,7    ; call
+lbl751 .stressmacro68 2,9,6,7    ; call
+lbl86 .stressmacro86 5    ; call
+lbl591 .stressmacro151 3,9,1    ; call
+lbl950 .stressmacro101    ; call
+lbl969 .stressmacro66 6    ; call
+lbl620 .stressmacro7 8,6,0    ; call
+lbl40 .stressmacro54    ; call
+lbl339 .stressmacro93    ; call
+lbl90 .stressmacro45 9    ; call
+lbl172 .stressmacro50 5,4,7    ; call
+lbl876 .stressmacro66 6    ; call
+lbl159 .stressmacro44 2    ; call
+lbl771 .stressmacro83 6,5,3,7    ; call
+lbl908 .stressmacro123    ; call
+lbl210 .stressmacro139 5,8,0,7    ; call
+lbl971 .stressmacro18 2,4,1,3    ; call
+lbl874 .stressmacro125 5    ; call
+lbl501 .stressmacro112 3,6    ; call
+lbl447 .stressmacro63 9,9,7    ; call
+lbl887 .stressmacro119 9,3    ; call
+lbl479 .stressmacro48 3    ; call
+lbl819 .stressmacro101    ; call
+lbl490 .stressmacro157    ; call
+lbl731 .stressmacro122 6,3,8,0    ; call
+lbl67 .stressmacro82 8,5,5,8    ; call
+lbl908 .stressmacro144 1,9    ; call
+lbl569 .stressmacro106 7,2,4    ; call
+lbl257 .stressmacro31 4,4,6    ; call
+lbl360 .stressmacro133 3,5,8    ; call
+lbl465 .stressmacro64 5,3    ; call
+lbl327 .stressmacro97 2    ; call
+lbl935 .stressmacro110    ; call
+lbl68 .stressmacro135 6,9,7,5    ; call
+lbl654 .stressmacro50 0,9,1    ; call
+lbl865 .stressmacro132 3,0,8    ; call
+lbl830 .stressmacro49 2    ; call
+lbl707 .stressmacro9 8,0,4,3    ; call
+lbl683 .stressmacro120 4,4,4,7    ; call
+lbl130 .stressmacro28 7,7,1    ; call
+lbl830 .stressmacro29    ; call
+lbl235 .stressmacro171 8,3    ; call
+lbl195 .stressmacro27 6,8    ; call
+lbl905 .stressmacro63 5,6,4    ; call
+lbl712 .stressmacro178    ; call
+lbl750 .stressmacro44 1    ; call
+lbl887 .stressmacro81 2    ; call
+lbl278 .stressmacro157    ; call
+lbl425 .stressmacro115    ; call
+lbl811 .stressmacro94 7,8,9    ; call
+lbl210 .stressmacro135 8,7,1,9    ; call
+lbl299 .stressmacro15 2,0,4    ; call
+lbl575 .stressmacro60    ; call
+lbl677 .stressmacro28 5,2,7    ; call
+lbl253 .stressmacro47 1,1    ; call
+lbl976 .stressmacro144 6,6    ; call
+lbl667 .stressmacro38 9    ; call
+lbl646 .stressmacro104 3,4    ; call
+lbl892 .stressmacro21 3,8    ; call
+lbl360 .stressmacro175 0    ; call
+lbl175 .stressmacro71 4,6,6    ; call
+lbl625 .stressmacro182 9    ; call
+lbl231 .stressmacro170 1,8,3,2    ; call
+lbl608 .stressmacro170 1,8,7,5    ; call
+lbl216 .stressmacro79 4,3    ; call
+lbl66 .stressmacro138 1,8    ; call
+lbl737 .stressmacro41 1    ; call
+lbl778 .stressmacro46    ; call
+lbl267 .stressmacro17 0    ; call
+lbl263 .stressmacro117 3    ; call
+lbl754 .stressmacro66 3    ; call
+lbl727 .stressmacro78    ; call
+lbl695 .stressmacro133 5,3,7    ; call
+lbl641 .stressmacro148 9    ; call
+lbl534 .stressmacro123    ; call
+lbl607 .stressmacro183 5    ; call
+lbl434 .stressmacro91 3,5    ; call
+lbl499 .stressmacro193 3,1,4    ; call
+lbl44 .stressmacro77    ; call
+lbl70 .stressmacro196 3    ; call
+lbl461 .stressmacro58 7,0    ; call
+lbl518 .stressmacro168 3    ; call
+lbl605 .stressmacro37 2,0,2    ; call
+lbl607 .stressmacro155 8,8    ; call
+lbl771 .stressmacro197 7,4,5,0    ; call
+lbl842 .stressmacro120 7,2,3,2    ; call
+lbl370 .stressmacro37 7,3,0    ; call
+lbl747 .stressmacro18 2,4,3,9    ; call
+lbl640 .stressmacro44 6    ; call
+lbl550 .stressmacro64 7,6    ; call
+lbl640 .stressmacro82 8,8,4,4    ; call
+lbl916 .stressmacro140 3,4,4,3    ; call
+lbl181 .stressmacro185 1    ; call
+lbl881 .stressmacro82 3,3,7,6    ; call
+lbl104 .stressmacro61 0,5,2    ; call
+lbl2 .stressmacro8    ; call
+lbl904 .stressmacro98    ; call
+lbl385 .stressmacro147 3    ; call
+lbl257 .stressmacro193 6,9,3    ; call
+lbl105 .stressmacro7 4,9,7    ; call
+lbl318 .stressmacro156 7    ; call
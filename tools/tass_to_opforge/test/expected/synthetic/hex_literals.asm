@@ -0,0 +1,601 @@
+; dense hex literals
+            .word   6C50H,0EE32H,0B39H,0FA61H,0BAFAH,08666H,0C10H,0B891H,0081FH,0A2DEH,343BH,0F2CEH,5048H,0ED2CH,019E5H
+            LXI     H,(0BF4EH >> 8)|(1 << 6)
+hex0 =    165AH
+            .word   230,4BB3H,0CB2FH,7336H,88,183,03C14H,8400H,0959FH,6EE6H,211,0BBF8H,238,173
+            LXI     H,(06F58H >> 8)|(1 << 0)
+hex1 =    4C23H
+            .word   0FFFDH,2481H,14F3H,237,9FFBH,0DBC4H
+            LXI     H,(0DC7DH >> 8)|(1 << 2)
+hex2 =    931CH
+            .word   27AH,0FB4EH,193,106,050B4H,0B1E6H,1C2FH,0CD94H,0391EH,60,0A01EH,0F71AH,0C105H
+            LXI     H,(08C39H >> 8)|(1 << 7)
+hex3 =    6D2CH
+            .word   0FF47H,030A8H,0F2BBH,37FBH,4FF2H,214
+            LXI     H,(0FA45H >> 8)|(1 << 7)
+hex4 =    0A5A9H
+            .word   0DEC4H,78BBH,0E0FCH,00681H,44,0D3C3H,1CB2H,0C7F8H,9CF2H,56D2H,0B1FFH,8A8EH,03DEFH
+            LXI     H,(01104H >> 8)|(1 << 1)
+hex5 =    0D5B5H
+            .word   1,4040H,174,7A66H,34,3E1AH,1FC9H,89,2717H,02A59H,8127H
+            LXI     H,(0C989H >> 8)|(1 << 5)
+hex6 =    1103H
+            .word   09305H,016C0H,71,03DCFH,204,93F6H,177,0C8E2H
+            LXI     H,(0291BH >> 8)|(1 << 1)
+hex7 =    31A7H
+            .word   0ECCDH,95CEH,0E115H,4DEDH,0E2B1H,0FC1EH,8DCDH,0FF0FH,0A9A2H,116,0B487H,0EEB7H
+            LXI     H,(04ABDH >> 8)|(1 << 0)
+hex8 =    99D8H
+            .word   196,143,073DFH,07D4BH,0D8C4H,231,9949H,5FF2H,396DH,0A86BH,9B86H,212,09AE1H
+            LXI     H,(0F534H >> 8)|(1 << 2)
+hex9 =    0BA81H
+            .word   7BA9H,9BF2H,71,0E224H,3AA1H,017DAH,8896H,049E8H,0C615H,8006H,0B0ECH,4029H,238,00D3FH,97
+            LXI     H,(02BC8H >> 8)|(1 << 4)
+hex10 =    3DAAH
+            .word   5551H,0B7D6H,0AC00H,258BH,0B385H,04999H,0D045H,39,2555H,68,27DAH,15,0DE71H
+            LXI     H,(04204H >> 8)|(1 << 2)
+hex11 =    596BH
+            .word   4000H,0DA15H,716DH,9477H,5855H,0FF57H,3,32,9D53H,892FH,55D1H,251,076A6H,22
+            LXI     H,(039AFH >> 8)|(1 << 3)
+hex12 =    0D893H
+            .word   4812H,216,04DC9H,63,0D753H,2459H,0ED83H
+            LXI     H,(0218BH >> 8)|(1 << 2)
+hex13 =    0F976H
+            .word   2717H,7B86H,54F0H,5FEH,0EFE7H
+            LXI     H,(0136FH >> 8)|(1 << 5)
+hex14 =    0F9D7H
+            .word   8A0CH,75C2H,09A72H,4749H,0C207H,74F1H,04ED9H,167
+            LXI     H,(01163H >> 8)|(1 << 5)
+hex15 =    0F709H
+            .word   0CA3FH,139,214,9CA4H,9166H,79CEH,0F464H,0B38AH,0DB77H,114,0F3A5H,08D19H,05421H,1FEFH,5A02H
+            LXI     H,(02C36H >> 8)|(1 << 5)
+hex16 =    6144H
+            .word   8897H,01CA4H,588FH,0EB20H,03F6EH,910EH,111,0FD76H,0BCD9H,169,0B42FH,0A146H,171,236,0AA3CH,221
+            LXI     H,(089F1H >> 8)|(1 << 7)
+hex17 =    0BDE6H
+            .word   02661H,167,0EBA1H,74B2H,119,0BBC2H,76C4H,0AEFDH,94E4H,0F52FH
+            LXI     H,(04711H >> 8)|(1 << 4)
+hex18 =    8264H
+            .word   2A08H,75C3H,69,37,0A8A7H,0ED72H,98,247,8297H,1FA5H,231,0A241H,950H,0DBCDH,74CAH,938CH
+            LXI     H,(0B54AH >> 8)|(1 << 0)
+hex19 =    5E5FH
+            .word   204,4764H,12FCH,03788H,74,512H,10,85D4H,0ED6FH,68
+            LXI     H,(03159H >> 8)|(1 << 4)
+hex20 =    0BA3BH
+            .word   0B7BFH,183,46D4H,9,194CH,6DCFH,8D18H,0F600H
+            LXI     H,(039BDH >> 8)|(1 << 2)
+hex21 =    8B8FH
+            .word   39,18CCH,8DA4H,62,7AB3H,50B4H,691CH
+            LXI     H,(0E050H >> 8)|(1 << 6)
+hex22 =    125AH
+            .word   73C9H,1882H,154,05315H,246,0B424H,153,0709AH,2143H,1955H,007EFH,25CCH,127H
+            LXI     H,(06432H >> 8)|(1 << 1)
+hex23 =    3444H
+            .word   40BFH,46D0H,5EFBH,9E89H,687BH,3CB2H,0BBBEH,081B7H,1292H,86,0AB73H,0C3A3H,8232H
+            LXI     H,(0A52EH >> 8)|(1 << 1)
+hex24 =    6A6FH
+            .word   09E5FH,78D5H,239,8D5DH,51C0H,01972H,3381H,5FADH,14,99B1H,251,149,70,0B40BH
+            LXI     H,(0A02CH >> 8)|(1 << 6)
+hex25 =    0FF77H
+            .word   203,0D66EH,0DBEBH,0C8ADH,10,002F2H,7D53H
+            LXI     H,(0B187H >> 8)|(1 << 2)
+hex26 =    0CC26H
+            .word   7B70H,960CH,0C95CH,0FD9BH,1561H,152,0F3E7H,0127EH
+            LXI     H,(0FF93H >> 8)|(1 << 1)
+hex27 =    564FH
+            .word   0F9FCH,5C19H,32B1H,45FEH,0EC1DH,05107H,9E36H,0BE05H,0CEEDH,3889H,37F7H,0F70AH,216,6CF4H,0FC28H
+            LXI     H,(03A04H >> 8)|(1 << 7)
+hex28 =    0A1C8H
+            .word   8C66H,6D8EH,0EFC2H,36,0E325H,59,2D2CH
+            LXI     H,(0DC96H >> 8)|(1 << 6)
+hex29 =    3008H
+            .word   028F9H,0323FH,06952H,0BF67H,206,05933H,0D44CH,0F156H,0FC37H,6804H,0CA3H,6550H,0A53DH,1001H
+            LXI     H,(0CA74H >> 8)|(1 << 7)
+hex30 =    0FF9DH
+            .word   0E37BH,0CD4CH,04617H,58F5H,656H,55,0C16AH,01ABEH,0AD16H,0FC53H,59B5H,0DAC1H,105,04F44H,7F03H
+            LXI     H,(061A5H >> 8)|(1 << 7)
+hex31 =    5445H
+            .word   114,0E292H,7E41H,11D9H,0BECH,837DH,68A3H,0E2F8H,0A155H,55,0CB0DH,0E1AFH,0CFE0H,80A6H
+            LXI     H,(0FF56H >> 8)|(1 << 6)
+hex32 =    8EB2H
+            .word   0A5D0H,0B897H,029B1H,934CH,0B7F7H,25DEH,0AAFBH,237,2302H
+            LXI     H,(0C6ADH >> 8)|(1 << 1)
+hex33 =    0A491H
+            .word   0C1D9H,8578H,0B7CDH,0EC20H,0B381H,47E8H,5CC3H,560CH,024CFH,0A640H,0B73FH,7054H,237,7E1BH
+            LXI     H,(07FAEH >> 8)|(1 << 2)
+hex34 =    5933H
+            .word   0E479H,0C71FH,103,67,148,47C1H,103
+            LXI     H,(0965FH >> 8)|(1 << 7)
+hex35 =    0F8BBH
+            .word   0B753H,16CCH,0C7C4H,819CH,2DBCH,66F0H,157,5F75H
+            LXI     H,(064ABH >> 8)|(1 << 3)
+hex36 =    66FEH
+            .word   109,134,3750H,0BCD1H,54,9B1H,9179H,105,0B1E6H,115,0F156H,0AF13H,109,57B0H,322AH
+            LXI     H,(041A2H >> 8)|(1 << 2)
+hex37 =    0585H
+            .word   0BC94H,0F6D8H,156,0EC27H,148,5344H,24,49,0F23BH,149,5,02E94H,0D079H
+            LXI     H,(044DEH >> 8)|(1 << 3)
+hex38 =    8252H
+            .word   6D23H,0DADAH,0D062H,0DDAFH,36F6H,0CB4FH,156,3095H
+            LXI     H,(0DD98H >> 8)|(1 << 5)
+hex39 =    4C41H
+            .word   0BE20H,0F0B3H,913CH,68,30,233,0AB29H,5FA4H,1F4EH,0C697H
+            LXI     H,(0584BH >> 8)|(1 << 6)
+hex40 =    0C7E3H
+            .word   191,7248H,63BAH,11E8H,0019DH,633H,218,4E95H,0B49BH,0E2FAH,65DCH
+            LXI     H,(0E5E9H >> 8)|(1 << 7)
+hex41 =    98C0H
+            .word   05496H,0A7F6H,03268H,9BCH,0C27AH,965AH,2279H,4E54H,0CB51H,0E923H,0B2BBH,0FBABH,23
+            LXI     H,(0E26CH >> 8)|(1 << 6)
+hex42 =    0C2C7H
+            .word   5BEBH,0F481H,414BH,202,03E1EH,172,0EFCAH,0C94H,150,143,0CBA3H,45ECH,183,40DH,0E88AH
+            LXI     H,(0986FH >> 8)|(1 << 5)
+hex43 =    0B410H
+            .word   0C74EH,0FB9EH,7169H,5614H,00FC1H,0D301H,132,826H,0BC95H,7BC7H,06F1DH,52CEH,108,255,118
+            LXI     H,(0B030H >> 8)|(1 << 1)
+hex44 =    0B977H
+            .word   0ED8FH,252,9F5H,0D59DH,0F1C9H,08408H,7C21H,0ADBFH,9AF0H,45,0AFE4H,07FF4H,118,1059H,70,072C9H
+            LXI     H,(0884FH >> 8)|(1 << 6)
+hex45 =    516CH
+            .word   182,76,0B200H,5FBH,0AA50H,14B1H,1761H,448CH
+            LXI     H,(00B2EH >> 8)|(1 << 5)
+hex46 =    0D311H
+            .word   0E0B9H,7BF2H,32DBH,0FBE5H,01ADDH
+            LXI     H,(08791H >> 8)|(1 << 3)
+hex47 =    55E9H
+            .word   7795H,6B31H,48,0937FH,0A2CFH,65AEH,447FH,515DH,0AE5H
+            LXI     H,(0F24AH >> 8)|(1 << 4)
+hex48 =    0370H
+            .word   88A9H,1B88H,204,2857H,0B3C5H,02C1AH,0C0C3H,6618H
+            LXI     H,(054E3H >> 8)|(1 << 2)
+hex49 =    0B7ADH
+            .word   0B0A3H,8EDCH,0F5F5H,9CFBH,4BB1H
+            LXI     H,(0948FH >> 8)|(1 << 0)
+hex50 =    4448H
+            .word   0ED33H,0BA0AH,3869H,1D1BH,4607H,45E5H,168
+            LXI     H,(0E4CAH >> 8)|(1 << 5)
+hex51 =    0F8E8H
+            .word   8523H,1F9EH,8EB1H,0FC29H,0C5BEH,27A3H,0C0FAH,188,69FDH,138EH,085C8H,0BCB8H,088BDH,80E3H,143
+            LXI     H,(0FD71H >> 8)|(1 << 2)
+hex52 =    6D43H
+            .word   03DBDH,0E2A8H,0A8E1H,0D310H,5E84H,54,0DB65H,2383H,173,0A8A0H,81,0BBB1H,0DFE1H,03DBDH,581DH
+            LXI     H,(0AFF0H >> 8)|(1 << 4)
+hex53 =    39FBH
+            .word   7AACH,4,727BH,6765H,062F4H,0BE1H,8E7H,9B89H,0E401H
+            LXI     H,(07D8FH >> 8)|(1 << 2)
+hex54 =    0D78AH
+            .word   184,96D8H,0136AH,007D2H,0CBBBH,087C0H,395BH,2EF0H,025ECH
+            LXI     H,(09CFCH >> 8)|(1 << 1)
+hex55 =    2392H
+            .word   0D5F9H,181,0FBC2H,2CF9H,0A975H,2E8AH,193,0F1D9H,0F281H,92DBH,0A158H,220DH,67B5H,02731H,870DH
+            LXI     H,(0465EH >> 8)|(1 << 0)
+hex56 =    97AFH
+            .word   3831H,0C255H,0B623H,04A83H,0E3C4H,29
+            LXI     H,(06BE6H >> 8)|(1 << 7)
+hex57 =    6E33H
+            .word   66,101,8577H,171,7,0E378H,916H,0E24DH,09D02H,43,06489H
+            LXI     H,(0970AH >> 8)|(1 << 3)
+hex58 =    0EB98H
+            .word   36A8H,0A8D5H,165,0AB8FH,013FDH,204,910AH,1EBEH,678CH,987CH,92CCH,97BAH,0DF38H,163
+            LXI     H,(09608H >> 8)|(1 << 2)
+hex59 =    7E44H
+            .word   7843H,01340H,9BAAH,164,5CBCH,50F4H,33D4H,3B79H,937H,2E95H,248,2F9DH,169,7B80H,0EC18H,0D8CCH
+            LXI     H,(0D346H >> 8)|(1 << 6)
+hex60 =    0E0BEH
+            .word   970FH,0CCCFH,4C03H,240,712H,184,39,94CCH,145,8ABAH,38FH,0F3FDH
+            LXI     H,(043EFH >> 8)|(1 << 0)
+hex61 =    4AF8H
+            .word   92BBH,0B706H,0D278H,0ABD1H,0DBD7H
+            LXI     H,(00CC8H >> 8)|(1 << 2)
+hex62 =    0F7F8H
+            .word   238,06CC4H,10DH,8DA1H,9E52H,141,41,0C071H,65FEH,0BE95H,196AH,74A0H
+            LXI     H,(0EEC1H >> 8)|(1 << 2)
+hex63 =    2A26H
+            .word   08DB9H,3C78H,0F16AH,9735H,114,0CBF7H,5625H,0E50H,1A28H,0F0A8H,90,2788H
+            LXI     H,(0F052H >> 8)|(1 << 1)
+hex64 =    6D78H
+            .word   0EF17H,0DEE2H,8FF5H,71CAH,852CH,0FCEBH,9718H
+            LXI     H,(0F5FBH >> 8)|(1 << 2)
+hex65 =    83E2H
+            .word   73A5H,231,4193H,0AED0H,425CH,246
+            LXI     H,(02FD2H >> 8)|(1 << 6)
+hex66 =    0D58FH
+            .word   5,44,02E05H,0EA58H
+            LXI     H,(0ADA5H >> 8)|(1 << 7)
+hex67 =    0FC2DH
+            .word   01BB2H,85C8H,926CH,23,0E178H,03DC2H
+            LXI     H,(07125H >> 8)|(1 << 3)
+hex68 =    0993H
+            .word   9A46H,08965H,3F53H,54D3H,0CCC5H,7460H,498FH,0DBB6H,0B6E6H,0EEF2H,641FH,018C3H
+            LXI     H,(062CFH >> 8)|(1 << 1)
+hex69 =    05F4H
+            .word   149,1750H,0CF36H,2623H,871EH,846AH,17CH,0CAD4H
+            LXI     H,(01EABH >> 8)|(1 << 7)
+hex70 =    4797H
+            .word   78,0A989H,145,04D50H,99,2,6BCAH,206,3569H,319FH,41,0FC69H,0DD5CH,99,0C829H,887EH
+            LXI     H,(05161H >> 8)|(1 << 1)
+hex71 =    0AB36H
+            .word   165,0AF3CH,45DH,3623H,78,52,83,165,011F1H
+            LXI     H,(0D3E4H >> 8)|(1 << 6)
+hex72 =    296AH
+            .word   01E70H,0C20H,02DF5H,09FCAH,74,3EB2H,360FH,979AH
+            LXI     H,(0F512H >> 8)|(1 << 1)
+hex73 =    4944H
+            .word   58E1H,0F466H,0CE3CH,4ED9H,45,248,0AA68H,6A5CH,372FH
+            LXI     H,(0C6C6H >> 8)|(1 << 6)
+hex74 =    55D6H
+            .word   99,0F154H,397H,7DB5H,0E087H,0250CH
+            LXI     H,(0C00FH >> 8)|(1 << 6)
+hex75 =    0ED99H
+            .word   61D7H,9D98H,158,0A92BH,3D4DH,7731H,8085H,0C00DH,22,0AD65H,8D7AH,0C2A3H,00B74H,0BBEAH
+            LXI     H,(02BFEH >> 8)|(1 << 4)
+hex76 =    94CAH
+            .word   208,0BABCH,0E4E4H,194EH,249,51
+            LXI     H,(0E97AH >> 8)|(1 << 6)
+hex77 =    30D1H
+            .word   0E7EDH,5DEDH,1B2DH,0FC77H,2C11H
+            LXI     H,(06C92H >> 8)|(1 << 1)
+hex78 =    5DF1H
+            .word   0B85BH,1B6CH,4E2BH,054E4H,0A9B9H,229,0A2EBH
+            LXI     H,(0DFB2H >> 8)|(1 << 0)
+hex79 =    8508H
+            .word   3A9FH,092C6H,1FACH,37AH,0E3D4H,3F0FH,0C090H,697AH,8785H,0FFE0H,7E66H,6625H,0D83FH,32FCH
+            LXI     H,(04A84H >> 8)|(1 << 1)
+hex80 =    170CH
+            .word   00F0CH,200FH,0A64AH,0CBBFH,0E635H,0F663H,13,0A665H
+            LXI     H,(0BEECH >> 8)|(1 << 7)
+hex81 =    0E14H
+            .word   215BH,47DBH,103,02294H,0E8FCH,0E421H,124DH,192,16,03DFEH,39B6H,0AD99H,99A1H,232,0B42CH
+            LXI     H,(0E83BH >> 8)|(1 << 0)
+hex82 =    1980H
+            .word   148EH,0B439H,0BB83H,55D8H
+            LXI     H,(0EBF0H >> 8)|(1 << 1)
+hex83 =    02CEH
+            .word   55,0B514H,103,066D7H,3790H
+            LXI     H,(0D7A8H >> 8)|(1 << 5)
+hex84 =    0C9A4H
+            .word   0C60BH,0DB40H,0BAC1H,9A08H,0C425H,17FFH,5D92H,098C7H,62,10,023E2H
+            LXI     H,(0273BH >> 8)|(1 << 5)
+hex85 =    0F912H
+            .word   0DCDCH,0CC8CH,0A030H,4862H,4140H,8860H,770DH,0D795H,148,0CEB6H,49D1H
+            LXI     H,(0638CH >> 8)|(1 << 5)
+hex86 =    621DH
+            .word   212H,34,076CAH,33C3H,231,2EDFH,0DAC3H,0F23BH,2BFEH,37A7H,0A593H,0E3F1H,0BB18H
+            LXI     H,(07916H >> 8)|(1 << 3)
+hex87 =    0A05EH
+            .word   047CEH,5829H,0A881H,98B5H,08C1BH,0FFF9H,0F61AH,0EA81H,255,0B3EDH,1480H,3F9BH,0450AH
+            LXI     H,(00DA3H >> 8)|(1 << 7)
+hex88 =    85CCH
+            .word   0A909H,13,8B5FH,0DDC5H,170,405FH,0286BH,300EH,2341H,6BD2H,5D0EH
+            LXI     H,(0C22CH >> 8)|(1 << 4)
+hex89 =    9BB1H
+            .word   0FCB1H,8748H,192,0EED7H,5DAFH,0CCE3H,0D95BH,2F55H,0CDDAH,0EF0FH,122,59A0H,72C7H,7E9DH
+            LXI     H,(0F8EDH >> 8)|(1 << 3)
+hex90 =    7B0FH
+            .word   827AH,634H,6662H,4C66H,5DACH
+            LXI     H,(01D85H >> 8)|(1 << 0)
+hex91 =    97A5H
+            .word   0D4DBH,81AAH,411EH,0D375H,04707H,0BCC2H,3D6EH,0117FH,2B7EH,0D136H,0DEC7H,0F043H
+            LXI     H,(0DB7FH >> 8)|(1 << 2)
+hex92 =    2939H
+            .word   0B2CFH,0DFBCH,5B15H,78C2H,0CB40H,0BC0AH,03A7FH
+            LXI     H,(05E97H >> 8)|(1 << 0)
+hex93 =    8BBFH
+            .word   0E9D4H,042A7H,17AH,04BC8H,837AH,9DFAH,86CCH
+            LXI     H,(00CF6H >> 8)|(1 << 3)
+hex94 =    7D7EH
+            .word   8911H,10,166,642DH,22,36ACH,1E3EH,56,0E84BH,43CEH,150,165,7A9EH
+            LXI     H,(0C07AH >> 8)|(1 << 2)
+hex95 =    0A0CBH
+            .word   0CA22H,0C544H,7A38H,0B29CH,140,0D483H,14AEH,107,56DH
+            LXI     H,(01EE0H >> 8)|(1 << 2)
+hex96 =    0AE00H
+            .word   3943H,68DFH,2F52H,0B149H,0C26BH
+            LXI     H,(01896H >> 8)|(1 << 5)
+hex97 =    1B62H
+            .word   9055H,28B0H,0FB86H,76D9H,053F6H
+            LXI     H,(047E7H >> 8)|(1 << 6)
+hex98 =    0AC90H
+            .word   88D5H,0D2ABH,7D03H,0AB65H
+            LXI     H,(0AFF9H >> 8)|(1 << 2)
+hex99 =    0A2E4H
+            .word   36F2H,2727H,52,188,0E6BCH
+            LXI     H,(0E7CFH >> 8)|(1 << 4)
+hex100 =    0DEFH
+            .word   0EC49H,247,077F6H,0FB8AH,130,241,149,90B0H,13C6H,04562H,150
+            LXI     H,(08BBCH >> 8)|(1 << 1)
+hex101 =    0F8BAH
+            .word   04791H,0BA34H,0F88H,36E8H,5BA5H,43,77C5H,0ED66H,0EF38H
+            LXI     H,(06B53H >> 8)|(1 << 4)
+hex102 =    0B75FH
+            .word   1BE2H,0BC9BH,37DBH,0BC13H,49E3H,7D1BH,78,200,0B621H,9F9CH,8113H,0B932H,790CH
+            LXI     H,(075D2H >> 8)|(1 << 3)
+hex103 =    974FH
+            .word   8463H,218,143,0C75FH,23C8H,70,7CADH
+            LXI     H,(06FC2H >> 8)|(1 << 0)
+hex104 =    1673H
+            .word   7FA5H,238,4193H,732FH,750BH,231,0D1E9H,8996H,162
+            LXI     H,(018CAH >> 8)|(1 << 2)
+hex105 =    0B98EH
+            .word   9A88H,2768H,410DH,5F89H,0E90CH,0BAE7H,151,025B9H,43A1H,13,4158H,0C67BH
+            LXI     H,(0C9D8H >> 8)|(1 << 3)
+hex106 =    1E3BH
+            .word   0EED9H,6533H,0083BH,029CDH,5559H,14,0B614H,602H,42FBH,0CF17H,89AAH,228,1C10H,0F1DBH,0D397H
+            LXI     H,(0E265H >> 8)|(1 << 6)
+hex107 =    1BB7H
+            .word   136,661EH,083C4H,733EH
+            LXI     H,(01232H >> 8)|(1 << 3)
+hex108 =    3253H
+            .word   0EDA8H,1C4CH,199,0D719H,1E6EH,0CDA7H,3CA8H,1BB3H,0A51EH,0A9F2H,62A8H
+            LXI     H,(0169CH >> 8)|(1 << 4)
+hex109 =    9373H
+            .word   0FF27H,23,09DBFH,444DH,1C48H,033A9H,892EH,0D995H
+            LXI     H,(04322H >> 8)|(1 << 5)
+hex110 =    0D3F4H
+            .word   1917H,1B3BH,26B9H,151FH,8947H,0EC19H
+            LXI     H,(0CE45H >> 8)|(1 << 3)
+hex111 =    1F74H
+            .word   245,734AH,5926H,0D984H,142,0B00BH,06AD8H,0605EH,0AE13H
+            LXI     H,(0D6EFH >> 8)|(1 << 6)
+hex112 =    5228H
+            .word   56,0ECE9H,2FFAH,0B7E1H,64EBH,193BH,3E72H,5954H,04E03H,3A9CH,0EE00H
+            LXI     H,(0119AH >> 8)|(1 << 0)
+hex113 =    0C54FH
+            .word   0CBC2H,252,0D959H,229,7E1EH,5942H,701FH,0BE9CH,70E8H,0D736H,7BDAH,176,0E12DH,32
+            LXI     H,(0C1D7H >> 8)|(1 << 3)
+hex114 =    0ACEAH
+            .word   06AB4H,0A5B9H,0DCD9H,71,1B51H,0AC5DH,021B3H,8,347FH,1781H,94C5H,02A84H
+            LXI     H,(0CCF2H >> 8)|(1 << 7)
+hex115 =    43BDH
+            .word   93,06816H,0E603H,219,150,0A4BFH,03B3CH,0FBAH,0B00CH
+            LXI     H,(0B3EAH >> 8)|(1 << 5)
+hex116 =    3DD4H
+            .word   6FCAH,209,714DH,0E5BDH,5A43H,214,25B5H,0C2E3H,09D55H,695FH,6150H,197,06C36H,0FD02H,8A5CH,0B9ADH
+            LXI     H,(09DF6H >> 8)|(1 << 1)
+hex117 =    9CE9H
+            .word   0F627H,0F335H,194,0E260H,1D79H,07BC3H,0D0A3H,1DAEH,6941H,8588H,0F3BBH,16DDH,30D7H,92,0E1D4H
+            LXI     H,(09934H >> 8)|(1 << 5)
+hex118 =    0C71DH
+            .word   1F5CH,7A08H,242,22DDH,60FFH,939FH,31E5H,0775CH,81FH,7A2AH,2
+            LXI     H,(0F8C6H >> 8)|(1 << 2)
+hex119 =    7374H
+            .word   241,097DEH,01475H,0EB98H,0CD4FH
+            LXI     H,(0F023H >> 8)|(1 << 1)
+hex120 =    6D5FH
+            .word   6B0CH,1334H,125,0DE0AH,0B843H,2933H,084D6H,0FDA6H,55,081C5H,198H,07238H,49E2H
+            LXI     H,(0290AH >> 8)|(1 << 3)
+hex121 =    0AE34H
+            .word   0E069H,2804H,03ACBH,16,3AA5H,0F7FEH,0B0F3H,0B6DCH,8B3EH,9E2CH,02295H,063E4H,0F064H,90F8H,3E48H
+            LXI     H,(07BF0H >> 8)|(1 << 0)
+hex122 =    5158H
+            .word   1F3EH,86DAH,0DB17H,0F6C9H,056AAH,0DD4EH,04E91H,0F26CH
+            LXI     H,(07725H >> 8)|(1 << 5)
+hex123 =    3E3DH
+            .word   182,05A34H,141,9B2BH,2109H,2492H
+            LXI     H,(01AF0H >> 8)|(1 << 5)
+hex124 =    8AC4H
+            .word   0CECCH,2BE7H,0EA00H,01B1DH,72CH,215,0BB7H,006E3H,0DBFCH,7260H,013EAH,0C1D0H,95
+            LXI     H,(04DD1H >> 8)|(1 << 5)
+hex125 =    0C211H
+            .word   78A3H,0DA9FH,3B36H,0EF63H,9729H,15,8A8BH,0B9AEH,163,0F017H
+            LXI     H,(0BCD6H >> 8)|(1 << 5)
+hex126 =    0A6C5H
+            .word   0C88DH,0E68BH,7941H,1ACBH,4B16H,237,0F611H,0AF62H
+            LXI     H,(09BEEH >> 8)|(1 << 6)
+hex127 =    8579H
+            .word   169,0DCE6H,0AB86H,51BAH,177,0ED90H,0A82DH,0BD4CH,0EE13H,9853H,0EA80H,250H,3C26H,7E17H
+            LXI     H,(0EA6EH >> 8)|(1 << 3)
+hex128 =    0F3AFH
+            .word   0FA2EH,0B570H,7D30H,5A47H,15BDH,196,6162H,998DH,00C3FH
+            LXI     H,(03D22H >> 8)|(1 << 4)
+hex129 =    06D5H
+            .word   066E0H,80,0A31H,0F49AH
+            LXI     H,(07B34H >> 8)|(1 << 1)
+hex130 =    4963H
+            .word   926BH,0E14CH,4BA5H,998CH,61A4H,502BH,0D551H,08A91H,73C7H,0BB96H,5F92H
+            LXI     H,(086B6H >> 8)|(1 << 3)
+hex131 =    0C0A4H
+            .word   3182H,19,8B71H,0E66AH,12BCH,0CB0FH,0856EH,0BBD8H,0FB5DH,102,0DFAFH,608CH,192,0EFCEH,0C30DH
+            LXI     H,(07EDEH >> 8)|(1 << 4)
+hex132 =    1858H
+            .word   08115H,302BH,0BC89H,0A731H,03537H,3FFCH,1BD3H,0A83DH,17,04E34H,0DDB7H,73,063B7H,0ACC6H,9980H
+            LXI     H,(003BBH >> 8)|(1 << 4)
+hex133 =    005DH
+            .word   166,3304H,67,0C1FAH,00344H,392H,6048H,2A2CH,05F3AH,81B3H,9F9BH,0C639H,05392H,0A197H
+            LXI     H,(0C249H >> 8)|(1 << 4)
+hex134 =    47CEH
+            .word   0C06H,88B8H,02755H,0D8BDH,0CE60H,0,22C4H,7236H,0A0FAH,0AADAH
+            LXI     H,(0FFC5H >> 8)|(1 << 0)
+hex135 =    0EE56H
+            .word   2C0AH,929FH,0EADBH,0FBFCH,207,0F195H,4A70H
+            LXI     H,(0092EH >> 8)|(1 << 3)
+hex136 =    0E3BAH
+            .word   159,0E8F9H,0CD1FH,0E18H,7146H
+            LXI     H,(0AAD4H >> 8)|(1 << 6)
+hex137 =    7728H
+            .word   1847H,6F69H,81EFH,02D16H,18F5H,76,0B3A4H,0564AH,61E5H,3109H
+            LXI     H,(0AD76H >> 8)|(1 << 2)
+hex138 =    6868H
+            .word   9C23H,211AH,56DEH,08D87H,75CBH,02F42H,8D2DH,80C5H,10A2H
+            LXI     H,(0EDE3H >> 8)|(1 << 0)
+hex139 =    0E84DH
+            .word   27,57E7H,9984H,8151H,0C93DH,0D155H,4536H,85DAH,133
+            LXI     H,(0F361H >> 8)|(1 << 7)
+hex140 =    7FD6H
+            .word   248,0FAABH,0FA07H,234,3CA5H,73A6H,0B645H,5173H,5687H,4A48H
+            LXI     H,(004EAH >> 8)|(1 << 5)
+hex141 =    8A73H
+            .word   911H,02BD9H,69A9H,0A60H,150,406AH,7975H,049C3H,01ED0H,8EDDH,0D0BCH
+            LXI     H,(08FDFH >> 8)|(1 << 3)
+hex142 =    2908H
+            .word   0CA65H,174,0E28H,180,0A3F7H
+            LXI     H,(0B487H >> 8)|(1 << 4)
+hex143 =    482EH
+            .word   1579H,5994H,83,0E9A0H,7CD0H
+            LXI     H,(0F0EDH >> 8)|(1 << 4)
+hex144 =    0009H
+            .word   99DFH,0A705H,0F645H,0DC0DH,201
+            LXI     H,(02471H >> 8)|(1 << 2)
+hex145 =    40DCH
+            .word   0F02H,0B3DFH,0E7F2H,0BAE8H,9C87H,0BBH,4272H,0E598H,0E57DH,0B48DH,127,33,7AFBH,31FH
+            LXI     H,(08CDCH >> 8)|(1 << 3)
+hex146 =    79BAH
+            .word   227CH,443CH,019C7H,599FH,178,9831H,0EAF4H,8E73H,0019BH,00531H,9B7EH
+            LXI     H,(06405H >> 8)|(1 << 4)
+hex147 =    0BA04H
+            .word   1A39H,29E8H,27CH,8FCEH,04C0CH,331DH,5C3BH,1A74H,94,0509CH,213,4049H,85E5H,152
+            LXI     H,(08351H >> 8)|(1 << 3)
+hex148 =    0B74H
+            .word   4,143,81CFH,9695H,73,24A2H
+            LXI     H,(00E11H >> 8)|(1 << 2)
+hex149 =    8395H
+            .word   0A362H,00350H,206,126,875EH
+            LXI     H,(05BF5H >> 8)|(1 << 4)
+hex150 =    0BBEH
+            .word   0E079H,255,9367H,488H,87,0E238H,08EE1H,0EF3DH,13
+            LXI     H,(04A46H >> 8)|(1 << 0)
+hex151 =    0DB57H
+            .word   1709H,7837H,48C6H,72CFH,7C3AH,0F8C2H,193,09B59H,89,0E18DH,4B59H,0A2E5H,5431H
+            LXI     H,(0399CH >> 8)|(1 << 1)
+hex152 =    0964H
+            .word   163,0B1CEH,01020H,0E4E2H,0E176H,10,95,1AD2H,05407H,34B8H,13,9FE7H,0C1A1H,193,0E7C6H,34A8H
+            LXI     H,(01EBCH >> 8)|(1 << 7)
+hex153 =    2B0DH
+            .word   0C786H,148,0FD13H,06B56H,0FC45H,5760H,476CH,149,00116H,2DBCH,0D8FBH,69,0410EH,242,0C4F8H,66CH
+            LXI     H,(079B1H >> 8)|(1 << 4)
+hex154 =    0F9D2H
+            .word   198,05375H,209,0E07EH,921CH,4F09H,0D444H,78ADH,0F0D3H,170,8EDEH,7C81H
+            LXI     H,(0D638H >> 8)|(1 << 5)
+hex155 =    0F52FH
+            .word   104,21A1H,0EA97H,803DH,04498H
+            LXI     H,(0ED5EH >> 8)|(1 << 2)
+hex156 =    0AA36H
+            .word   235,0D09FH,132,0B9BFH,142H,209,03D74H,218,162,5B11H,0F4E7H,0D85CH,138,0B62EH
+            LXI     H,(03467H >> 8)|(1 << 1)
+hex157 =    824DH
+            .word   0CDE5H,32,4A00H,0226FH,6B93H,52
+            LXI     H,(02CCCH >> 8)|(1 << 3)
+hex158 =    0DF57H
+            .word   6069H,95F4H,09961H,136,77,213,112,662H,2B82H,0F3CEH,9AE0H,76D6H,0FA3CH,0C18AH,0E877H
+            LXI     H,(0E4D9H >> 8)|(1 << 4)
+hex159 =    6EB4H
+            .word   0B020H,21,0B17CH,0D534H,66,170,901FH,0F858H,346AH,5941H,08263H,0B3B0H
+            LXI     H,(04FABH >> 8)|(1 << 3)
+hex160 =    0A56BH
+            .word   3AC3H,0EB74H,75,089B6H,109,0A05BH,0B05BH,4CF5H,140,5E30H,78A8H,8143H,18DDH,8201H,0CC0DH
+            LXI     H,(09E2BH >> 8)|(1 << 2)
+hex161 =    0E1C7H
+            .word   0FAECH,125,87,08329H,7692H,16,271FH,6346H,08652H,0AAF0H
+            LXI     H,(0046DH >> 8)|(1 << 3)
+hex162 =    9303H
+            .word   139,191,0AC09H,0A81CH,222
+            LXI     H,(03598H >> 8)|(1 << 3)
+hex163 =    0D02FH
+            .word   3EA9H,101,848EH,0D86BH,848BH,8316H,8C38H,127BH,9E5DH,4667H,7322H
+            LXI     H,(004D8H >> 8)|(1 << 7)
+hex164 =    2D70H
+            .word   5E27H,2588H,0FBBBH,253,0A696H,026B7H,0C378H,41,07F90H,2E8H,0B34H,34
+            LXI     H,(0A382H >> 8)|(1 << 2)
+hex165 =    0FB27H
+            .word   6ED9H,0D056H,241,232,908EH,5EACH,3302H,255,626AH,9EB7H,0CB99H,89,127
+            LXI     H,(0FC01H >> 8)|(1 << 0)
+hex166 =    3ADEH
+            .word   6864H,3121H,438AH,052CBH,05B45H
+            LXI     H,(0F05CH >> 8)|(1 << 5)
+hex167 =    0DD83H
+            .word   0E35H,4161H,0721AH,829BH,6F12H
+            LXI     H,(0F357H >> 8)|(1 << 2)
+hex168 =    0DBC1H
+            .word   7DEEH,3E82H,890BH,199,0D5E0H,45B0H,0C755H
+            LXI     H,(02A4FH >> 8)|(1 << 1)
+hex169 =    9485H
+            .word   1A83H,85,0DA43H,6948H,0DC3H,1925H,230CH,0C3EEH,01250H,45D4H,4EF4H,2B8FH,0B54CH,19A7H,7D58H
+            LXI     H,(0B15EH >> 8)|(1 << 1)
+hex170 =    5C7BH
+            .word   91,2CF7H,94F1H,73FDH,03FE3H,210CH,10BFH,278AH,236,727CH
+            LXI     H,(0AF02H >> 8)|(1 << 0)
+hex171 =    0F242H
+            .word   0FB78H,0B70BH,7BBFH,0E124H,97,1626H,0FC06H,037BDH,0E5C1H,0DEAFH,0F03FH,4BADH,4
+            LXI     H,(0981BH >> 8)|(1 << 3)
+hex172 =    0BA0FH
+            .word   3CEDH,205,62,5F77H,148,3C9BH,04945H,0501AH,882EH,6A7CH,8092H,0EFD0H,0DD53H,86B4H
+            LXI     H,(06C23H >> 8)|(1 << 3)
+hex173 =    0B2BAH
+            .word   47,9DAFH,05FD5H,3D08H,221,111,7DD7H,11BDH,40,485AH
+            LXI     H,(0F24BH >> 8)|(1 << 2)
+hex174 =    1289H
+            .word   113FH,213EH,8,1E18H,0B8F6H,00D26H,0D3F0H
+            LXI     H,(0B8F7H >> 8)|(1 << 1)
+hex175 =    7A09H
+            .word   0FB6BH,8,0F61DH,98,158,0D2E2H,00C19H,43,5EA7H,114,0007DH,4308H,7EDEH
+            LXI     H,(0DB75H >> 8)|(1 << 3)
+hex176 =    3267H
+            .word   3179H,7855H,118,172,06345H
+            LXI     H,(04EA3H >> 8)|(1 << 4)
+hex177 =    0ED8AH
+            .word   2F7BH,8A3BH,213,9,2E84H,68FH,184,49F0H,01C11H
+            LXI     H,(049C8H >> 8)|(1 << 7)
+hex178 =    13ECH
+            .word   05539H,06E4DH,0D7BEH,07242H,6927H,838H
+            LXI     H,(0604AH >> 8)|(1 << 3)
+hex179 =    35C3H
+            .word   1073H,043C1H,151,218,0EEBBH,2119H,0CD7DH
+            LXI     H,(09F63H >> 8)|(1 << 3)
+hex180 =    0A2F5H
+            .word   29,0CE5H,7533H,0784AH,67B2H,5BB6H
+            LXI     H,(0A92BH >> 8)|(1 << 6)
+hex181 =    0AD52H
+            .word   0F4D9H,0CA0H,89DBH,96CEH,0BE14H,88,71F9H,16D6H,0B7B9H,114,0A1C5H
+            LXI     H,(019FAH >> 8)|(1 << 5)
+hex182 =    61ABH
+            .word   0B498H,0A6DBH,0C0B8H,8EB6H,01059H,0F43FH,3144H,4642H,0C2FFH
+            LXI     H,(01F79H >> 8)|(1 << 6)
+hex183 =    110EH
+            .word   0C5E8H,119,3357H,3ECFH,03786H,03E32H,18
+            LXI     H,(03D4FH >> 8)|(1 << 4)
+hex184 =    7834H
+            .word   0E54CH,464DH,988EH,018B1H,420H,164,0F22BH,28,0FF0CH
+            LXI     H,(00B6BH >> 8)|(1 << 0)
+hex185 =    7FA7H
+            .word   4038H,026EAH,03E10H,1FE2H,6BD5H
+            LXI     H,(09B79H >> 8)|(1 << 0)
+hex186 =    6EC4H
+            .word   219,74BH,0AC5AH,0C89CH,0A24DH,0E372H,0B402H,55,4A37H,8663H,2580H,5FF5H,0ACFEH
+            LXI     H,(0791BH >> 8)|(1 << 6)
+hex187 =    0B62H
+            .word   0FDEH,09CA7H,0E314H,5B7FH,0F294H,43F2H,5E14H,8CA8H,0BEB0H,5BFDH
+            LXI     H,(0FF18H >> 8)|(1 << 1)
+hex188 =    0A072H
+            .word   1BA1H,250,104,51B7H,1231H,109
+            LXI     H,(0059BH >> 8)|(1 << 4)
+hex189 =    0B0CEH
+            .word   0D145H,0B0CEH,215,0ED10H,116,206,6CAAH
+            LXI     H,(05250H >> 8)|(1 << 1)
+hex190 =    1A23H
+            .word   8C7AH,09035H,02B1CH,7396H,0803AH,114,7B98H,8D3CH,0FACDH,7C29H
+            LXI     H,(0B948H >> 8)|(1 << 0)
+hex191 =    0F60CH
+            .word   38A0H,8FDDH,0CF88H,75,48D7H,925AH,0A18CH,0B4E5H,0B58AH,244CH
+            LXI     H,(04B0AH >> 8)|(1 << 3)
+hex192 =    0AA7AH
+            .word   0FF9H,0FE43H,1281H,0AC15H,0EFD9H,0B5F3H,237,09C07H,06A6EH,0BB32H,1548H
+            LXI     H,(0D09DH >> 8)|(1 << 3)
+hex193 =    8B8AH
+            .word   0E937H,4BDFH,149,14F0H,4DD8H,06B25H,228,0ED1BH,26,233,70FCH,6D63H,2BDCH,0D4D3H
+            LXI     H,(053B9H >> 8)|(1 << 1)
+hex194 =    0B22CH
+            .word   06D85H,20F5H,4A3DH,0C6DCH,239,0FD78H,9A6DH,0C90AH,83C9H,35,040BFH,0A50H
+            LXI     H,(0232BH >> 8)|(1 << 5)
+hex195 =    7981H
+            .word   197,0D771H,2236H,29,3806H,60,0A516H,39A7H,127,08F3FH,4B3CH
+            LXI     H,(04225H >> 8)|(1 << 2)
+hex196 =    0E581H
+            .word   0DBA3H,0BC50H,685CH,1AFH,5108H,75BEH,4BC2H,1F73H,0F137H,0B88EH,545BH,06D9AH,193,3FB6H,0334EH
+            LXI     H,(0F4BBH >> 8)|(1 << 3)
+hex197 =    2274H
+            .word   0A222H,9AA4H,004EFH,0E929H,0EE14H,062B6H,0590EH,5B5H,0F7CCH,0C849H,2EC1H,7508H
+            LXI     H,(0EBBBH >> 8)|(1 << 1)
+hex198 =    6C37H
+            .word   231,2A04H,0AEA6H,5,1390H
+            LXI     H,(0F1F7H >> 8)|(1 << 7)
+hex199 =    8810H
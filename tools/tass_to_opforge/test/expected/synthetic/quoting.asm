@@ -0,0 +1,401 @@
+; heavy quoting
+str0 byte   "",'"' ; it's
+; ECHO "msg 0; \"done\""
+str1 byte   205,'q' ; it's
+; ECHO "msg 1; \"done\""
+str2 byte   "","",';',98,'q','"' ; it's
+; ECHO "msg 2; \"done\""
+str3 db   "x\"y;z","(nest)","","\\","\\" ; "quoted; comment"
+; ECHO "msg 3; \"done\""
+str4 db   '"','q'
+; ECHO "msg 4; \"done\""
+str5 byte   "x\"y;z","",'q',"(nest)","\\"
+; ECHO "msg 5; \"done\""
+str6 .byte   "x\"y;z","x\"y;z" ; "quoted; comment"
+; ECHO "msg 6; \"done\""
+str7 byte   109,'"' ; it's
+; ECHO "msg 7; \"done\""
+str8 byte   "\\",80,"a;b","(nest)"
+; ECHO "msg 8; \"done\""
+str9 .byte   "\\",138,"(nest)",'"',';','q','q',"x\"y;z"
+; ECHO "msg 9; \"done\""
+str10 .byte   "x\"y;z","a;b",'q',';',"\\"
+; ECHO "msg 10; \"done\""
+str11 db   "x\"y;z",'"',"x\"y;z","(nest)","x\"y;z","(nest)" ; "quoted; comment"
+; ECHO "msg 11; \"done\""
+str12 db   "a;b",'"',"(nest)","(nest)","x\"y;z",187
+; ECHO "msg 12; \"done\""
+str13 byte   '"',12,"a;b",';',';',"(nest)","x\"y;z",';' ; "quoted; comment"
+; ECHO "msg 13; \"done\""
+str14 .byte   "x\"y;z",'"',"a;b","x\"y;z",';',';',"(nest)",'q',';',149,'"'
+; ECHO "msg 14; \"done\""
+str15 byte   "x\"y;z","\\","(nest)",'q',"a;b","a;b",'q',"",50,"","","(nest)" ; "quoted; comment"
+; ECHO "msg 15; \"done\""
+str16 byte   "",'q',19,"",14,83,"","\\","",""
+; ECHO "msg 16; \"done\""
+str17 .byte   "x\"y;z","x\"y;z",'q','"' ; it's
+; ECHO "msg 17; \"done\""
+str18 db   ';',"(nest)","x\"y;z" ; it's
+; ECHO "msg 18; \"done\""
+str19 db   '"','"',"(nest)","x\"y;z","a;b",'"','"',"","" ; "quoted; comment"
+; ECHO "msg 19; \"done\""
+str20 byte   '"',"\\","x\"y;z"
+; ECHO "msg 20; \"done\""
+str21 byte   'q',"x\"y;z","(nest)" ; "quoted; comment"
+; ECHO "msg 21; \"done\""
+str22 byte   ';',56,"x\"y;z","(nest)","(nest)","a;b" ; "quoted; comment"
+; ECHO "msg 22; \"done\""
+str23 db   '"',"",129 ; "quoted; comment"
+; ECHO "msg 23; \"done\""
+str24 byte   "","","\\",38,61 ; "quoted; comment"
+; ECHO "msg 24; \"done\""
+str25 db   "","a;b","x\"y;z","x\"y;z","(nest)",'"','q'
+; ECHO "msg 25; \"done\""
+str26 byte   'q','q',"a;b","a;b","","(nest)","(nest)"
+; ECHO "msg 26; \"done\""
+str27 .byte   "a;b","\\",';',';','"',"" ; "quoted; comment"
+; ECHO "msg 27; \"done\""
+str28 byte   "x\"y;z","(nest)","",'q',"" ; it's
+; ECHO "msg 28; \"done\""
+str29 byte   "a;b","","x\"y;z" ; it's
+; ECHO "msg 29; \"done\""
+str30 byte   "\\",';',';',"a;b",';',"x\"y;z" ; it's
+; ECHO "msg 30; \"done\""
+str31 db   "x\"y;z",78,168,52,"a;b","x\"y;z","","x\"y;z",29,"x\"y;z","\\" ; "quoted; comment"
+; ECHO "msg 31; \"done\""
+str32 db   "(nest)","\\","(nest)",';',"x\"y;z",';',110 ; it's
+; ECHO "msg 32; \"done\""
+str33 .byte   '"',"\\","a;b","",';','q',"\\","\\",'"','"',"\\" ; it's
+; ECHO "msg 33; \"done\""
+str34 db   'q','q',"x\"y;z",';',"a;b","x\"y;z","(nest)",'"',"(nest)" ; it's
+; ECHO "msg 34; \"done\""
+str35 byte   38,"x\"y;z",';',"x\"y;z",'"',"(nest)",'q',"x\"y;z","(nest)","\\",';'
+; ECHO "msg 35; \"done\""
+str36 .byte   'q',';',"" ; "quoted; comment"
+; ECHO "msg 36; \"done\""
+str37 byte   "","(nest)","x\"y;z" ; "quoted; comment"
+; ECHO "msg 37; \"done\""
+str38 .byte   "a;b",'q',"a;b",'"' ; it's
+; ECHO "msg 38; \"done\""
+str39 .byte   'q','q','"' ; "quoted; comment"
+; ECHO "msg 39; \"done\""
+str40 byte   "a;b",'q','q' ; "quoted; comment"
+; ECHO "msg 40; \"done\""
+str41 .byte   'q',"(nest)",70,"\\","(nest)",';'
+; ECHO "msg 41; \"done\""
+str42 .byte   '"',';',"\\"
+; ECHO "msg 42; \"done\""
+str43 db   '"',';',"",'"',"(nest)",';',"(nest)","x\"y;z",'"',"a;b",'"' ; it's
+; ECHO "msg 43; \"done\""
+str44 db   ';',"(nest)"
+; ECHO "msg 44; \"done\""
+str45 byte   'q','"',"","" ; it's
+; ECHO "msg 45; \"done\""
+str46 .byte   "\\",';',';',"","(nest)","a;b","(nest)",251,"(nest)",247
+; ECHO "msg 46; \"done\""
+str47 db   "",';',"",';',"\\","",'"',';' ; it's
+; ECHO "msg 47; \"done\""
+str48 db   '"',"\\" ; it's
+; ECHO "msg 48; \"done\""
+str49 .byte   "",'q'
+; ECHO "msg 49; \"done\""
+str50 .byte   "\\","a;b","x\"y;z",';',248,"a;b","\\","(nest)","",';' ; it's
+; ECHO "msg 50; \"done\""
+str51 .byte   "(nest)","x\"y;z","a;b","\\","(nest)","(nest)","","x\"y;z" ; "quoted; comment"
+; ECHO "msg 51; \"done\""
+str52 db   'q',"a;b","\\","a;b","\\" ; it's
+; ECHO "msg 52; \"done\""
+str53 byte   "","(nest)",185,"","(nest)","\\",'"',';' ; it's
+; ECHO "msg 53; \"done\""
+str54 byte   '"','"',3,"",99,'"',"a;b",'"',"","a;b","x\"y;z",6
+; ECHO "msg 54; \"done\""
+str55 byte   "(nest)",';','"',"\\","a;b","" ; it's
+; ECHO "msg 55; \"done\""
+str56 byte   "\\",241,';','q',"a;b","",';'
+; ECHO "msg 56; \"done\""
+str57 byte   "\\",171,"",'"',"(nest)","a;b","(nest)","a;b","a;b" ; "quoted; comment"
+; ECHO "msg 57; \"done\""
+str58 .byte   "a;b","","\\","","a;b",'q'
+; ECHO "msg 58; \"done\""
+str59 db   "a;b",'q',"a;b","x\"y;z","",'q',"\\","a;b" ; it's
+; ECHO "msg 59; \"done\""
+str60 .byte   "a;b","x\"y;z",';',"\\",'"' ; it's
+; ECHO "msg 60; \"done\""
+str61 db   "\\",156,"",';',"a;b","a;b","(nest)",'q','q','"' ; "quoted; comment"
+; ECHO "msg 61; \"done\""
+str62 byte   "\\","(nest)",'"','"',"\\","x\"y;z","",'"',"\\",212,';',';' ; it's
+; ECHO "msg 62; \"done\""
+str63 .byte   "\\","(nest)","\\",83,"x\"y;z","\\","a;b" ; "quoted; comment"
+; ECHO "msg 63; \"done\""
+str64 .byte   "",'"',"\\","(nest)","",'q',""
+; ECHO "msg 64; \"done\""
+str65 byte   "",'q',"(nest)",'q',';',"\\"
+; ECHO "msg 65; \"done\""
+str66 db   "(nest)","","a;b","x\"y;z",'q',"",13,"\\","a;b","","\\" ; "quoted; comment"
+; ECHO "msg 66; \"done\""
+str67 db   "\\",';',"",""
+; ECHO "msg 67; \"done\""
+str68 db   "a;b","a;b",'"','"',"","(nest)",'"',"",';'
+; ECHO "msg 68; \"done\""
+str69 db   "\\","","a;b" ; "quoted; comment"
+; ECHO "msg 69; \"done\""
+str70 byte   "",'"',"(nest)",15,"(nest)" ; "quoted; comment"
+; ECHO "msg 70; \"done\""
+str71 db   "","\\","\\","","x\"y;z","a;b",';','q',';' ; "quoted; comment"
+; ECHO "msg 71; \"done\""
+str72 byte   ';',"(nest)","\\",'"',"x\"y;z" ; it's
+; ECHO "msg 72; \"done\""
+str73 byte   '"',"x\"y;z","x\"y;z",'q' ; it's
+; ECHO "msg 73; \"done\""
+str74 .byte   'q',"",'"',"a;b","\\","x\"y;z",'"',"x\"y;z","x\"y;z","\\","(nest)"
+; ECHO "msg 74; \"done\""
+str75 byte   "(nest)","\\","(nest)",172,'q',"(nest)",'q',"a;b" ; "quoted; comment"
+; ECHO "msg 75; \"done\""
+str76 byte   'q',"a;b","a;b",';',"\\" ; it's
+; ECHO "msg 76; \"done\""
+str77 byte   "\\",'q',"a;b",';',"x\"y;z",'q',131,"a;b","\\" ; "quoted; comment"
+; ECHO "msg 77; \"done\""
+str78 db   "x\"y;z",'"',';',"a;b",';',"\\","a;b",';',';',"a;b","\\"
+; ECHO "msg 78; \"done\""
+str79 .byte   "(nest)",235,'"',"x\"y;z",';' ; it's
+; ECHO "msg 79; \"done\""
+str80 .byte   "\\","x\"y;z","","a;b","\\"
+; ECHO "msg 80; \"done\""
+str81 byte   ';',"\\",';',"a;b","\\",'q',"(nest)",';' ; it's
+; ECHO "msg 81; \"done\""
+str82 db   "\\","\\",'"',"","(nest)","x\"y;z",'q','q',"\\","",';' ; "quoted; comment"
+; ECHO "msg 82; \"done\""
+str83 db   132,'q','q','"',"\\","a;b",';','"',';',"x\"y;z",'q',55 ; "quoted; comment"
+; ECHO "msg 83; \"done\""
+str84 byte   "",'"',"a;b","(nest)",';',27,"(nest)","\\",';',"\\",'"','q'
+; ECHO "msg 84; \"done\""
+str85 db   "x\"y;z","a;b","(nest)","(nest)" ; "quoted; comment"
+; ECHO "msg 85; \"done\""
+str86 .byte   '"',"a;b","(nest)",';',"",179,"","(nest)","a;b","","a;b","a;b"
+; ECHO "msg 86; \"done\""
+str87 db   "x\"y;z","x\"y;z","\\","(nest)",'"',"a;b",';',"\\",'"',"\\"
+; ECHO "msg 87; \"done\""
+str88 .byte   "\\",57,"x\"y;z","x\"y;z",'q',"(nest)","a;b","(nest)",'q' ; it's
+; ECHO "msg 88; \"done\""
+str89 .byte   'q',"","\\",'"'
+; ECHO "msg 89; \"done\""
+str90 byte   "a;b","","(nest)","a;b","\\",79,"","a;b" ; "quoted; comment"
+; ECHO "msg 90; \"done\""
+str91 db   "","x\"y;z",';','"',184 ; "quoted; comment"
+; ECHO "msg 91; \"done\""
+str92 .byte   "\\",';',"\\",182,"a;b","",'q',"x\"y;z","","a;b" ; it's
+; ECHO "msg 92; \"done\""
+str93 byte   'q',"",';',"x\"y;z",181,"\\","a;b",'q',';','q','q' ; it's
+; ECHO "msg 93; \"done\""
+str94 .byte   "",'q',"a;b",218,';',"a;b","x\"y;z",'"'
+; ECHO "msg 94; \"done\""
+str95 db   'q',"\\",171,'"',"a;b","x\"y;z",'"' ; "quoted; comment"
+; ECHO "msg 95; \"done\""
+str96 db   239,191,'"' ; "quoted; comment"
+; ECHO "msg 96; \"done\""
+str97 db   "","x\"y;z","x\"y;z","","x\"y;z",158,"(nest)","a;b","","x\"y;z","a;b","" ; it's
+; ECHO "msg 97; \"done\""
+str98 db   "x\"y;z",'"' ; it's
+; ECHO "msg 98; \"done\""
+str99 db   "a;b",216,"","(nest)","\\","a;b","x\"y;z"
+; ECHO "msg 99; \"done\""
+str100 db   "a;b","(nest)","(nest)","(nest)","",'q',"\\" ; "quoted; comment"
+; ECHO "msg 100; \"done\""
+str101 db   24,"",';',140,'q',"x\"y;z","x\"y;z","(nest)" ; "quoted; comment"
+; ECHO "msg 101; \"done\""
+str102 db   'q',';',"\\",253,';',"(nest)",'q' ; it's
+; ECHO "msg 102; \"done\""
+str103 .byte   '"',"x\"y;z","","a;b","a;b",'"',';','q','"' ; it's
+; ECHO "msg 103; \"done\""
+str104 db   3,'q' ; it's
+; ECHO "msg 104; \"done\""
+str105 db   "","(nest)","a;b","\\","x\"y;z",248,"",'q',"x\"y;z",';',251
+; ECHO "msg 105; \"done\""
+str106 byte   44,'q',"",193,""
+; ECHO "msg 106; \"done\""
+str107 db   'q',"\\","(nest)","\\","a;b","(nest)","\\","","a;b","(nest)",';','"' ; it's
+; ECHO "msg 107; \"done\""
+str108 byte   "a;b",'q','"',';',"a;b",';',"\\",189 ; "quoted; comment"
+; ECHO "msg 108; \"done\""
+str109 byte   '"',"",121,"x\"y;z","(nest)",'"',"\\","","(nest)" ; it's
+; ECHO "msg 109; \"done\""
+str110 byte   "(nest)","",';',121
+; ECHO "msg 110; \"done\""
+str111 .byte   111,'q','q',"(nest)",'"','"','q','q',';',';' ; "quoted; comment"
+; ECHO "msg 111; \"done\""
+str112 .byte   "(nest)",'q',176,'"',"a;b","\\","a;b",'q'
+; ECHO "msg 112; \"done\""
+str113 .byte   "",'q','q',"x\"y;z","\\",'q',';',';',251,243 ; it's
+; ECHO "msg 113; \"done\""
+str114 byte   "a;b",'q',"a;b","(nest)",'"',4,'"' ; "quoted; comment"
+; ECHO "msg 114; \"done\""
+str115 byte   ';',"\\",'q','"',56,"x\"y;z"
+; ECHO "msg 115; \"done\""
+str116 byte   "a;b","x\"y;z","a;b",';',70,"a;b","\\" ; "quoted; comment"
+; ECHO "msg 116; \"done\""
+str117 .byte   ';',"","\\","a;b"
+; ECHO "msg 117; \"done\""
+str118 .byte   "\\",';',30
+; ECHO "msg 118; \"done\""
+str119 .byte   "a;b",';',"a;b","x\"y;z","\\",'q','q',"\\" ; "quoted; comment"
+; ECHO "msg 119; \"done\""
+str120 db   "\\","a;b",'"',"\\"
+; ECHO "msg 120; \"done\""
+str121 .byte   'q',"a;b","(nest)","",94,"a;b",'"','q',"x\"y;z",';',';'
+; ECHO "msg 121; \"done\""
+str122 db   "\\",'"','"',"",';',"a;b"
+; ECHO "msg 122; \"done\""
+str123 db   "\\",';','q','q',';' ; it's
+; ECHO "msg 123; \"done\""
+str124 db   ';','"',"\\",';','q',"x\"y;z",';',';','"',60,"\\" ; it's
+; ECHO "msg 124; \"done\""
+str125 db   39,"\\","",';','q',"","a;b","a;b","a;b" ; it's
+; ECHO "msg 125; \"done\""
+str126 byte   "",225,"(nest)",'q','"',"\\","(nest)",118,'"',224
+; ECHO "msg 126; \"done\""
+str127 .byte   "(nest)","",';','q',"\\",'q','"',';','q',"x\"y;z",29 ; "quoted; comment"
+; ECHO "msg 127; \"done\""
+str128 db   "\\","","","\\","x\"y;z","x\"y;z","(nest)"
+; ECHO "msg 128; \"done\""
+str129 .byte   "\\",128,'"',41
+; ECHO "msg 129; \"done\""
+str130 .byte   "(nest)","a;b","a;b",'"',"a;b","x\"y;z",';',"x\"y;z",'"',"\\","\\" ; "quoted; comment"
+; ECHO "msg 130; \"done\""
+str131 db   "(nest)","" ; it's
+; ECHO "msg 131; \"done\""
+str132 byte   ';',72,"\\",';',"\\",';',"x\"y;z","","(nest)"
+; ECHO "msg 132; \"done\""
+str133 db   "x\"y;z","(nest)","x\"y;z",49,"","(nest)",';','q',"x\"y;z","",""
+; ECHO "msg 133; \"done\""
+str134 byte   'q',"x\"y;z",124,66,'"',"(nest)","(nest)","","","\\",37,'q' ; "quoted; comment"
+; ECHO "msg 134; \"done\""
+str135 .byte   "(nest)","(nest)",14,"\\",';','q',"a;b","(nest)"
+; ECHO "msg 135; \"done\""
+str136 db   148,"a;b","","\\","x\"y;z","x\"y;z","","",'"' ; "quoted; comment"
+; ECHO "msg 136; \"done\""
+str137 .byte   'q',0,';',"x\"y;z",';','"',254,';','"',';'
+; ECHO "msg 137; \"done\""
+str138 .byte   "\\","a;b","(nest)",'"',"\\","a;b","(nest)",';',"a;b"
+; ECHO "msg 138; \"done\""
+str139 .byte   "",'q',219,"\\","x\"y;z","\\" ; "quoted; comment"
+; ECHO "msg 139; \"done\""
+str140 db   "a;b",155,'q',"x\"y;z",'q',"\\",227 ; "quoted; comment"
+; ECHO "msg 140; \"done\""
+str141 db   '"','"' ; "quoted; comment"
+; ECHO "msg 141; \"done\""
+str142 .byte   "(nest)","x\"y;z",'"',"x\"y;z","(nest)","x\"y;z",';','"' ; "quoted; comment"
+; ECHO "msg 142; \"done\""
+str143 db   "(nest)",'"',"(nest)",'q',"x\"y;z",'"',"(nest)","\\",';',232,"" ; it's
+; ECHO "msg 143; \"done\""
+str144 .byte   'q','"',"(nest)","a;b","x\"y;z","x\"y;z","\\",'"',"(nest)",122 ; "quoted; comment"
+; ECHO "msg 144; \"done\""
+str145 byte   'q',"a;b","x\"y;z","a;b",'"'
+; ECHO "msg 145; \"done\""
+str146 db   "","\\",';',133,'"',"(nest)",'q',"(nest)","",'q'
+; ECHO "msg 146; \"done\""
+str147 byte   "x\"y;z","a;b",7,"(nest)",';' ; it's
+; ECHO "msg 147; \"done\""
+str148 db   "(nest)","(nest)","\\",'q' ; "quoted; comment"
+; ECHO "msg 148; \"done\""
+str149 .byte   "(nest)","a;b","a;b",';','"',"(nest)","x\"y;z",'"',"\\","(nest)"
+; ECHO "msg 149; \"done\""
+str150 db   "a;b","","\\","\\","(nest)",""
+; ECHO "msg 150; \"done\""
+str151 .byte   "a;b","",216,"x\"y;z","\\","(nest)" ; it's
+; ECHO "msg 151; \"done\""
+str152 byte   106,"x\"y;z","(nest)",'q',"\\",39,"a;b",217,"\\","",8,';' ; "quoted; comment"
+; ECHO "msg 152; \"done\""
+str153 db   "(nest)",'"',';','q',109,156,"(nest)",';','"',"x\"y;z","a;b",';' ; it's
+; ECHO "msg 153; \"done\""
+str154 .byte   '"',"x\"y;z","x\"y;z" ; it's
+; ECHO "msg 154; \"done\""
+str155 db   ';',"\\","(nest)","",'q',"x\"y;z","\\" ; "quoted; comment"
+; ECHO "msg 155; \"done\""
+str156 byte   "",'q','"',';',"\\","(nest)",'"','"','q',"\\",87,"(nest)"
+; ECHO "msg 156; \"done\""
+str157 .byte   "x\"y;z","(nest)","(nest)",72,'"',"(nest)",'q','q',"a;b","a;b","a;b","x\"y;z" ; it's
+; ECHO "msg 157; \"done\""
+str158 db   '"','"',"a;b","x\"y;z",'q',"x\"y;z" ; it's
+; ECHO "msg 158; \"done\""
+str159 byte   "","\\","",'"','q',236,"x\"y;z",'"',';' ; it's
+; ECHO "msg 159; \"done\""
+str160 .byte   "x\"y;z","a;b","(nest)"
+; ECHO "msg 160; \"done\""
+str161 byte   "\\",'q',"",'"','"',"","x\"y;z","(nest)","x\"y;z","(nest)" ; it's
+; ECHO "msg 161; \"done\""
+str162 db   "\\","a;b","x\"y;z","x\"y;z",';',243,20,"(nest)","a;b" ; "quoted; comment"
+; ECHO "msg 162; \"done\""
+str163 byte   '"',"a;b",'q',"a;b",';','q',';',"\\","","a;b",60,16 ; "quoted; comment"
+; ECHO "msg 163; \"done\""
+str164 byte   "(nest)","(nest)",';','"',"x\"y;z","a;b",'q',"\\","" ; "quoted; comment"
+; ECHO "msg 164; \"done\""
+str165 .byte   'q','"',44,'q','q' ; "quoted; comment"
+; ECHO "msg 165; \"done\""
+str166 .byte   "a;b","(nest)",189,';' ; "quoted; comment"
+; ECHO "msg 166; \"done\""
+str167 db   "(nest)","x\"y;z","(nest)","a;b","a;b","\\","\\","",';',';' ; "quoted; comment"
+; ECHO "msg 167; \"done\""
+str168 db   '"',"",'q',"","a;b",'q',""
+; ECHO "msg 168; \"done\""
+str169 db   176,"(nest)",164,"",128,"(nest)",'"',"a;b",'"' ; "quoted; comment"
+; ECHO "msg 169; \"done\""
+str170 .byte   "\\",'q',';',"\\","x\"y;z","a;b",81,"x\"y;z" ; "quoted; comment"
+; ECHO "msg 170; \"done\""
+str171 .byte   "(nest)","","x\"y;z","a;b",29,"","\\",'q','"',250 ; it's
+; ECHO "msg 171; \"done\""
+str172 db   "x\"y;z","x\"y;z","","(nest)","\\",115,"\\","(nest)","a;b","x\"y;z",149 ; "quoted; comment"
+; ECHO "msg 172; \"done\""
+str173 .byte   "(nest)","(nest)",'q','q',"(nest)"
+; ECHO "msg 173; \"done\""
+str174 db   'q',"\\",'q',"\\","a;b","","" ; "quoted; comment"
+; ECHO "msg 174; \"done\""
+str175 .byte   "(nest)",';',"a;b","(nest)","(nest)",';',';','q',"\\","" ; "quoted; comment"
+; ECHO "msg 175; \"done\""
+str176 db   ';','q',"a;b",137,"(nest)",'q',125,"(nest)",'q',10,"(nest)" ; it's
+; ECHO "msg 176; \"done\""
+str177 db   "x\"y;z","a;b","(nest)","(nest)","x\"y;z" ; "quoted; comment"
+; ECHO "msg 177; \"done\""
+str178 byte   "",'q','"','"','"' ; it's
+; ECHO "msg 178; \"done\""
+str179 byte   'q',"a;b","\\","\\","","(nest)" ; "quoted; comment"
+; ECHO "msg 179; \"done\""
+str180 byte   "x\"y;z","a;b",'"','"' ; "quoted; comment"
+; ECHO "msg 180; \"done\""
+str181 .byte   ';',"(nest)","x\"y;z",38,13,""
+; ECHO "msg 181; \"done\""
+str182 byte   ';',"a;b" ; "quoted; comment"
+; ECHO "msg 182; \"done\""
+str183 db   "a;b",';',14,"",'"',"\\",'q',"\\",'"'
+; ECHO "msg 183; \"done\""
+str184 byte   '"','"',"\\",'q',';','q','q' ; it's
+; ECHO "msg 184; \"done\""
+str185 byte   "\\","",';',"(nest)","(nest)","a;b",'q','q'
+; ECHO "msg 185; \"done\""
+str186 db   "x\"y;z",';','q','"'
+; ECHO "msg 186; \"done\""
+str187 db   "x\"y;z","(nest)",83 ; "quoted; comment"
+; ECHO "msg 187; \"done\""
+str188 db   '"',';' ; "quoted; comment"
+; ECHO "msg 188; \"done\""
+str189 db   "a;b",'"',58,'q',"a;b","","\\","a;b",';',';','q',"a;b" ; "quoted; comment"
+; ECHO "msg 189; \"done\""
+str190 byte   50,"\\","(nest)",'"',108,165,196,"",'q' ; "quoted; comment"
+; ECHO "msg 190; \"done\""
+str191 byte   'q',';',"a;b" ; "quoted; comment"
+; ECHO "msg 191; \"done\""
+str192 .byte   ';',"\\",';','q','q',"(nest)","\\",'q','"','"','q',"\\" ; it's
+; ECHO "msg 192; \"done\""
+str193 .byte   "",';',"x\"y;z",'q' ; "quoted; comment"
+; ECHO "msg 193; \"done\""
+str194 byte   "(nest)","\\","(nest)","\\","",';',124,'"',"x\"y;z","a;b",'q','"'
+; ECHO "msg 194; \"done\""
+str195 byte   "(nest)","x\"y;z"
+; ECHO "msg 195; \"done\""
+str196 byte   '"',"",'q',"a;b","a;b",'"','q',"(nest)",'q',"" ; it's
+; ECHO "msg 196; \"done\""
+str197 byte   "x\"y;z",'"',"a;b",213,'"','"',"x\"y;z",'"',"x\"y;z",';',153,';' ; "quoted; comment"
+; ECHO "msg 197; \"done\""
+str198 .byte   "a;b",'"','"',';',"a;b","x\"y;z","a;b",'"',"(nest)" ; it's
+; ECHO "msg 198; \"done\""
+str199 .byte   "(nest)",126,'q',115,"a;b","","","\\",';','"',"" ; it's
+; ECHO "msg 199; \"done\""
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""mforth_dict.Rom/WordRef on small hand-built dictionaries.
+
+Each image is laid out as src/main.asm does it: the name stored backwards
+with bit 7 set on its last byte, the NFA (length, bit 7 = immediate), the
+link to the previous NFA, in a PROFILER build the execution count cell, and
+a JMP code field.
+
+    python3 -m unittest discover -s tools/test
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+sys.path.insert(0, str(HERE.parent))
+import mforth_dict  # noqa: E402
+from mforth_dict import Rom  # noqa: E402
+
+ENTER = 0x015C
+JMP = 0xC3
+START = 0x0100
+
+
+def build_rom(words: list[tuple[str, bool, int]], profiler: bool = False) -> tuple[bytearray, dict[str, int]]:
+    """A ROM holding words (name, immediate, execution count), oldest first; returns it and name -> NFA.
+
+    The count is only stored in a PROFILER build.  The latest word's NFA goes
+    in the pointer at 07FFEH, as in a pass-1 image.
+    """
+    rom = bytearray(mforth_dict.ROM_SIZE)
+    nfas = {}
+    addr, link = START, 0
+    for name, immediate, count in words:
+        stored = name[::-1].encode("ascii")
+        rom[addr:addr + len(stored)] = stored
+        rom[addr] |= 0x80
+        nfa = addr + len(stored)
+        rom[nfa] = len(name) | (0x80 if immediate else 0)
+        rom[nfa + 1:nfa + 3] = link.to_bytes(2, "little")
+        cfa = nfa + 3
+        if profiler:
+            rom[cfa:cfa + 2] = count.to_bytes(2, "little")
+            cfa += 2
+        rom[cfa:cfa + 3] = bytes([JMP]) + ENTER.to_bytes(2, "little")
+        nfas[name] = link = nfa
+        addr = cfa + 3 + 4                  # two cells of body
+    rom[mforth_dict.LATEST_WORD_PTR_ADDR:] = link.to_bytes(2, "little")
+    return rom, nfas
+
+
+WORDS = [("DUP", False, 0), ("DROP", False, 0), ("[CHAR]", True, 0), ("swap", False, 0)]
+
+
+class HeaderLayout(unittest.TestCase):
+    def test_standard(self):
+        image, nfas = build_rom(WORDS)
+        rom = Rom(bytes(image))
+        self.assertFalse(rom.profiler)
+        self.assertEqual(rom.nfatocfasz, mforth_dict.NFATOCFASZ)
+        for word in rom:
+            nfa = nfas[word.name]
+            self.assertEqual((word.nfa, word.lfa, word.cfa, word.pfa), (nfa, nfa + 1, nfa + 3, nfa + 6))
+            self.assertEqual(image[word.cfa], JMP)
+            self.assertIsNone(word.pec)
+            self.assertIsNone(word.count)
+
+    def test_profiler_detected_from_zero_counts(self):
+        image, nfas = build_rom(WORDS, profiler=True)
+        rom = Rom(bytes(image))
+        self.assertTrue(rom.profiler)
+        self.assertEqual(rom.nfatocfasz, mforth_dict.NFATOCFASZ_PROFILER)
+        for word in rom:
+            nfa = nfas[word.name]
+            self.assertEqual((word.cfa, word.pfa, word.pec), (nfa + 5, nfa + 8, nfa + 3))
+            self.assertEqual(image[word.cfa], JMP)
+            self.assertEqual(word.count, 0)
+
+    def test_one_count_set_is_not_profiler(self):
+        # Only a freshly built PROFILER image has every count cell zero.
+        image, _ = build_rom([("DUP", False, 0), ("DROP", False, 7)], profiler=True)
+        self.assertFalse(Rom(bytes(image)).profiler)
+
+    def test_counts_decoded_when_layout_given(self):
+        image, nfas = build_rom([("DUP", False, 0x1234), ("DROP", False, 1), ("OVER", False, 0xFFFF)], profiler=True)
+        rom = Rom(bytes(image), nfatocfasz=mforth_dict.NFATOCFASZ_PROFILER)
+        self.assertEqual({w.name: w.count for w in rom}, {"DUP": 0x1234, "DROP": 1, "OVER": 0xFFFF})
+        self.assertEqual(rom.find("DUP").cfa, nfas["DUP"] + 5)
+
+    def test_fields_and_words_agree(self):
+        image, _ = build_rom(WORDS)
+        rom = Rom(image)
+        refs = [w.to_word() for w in rom]
+        self.assertEqual(refs, mforth_dict.words(bytes(image)))
+        self.assertEqual([w.name for w in refs], ["swap", "[CHAR]", "DROP", "DUP"])
+        self.assertEqual([w.immediate for w in refs], [False, True, False, False])
+        self.assertEqual(refs[-1].next_word_addr, 0)
+
+    def test_head_given(self):
+        image, nfas = build_rom(WORDS)
+        rom = Rom(bytes(image), head=nfas["DROP"])
+        self.assertEqual([w.name for w in rom], ["DROP", "DUP"])
+
+    def test_bad_link(self):
+        image, nfas = build_rom(WORDS)
+        image[nfas["DUP"] + 1:nfas["DUP"] + 3] = nfas["swap"].to_bytes(2, "little")
+        with self.assertRaises(ValueError):
+            list(Rom(bytes(image)))
+
+
+class Find(unittest.TestCase):
+    def test_case_insensitive(self):
+        image, nfas = build_rom(WORDS)
+        rom = Rom(bytes(image))
+        for name in ("dup", "DUP", "Dup", "SWAP", "[char]"):
+            with self.subTest(name=name):
+                word = rom.find(name)
+                self.assertIsNotNone(word)
+                self.assertEqual(word.nfa, nfas[word.name])
+                self.assertEqual(word.name.upper(), name.upper())
+        self.assertIsNone(rom.find("ROT"))
+        self.assertIs(rom.find("dup"), rom.find("DUP"))
+
+    def test_newest_definition_wins(self):
+        image, _ = build_rom([("DUP", False, 0), ("DROP", False, 0), ("dup", False, 0)])
+        rom = Rom(bytes(image))
+        self.assertEqual(rom.find("DUP").name, "dup")
+        self.assertEqual(rom.find("DUP").nfa, rom.head)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""The i8085 region cache must not change what a program does.
+
+Every program here runs twice, with cache=True and with cache=False, and the
+two machines must end with the same registers, memory and T-state count:
+
+  self-modifying  a store into a later instruction of the same basic block
+                  (MVI A,55h / STA 9006h / MVI B,0 ...), which once ran the
+                  stale folded operand from the cache
+  forth-patch     MFORTH patching a CODE word it has already run, with the
+                  4 ms timer interrupt on
+  forth_bench     every forth_bench.py workload on test/Reference.bx
+
+    python3 -m unittest discover -s tools/test
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+ROOT = HERE.parents[1]
+REFERENCE_ROM = ROOT / "test" / "Reference.bx"
+
+sys.path.insert(0, str(HERE.parent))
+import forth_bench  # noqa: E402
+import i8085  # noqa: E402
+import m100emu  # noqa: E402
+
+CPU_STATE = ("a", "b", "c", "d", "e", "h", "l", "f", "sp", "pc", "ie", "mask", "pending75", "halted", "cycles")
+
+# 9000: MVI A,55h; STA 9006h; MVI B,0 (operand patched to 55h, then back to 0)
+# 9007: MOV A,E; ADD B; MOV E,A; XRA A; STA 9006h; DCR C; JNZ 9000h; HLT
+SELF_MODIFYING = bytes.fromhex("3E55 320690 0600 7B 80 5F AF 320690 0D C20090 76".replace(" ", ""))
+
+
+def cpu_state(cpu: i8085.CPU, reason: str) -> dict:
+    state = {name: getattr(cpu, name) for name in CPU_STATE}
+    state.update(reason=reason, mem=bytes(cpu.mem))
+    return state
+
+
+class SameState(unittest.TestCase):
+    def assertSameState(self, cached: dict, plain: dict) -> None:
+        """Equal field by field; byte strings (memory, LCD) report their first difference."""
+        self.assertEqual(cached.keys(), plain.keys())
+        for name in cached:
+            a, b = cached[name], plain[name]
+            if isinstance(a, bytes) and a != b:
+                at = next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b)))
+                self.fail(f"{name} differs at {at:04X}: cached {a[at:at + 8].hex()} plain {b[at:at + 8].hex()}")
+            self.assertEqual(a, b, name)
+
+
+class SelfModifyingCode(SameState):
+    def run_program(self, loops: int, cache: bool) -> dict:
+        cpu = i8085.CPU(rom_top=0x8000, cache=cache)
+        cpu.mem[0x9000:0x9000 + len(SELF_MODIFYING)] = SELF_MODIFYING
+        cpu.pc, cpu.c, cpu.sp = 0x9000, loops, 0xF000
+        return cpu_state(cpu, cpu.run(1_000_000))
+
+    def test_store_into_same_block(self):
+        for loops in (1, 3, 40, 255):
+            with self.subTest(loops=loops):
+                cached = self.run_program(loops, True)
+                self.assertSameState(cached, self.run_program(loops, False))
+                self.assertEqual(cached["e"], loops * 0x55 & 0xFF)
+
+
+@unittest.skipUnless(REFERENCE_ROM.exists(), f"{REFERENCE_ROM} not found")
+class ForthWorkloads(SameState):
+    @classmethod
+    def setUpClass(cls):
+        cls.rom = REFERENCE_ROM.read_bytes()
+
+    def test_patched_code_word(self):
+        lines = ("CODE K1 33 C, 5 C, 0 C, 229 C, NEXT END-CODE", ": T 0 100 0 DO K1 + LOOP ; T . K1 .",
+                 "7 ' K1 1+ C! K1 . T . 9 ' K1 1+ C! T .")
+        states = []
+        for cache in (True, False):
+            machine = m100emu.Model100(self.rom, timer=True, cache=cache)
+            machine.boot(m100emu.MAX_CYCLES)
+            for line in lines:
+                machine.interpret(line, m100emu.MAX_CYCLES)
+            states.append(machine.snapshot())
+        self.assertSameState(states[0], states[1])
+        self.assertIn("7 700 900", states[0]["lcd"].decode("latin-1"))
+
+    def test_bench_workloads(self):
+        for workload in forth_bench.WORKLOADS:
+            with self.subTest(workload=workload.name):
+                cached, cached_t = forth_bench.run_workload(self.rom, workload, cache=True)
+                plain, plain_t = forth_bench.run_workload(self.rom, workload, cache=False)
+                self.assertEqual(cached_t, plain_t)
+                self.assertSameState(cached.snapshot(), plain.snapshot())
+
+
+if __name__ == "__main__":
+    unittest.main()
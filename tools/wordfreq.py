@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Word-frequency lists for weighting dictionary lookups.
+
+Two kinds of input are understood:
+  counts   lines of "COUNT NAME" as PRINT-PROFILE prints them (a PROFILER build's
+           execution counts), or "NAME COUNT"; anything else is ignored
+  sources  Forth source (.DO, .fs, .4th): every token the outer interpreter would
+           look up with FIND is counted once per occurrence
+
+Names are matched case-insensitively, like FIND.  Run as a script to print the
+merged counts: wordfreq.py [--counts FILE ...] [SOURCE ...]
+"""
+from __future__ import annotations
+import argparse, collections, pathlib, re, sys
+
+SOURCE_SUFFIXES = (".do", ".fs", ".4th", ".fth", ".f")
+
+# Words that consume the rest of the line or a delimited string instead of tokens.
+_SKIP_TO = {"\\": "\n", "(": ")", ".(": ")", '."': '"', 'S"': '"', 'C"': '"', 'ABORT"': '"'}
+_TOKEN_RE = re.compile(r"\S+")
+
+def _count_or_none(text: str) -> int | None:
+    return int(text) if text.isdigit() else None
+
+def parse_counts(text: str) -> collections.Counter:
+    """Counts from PRINT-PROFILE output ("COUNT NAME") or "NAME COUNT" lines."""
+    counts = collections.Counter()
+    for line in text.replace("\x0c", "\n").splitlines():
+        parts = line.split()
+        if len(parts) != 2:
+            continue
+        first, second = _count_or_none(parts[0]), _count_or_none(parts[1])
+        if first is not None:
+            counts[parts[1].upper()] += first      # PRINT-PROFILE order wins when both are numbers
+        elif second is not None:
+            counts[parts[0].upper()] += second
+    return counts
+
+def count_source(text: str) -> collections.Counter:
+    """Occurrences of every interpreted token in Forth source, comments and strings skipped."""
+    counts = collections.Counter()
+    text = text.replace("\r\n", "\n").replace("\r", "\n").split("\x1a", 1)[0]
+    pos = 0
+    while True:
+        m = _TOKEN_RE.search(text, pos)
+        if m is None:
+            break
+        token = m.group().upper()
+        pos = m.end()
+        counts[token] += 1
+        end = _SKIP_TO.get(token)
+        if end is not None:
+            if pos < len(text) and text[pos] != "\n":
+                pos += 1                             # the single delimiting blank
+            stop = text.find(end, pos)
+            pos = len(text) if stop < 0 else stop + (0 if end == "\n" else 1)
+    return counts
+
+def load(count_files=(), source_files=()) -> collections.Counter:
+    """Merged counts from count files and source files."""
+    counts = collections.Counter()
+    for path in count_files:
+        counts.update(parse_counts(pathlib.Path(path).read_text(errors="ignore")))
+    for path in source_files:
+        counts.update(count_source(pathlib.Path(path).read_text(errors="ignore")))
+    return counts
+
+def load_any(paths) -> collections.Counter:
+    """Like load(), telling sources from count files by suffix."""
+    paths = [pathlib.Path(p) for p in paths]
+    sources = [p for p in paths if p.suffix.lower() in SOURCE_SUFFIXES]
+    return load([p for p in paths if p not in sources], sources)
+
+def weights_for(names: list[str], counts: collections.Counter) -> list[int]:
+    """counts looked up for each dictionary name (0 when absent)."""
+    return [counts.get(name.upper(), 0) for name in names]
+
+def main():
+    ap=argparse.ArgumentParser(description="Print merged word frequencies, most frequent first.")
+    ap.add_argument("sources", nargs="*", help="Forth source files (.DO, .fs, ...)")
+    ap.add_argument("--counts", action="append", default=[], help="PRINT-PROFILE output or NAME COUNT lines")
+    args=ap.parse_args()
+    for name, count in load(args.counts, args.sources).most_common():
+        print(f"{count} {name}")
+
+if __name__=="__main__":
+    sys.exit(main())